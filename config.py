@@ -3,18 +3,23 @@
 # Applicatie instellingen
 APP_NAME = "Planning Tool"
 
-# Versie Beheer (v0.6.28)
+# Versie Beheer (v0.6.29)
 # APP_VERSION verhoogt bij elke wijziging (GUI of DB)
 # MIN_DB_VERSION verhoogt alleen bij database schema wijzigingen
-APP_VERSION = "0.6.28"
-MIN_DB_VERSION = "0.6.28"  # Laatste DB wijziging: v0.6.28 (voornaam/achternaam kolommen - sortering op achternaam)
+APP_VERSION = "0.6.29"
+MIN_DB_VERSION = "0.6.29"  # Laatste DB wijziging: v0.6.29 (maand_status tabel - harde overstap, zie migrations/upgrade_to_v0_6_29.py)
 # v0.6.28: ISSUE-002 fix - Gebruikers sortering op achternaam (eerst vaste, dan reserves)
+# v0.6.29: Publicatie status per maand (maand_status) - oude clients weigeren een 0.6.29 database
 
 # Performance settings
 ENABLE_VALIDATION_CACHE = False  # Toggle ValidationCache voor performance testing (v0.6.26.2)
                                   # True = Batch preload (5 queries, sneller lokaal)
                                   # False = Direct queries (900+ queries, mogelijk sneller over netwerk)
 
+# Database onderhoud (ANALYZE, incremental vacuum, WAL checkpoint)
+ENABLE_DB_ONDERHOUD = True       # Achtergrond onderhoud als de app idle is
+DB_ONDERHOUD_IDLE_MINUTEN = 5    # Minuten zonder muis/toetsenbord input voor onderhoud start
+
 # Window settings
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
@@ -235,6 +235,21 @@ def create_tables(cursor):
         )
     """)
 
+    # Maand publicatie status (v0.6.29: bron van waarheid i.p.v. planning.status per rij)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS maand_status (
+            jaar INTEGER NOT NULL,
+            maand INTEGER NOT NULL CHECK(maand BETWEEN 1 AND 12),
+            status TEXT NOT NULL DEFAULT 'concept'
+                   CHECK(status IN ('concept', 'gepubliceerd')),
+            gepubliceerd_op TIMESTAMP,
+            gepubliceerd_door INTEGER,
+            versie INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (jaar, maand),
+            FOREIGN KEY (gepubliceerd_door) REFERENCES gebruikers(id)
+        )
+    """)
+
     # HR regels tabel (updated: versioning support)
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS hr_regels (
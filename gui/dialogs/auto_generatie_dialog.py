@@ -6,12 +6,14 @@ Dialog voor het genereren van planning uit actieve typetabel
 from typing import Dict, Any, Optional, List, Set
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QDateEdit, QMessageBox, QTextEdit,
-                             QGroupBox)
-from PyQt6.QtCore import QDate
+                             QGroupBox, QProgressDialog, QApplication)
+from PyQt6.QtCore import QDate, Qt
 from PyQt6.QtGui import QFont
 from database.connection import get_connection
 from gui.styles import Styles, Fonts, Dimensions
-from datetime import datetime, timedelta
+from services.rooster_projectie import RoosterProjectie
+from services.auto_generatie_service import GeneratieDiff, bereken_generatie_diff, pas_diff_toe
+from services.referentie_catalogus import ReferentieCatalogus
 import sqlite3
 
 
@@ -35,10 +37,10 @@ class AutoGeneratieDialog(QDialog):
         # Data
         self.actieve_typetabel: Optional[Dict[str, Any]] = None
         self.gebruikers: List[Dict[str, Any]] = []
-        self.bestaande_data_count: int = 0
-        self.beschermd_count: int = 0
         self.speciale_codes: Set[str] = set()
         self.feestdagen: Dict[str, bool] = {}  # {datum_str: is_zondagsrust}
+        self.projectie: Optional[RoosterProjectie] = None
+        self.diff: Optional[GeneratieDiff] = None  # Dry-run voor huidige periode (v0.6.29)
 
         self.init_ui()
         self.load_data()
@@ -159,13 +161,8 @@ class AutoGeneratieDialog(QDialog):
             """)
             self.gebruikers = cursor.fetchall()
 
-            # Haal speciale codes op (voor bescherming)
-            cursor.execute("""
-                SELECT code
-                FROM speciale_codes
-            """)
-            for row in cursor.fetchall():
-                self.speciale_codes.add(row['code'])
+            # Speciale codes (voor bescherming) - v0.6.29: uit ReferentieCatalogus
+            self.speciale_codes.update(ReferentieCatalogus.get_instance().speciale_code_set())
 
             # Haal feestdagen op (voor correcte code toekenning)
             cursor.execute("""
@@ -175,6 +172,9 @@ class AutoGeneratieDialog(QDialog):
             for row in cursor.fetchall():
                 self.feestdagen[row['datum']] = bool(row['is_zondagsrust'])
 
+            # Typetabel projectie (gecompileerd, hergebruikt bij elke preview)
+            self.projectie = RoosterProjectie.laad(self.actieve_typetabel['id'], conn)
+
             conn.close()
 
             # Update preview
@@ -204,8 +204,13 @@ class AutoGeneratieDialog(QDialog):
         # Bereken aantal dagen
         dagen = (eind_date - start_date).days + 1
 
-        # Check bestaande data
-        self.check_bestaande_data(start_date, eind_date)
+        # Dry-run: wat zou generatie wijzigen (geen writes)
+        try:
+            self.diff = bereken_generatie_diff(self.projectie, start_date, eind_date) if self.projectie else None
+        except sqlite3.Error as e:
+            self.diff = None
+            self.preview_text.setPlainText(f"⚠️ Kon bestaande planning niet laden: {e}")
+            return
 
         # Bouw preview tekst
         lines = []
@@ -226,8 +231,6 @@ class AutoGeneratieDialog(QDialog):
         if len(self.gebruikers) > 5:
             lines.append(f"  ... en {len(self.gebruikers) - 5} anderen")
 
-        lines.append("")
-        lines.append(f"TOTAAL TE GENEREREN: {len(self.gebruikers) * dagen} planning records")
         lines.append("")
         lines.append("FEESTDAGEN:")
         lines.append(f"  - {len(self.feestdagen)} feestdagen gevonden")
@@ -236,59 +239,39 @@ class AutoGeneratieDialog(QDialog):
         lines.append("BESCHERMING:")
         lines.append(f"  - Speciale codes: {', '.join(sorted(self.speciale_codes)) if self.speciale_codes else 'Geen'}")
         lines.append("  - Handmatig aangepaste shifts")
+        lines.append("  - Gepubliceerde maanden")
 
-        if self.bestaande_data_count > 0:
+        if self.diff:
             lines.append("")
-            lines.append(f"ℹ️ BESTAAND: {self.bestaande_data_count} records")
-            if self.beschermd_count > 0:
-                lines.append(f"🔒 BESCHERMD: {self.beschermd_count} records (worden overgeslagen)")
-            lines.append("✓ WORDT INGEVULD: Lege cellen en typetabel-shifts")
+            lines.extend(self.get_diff_regels(self.diff))
 
         self.preview_text.setPlainText("\n".join(lines))
 
-    def check_bestaande_data(self, start_date, eind_date):
-        """Check hoeveel planning records al bestaan en hoeveel beschermd zijn"""
-        try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
-            # Totaal bestaande records
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM planning
-                WHERE datum >= ? AND datum <= ?
-                  AND shift_code IS NOT NULL
-            """, (start_date.isoformat(), eind_date.isoformat()))
-
-            result = cursor.fetchone()
-            self.bestaande_data_count = result[0] if result else 0
-
-            # Beschermde records (speciale codes)
-            if self.speciale_codes:
-                placeholders = ','.join(['?' for _ in self.speciale_codes])
-                query = f"""
-                    SELECT COUNT(*)
-                    FROM planning
-                    WHERE datum >= ? AND datum <= ?
-                      AND shift_code IN ({placeholders})
-                """
-                params = [start_date.isoformat(), eind_date.isoformat()] + list(self.speciale_codes)
-                cursor.execute(query, params)
-
-                result = cursor.fetchone()
-                self.beschermd_count = result[0] if result else 0
-            else:
-                self.beschermd_count = 0
-
-            conn.close()
-
-        except sqlite3.Error:
-            self.bestaande_data_count = 0
-            self.beschermd_count = 0
+    def get_diff_regels(self, diff: GeneratieDiff) -> List[str]:
+        """Preview regels voor de dry-run diff"""
+        namen = {gebruiker['id']: gebruiker['volledige_naam'] for gebruiker in self.gebruikers}
+        lines = [
+            "WIJZIGINGEN (dry-run):",
+            f"  ✓ Invullen (lege cellen): {len(diff.invullen)}",
+            f"  = Ongewijzigd (al gelijk, overgeslagen): {diff.ongewijzigd}",
+        ]
+        if diff.beschermd:
+            lines.append(f"  🔒 Beschermd: {diff.beschermd} "
+                         f"(speciale codes {diff.beschermd_speciaal}, "
+                         f"handmatig {diff.beschermd_handmatig}, "
+                         f"gepubliceerd {diff.beschermd_gepubliceerd})")
+
+        # Per gebruiker (meeste wijzigingen eerst)
+        per_gebruiker = sorted(diff.invullen_per_gebruiker.items(), key=lambda item: -item[1])
+        for gebruiker_id, aantal in per_gebruiker[:10]:
+            lines.append(f"    - {namen.get(gebruiker_id, gebruiker_id)}: {aantal}")
+        if len(per_gebruiker) > 10:
+            lines.append(f"    ... en {len(per_gebruiker) - 10} anderen")
+        return lines
 
     def genereer(self):
-        """Voer auto-generatie uit"""
-        if not self.actieve_typetabel:
+        """Voer auto-generatie uit: diff tonen, bevestigen, gechunkt toepassen"""
+        if not self.actieve_typetabel or not self.projectie:
             QMessageBox.warning(self, "Fout", "Geen actieve typetabel beschikbaar!")
             return
 
@@ -299,14 +282,32 @@ class AutoGeneratieDialog(QDialog):
             QMessageBox.warning(self, "Validatie Fout", "Start datum moet voor eind datum liggen!")
             return
 
+        # Verse dry-run (planning kan gewijzigd zijn sinds de preview)
+        try:
+            self.diff = bereken_generatie_diff(self.projectie, start_date, eind_date)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Fout", str(e))
+            return
+
+        if not self.diff.invullen:
+            QMessageBox.information(
+                self,
+                "Niets te Genereren",
+                f"Alle cellen zijn al ingevuld of beschermd.\n\n"
+                f"= {self.diff.ongewijzigd} ongewijzigd\n"
+                f"🔒 {self.diff.beschermd} beschermd"
+            )
+            return
+
         # Bevestiging
         reply = QMessageBox.question(
             self,
             "Bevestig Genereren",
-            f"Planning genereren voor {len(self.gebruikers)} gebruikers van "
+            f"Planning genereren voor {len(self.diff.invullen_per_gebruiker)} gebruikers van "
             f"{start_date.strftime('%d-%m-%Y')} t/m {eind_date.strftime('%d-%m-%Y')}?\n\n"
-            f"Lege cellen en typetabel-shifts worden ingevuld.\n"
-            f"Verlof, ziekte en handmatige wijzigingen blijven behouden.",
+            f"✓ {len(self.diff.invullen)} lege cellen worden ingevuld\n"
+            f"= {self.diff.ongewijzigd} cellen zijn al gelijk aan de typetabel\n"
+            f"🔒 {self.diff.beschermd} cellen blijven behouden (verlof, ziekte, handmatig, gepubliceerd)",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.Yes
         )
@@ -316,234 +317,50 @@ class AutoGeneratieDialog(QDialog):
 
         # Genereer planning
         try:
-            records_toegevoegd, records_beschermd = self.genereer_planning(start_date, eind_date)
+            records_toegevoegd, records_beschermd = self.genereer_planning(self.diff)
+        except Exception as e:
+            QMessageBox.critical(self, "Fout", f"Fout bij genereren:\n{str(e)}")
+            return
 
+        if records_toegevoegd < len(self.diff.invullen):
+            QMessageBox.warning(
+                self,
+                "Geannuleerd",
+                f"Generatie geannuleerd.\n\n"
+                f"✓ {records_toegevoegd} van {len(self.diff.invullen)} records reeds gegenereerd"
+            )
+        else:
             QMessageBox.information(
                 self,
                 "Succes",
                 f"✓ {records_toegevoegd} planning records gegenereerd\n"
                 f"🔒 {records_beschermd} records beschermd (niet overschreven)"
             )
-            self.accept()
+        # Ook na annuleren: grid moet de reeds geschreven chunks tonen
+        self.accept()
 
-        except Exception as e:
-            QMessageBox.critical(self, "Fout", f"Fout bij genereren:\n{str(e)}")
-
-    def genereer_planning(self, start_date, eind_date) -> tuple:
+    def genereer_planning(self, diff: GeneratieDiff) -> tuple:
         """
-        Genereer planning records uit typetabel
+        Pas dry-run diff toe in chunks met voortgang (v0.6.29)
+
+        Elke chunk is een eigen korte transactie; annuleren stopt na de
+        lopende chunk.
         Returns: (records_toegevoegd, records_beschermd)
         """
-        conn = get_connection()
-        cursor = conn.cursor()
+        voortgang = QProgressDialog("Planning genereren...", "Annuleren", 0, len(diff.invullen), self)
+        voortgang.setWindowTitle("Auto-Genereren")
+        voortgang.setWindowModality(Qt.WindowModality.WindowModal)
+        voortgang.setMinimumDuration(0)
 
-        records_toegevoegd = 0
-        records_beschermd = 0
-        versie_id = self.actieve_typetabel['id']
-        aantal_weken = self.actieve_typetabel['aantal_weken']
-        actief_vanaf_str = self.actieve_typetabel['actief_vanaf']
+        def update_voortgang(gedaan: int, totaal: int) -> bool:
+            voortgang.setValue(gedaan)
+            voortgang.setLabelText(f"Planning genereren... {gedaan} / {totaal}")
+            QApplication.processEvents()
+            return not voortgang.wasCanceled()
 
-        # Parse actief_vanaf datum
         try:
-            actief_vanaf = datetime.strptime(actief_vanaf_str, "%Y-%m-%d").date()
-        except (ValueError, TypeError):
-            # Fallback als format anders is
-            actief_vanaf = datetime.fromisoformat(actief_vanaf_str).date()
-
-        # Laad alle typetabel data in memory (sneller)
-        cursor.execute("""
-            SELECT week_nummer, dag_nummer, shift_type
-            FROM typetabel_data
-            WHERE versie_id = ?
-        """, (versie_id,))
-
-        typetabel_data = {}
-        for row in cursor.fetchall():
-            key = (row['week_nummer'], row['dag_nummer'])
-            typetabel_data[key] = row['shift_type']
-
-        # Laad gebruiker werkposten mapping (NIEUW - v0.6.14)
-        cursor.execute("""
-            SELECT gebruiker_id, werkpost_id, prioriteit
-            FROM gebruiker_werkposten
-            ORDER BY gebruiker_id, prioriteit
-        """)
-
-        gebruiker_werkposten = {}  # {gebruiker_id: [(werkpost_id, prioriteit), ...]}
-        for row in cursor.fetchall():
-            gebruiker_id = row['gebruiker_id']
-            if gebruiker_id not in gebruiker_werkposten:
-                gebruiker_werkposten[gebruiker_id] = []
-            gebruiker_werkposten[gebruiker_id].append((row['werkpost_id'], row['prioriteit']))
-
-        # Laad shift_codes mapping (NIEUW - v0.6.14)
-        cursor.execute("""
-            SELECT werkpost_id, dag_type, shift_type, code
-            FROM shift_codes
-        """)
-
-        shift_codes_map = {}  # {(werkpost_id, dag_type, shift_type): code}
-        for row in cursor.fetchall():
-            key = (row['werkpost_id'], row['dag_type'], row['shift_type'])
-            shift_codes_map[key] = row['code']
-
-        # Laad alle bestaande planning in memory (sneller dan per query)
-        cursor.execute("""
-            SELECT gebruiker_id, datum, shift_code
-            FROM planning
-            WHERE datum >= ? AND datum <= ?
-        """, (start_date.isoformat(), eind_date.isoformat()))
-
-        bestaande_planning = {}
-        for row in cursor.fetchall():
-            key = (row['gebruiker_id'], row['datum'])
-            bestaande_planning[key] = row['shift_code']
-
-        # Loop door elke gebruiker
-        for gebruiker in self.gebruikers:
-            gebruiker_id = gebruiker['id']
-            startweek = gebruiker['startweek_typedienst'] or 1
-
-            # Haal werkposten van gebruiker op
-            werkposten = gebruiker_werkposten.get(gebruiker_id, [])
-            if not werkposten:
-                # Gebruiker heeft geen werkposten - skip
-                continue
-
-            # Loop door elke datum
-            current_date = start_date
-            while current_date <= eind_date:
-                # Bereken shift voor deze datum (SLIMME VERSIE)
-                shift_code_typetabel = self.bereken_shift_slim(
-                    current_date,
-                    actief_vanaf,
-                    aantal_weken,
-                    startweek,
-                    typetabel_data,
-                    werkposten,
-                    shift_codes_map,
-                    self.feestdagen  # NIEUW: feestdagen meegeven
-                )
-
-                # Check bestaande planning
-                key = (gebruiker_id, current_date.isoformat())
-                bestaande_code = bestaande_planning.get(key)
-
-                # Beslissingslogica
-                if bestaande_code is None:
-                    # Lege cel - altijd invullen
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO planning
-                        (gebruiker_id, datum, shift_code, status)
-                        VALUES (?, ?, ?, 'concept')
-                    """, (gebruiker_id, current_date.isoformat(), shift_code_typetabel))
-                    records_toegevoegd += 1
-
-                elif bestaande_code in self.speciale_codes:
-                    # Speciale code (VV, KD, RX, etc.) - BESCHERMD
-                    records_beschermd += 1
-
-                elif bestaande_code == shift_code_typetabel:
-                    # Zelfde als typetabel - refresh (update timestamp)
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO planning
-                        (gebruiker_id, datum, shift_code, status)
-                        VALUES (?, ?, ?, 'concept')
-                    """, (gebruiker_id, current_date.isoformat(), shift_code_typetabel))
-                    # Niet tellen als nieuw toegevoegd (is refresh)
-
-                else:
-                    # Handmatig aangepaste shift - BESCHERMD
-                    records_beschermd += 1
-
-                current_date += timedelta(days=1)
-
-        conn.commit()
-        conn.close()
-
-        return records_toegevoegd, records_beschermd
-
-    def bereken_shift_slim(self, datum, actief_vanaf, aantal_weken, startweek,
-                           typetabel_data, werkposten, shift_codes_map,
-                           feestdagen) -> Optional[str]:
-        """
-        Bereken shift code voor een specifieke datum en gebruiker (SLIM - v0.6.14)
-
-        Args:
-            datum: Datum waarvoor shift berekend wordt
-            actief_vanaf: Start datum typetabel
-            aantal_weken: Aantal weken in typetabel cyclus
-            startweek: Gebruiker's startweek in cyclus
-            typetabel_data: {(week, dag): shift_type} - bijv. "V", "L", "N"
-            werkposten: [(werkpost_id, prioriteit), ...] voor deze gebruiker
-            shift_codes_map: {(werkpost_id, dag_type, shift_type): code}
-            feestdagen: {datum_str: is_zondagsrust} - feestdagen mapping
-
-        Returns:
-            Concrete shift code (bijv. "7101") of None
-        """
-        # Bereken aantal dagen sinds actief_vanaf
-        dagen_verschil = (datum - actief_vanaf).days
-
-        # Bereken week in cyclus (0-based, dan +1 voor 1-based)
-        # Met startweek offset
-        week_in_cyclus = ((dagen_verschil // 7 + startweek - 1) % aantal_weken) + 1
-
-        # Dag nummer (1=maandag, 7=zondag)
-        dag_nummer = datum.isoweekday()
-
-        # Haal shift_type op uit typetabel (bijv. "V", "L", "N", "dag")
-        key = (week_in_cyclus, dag_nummer)
-        shift_type = typetabel_data.get(key)
-
-        if not shift_type:
-            return None
-
-        # CHECK FEESTDAG: Feestdagen worden behandeld als zondag voor shift codes
-        datum_str = datum.isoformat()
-        is_feestdag = datum_str in feestdagen
-
-        # Bereken dag_type op basis van dag nummer (of feestdag!)
-        if is_feestdag:
-            # Feestdag = altijd zondag shift codes gebruiken (bijv. V → 7701)
-            dag_type = 'zondag'
-        elif dag_nummer == 6:  # Zaterdag
-            dag_type = 'zaterdag'
-        elif dag_nummer == 7:  # Zondag
-            dag_type = 'zondag'
-        else:  # Ma-Vr
-            dag_type = 'weekdag'
-
-        # Check of dit een directe code is (RX, CX, T)
-        # Deze codes moeten niet gemapt worden maar direct overgenomen
-        shift_type_upper = shift_type.upper()
-        if shift_type_upper in ['RX', 'CX', 'T']:
-            # Directe code - return as-is
-            return shift_type_upper
-
-        # Normaliseer shift_type naar shift_codes formaat (V, L, N, D)
-        # Typetabel kan "V", "v", "vroeg" bevatten
-        shift_type_lower = shift_type.lower()
-        if shift_type_lower in ['v', 'vroeg']:
-            shift_type_normalized = 'vroeg'
-        elif shift_type_lower in ['l', 'laat']:
-            shift_type_normalized = 'laat'
-        elif shift_type_lower in ['n', 'nacht']:
-            shift_type_normalized = 'nacht'
-        elif shift_type_lower in ['d', 'dag']:
-            shift_type_normalized = 'dag'
-        else:
-            # Onbekend shift type - return None
-            return None
-
-        # Loop door werkposten (op prioriteit) om match te vinden
-        for werkpost_id, _ in sorted(werkposten, key=lambda x: x[1]):
-            lookup_key = (werkpost_id, dag_type, shift_type_normalized)
-            shift_code = shift_codes_map.get(lookup_key)
-
-            if shift_code:
-                # Match gevonden!
-                return shift_code
+            records_toegevoegd = pas_diff_toe(diff.invullen, voortgang=update_voortgang)
+        finally:
+            voortgang.close()
 
-        # Geen match gevonden in shift_codes - return None
-        return None
+        return records_toegevoegd, diff.beschermd
@@ -0,0 +1,163 @@
+# gui/dialogs/batch_export_dialog.py
+"""
+Batch Export Dialog
+v0.6.29 - Meerdere maanden en/of 1 bestand per teamlid exporteren (process pool)
+"""
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QDateEdit, QMessageBox, QCheckBox,
+                             QGroupBox, QProgressDialog, QApplication)
+from PyQt6.QtCore import QDate, Qt
+from PyQt6.QtGui import QFont
+from gui.styles import Styles, Fonts, Dimensions
+from services.batch_export_service import (EXPORT_DIR, TEAMLEDEN_SUBDIR, BatchExportResultaat,
+                                           exporteer_batch, laad_export_snapshot, maanden_tussen)
+import sqlite3
+
+
+class BatchExportDialog(QDialog):
+    """Dialog voor batch export van een maand bereik"""
+
+    def __init__(self, parent, current_year: int, current_month: int):
+        super().__init__(parent)
+        self.current_year = current_year
+        self.current_month = current_month
+
+        self.setWindowTitle("Batch Export")
+        self.setModal(True)
+        self.resize(500, 380)
+
+        # Instance attributes
+        self.van_maand: QDateEdit = QDateEdit()
+        self.tot_maand: QDateEdit = QDateEdit()
+        self.maand_check: QCheckBox = QCheckBox("1 bestand per maand (met Validatie Rapport)")
+        self.teamlid_check: QCheckBox = QCheckBox("1 bestand per teamlid (1 tab per maand)")
+
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(Dimensions.SPACING_MEDIUM)
+
+        # Title
+        title = QLabel("Batch Export naar Excel")
+        title.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_HEADING, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        # Info box
+        info = QLabel(
+            "Exporteer meerdere maanden in 1 keer (HR formaat).\n"
+            f"Maandbestanden komen in '{EXPORT_DIR}', persoonlijke roosters in "
+            f"'{EXPORT_DIR / TEAMLEDEN_SUBDIR}'.\n"
+            "Bestaande bestanden worden overschreven; de maandstatus wijzigt niet."
+        )
+        info.setStyleSheet(Styles.info_box())
+        info.setWordWrap(True)
+        layout.addWidget(info)
+
+        # Maand bereik group
+        maand_group = QGroupBox("Maanden")
+        maand_layout = QVBoxLayout()
+
+        for label, veld, datum in (
+            ("Van:", self.van_maand, QDate(self.current_year, self.current_month, 1)),
+            ("Tot:", self.tot_maand, QDate(self.current_year, 12, 1)),
+        ):
+            rij = QHBoxLayout()
+            rij.addWidget(QLabel(label))
+            veld.setDisplayFormat("MM-yyyy")
+            veld.setDate(datum)
+            veld.setStyleSheet(Styles.input_field())
+            rij.addWidget(veld)
+            maand_layout.addLayout(rij)
+
+        maand_group.setLayout(maand_layout)
+        layout.addWidget(maand_group)
+
+        # Bestanden group
+        bestanden_group = QGroupBox("Bestanden")
+        bestanden_layout = QVBoxLayout()
+        self.maand_check.setChecked(True)
+        bestanden_layout.addWidget(self.maand_check)
+        bestanden_layout.addWidget(self.teamlid_check)
+        bestanden_group.setLayout(bestanden_layout)
+        layout.addWidget(bestanden_group)
+
+        layout.addStretch()
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        annuleer_btn = QPushButton("Annuleren")
+        annuleer_btn.setStyleSheet(Styles.button_secondary())
+        annuleer_btn.setMinimumHeight(Dimensions.BUTTON_HEIGHT_NORMAL)
+        annuleer_btn.clicked.connect(self.reject)  # type: ignore
+        button_layout.addWidget(annuleer_btn)
+
+        export_btn = QPushButton("Exporteren")
+        export_btn.setStyleSheet(Styles.button_success())
+        export_btn.setMinimumHeight(Dimensions.BUTTON_HEIGHT_NORMAL)
+        export_btn.clicked.connect(self.exporteer)  # type: ignore
+        button_layout.addWidget(export_btn)
+
+        layout.addLayout(button_layout)
+
+    def exporteer(self):
+        """Snapshot laden, bestanden over de process pool schrijven met voortgang"""
+        van = self.van_maand.date()
+        tot = self.tot_maand.date()
+        maanden = maanden_tussen((van.year(), van.month()), (tot.year(), tot.month()))
+
+        if not maanden:
+            QMessageBox.warning(self, "Validatie Fout", "Van maand moet voor tot maand liggen!")
+            return
+        if not self.maand_check.isChecked() and not self.teamlid_check.isChecked():
+            QMessageBox.warning(self, "Validatie Fout", "Kies minstens 1 soort bestand.")
+            return
+
+        voortgang = QProgressDialog("Planning laden...", "Annuleren", 0, 0, self)
+        voortgang.setWindowTitle("Batch Export")
+        voortgang.setWindowModality(Qt.WindowModality.WindowModal)
+        voortgang.setMinimumDuration(0)
+        QApplication.processEvents()
+
+        def update_voortgang(gedaan: int, totaal: int) -> bool:
+            voortgang.setMaximum(totaal)
+            voortgang.setValue(gedaan)
+            voortgang.setLabelText(f"Bestanden exporteren... {gedaan} / {totaal}")
+            QApplication.processEvents()
+            return not voortgang.wasCanceled()
+
+        try:
+            snapshot = laad_export_snapshot(maanden)
+            resultaat = exporteer_batch(
+                maanden,
+                maand_bestanden=self.maand_check.isChecked(),
+                per_teamlid=self.teamlid_check.isChecked(),
+                voortgang=update_voortgang,
+                snapshot=snapshot
+            )
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Fout", str(e))
+            return
+        except Exception as e:
+            QMessageBox.critical(self, "Fout", f"Fout bij batch export:\n{str(e)}")
+            return
+        finally:
+            voortgang.close()
+
+        self.toon_resultaat(resultaat)
+        self.accept()
+
+    def toon_resultaat(self, resultaat: BatchExportResultaat):
+        """Samenvatting + mislukte bestanden (bv. open in Excel)"""
+        tekst = f"✓ {resultaat.samenvatting()}\n\nLocatie: {EXPORT_DIR.absolute()}"
+        if resultaat.fouten:
+            tekst += "\n\nMislukt:\n" + "\n".join(f"• {naam}: {fout}" for naam, fout in resultaat.fouten[:10])
+            if len(resultaat.fouten) > 10:
+                tekst += f"\n... en {len(resultaat.fouten) - 10} anderen"
+            QMessageBox.warning(self, "Batch Export", tekst)
+        elif resultaat.geannuleerd:
+            QMessageBox.warning(self, "Geannuleerd", tekst)
+        else:
+            QMessageBox.information(self, "Batch Export", tekst)
@@ -0,0 +1,159 @@
+# gui/dialogs/geheugen_diagnose_dialog.py
+"""
+Geheugen Diagnose Dialog
+v0.6.29 - Widget aantallen en cache groottes tijdens lange sessies
+
+Geopend via Ctrl+Shift+M (main.py). Toont hoeveel widgets er leven per
+klasse, welke schermen in de stack/cache zitten en hoe groot de caches zijn,
+zodat geheugengroei tijdens een werkdag zichtbaar wordt.
+"""
+import gc
+from collections import Counter
+from typing import List, Tuple
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QGroupBox, QStackedWidget, QApplication)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+from gui.styles import Styles, Fonts, Dimensions, TableConfig
+from gui.scherm_cache import SchermCache
+from gui.widgets.cel_stijlen import CelStijlCache, css_naar_qcolor
+from gui.widgets.grid_kalender_base import GridKalenderBase
+from services.validation_cache import ValidationCache
+
+
+# Aantal widget klassen in de tabel (rest opgeteld als "Overige")
+MAX_WIDGET_KLASSEN = 25
+
+
+class GeheugenDiagnoseDialog(QDialog):
+    """Overzicht van levende widgets en cache groottes"""
+
+    def __init__(self, parent, stack: QStackedWidget, scherm_cache: SchermCache):
+        super().__init__(parent)
+        self.stack = stack
+        self.scherm_cache = scherm_cache
+
+        self.setWindowTitle("Geheugen Diagnose")
+        self.setMinimumSize(800, 600)
+
+        # Instance attributes
+        self.totaal_label: QLabel = QLabel()
+        self.widget_tabel: QTableWidget = QTableWidget()
+        self.cache_tabel: QTableWidget = QTableWidget()
+
+        self.init_ui()
+        self.load_data()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(Dimensions.SPACING_MEDIUM)
+
+        title = QLabel("Geheugen Diagnose")
+        title.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_HEADING, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        self.totaal_label.setStyleSheet(Styles.info_box())
+        layout.addWidget(self.totaal_label)
+
+        tabellen_layout = QHBoxLayout()
+        for titel, tabel, kolommen in (
+            ("WIDGETS PER KLASSE", self.widget_tabel, ["Klasse", "Aantal"]),
+            ("CACHES", self.cache_tabel, ["Cache", "Grootte"]),
+        ):
+            group = QGroupBox(titel)
+            group_layout = QVBoxLayout()
+            tabel.setColumnCount(2)
+            tabel.setHorizontalHeaderLabels(kolommen)
+            TableConfig.setup_table_widget(tabel, row_height=30)
+            header = tabel.horizontalHeader()
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+            group_layout.addWidget(tabel)
+            group.setLayout(group_layout)
+            tabellen_layout.addWidget(group)
+        layout.addLayout(tabellen_layout)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+
+        legen_btn = QPushButton("Caches Legen")
+        legen_btn.setStyleSheet(Styles.button_warning())
+        legen_btn.setToolTip("Validatie cache en bewaarde schermen vrijgeven")
+        legen_btn.clicked.connect(self.caches_legen)  # type: ignore
+        button_layout.addWidget(legen_btn)
+
+        button_layout.addStretch()
+
+        vernieuw_btn = QPushButton("Vernieuwen")
+        vernieuw_btn.setStyleSheet(Styles.button_secondary())
+        vernieuw_btn.clicked.connect(self.load_data)  # type: ignore
+        button_layout.addWidget(vernieuw_btn)
+
+        sluiten_btn = QPushButton("Sluiten")
+        sluiten_btn.setStyleSheet(Styles.button_primary())
+        sluiten_btn.clicked.connect(self.accept)  # type: ignore
+        button_layout.addWidget(sluiten_btn)
+
+        layout.addLayout(button_layout)
+
+    def load_data(self):
+        """Tel widgets en lees cache statistieken"""
+        widgets = QApplication.allWidgets()
+        per_klasse = Counter(type(widget).__name__ for widget in widgets)
+
+        rijen = per_klasse.most_common(MAX_WIDGET_KLASSEN)
+        overige = sum(per_klasse.values()) - sum(aantal for _, aantal in rijen)
+        if overige:
+            rijen.append(("Overige", overige))
+        self.vul_tabel(self.widget_tabel, [(klasse, str(aantal)) for klasse, aantal in rijen])
+        self.vul_tabel(self.cache_tabel, self.get_cache_rijen())
+
+        self.totaal_label.setText(
+            f"{len(widgets)} widgets in {len(per_klasse)} klassen - "
+            f"{len(gc.get_objects())} Python objecten"
+        )
+
+    def get_cache_rijen(self) -> List[Tuple[str, str]]:
+        schermen = [self.stack.widget(i) for i in range(self.stack.count())]
+        rijen = [
+            ("Schermen in stack", ", ".join(type(scherm).__name__ for scherm in schermen)),
+            ("Bewaarde schermen",
+             f"{len(self.scherm_cache)} / {self.scherm_cache.max_schermen}"
+             + (f" ({', '.join(self.scherm_cache.sleutels())})" if len(self.scherm_cache) else "")),
+        ]
+
+        validatie = ValidationCache.get_instance().get_stats()
+        rijen.append(("Validatie cache",
+                      f"{validatie['cache_size']} / {validatie['max_dagen']} dagen, "
+                      f"{validatie['dirty_dates']} dirty, hit rate {validatie['hit_rate']}, "
+                      f"{validatie['evictions']} verwijderd"))
+
+        stijlen = CelStijlCache.get_stats()
+        rijen.append(("Cel stijlen", f"{stijlen['stijlen']} stijlen, {stijlen['property_ids']} ids"))
+        kleuren = css_naar_qcolor.cache_info()
+        rijen.append(("Kleur cache", f"{kleuren.currsize} / {kleuren.maxsize}"))
+
+        for scherm in schermen:
+            for kalender in scherm.findChildren(GridKalenderBase):
+                stats = kalender.get_geheugen_stats()
+                rijen.append((
+                    f"{type(kalender).__name__} ({kalender.maand:02d}/{kalender.jaar})",
+                    ", ".join(f"{naam}: {waarde}" for naam, waarde in stats.items())
+                ))
+        return rijen
+
+    @staticmethod
+    def vul_tabel(tabel: QTableWidget, rijen: List[Tuple[str, str]]):
+        tabel.setRowCount(len(rijen))
+        for row, (naam, waarde) in enumerate(rijen):
+            tabel.setItem(row, 0, QTableWidgetItem(naam))
+            waarde_item = QTableWidgetItem(waarde)
+            waarde_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            tabel.setItem(row, 1, waarde_item)
+
+    def caches_legen(self):
+        ValidationCache.get_instance().clear()
+        self.scherm_cache.leeg()
+        gc.collect()
+        self.load_data()
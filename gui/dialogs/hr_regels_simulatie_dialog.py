@@ -0,0 +1,213 @@
+# gui/dialogs/hr_regels_simulatie_dialog.py
+"""
+HR Regels Simulatie Dialog
+v0.6.29 - What-if: alternatieve HR regels op de planning van de laatste maanden
+
+Links: huidige waarde + alternatieve waarde per regel.
+Rechts: violations per regel en per gebruiker, huidig vs alternatief.
+De live regels in hr_regels blijven ongewijzigd.
+"""
+import time
+from typing import Dict, Any, Optional
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTableWidget, QTableWidgetItem, QSpinBox, QDoubleSpinBox,
+                             QLineEdit, QMessageBox, QHeaderView, QGridLayout, QGroupBox,
+                             QWidget)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QColor
+from gui.styles import Styles, Colors, Fonts, Dimensions
+from services.hr_regels_simulatie import SimulatieBron, WhatIfResultaat, laad_simulatie_bron, simuleer
+
+
+# (hr_config sleutel, eenheid) die in de simulatie aanpasbaar zijn
+SIMULEERBARE_REGELS = [
+    ('min_rust_uren', 'uur'),
+    ('max_uren_week', 'uur'),
+    ('max_werkdagen_cyclus', 'dagen'),
+    ('max_dagen_tussen_rx', 'dagen'),
+    ('max_werkdagen_reeks', 'dagen'),
+    ('max_weekends_achter_elkaar', 'dagen'),
+    ('week_definitie', 'periode'),
+    ('weekend_definitie', 'periode'),
+]
+
+
+class HRRegelsSimulatieDialog(QDialog):
+    """What-if simulatie van HR regel wijzigingen"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.bron: Optional[SimulatieBron] = None
+        self.resultaat: Optional[WhatIfResultaat] = None
+
+        self.setWindowTitle("HR Regels - What-if Simulatie")
+        self.setMinimumSize(1000, 600)
+
+        # Instance attributes
+        self.maanden_spin: QSpinBox = QSpinBox()
+        self.editors: Dict[str, QWidget] = {}
+        self.huidig_labels: Dict[str, QLabel] = {}
+        self.samenvatting_label: QLabel = QLabel()
+        self.regel_table: QTableWidget = QTableWidget()
+        self.gebruiker_table: QTableWidget = QTableWidget()
+
+        self.init_ui()
+        self.load_data()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(Dimensions.SPACING_MEDIUM)
+
+        title = QLabel("What-if Simulatie")
+        title.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_HEADING, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        periode_layout = QHBoxLayout()
+        periode_layout.addWidget(QLabel("Planning van de laatste"))
+        self.maanden_spin.setRange(1, 24)
+        self.maanden_spin.setValue(6)
+        periode_layout.addWidget(self.maanden_spin)
+        periode_layout.addWidget(QLabel("maanden"))
+        laad_btn = QPushButton("Laden")
+        laad_btn.setStyleSheet(Styles.button_secondary(Dimensions.BUTTON_HEIGHT_TINY))
+        laad_btn.clicked.connect(self.load_data)  # type: ignore
+        periode_layout.addWidget(laad_btn)
+        periode_layout.addStretch()
+        layout.addLayout(periode_layout)
+
+        inhoud_layout = QHBoxLayout()
+
+        # Alternatieve regels
+        regels_group = QGroupBox("Alternatieve regels")
+        grid = QGridLayout()
+        grid.addWidget(QLabel("Regel"), 0, 0)
+        grid.addWidget(QLabel("Huidig"), 0, 1)
+        grid.addWidget(QLabel("Alternatief"), 0, 2)
+        for rij, (sleutel, eenheid) in enumerate(SIMULEERBARE_REGELS, start=1):
+            grid.addWidget(QLabel(sleutel.replace('_', ' ').capitalize()), rij, 0)
+            huidig_label = QLabel("-")
+            grid.addWidget(huidig_label, rij, 1)
+            self.huidig_labels[sleutel] = huidig_label
+
+            if eenheid == 'uur':
+                editor = QDoubleSpinBox()
+                editor.setRange(0, 168)
+                editor.setDecimals(1)
+                editor.setSuffix(" u")
+            elif eenheid == 'dagen':
+                editor = QSpinBox()
+                editor.setRange(0, 365)
+            else:
+                editor = QLineEdit()
+                editor.setPlaceholderText("ma-00:00|zo-23:59")
+            grid.addWidget(editor, rij, 2)
+            self.editors[sleutel] = editor
+
+        simuleer_btn = QPushButton("Simuleren")
+        simuleer_btn.setStyleSheet(Styles.button_primary(Dimensions.BUTTON_HEIGHT_TINY))
+        simuleer_btn.clicked.connect(self.simuleer)  # type: ignore
+        grid.addWidget(simuleer_btn, len(SIMULEERBARE_REGELS) + 1, 2)
+        regels_group.setLayout(grid)
+        inhoud_layout.addWidget(regels_group)
+
+        # Resultaten
+        resultaat_layout = QVBoxLayout()
+        self.samenvatting_label.setStyleSheet(Styles.info_box())
+        self.samenvatting_label.setWordWrap(True)
+        resultaat_layout.addWidget(self.samenvatting_label)
+
+        for table, eerste_kolom in ((self.regel_table, "Regel"), (self.gebruiker_table, "Gebruiker")):
+            table.setColumnCount(4)
+            table.setHorizontalHeaderLabels([eerste_kolom, "Huidig", "Alternatief", "Verschil"])
+            table.verticalHeader().setVisible(False)
+            table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+            resultaat_layout.addWidget(table)
+        inhoud_layout.addLayout(resultaat_layout, stretch=1)
+        layout.addLayout(inhoud_layout)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        sluiten_btn = QPushButton("Sluiten")
+        sluiten_btn.setStyleSheet(Styles.button_secondary())
+        sluiten_btn.clicked.connect(self.accept)  # type: ignore
+        button_layout.addWidget(sluiten_btn)
+        layout.addLayout(button_layout)
+
+    def load_data(self):
+        """Planning historiek + huidige regels laden, editors resetten"""
+        self.bron = laad_simulatie_bron(self.maanden_spin.value())
+        for sleutel, eenheid in SIMULEERBARE_REGELS:
+            waarde = self.bron.hr_config.get(sleutel)
+            self.huidig_labels[sleutel].setText(str(waarde))
+            editor = self.editors[sleutel]
+            if eenheid == 'uur':
+                editor.setValue(float(waarde))
+            elif eenheid == 'dagen':
+                editor.setValue(int(waarde))
+            else:
+                editor.setText(str(waarde))
+        self.simuleer()
+
+    def alternatief_config(self) -> Dict[str, Any]:
+        """Huidige config met de waarden uit de editors"""
+        config = dict(self.bron.hr_config)
+        for sleutel, eenheid in SIMULEERBARE_REGELS:
+            editor = self.editors[sleutel]
+            if eenheid == 'uur':
+                config[sleutel] = float(editor.value())
+            elif eenheid == 'dagen':
+                config[sleutel] = int(editor.value())
+            else:
+                config[sleutel] = editor.text().strip()
+        return config
+
+    def simuleer(self):
+        if self.bron is None:
+            return
+        begin = time.perf_counter()
+        try:
+            self.resultaat = simuleer(self.bron, self.alternatief_config())
+        except (ValueError, KeyError) as e:
+            QMessageBox.warning(self, "Ongeldige regel",
+                                f"Alternatieve regels ongeldig (periode formaat: ma-00:00|zo-23:59):\n{e}")
+            return
+        duur = time.perf_counter() - begin
+
+        self.vul_tabellen()
+        gewijzigd = ", ".join(self.resultaat.gewijzigde_regels) or "geen"
+        self.samenvatting_label.setText(
+            f"{len(self.bron.planning)} gebruikers, {self.bron.van.strftime('%d-%m-%Y')} t/m "
+            f"{self.bron.tot.strftime('%d-%m-%Y')}. Herberekende regels: {gewijzigd}. "
+            f"Berekend in {duur * 1000:.0f} ms."
+        )
+
+    def vul_tabellen(self):
+        resultaat = self.resultaat
+
+        per_regel = resultaat.per_regel()
+        self.regel_table.setRowCount(len(per_regel))
+        for rij, (regel, huidig, alternatief) in enumerate(per_regel):
+            self._vul_rij(self.regel_table, rij, regel.replace('_', ' '), huidig, alternatief,
+                          vet=regel in resultaat.gewijzigde_regels)
+
+        per_gebruiker = resultaat.per_gebruiker()
+        self.gebruiker_table.setRowCount(len(per_gebruiker))
+        for rij, (gebruiker_id, huidig, alternatief) in enumerate(per_gebruiker):
+            naam = self.bron.namen.get(gebruiker_id, str(gebruiker_id))
+            self._vul_rij(self.gebruiker_table, rij, naam, huidig, alternatief)
+
+    @staticmethod
+    def _vul_rij(table: QTableWidget, rij: int, naam: str, huidig: int, alternatief: int,
+                 vet: bool = False):
+        verschil = alternatief - huidig
+        naam_item = QTableWidgetItem(naam)
+        if vet:
+            naam_item.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_NORMAL, QFont.Weight.Bold))
+        table.setItem(rij, 0, naam_item)
+        for kolom, waarde in ((1, str(huidig)), (2, str(alternatief)), (3, f"{verschil:+d}")):
+            item = QTableWidgetItem(waarde)
+            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            table.setItem(rij, kolom, item)
+        if verschil:
+            table.item(rij, 3).setForeground(QColor(Colors.DANGER if verschil > 0 else Colors.SUCCESS))
@@ -0,0 +1,195 @@
+# gui/dialogs/planning_prognose_dialog.py
+"""
+Planning Prognose Dialog
+v0.6.29 - HR overtredingen + onderbemanning per maand, VOOR generatie
+
+Links: startweek per gebruiker (aanpasbaar, enkel in deze simulatie).
+Rechts: per maand het aantal HR errors/warnings, onderbemande en dubbel
+bemande dagen en verlofdagen. Herberekenen gebruikt de 1x geladen data,
+er wordt niets in de planning geschreven.
+"""
+import time
+from datetime import date
+from typing import Dict, Any, List, Optional
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QTableWidget, QTableWidgetItem,
+                             QDateEdit, QSpinBox, QMessageBox, QHeaderView)
+from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtGui import QFont
+from gui.styles import Styles, Fonts, Dimensions
+from gui.dialogs.typetabel_dekking_dialog import KLEUR_GAT, KLEUR_GEDEKT, KLEUR_DUBBEL
+from services.planning_prognose import (
+    MaandPrognose, PrognoseBron, bereken_prognose, laad_prognose_bron
+)
+
+MAAND_NAMEN = ['jan', 'feb', 'mrt', 'apr', 'mei', 'jun',
+               'jul', 'aug', 'sep', 'okt', 'nov', 'dec']
+
+
+class PlanningPrognoseDialog(QDialog):
+    """Prognose voor 1 typetabel versie met het huidige team"""
+
+    def __init__(self, parent, versie: Dict[str, Any]):
+        super().__init__(parent)
+        self.versie = versie
+        self.bron: Optional[PrognoseBron] = None
+        self.bron_start: Optional[date] = None
+        self.maanden: List[MaandPrognose] = []
+
+        self.setWindowTitle(f"Prognose - {versie['versie_naam']}")
+        self.setMinimumSize(1000, 550)
+
+        # Instance attributes
+        self.start_edit: QDateEdit = QDateEdit()
+        self.maanden_spin: QSpinBox = QSpinBox()
+        self.gebruikers_table: QTableWidget = QTableWidget()
+        self.resultaat_table: QTableWidget = QTableWidget()
+        self.samenvatting_label: QLabel = QLabel()
+        self.startweek_spins: Dict[int, QSpinBox] = {}
+
+        self.init_ui()
+        self.load_data()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(Dimensions.SPACING_MEDIUM)
+
+        title = QLabel(f"Prognose: {self.versie['versie_naam']}")
+        title.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_HEADING, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        # Periode
+        periode_layout = QHBoxLayout()
+        periode_layout.addWidget(QLabel("Vanaf maand:"))
+        self.start_edit.setCalendarPopup(True)
+        self.start_edit.setDisplayFormat("MM-yyyy")
+        vandaag = date.today()
+        self.start_edit.setDate(QDate(vandaag.year, vandaag.month, 1))
+        periode_layout.addWidget(self.start_edit)
+
+        periode_layout.addWidget(QLabel("Aantal maanden:"))
+        self.maanden_spin.setRange(1, 24)
+        self.maanden_spin.setValue(12)
+        periode_layout.addWidget(self.maanden_spin)
+
+        bereken_btn = QPushButton("Herberekenen")
+        bereken_btn.setStyleSheet(Styles.button_primary(Dimensions.BUTTON_HEIGHT_TINY))
+        bereken_btn.clicked.connect(self.herbereken)  # type: ignore
+        periode_layout.addWidget(bereken_btn)
+        periode_layout.addStretch()
+        layout.addLayout(periode_layout)
+
+        self.samenvatting_label.setStyleSheet(Styles.info_box())
+        self.samenvatting_label.setWordWrap(True)
+        layout.addWidget(self.samenvatting_label)
+
+        tabellen_layout = QHBoxLayout()
+
+        # Startweken (what-if)
+        self.gebruikers_table.setColumnCount(2)
+        self.gebruikers_table.setHorizontalHeaderLabels(["Gebruiker", "Startweek"])
+        self.gebruikers_table.verticalHeader().setVisible(False)
+        self.gebruikers_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.gebruikers_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.gebruikers_table.setMaximumWidth(320)
+        tabellen_layout.addWidget(self.gebruikers_table)
+
+        # Resultaat per maand
+        self.resultaat_table.setColumnCount(6)
+        self.resultaat_table.setHorizontalHeaderLabels(
+            ["Maand", "HR errors", "HR warnings", "Onderbemand", "Dubbel", "Verlofdagen"])
+        self.resultaat_table.verticalHeader().setVisible(False)
+        self.resultaat_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.resultaat_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        tabellen_layout.addWidget(self.resultaat_table)
+        layout.addLayout(tabellen_layout)
+
+        info = QLabel("Typetabel + goedgekeurd verlof, zonder handmatige aanpassingen. "
+                      "Startweken hier aanpassen wijzigt niets in de database.")
+        info.setStyleSheet(f"font-size: {Fonts.SIZE_SMALL}px;")
+        info.setWordWrap(True)
+        layout.addWidget(info)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        sluiten_btn = QPushButton("Sluiten")
+        sluiten_btn.setStyleSheet(Styles.button_secondary())
+        sluiten_btn.clicked.connect(self.accept)  # type: ignore
+        button_layout.addWidget(sluiten_btn)
+        layout.addLayout(button_layout)
+
+    def load_data(self):
+        """Statische data 1x laden, daarna berekenen"""
+        self.bron_start = self.start_edit.date().toPyDate()
+        self.bron = laad_prognose_bron(self.versie['id'], start=self.bron_start)
+        if self.bron is None:
+            QMessageBox.warning(self, "Prognose", "Typetabel versie niet gevonden.")
+            return
+
+        gebruikers = sorted(self.bron.projectie.gebruikers,
+                            key=lambda g: self.bron.namen.get(g.gebruiker_id, ''))
+        self.gebruikers_table.setRowCount(len(gebruikers))
+        self.startweek_spins = {}
+        for rij, gebruiker in enumerate(gebruikers):
+            self.gebruikers_table.setItem(
+                rij, 0, QTableWidgetItem(self.bron.namen.get(gebruiker.gebruiker_id, str(gebruiker.gebruiker_id))))
+            spin = QSpinBox()
+            spin.setRange(1, self.bron.projectie.aantal_weken)
+            spin.setValue((gebruiker.startweek - 1) % self.bron.projectie.aantal_weken + 1)
+            self.gebruikers_table.setCellWidget(rij, 1, spin)
+            self.startweek_spins[gebruiker.gebruiker_id] = spin
+
+        self.herbereken()
+
+    def herbereken(self):
+        """Prognose opnieuw met de huidige periode en startweken"""
+        if self.bron is None:
+            return
+        start = self.start_edit.date().toPyDate()
+        if start != self.bron_start:
+            # Verlof range + concept activatie hangen af van de startmaand
+            self.bron = laad_prognose_bron(self.versie['id'], start=start)
+            self.bron_start = start
+        startweken = {gebruiker_id: spin.value() for gebruiker_id, spin in self.startweek_spins.items()}
+
+        begin = time.perf_counter()
+        self.maanden = bereken_prognose(self.bron, start, self.maanden_spin.value(), startweken)
+        duur = time.perf_counter() - begin
+
+        self.vul_resultaat()
+        totaal_errors = sum(len(m.errors) for m in self.maanden)
+        totaal_onderbemand = sum(len(m.onderbemand) for m in self.maanden)
+        kritisch = "" if self.bron.kritische_codes else " (geen kritische shift codes gedefinieerd)"
+        self.samenvatting_label.setText(
+            f"{len(self.startweek_spins)} gebruikers, {len(self.maanden)} maanden: "
+            f"{totaal_errors} HR errors, {totaal_onderbemand} onderbemande dagen{kritisch}. "
+            f"Berekend in {duur * 1000:.0f} ms."
+        )
+
+    def vul_resultaat(self):
+        self.resultaat_table.setRowCount(len(self.maanden))
+        for rij, maand in enumerate(self.maanden):
+            errors = len(maand.errors)
+            warnings = len(maand.violations) - errors
+            cellen = [f"{MAAND_NAMEN[maand.maand - 1]} {maand.jaar}", str(errors), str(warnings),
+                      str(len(maand.onderbemand)), str(len(maand.dubbel)), str(maand.verlof_dagen)]
+            for kolom, tekst in enumerate(cellen):
+                item = QTableWidgetItem(tekst)
+                if kolom > 0:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.resultaat_table.setItem(rij, kolom, item)
+
+            # Details als tooltip
+            hr_item = self.resultaat_table.item(rij, 1)
+            hr_item.setBackground(KLEUR_GAT if errors else KLEUR_GEDEKT)
+            if maand.violations:
+                hr_item.setToolTip("\n".join(f"{regel}: {aantal}"
+                                             for regel, aantal in sorted(maand.violations_per_type.items())))
+
+            bemand_item = self.resultaat_table.item(rij, 3)
+            bemand_item.setBackground(KLEUR_GAT if maand.onderbemand else KLEUR_GEDEKT)
+            if maand.gaten:
+                bemand_item.setToolTip("\n".join(f"{datum.strftime('%d-%m')}: {code}"
+                                                 for datum, code in maand.gaten[:20]))
+            if maand.dubbel:
+                self.resultaat_table.item(rij, 4).setBackground(KLEUR_DUBBEL)
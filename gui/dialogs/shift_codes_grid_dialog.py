@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtGui import QFont
 from database.connection import get_connection
 from gui.styles import Styles, Colors, Fonts, Dimensions
+from services.referentie_catalogus import ReferentieCatalogus
 import sqlite3
 
 
@@ -337,6 +338,7 @@ class ShiftCodesGridDialog(QDialog):
 
             conn.commit()
             conn.close()
+            ReferentieCatalogus.invalideer()
 
             QMessageBox.information(self, "Succes", "Shift codes opgeslagen!")
             self.accept()
@@ -0,0 +1,161 @@
+# gui/dialogs/typetabel_dekking_dialog.py
+"""
+Typetabel Dekking Dialog
+v0.6.29 - Heatmap: kritische shifts per cyclusdag met het echte team
+
+Rijen = werkpost + shift type, kolommen = dagen van 1 cyclus vanaf de
+gekozen startdatum. Cel = aantal gebruikers met die kritische code:
+rood = gat, groen = 1, oranje = dubbel, grijs = niet verwacht die dag.
+Bovenste rij = dag status (zelfde kleuren als de planner overlay).
+"""
+from datetime import date
+from typing import Dict, Any, Optional
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QTableWidget, QTableWidgetItem,
+                             QDateEdit, QMessageBox)
+from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtGui import QFont, QColor
+from gui.styles import Styles, Fonts, Dimensions
+from services.typetabel_dekking import DekkingsAnalyse, laad_dekking, volgende_maandag
+
+
+# Heatmap kleuren (zelfde tinten als de bemannings overlay in de planner)
+KLEUR_GAT = QColor(229, 115, 115)
+KLEUR_GEDEKT = QColor(129, 199, 132)
+KLEUR_DUBBEL = QColor(251, 140, 0)
+KLEUR_NIET_VERWACHT = QColor(238, 238, 238)
+STATUS_KLEUREN = {'groen': KLEUR_GEDEKT, 'geel': KLEUR_DUBBEL, 'rood': KLEUR_GAT}
+
+DAG_AFKORTINGEN = ['ma', 'di', 'wo', 'do', 'vr', 'za', 'zo']
+
+
+class TypetabelDekkingDialog(QDialog):
+    """Dekkingsanalyse van 1 typetabel versie"""
+
+    def __init__(self, parent, versie: Dict[str, Any]):
+        super().__init__(parent)
+        self.versie = versie
+        self.analyse: Optional[DekkingsAnalyse] = None
+
+        self.setWindowTitle(f"Dekking - {versie['versie_naam']}")
+        self.setMinimumSize(1100, 500)
+
+        # Instance attributes
+        self.start_edit: QDateEdit = QDateEdit()
+        self.samenvatting_label: QLabel = QLabel()
+        self.heatmap: QTableWidget = QTableWidget()
+
+        self.init_ui()
+        self.load_data()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(Dimensions.SPACING_MEDIUM)
+
+        title = QLabel(f"Dekking: {self.versie['versie_naam']}")
+        title.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_HEADING, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        # Startdatum van de geanalyseerde cyclus
+        start_layout = QHBoxLayout()
+        start_layout.addWidget(QLabel("Cyclus vanaf:"))
+        self.start_edit.setCalendarPopup(True)
+        self.start_edit.setDisplayFormat("dd-MM-yyyy")
+        if self.versie.get('actief_vanaf'):
+            actief_vanaf = date.fromisoformat(self.versie['actief_vanaf'][:10])
+            self.start_edit.setDate(QDate(actief_vanaf.year, actief_vanaf.month, actief_vanaf.day))
+        else:
+            # Concept: startweken gelden vanaf de eerstvolgende maandag
+            maandag = volgende_maandag(date.today())
+            self.start_edit.setDate(QDate(maandag.year, maandag.month, maandag.day))
+        start_layout.addWidget(self.start_edit)
+
+        bereken_btn = QPushButton("Berekenen")
+        bereken_btn.setStyleSheet(Styles.button_primary(Dimensions.BUTTON_HEIGHT_TINY))
+        bereken_btn.clicked.connect(self.load_data)  # type: ignore
+        start_layout.addWidget(bereken_btn)
+        start_layout.addStretch()
+        layout.addLayout(start_layout)
+
+        self.samenvatting_label.setStyleSheet(Styles.info_box())
+        self.samenvatting_label.setWordWrap(True)
+        layout.addWidget(self.samenvatting_label)
+
+        self.heatmap.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.heatmap.horizontalHeader().setDefaultSectionSize(34)
+        self.heatmap.verticalHeader().setDefaultSectionSize(26)
+        layout.addWidget(self.heatmap)
+
+        legende = QLabel("Rood = niet gedekt  |  Groen = 1x  |  Oranje = dubbel  |  "
+                         "Grijs = niet verwacht  |  * = feestdag (zondag codes)")
+        legende.setStyleSheet(f"font-size: {Fonts.SIZE_SMALL}px;")
+        layout.addWidget(legende)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        sluiten_btn = QPushButton("Sluiten")
+        sluiten_btn.setStyleSheet(Styles.button_secondary())
+        sluiten_btn.clicked.connect(self.accept)  # type: ignore
+        button_layout.addWidget(sluiten_btn)
+        layout.addLayout(button_layout)
+
+    def load_data(self):
+        """Analyse (her)berekenen vanaf de gekozen startdatum"""
+        start = self.start_edit.date().toPyDate()
+        self.analyse = laad_dekking(self.versie['id'], start_datum=start)
+        if self.analyse is None:
+            QMessageBox.warning(self, "Dekking", "Typetabel versie niet gevonden.")
+            return
+        if not self.analyse.rijen:
+            self.samenvatting_label.setText(
+                "Geen kritische shift codes gedefinieerd (Shift Codes beheer → Kritisch).")
+        self.vul_heatmap()
+
+    def vul_heatmap(self):
+        analyse = self.analyse
+        aantal_dagen = len(analyse.datums)
+
+        self.heatmap.clear()
+        self.heatmap.setRowCount(len(analyse.rijen) + 1)
+        self.heatmap.setColumnCount(aantal_dagen)
+
+        # Kolom headers: cyclusweek + dag, feestdag gemarkeerd
+        for dag, datum in enumerate(analyse.datums):
+            feestdag = "*" if datum in analyse.feestdagen else ""
+            item = QTableWidgetItem(f"W{dag // 7 + 1}\n{DAG_AFKORTINGEN[datum.weekday()]}{feestdag}")
+            item.setToolTip(datum.strftime('%d-%m-%Y'))
+            self.heatmap.setHorizontalHeaderItem(dag, item)
+
+        self.heatmap.setVerticalHeaderLabels(
+            ["Status"] + [f"{werkpost} {shift_type}" for werkpost, shift_type in analyse.rijen])
+
+        # Status rij
+        for dag in range(aantal_dagen):
+            item = QTableWidgetItem()
+            item.setBackground(STATUS_KLEUREN[analyse.status(dag)])
+            item.setToolTip(analyse.datums[dag].strftime('%d-%m-%Y'))
+            self.heatmap.setItem(0, dag, item)
+
+        # Telling per kritische code
+        for r in range(len(analyse.rijen)):
+            for dag in range(aantal_dagen):
+                code = analyse.codes[r][dag]
+                item = QTableWidgetItem()
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                if code is None:
+                    item.setBackground(KLEUR_NIET_VERWACHT)
+                else:
+                    aantal = analyse.aantallen[r][dag]
+                    item.setText(str(aantal))
+                    item.setBackground(KLEUR_GAT if aantal == 0 else
+                                       KLEUR_GEDEKT if aantal == 1 else KLEUR_DUBBEL)
+                    item.setToolTip(f"{code} op {analyse.datums[dag].strftime('%d-%m-%Y')}: {aantal}x")
+                self.heatmap.setItem(r + 1, dag, item)
+
+        if analyse.rijen:
+            samenvatting = analyse.samenvatting()
+            self.samenvatting_label.setText(
+                f"{analyse.aantal_gebruikers} gebruikers, {samenvatting['totaal']} dagen: "
+                f"{samenvatting['volledig']} volledig, {samenvatting['dubbel']} dubbel, "
+                f"{samenvatting['onvolledig']} onvolledig ({len(analyse.gaten())} ontbrekende shifts)"
+            )
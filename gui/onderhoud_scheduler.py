@@ -0,0 +1,102 @@
+# gui/onderhoud_scheduler.py
+"""
+Database Onderhoud Scheduler
+v0.6.29 - Voert database onderhoud uit wanneer de applicatie idle is
+
+- Application-wide event filter houdt laatste gebruikers input bij
+- Timer controleert elke minuut of de app lang genoeg idle is
+- Onderhoud draait in QThreadPool (GUI blijft responsief)
+- Leader election in services.database_onderhoud_service zorgt dat
+  maar één client op de netwerkshare onderhoud doet
+"""
+import time
+from PyQt6.QtCore import QObject, QEvent, QTimer, QRunnable, QThreadPool, pyqtSignal
+
+from services.database_onderhoud_service import voer_onderhoud_uit
+
+
+class _OnderhoudSignalen(QObject):
+    """Signalen vanuit worker thread (QRunnable is geen QObject)"""
+    klaar = pyqtSignal(list)
+
+
+class _OnderhoudTaak(QRunnable):
+    """Worker die één onderhoudsronde uitvoert"""
+
+    def __init__(self, forceer: bool = False):
+        super().__init__()
+        self.forceer = forceer
+        self.signalen = _OnderhoudSignalen()
+
+    def run(self) -> None:
+        resultaten = voer_onderhoud_uit(forceer=self.forceer)
+        self.signalen.klaar.emit(resultaten)
+
+
+class DatabaseOnderhoudScheduler(QObject):
+    """
+    Idle-gebaseerde onderhoud scheduler
+
+    Usage (main.py):
+        scheduler = DatabaseOnderhoudScheduler(app, idle_minuten=5)
+        scheduler.start()
+    """
+
+    onderhoud_klaar = pyqtSignal(list)  # list van resultaat dicts
+
+    INPUT_EVENTS = {
+        QEvent.Type.MouseButtonPress,
+        QEvent.Type.MouseMove,
+        QEvent.Type.KeyPress,
+        QEvent.Type.Wheel,
+    }
+
+    def __init__(self, app: QObject, idle_minuten: int = 5, check_interval_ms: int = 60_000):
+        super().__init__(app)
+        self.app = app
+        self.idle_seconden = idle_minuten * 60
+        self.laatste_input = time.monotonic()
+        self.bezig = False
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(check_interval_ms)
+        self.timer.timeout.connect(self.check_idle)  # type: ignore
+
+    def start(self) -> None:
+        """Start event filter + timer"""
+        self.app.installEventFilter(self)
+        self.timer.start()
+
+    def stop(self) -> None:
+        """Stop scheduler"""
+        self.timer.stop()
+        self.app.removeEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:  # type: ignore
+        """Registreer gebruikers input (event wordt nooit onderschept)"""
+        if event.type() in self.INPUT_EVENTS:
+            self.laatste_input = time.monotonic()
+        return False
+
+    def is_idle(self) -> bool:
+        return time.monotonic() - self.laatste_input >= self.idle_seconden
+
+    def check_idle(self) -> None:
+        """Timer callback: start onderhoud als app idle is"""
+        if self.bezig or not self.is_idle():
+            return
+        self.start_onderhoud()
+
+    def start_onderhoud(self, forceer: bool = False) -> None:
+        """Start onderhoudsronde in thread pool"""
+        if self.bezig:
+            return
+
+        self.bezig = True
+        taak = _OnderhoudTaak(forceer)
+        taak.signalen.klaar.connect(self.on_onderhoud_klaar)  # type: ignore
+        QThreadPool.globalInstance().start(taak)
+
+    def on_onderhoud_klaar(self, resultaten: list) -> None:
+        self.bezig = False
+        self.onderhoud_klaar.emit(resultaten)
@@ -0,0 +1,81 @@
+# gui/scherm_cache.py
+"""
+Scherm Cache
+v0.6.29 - Levenscyclus van schermen in de QStackedWidget
+
+Probleem: elke navigatie maakte een nieuw scherm aan. Planners houden de app
+de hele dag open; schermen die niet via terug() gesloten werden (logout,
+thema wissel, navigatie vanuit een ander scherm) bleven in de stack hangen
+en het geheugen groeide.
+
+Oplossing:
+- sluit_scherm(): expliciet opruimen (grid data vrijgeven) + deleteLater
+- SchermCache: beheer schermen die een load_data() hebben worden bij terug()
+  bewaard i.p.v. verwijderd en bij heropenen ververst. Begrensd op
+  MAX_SCHERMEN; het minst recent gebruikte scherm wordt gesloten.
+
+Schermen met sessie configuratie (planning editor, mijn planning) worden
+niet gecachet: die houden de meeste data vast en worden altijd gesloten.
+
+USAGE (main.py):
+    scherm = self.scherm_cache.haal('shift_codes')
+    if scherm is None:
+        scherm = ShiftCodesScreen(self.terug)
+    self.toon_scherm(scherm, sleutel='shift_codes')
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import QWidget
+
+from gui.widgets.grid_kalender_base import GridKalenderBase
+
+
+# Property op het scherm met zijn cache sleutel (None = niet cachebaar)
+SLEUTEL_PROPERTY = 'scherm_cache_sleutel'
+
+
+def sluit_scherm(scherm: QWidget) -> None:
+    """Geef grid data direct vrij en laat Qt het scherm verwijderen"""
+    for kalender in scherm.findChildren(GridKalenderBase):
+        kalender.opruimen()
+    scherm.deleteLater()
+
+
+class SchermCache:
+    """Begrensde LRU cache van verborgen schermen"""
+
+    MAX_SCHERMEN = 3
+
+    def __init__(self, max_schermen: int = MAX_SCHERMEN):
+        self.max_schermen = max_schermen
+        self._schermen: Dict[str, QWidget] = OrderedDict()
+
+    def haal(self, sleutel: str) -> Optional[QWidget]:
+        """Gecacht scherm (ververst via load_data) of None"""
+        scherm = self._schermen.pop(sleutel, None)
+        if scherm is not None and hasattr(scherm, 'load_data'):
+            scherm.load_data()
+        return scherm
+
+    def bewaar(self, sleutel: str, scherm: QWidget) -> None:
+        """Bewaar scherm; sluit het minst recent gebruikte boven de limiet"""
+        vorig = self._schermen.pop(sleutel, None)
+        if vorig is not None and vorig is not scherm:
+            sluit_scherm(vorig)
+        self._schermen[sleutel] = scherm
+        while len(self._schermen) > self.max_schermen:
+            _, oudste = self._schermen.popitem(last=False)
+            sluit_scherm(oudste)
+
+    def leeg(self) -> None:
+        """Sluit alle gecachte schermen (logout, thema wissel)"""
+        while self._schermen:
+            _, scherm = self._schermen.popitem(last=False)
+            sluit_scherm(scherm)
+
+    def sleutels(self) -> List[str]:
+        return list(self._schermen)
+
+    def __len__(self) -> int:
+        return len(self._schermen)
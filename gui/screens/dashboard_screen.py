@@ -40,6 +40,7 @@ class DashboardScreen(QWidget):
     verlof_saldo_beheer_clicked: pyqtSignal = pyqtSignal()  # Voor admin - v0.6.10
     werkpost_koppeling_clicked: pyqtSignal = pyqtSignal()  # Voor admin - v0.6.14
     notities_overzicht_clicked: pyqtSignal = pyqtSignal()  # Voor planners - v0.6.29
+    db_onderhoud_clicked: pyqtSignal = pyqtSignal()  # Database onderhoud scherm (admin) - v0.6.29
 
 
 
@@ -689,6 +690,11 @@ class DashboardScreen(QWidget):
                 "Beheer feestdagen per jaar"
             ))
 
+            scroll_layout.addWidget(self.create_menu_button(
+                "Database Onderhoud",
+                "Onderhoudshistoriek, database grootte en handmatig onderhoud"
+            ))
+
         scroll_layout.addStretch()
         scroll.setWidget(scroll_widget)
         layout.addWidget(scroll)
@@ -778,6 +784,8 @@ class DashboardScreen(QWidget):
             self.notities_overzicht_clicked.emit()  # type: ignore
         elif title == "Verlof & KD Saldo":
             self.verlof_saldo_beheer_clicked.emit()  # type: ignore
+        elif title == "Database Onderhoud":
+            self.db_onderhoud_clicked.emit()  # type: ignore
 
 
 class WachtwoordWijzigenDialog(QDialog):
@@ -0,0 +1,291 @@
+# gui/screens/database_onderhoud_screen.py
+"""
+Database Onderhoud Scherm
+v0.6.29 - Status, historiek en handmatig onderhoud van de SQLite database
+"""
+from typing import List, Dict, Any, Callable
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QTableWidget, QTableWidgetItem,
+                             QMessageBox, QHeaderView, QGroupBox, QGridLayout,
+                             QApplication)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+from services.database_onderhoud_service import (
+    get_db_status, get_onderhoud_historiek, get_grootte_per_dag, voer_onderhoud_uit,
+    converteer_naar_incremental
+)
+from gui.styles import Styles, Colors, Fonts, Dimensions, TableConfig
+import sqlite3
+
+
+def format_bytes(aantal: int) -> str:
+    """Bytes → leesbare grootte (KB/MB)"""
+    if aantal is None:
+        return "-"
+    if aantal < 1024 * 1024:
+        return f"{aantal / 1024:.1f} KB"
+    return f"{aantal / (1024 * 1024):.2f} MB"
+
+
+class DatabaseOnderhoudScreen(QWidget):
+    """Database Onderhoud - ANALYZE / vacuum / WAL checkpoint status en historiek"""
+
+    def __init__(self, router: Callable):
+        super().__init__()
+        self.router = router
+
+        # Instance attributes
+        self.status_labels: Dict[str, QLabel] = {}
+        self.historiek_tabel: QTableWidget = QTableWidget()
+        self.grootte_tabel: QTableWidget = QTableWidget()
+        self.historiek: List[Dict[str, Any]] = []
+        self.conversie_btn: QPushButton = QPushButton("Omzetten naar incrementeel vacuum")
+
+        self.init_ui()
+        self.load_data()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(
+            Dimensions.MARGIN_LARGE,
+            Dimensions.MARGIN_LARGE,
+            Dimensions.MARGIN_LARGE,
+            Dimensions.MARGIN_LARGE
+        )
+        layout.setSpacing(Dimensions.SPACING_LARGE)
+
+        # Header
+        header_layout = QHBoxLayout()
+
+        title = QLabel("Database Onderhoud")
+        title.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_TITLE, QFont.Weight.Bold))
+        header_layout.addWidget(title)
+
+        header_layout.addStretch()
+
+        vernieuw_btn = QPushButton("Vernieuwen")
+        vernieuw_btn.setFixedHeight(Dimensions.BUTTON_HEIGHT_NORMAL)
+        vernieuw_btn.setStyleSheet(Styles.button_secondary())
+        vernieuw_btn.clicked.connect(self.load_data)  # type: ignore
+        header_layout.addWidget(vernieuw_btn)
+
+        nu_btn = QPushButton("Onderhoud nu uitvoeren")
+        nu_btn.setFixedHeight(Dimensions.BUTTON_HEIGHT_NORMAL)
+        nu_btn.setStyleSheet(Styles.button_primary())
+        nu_btn.clicked.connect(self.onderhoud_nu)  # type: ignore
+        header_layout.addWidget(nu_btn)
+
+        # Eenmalige volledige VACUUM: nooit automatisch (exclusieve lock op de share)
+        self.conversie_btn.setFixedHeight(Dimensions.BUTTON_HEIGHT_NORMAL)
+        self.conversie_btn.setStyleSheet(Styles.button_warning())
+        self.conversie_btn.clicked.connect(self.converteer_vacuum)  # type: ignore
+        header_layout.addWidget(self.conversie_btn)
+
+        terug_btn = QPushButton("Terug")
+        terug_btn.setFixedSize(100, Dimensions.BUTTON_HEIGHT_NORMAL)
+        terug_btn.setStyleSheet(Styles.button_secondary())
+        terug_btn.clicked.connect(self.router)  # type: ignore
+        header_layout.addWidget(terug_btn)
+
+        layout.addLayout(header_layout)
+
+        # Info box
+        info = QLabel(
+            "Onderhoud (ANALYZE, incremental vacuum, WAL checkpoint) draait automatisch "
+            "wanneer de applicatie enkele minuten niet gebruikt wordt. Slechts één werkstation "
+            "voert het onderhoud tegelijk uit. Staat auto vacuum nog op NONE, dan is een "
+            "eenmalige omzetting nodig (volledige VACUUM, alle andere gebruikers afgemeld)."
+        )
+        info.setStyleSheet(Styles.info_box())
+        info.setWordWrap(True)
+        layout.addWidget(info)
+
+        # Status groep
+        status_group = QGroupBox("HUIDIGE STATUS")
+        status_layout = QGridLayout()
+
+        velden = [
+            ('db_grootte', "Database grootte:"),
+            ('wal_grootte', "WAL bestand:"),
+            ('paginas', "Pagina's (vrij / totaal):"),
+            ('journal_mode', "Journal mode:"),
+            ('auto_vacuum', "Auto vacuum:"),
+            ('statistieken', "Query statistieken:"),
+            ('verlopen', "Verlopen taken:"),
+            ('leider', "Onderhoud bezig door:"),
+        ]
+        for i, (key, tekst) in enumerate(velden):
+            label = QLabel(tekst)
+            label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+            waarde = QLabel("-")
+            waarde.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_NORMAL, QFont.Weight.Bold))
+            status_layout.addWidget(label, i // 2, (i % 2) * 2)
+            status_layout.addWidget(waarde, i // 2, (i % 2) * 2 + 1)
+            self.status_labels[key] = waarde
+
+        status_group.setLayout(status_layout)
+        layout.addWidget(status_group)
+
+        tabellen_layout = QHBoxLayout()
+
+        # Historiek tabel
+        historiek_group = QGroupBox("HISTORIEK")
+        historiek_layout = QVBoxLayout()
+
+        self.historiek_tabel.setColumnCount(5)
+        self.historiek_tabel.setHorizontalHeaderLabels([
+            "Tijdstip", "Taak", "Duur", "Resultaat", "Werkstation"
+        ])
+        TableConfig.setup_table_widget(self.historiek_tabel, row_height=36)
+
+        header = self.historiek_tabel.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+
+        historiek_layout.addWidget(self.historiek_tabel)
+        historiek_group.setLayout(historiek_layout)
+        tabellen_layout.addWidget(historiek_group, 3)
+
+        # Grootte over tijd
+        grootte_group = QGroupBox("GROOTTE PER DAG")
+        grootte_layout = QVBoxLayout()
+
+        self.grootte_tabel.setColumnCount(3)
+        self.grootte_tabel.setHorizontalHeaderLabels(["Dag", "Database", "WAL"])
+        TableConfig.setup_table_widget(self.grootte_tabel, row_height=36)
+        self.grootte_tabel.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+
+        grootte_layout.addWidget(self.grootte_tabel)
+        grootte_group.setLayout(grootte_layout)
+        tabellen_layout.addWidget(grootte_group, 1)
+
+        layout.addLayout(tabellen_layout)
+
+    def load_data(self):
+        """Laad status, historiek en grootte trend"""
+        try:
+            status = get_db_status()
+            self.historiek = get_onderhoud_historiek()
+            grootte = get_grootte_per_dag()
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Fout", str(e))
+            return
+
+        self.display_status(status)
+        self.display_historiek()
+        self.display_grootte(grootte)
+
+    def display_status(self, status: Dict[str, Any]):
+        self.status_labels['db_grootte'].setText(format_bytes(status['db_grootte_bytes']))
+        self.status_labels['wal_grootte'].setText(
+            format_bytes(status['wal_grootte_bytes']) if status['journal_mode'] == 'wal' else "n.v.t."
+        )
+        self.status_labels['paginas'].setText(f"{status['vrije_paginas']} / {status['page_count']}")
+        self.status_labels['journal_mode'].setText(status['journal_mode'].upper())
+        self.status_labels['auto_vacuum'].setText(
+            status['auto_vacuum'].upper() + (" (omzetten aanbevolen)" if status['conversie_aanbevolen'] else "")
+        )
+        self.conversie_btn.setEnabled(status['auto_vacuum'] != 'incremental')
+        self.status_labels['statistieken'].setText(
+            "Aanwezig" if status['heeft_statistieken'] else "Ontbreekt (ANALYZE nodig)"
+        )
+        self.status_labels['verlopen'].setText(", ".join(status['verlopen_taken']) or "Geen")
+
+        leider = status['leider']
+        if leider:
+            self.status_labels['leider'].setText(leider['client_id'].rsplit(':', 1)[0])
+        else:
+            self.status_labels['leider'].setText("-")
+
+    def display_historiek(self):
+        self.historiek_tabel.setRowCount(len(self.historiek))
+
+        for row, regel in enumerate(self.historiek):
+            self.historiek_tabel.setItem(row, 0, QTableWidgetItem(regel['gestart_op'].replace('T', ' ')))
+            self.historiek_tabel.setItem(row, 1, QTableWidgetItem(regel['taak']))
+            duur_item = QTableWidgetItem(f"{regel['duur_ms']} ms")
+            duur_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            self.historiek_tabel.setItem(row, 2, duur_item)
+
+            details_item = QTableWidgetItem(regel['details'] or "")
+            if not regel['succes']:
+                details_item.setForeground(Qt.GlobalColor.red)
+            self.historiek_tabel.setItem(row, 3, details_item)
+
+            werkstation = (regel['client_id'] or "").split(':', 1)[0]
+            self.historiek_tabel.setItem(row, 4, QTableWidgetItem(werkstation))
+
+    def display_grootte(self, grootte: List[Dict[str, Any]]):
+        # Nieuwste dag bovenaan
+        self.grootte_tabel.setRowCount(len(grootte))
+
+        for row, meting in enumerate(reversed(grootte)):
+            self.grootte_tabel.setItem(row, 0, QTableWidgetItem(meting['dag']))
+            self.grootte_tabel.setItem(row, 1, QTableWidgetItem(format_bytes(meting['db_grootte_bytes'])))
+            self.grootte_tabel.setItem(row, 2, QTableWidgetItem(format_bytes(meting['wal_grootte_bytes'])))
+
+    def onderhoud_nu(self):
+        """Voer alle onderhoudstaken direct uit (ongeacht interval)"""
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            resultaten = voer_onderhoud_uit(forceer=True)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if not resultaten:
+            QMessageBox.information(
+                self, "Onderhoud",
+                "Onderhoud kon niet starten: een ander werkstation voert momenteel onderhoud uit "
+                "of de database is bezet. Probeer later opnieuw."
+            )
+        else:
+            samenvatting = "\n".join(
+                f"{'✓' if r['succes'] else '✗'} {r['taak']} ({r['duur_ms']} ms): {r['details']}"
+                for r in resultaten
+            )
+            QMessageBox.information(self, "Onderhoud Voltooid", samenvatting)
+
+        self.load_data()
+
+    def converteer_vacuum(self):
+        """Eenmalige omzetting naar auto_vacuum = INCREMENTAL (volledige VACUUM)"""
+        reply = QMessageBox.warning(
+            self,
+            "Omzetten naar Incrementeel Vacuum",
+            "Dit herschrijft de volledige database (VACUUM) en blokkeert de database "
+            "voor alle werkstations tot de omzetting klaar is. Dit kan enkele minuten duren.\n\n"
+            "⚠ Zorg dat ALLE andere gebruikers afgemeld zijn.\n\n"
+            "Daarna wint het automatische onderhoud vrije pagina's in kleine stappen terug.\n\n"
+            "Nu omzetten?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            resultaat = converteer_naar_incremental()
+        except sqlite3.Error as e:
+            resultaat = {'succes': False, 'details': str(e)}
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if resultaat is None:
+            QMessageBox.information(
+                self, "Omzetten",
+                "Omzetten kon niet starten: een ander werkstation voert momenteel onderhoud uit "
+                "of de database is bezet. Probeer later opnieuw."
+            )
+        elif not resultaat['succes']:
+            QMessageBox.critical(
+                self, "Omzetten Mislukt",
+                f"{resultaat['details']}\n\nMeest waarschijnlijke oorzaak: andere gebruikers zijn nog aangemeld."
+            )
+        else:
+            QMessageBox.information(self, "Omzetten Voltooid", resultaat['details'])
+
+        self.load_data()
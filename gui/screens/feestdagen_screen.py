@@ -14,6 +14,7 @@ from PyQt6.QtGui import QFont
 from datetime import datetime
 from database.connection import get_connection
 from services.data_ensure_service import ensure_jaar_data
+from services.dag_kalender import DagKalender
 from gui.styles import Styles, Colors, Fonts, Dimensions, TableConfig
 
 
@@ -281,6 +282,7 @@ class FeestdagenScherm(QWidget):
             """, (nieuwe_datum, oude_datum))
             conn.commit()
             conn.close()
+            DagKalender.refresh()  # Grids/validatie zien de wijziging (v0.6.29)
 
             self.laad_feestdagen()
 
@@ -321,6 +323,7 @@ class FeestdagenScherm(QWidget):
             """, (datum, naam))
             conn.commit()
             conn.close()
+            DagKalender.refresh()  # Grids/validatie zien de wijziging (v0.6.29)
 
             self.laad_feestdagen()
 
@@ -352,6 +355,7 @@ class FeestdagenScherm(QWidget):
             cursor.execute("DELETE FROM feestdagen WHERE datum = ?", (datum,))
             conn.commit()
             conn.close()
+            DagKalender.refresh()  # Grids/validatie zien de wijziging (v0.6.29)
 
             self.laad_feestdagen()
 
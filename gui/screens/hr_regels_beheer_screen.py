@@ -6,11 +6,13 @@ Beheer van HR validatie regels met versioning support
 from typing import List, Dict, Any, Callable
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QTableWidget, QTableWidgetItem,
-                             QMessageBox, QHeaderView, QGroupBox, QCheckBox)
+                             QMessageBox, QHeaderView, QGroupBox, QCheckBox, QApplication)
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QCursor
 from datetime import datetime
 from database.connection import get_connection
+from services.hr_regels_index import HRRegelsIndex
+from services.dag_kalender import DagKalender
 from gui.styles import Styles, Colors, Fonts, Dimensions, TableConfig
 import sqlite3
 
@@ -52,6 +54,13 @@ class HRRegelsBeheerScreen(QWidget):
 
         header_layout.addStretch()
 
+        simulatie_btn = QPushButton("What-if Simulatie")
+        simulatie_btn.setFixedHeight(Dimensions.BUTTON_HEIGHT_NORMAL)
+        simulatie_btn.setStyleSheet(Styles.button_primary())
+        simulatie_btn.setToolTip("Impact van gewijzigde regels op de planning van de laatste maanden")
+        simulatie_btn.clicked.connect(self.toon_simulatie)  # type: ignore
+        header_layout.addWidget(simulatie_btn)
+
         terug_btn = QPushButton("Terug")
         terug_btn.setFixedSize(100, Dimensions.BUTTON_HEIGHT_NORMAL)
         terug_btn.setStyleSheet(Styles.button_secondary())
@@ -330,6 +339,20 @@ class HRRegelsBeheerScreen(QWidget):
                 vervangen_item = QTableWidgetItem("-")
             self.historiek_tabel.setItem(row, 4, vervangen_item)
 
+    def toon_simulatie(self):
+        """What-if simulatie met alternatieve regels (v0.6.29)"""
+        from gui.dialogs.hr_regels_simulatie_dialog import HRRegelsSimulatieDialog
+
+        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
+        try:
+            dialog = HRRegelsSimulatieDialog(self)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Fout", f"Kon simulatie niet laden:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        dialog.exec()
+
     def create_bewerk_callback(self, regel: Dict[str, Any]):
         def callback():
             self.bewerk_regel(regel)
@@ -388,6 +411,10 @@ class HRRegelsBeheerScreen(QWidget):
             conn.commit()
             conn.close()
 
+            # Versie index + kalender vensters herladen (v0.6.29)
+            HRRegelsIndex.refresh()
+            DagKalender.refresh()
+
             # Format datum voor display
             datum_obj = datetime.fromisoformat(nieuwe_data['actief_vanaf'])
             datum_display = datum_obj.strftime('%d-%m-%Y')
@@ -140,7 +140,7 @@ class KalenderTestScreen(QWidget):
                 eind = datum_lijst[-1][0]
                 print(f"Loading planning data: {start} - {eind}")
                 base.load_planning_data(start, eind)
-                print(f"✓ Planning data geladen voor {len(base.planning_data)} dagen")
+                print(f"✓ Planning data geladen voor {base.rooster.dagen_met_data()} dagen")
 
             QMessageBox.information(
                 self,
@@ -149,7 +149,7 @@ class KalenderTestScreen(QWidget):
                 f"• {len(base.gebruikers_data)} gebruikers\n"
                 f"• {len(base.feestdagen)} feestdagen\n"
                 f"• {len(datum_lijst)} datums\n"
-                f"• {len(base.planning_data)} dagen planning"
+                f"• {base.rooster.dagen_met_data()} dagen planning"
             )
 
         except Exception as e:
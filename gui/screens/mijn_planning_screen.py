@@ -13,6 +13,8 @@ from datetime import datetime
 from gui.styles import Styles, Colors, Fonts, Dimensions
 from gui.widgets import TeamlidGridKalender
 from database.connection import get_connection
+from services.maand_status_service import get_maand_status
+from services.referentie_catalogus import ReferentieCatalogus
 
 
 class MijnPlanningScreen(QWidget):
@@ -165,30 +167,12 @@ class MijnPlanningScreen(QWidget):
         return widget
 
     def load_valid_codes(self):
-        """Laad alle geldige codes uit database"""
-        conn = get_connection()
-        cursor = conn.cursor()
+        """Laad alle geldige codes (v0.6.29: uit de gedeelde ReferentieCatalogus)"""
+        catalogus = ReferentieCatalogus.get_instance()
 
-        # Shift codes (alleen actieve werkposten)
-        cursor.execute("""
-            SELECT DISTINCT sc.code
-            FROM shift_codes sc
-            JOIN werkposten w ON sc.werkpost_id = w.id
-            WHERE w.is_actief = 1
-        """)
-
-        for row in cursor.fetchall():
-            self.valid_codes.add(row['code'])
-
-        # Speciale codes
-        cursor.execute("SELECT code FROM speciale_codes")
-
-        for row in cursor.fetchall():
-            code = row['code']
-            self.valid_codes.add(code)
-            self.speciale_codes.add(code)
-
-        conn.close()
+        # Shift codes (alleen actieve werkposten) + speciale codes
+        self.valid_codes.update(catalogus.geldige_codes())
+        self.speciale_codes.update(catalogus.speciale_code_set())
 
     def get_shift_codes_text(self) -> str:
         """Haal shift codes tekst voor sidebar"""
@@ -239,37 +223,9 @@ class MijnPlanningScreen(QWidget):
         return "\n".join(lines) if lines else "Geen speciale codes beschikbaar"
 
     def get_maand_status(self) -> str:
-        """Check of huidige maand gepubliceerd is"""
+        """Check of huidige maand gepubliceerd is (maand_status lookup - v0.6.29)"""
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
-            jaar = self.kalender.jaar
-            maand = self.kalender.maand
-
-            # Bepaal eerste dag van maand en eerste dag van volgende maand
-            eerste_dag = f"{jaar:04d}-{maand:02d}-01"
-            if maand == 12:
-                volgende_maand = f"{jaar + 1:04d}-01-01"
-            else:
-                volgende_maand = f"{jaar:04d}-{maand + 1:02d}-01"
-
-            # Haal unieke statussen op voor deze maand
-            cursor.execute("""
-                SELECT DISTINCT status
-                FROM planning
-                WHERE datum >= ? AND datum < ?
-            """, (eerste_dag, volgende_maand))
-
-            statussen = [row['status'] for row in cursor.fetchall()]
-            conn.close()
-
-            # Bepaal status
-            if 'gepubliceerd' in statussen:
-                return 'gepubliceerd'
-            else:
-                return 'concept'
-
+            return get_maand_status(self.kalender.jaar, self.kalender.maand)
         except Exception:
             return 'concept'
 
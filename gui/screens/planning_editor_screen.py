@@ -27,9 +27,10 @@ VERSION HISTORY:
 
 PERFORMANCE NOTES:
 Het toggle concept ↔ gepubliceerd update nu alleen:
-1. Database status (UPDATE query)
-2. In-memory cache (_cached_planning_data)
-3. UI status labels
+1. Database status (1 rij in maand_status - v0.6.29, was UPDATE van alle planning rijen)
+2. Grid edit state (kalender.zet_maand_status) + UI status labels
+
+Cache rijen dragen geen publicatie status meer (v0.6.29: maand_status is de bron van waarheid).
 
 GEEN volledige grid reload meer! Data blijft hetzelfde, alleen de view/filter wijzigt.
 """
@@ -45,6 +46,8 @@ from gui.styles import Styles, Colors, Fonts, Dimensions, TableConfig
 from database.connection import get_connection
 from services.bemannings_controle_service import controleer_maand
 from services.planning_validator_service import PlanningValidator
+from services.maand_status_service import get_maand_status, zet_maand_status
+from services.referentie_catalogus import ReferentieCatalogus
 from datetime import datetime
 
 
@@ -62,10 +65,12 @@ class PlanningEditorScreen(QWidget):
         router: Callable,
         jaar: Optional[int] = None,
         maand: Optional[int] = None,
-        gebruiker_ids: Optional[List[int]] = None
+        gebruiker_ids: Optional[List[int]] = None,
+        huidige_gebruiker_id: Optional[int] = None
     ):
         super().__init__()
         self.router = router
+        self.huidige_gebruiker_id = huidige_gebruiker_id  # Planner (gepubliceerd_door)
 
         # PERFORMANCE (v0.6.25): Gebruik configuratie parameters of defaults
         vandaag = datetime.now()
@@ -86,7 +91,6 @@ class PlanningEditorScreen(QWidget):
         # PERFORMANCE CACHE (v0.6.25) - Quick Win voor toggle
         # Cache alle planning data bij load, filter in-memory bij toggle
         self._cached_planning_data: Dict = {}  # Alle planning data (concept + gepubliceerd)
-        self._show_only_gepubliceerd: bool = False  # Filter flag
 
         # PERFORMANCE (v0.6.25): Pass configuratie naar grid
         self.kalender: PlannerGridKalender = PlannerGridKalender(
@@ -174,6 +178,13 @@ class PlanningEditorScreen(QWidget):
         auto_btn.clicked.connect(self.show_auto_generatie_dialog)  # type: ignore
         buttons_row.addWidget(auto_btn)
 
+        # Batch export button (v0.6.29)
+        batch_export_btn = QPushButton("Batch Export")
+        batch_export_btn.setStyleSheet(Styles.button_secondary())
+        batch_export_btn.setMinimumHeight(Dimensions.BUTTON_HEIGHT_NORMAL)
+        batch_export_btn.clicked.connect(self.show_batch_export_dialog)  # type: ignore
+        buttons_row.addWidget(batch_export_btn)
+
         # Bulk delete button
         bulk_delete_btn = QPushButton("Wis Maand (Bescherm Speciale Codes)")
         bulk_delete_btn.setStyleSheet(Styles.button_warning())
@@ -290,70 +301,21 @@ class PlanningEditorScreen(QWidget):
         return widget
 
     def load_valid_codes(self):
-        """Laad alle geldige codes uit database"""
-        conn = get_connection()
-        cursor = conn.cursor()
+        """Laad alle geldige codes (v0.6.29: uit de gedeelde ReferentieCatalogus)"""
+        catalogus = ReferentieCatalogus.get_instance()
 
         # Shift codes per dag_type (alleen actieve werkposten)
-        cursor.execute("""
-            SELECT DISTINCT sc.code, sc.dag_type
-            FROM shift_codes sc
-            JOIN werkposten w ON sc.werkpost_id = w.id
-            WHERE w.is_actief = 1
-        """)
-
-        for row in cursor.fetchall():
-            code = row['code']
-            dag_type = row['dag_type']
-
-            self.valid_codes.add(code)
+        for dag_type, codes in catalogus.geldige_codes_per_dag().items():
+            self.valid_codes_per_dag.setdefault(dag_type, set()).update(codes)
 
-            # Voeg toe aan juiste dag_type Set
-            if dag_type in self.valid_codes_per_dag:
-                self.valid_codes_per_dag[dag_type].add(code)
-
-        # Speciale codes (geldig voor alle dagen)
-        cursor.execute("SELECT code FROM speciale_codes")
-
-        for row in cursor.fetchall():
-            code = row['code']
-            self.valid_codes.add(code)
-            self.speciale_codes.add(code)
-
-        conn.close()
+        # Alle shift codes + speciale codes (geldig voor alle dagen)
+        self.valid_codes.update(catalogus.geldige_codes())
+        self.speciale_codes.update(catalogus.speciale_code_set())
 
     def load_maand_status(self):
-        """Haal status op voor huidige maand"""
+        """Haal status op voor huidige maand (maand_status lookup - v0.6.29)"""
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
-            jaar = self.kalender.jaar
-            maand = self.kalender.maand
-
-            # Bepaal eerste dag van maand en eerste dag van volgende maand
-            eerste_dag = f"{jaar:04d}-{maand:02d}-01"
-            if maand == 12:
-                volgende_maand = f"{jaar + 1:04d}-01-01"
-            else:
-                volgende_maand = f"{jaar:04d}-{maand + 1:02d}-01"
-
-            # Haal unieke statussen op voor deze maand
-            cursor.execute("""
-                SELECT DISTINCT status
-                FROM planning
-                WHERE datum >= ? AND datum < ?
-            """, (eerste_dag, volgende_maand))
-
-            statussen = [row['status'] for row in cursor.fetchall()]
-            conn.close()
-
-            # Bepaal status
-            if 'gepubliceerd' in statussen:
-                self.current_status = 'gepubliceerd'
-            else:
-                self.current_status = 'concept'
-
+            self.current_status = get_maand_status(self.kalender.jaar, self.kalender.maand)
         except Exception:
             self.current_status = 'concept'
 
@@ -565,37 +527,14 @@ class PlanningEditorScreen(QWidget):
 
         # STAP 2: Update database (alleen als Excel export succesvol was)
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
-            # Bepaal datum range
-            eerste_dag = f"{jaar:04d}-{maand:02d}-01"
-            if maand == 12:
-                volgende_maand = f"{jaar + 1:04d}-01-01"
-            else:
-                volgende_maand = f"{jaar:04d}-{maand + 1:02d}-01"
-
-            # Update alle planning records naar gepubliceerd
-            cursor.execute("""
-                UPDATE planning
-                SET status = 'gepubliceerd'
-                WHERE datum >= ? AND datum < ?
-            """, (eerste_dag, volgende_maand))
-
-            conn.commit()
-            conn.close()
+            # Constante write: 1 rij in maand_status (v0.6.29)
+            zet_maand_status(jaar, maand, 'gepubliceerd', gebruiker_id=self.huidige_gebruiker_id)
 
-            # PERFORMANCE FIX (v0.6.25): Update cache ipv volledige reload
-            # Update cache: markeer alle records als gepubliceerd
-            if self._cached_planning_data:
-                for datum_str in self._cached_planning_data:
-                    for user_id in self._cached_planning_data[datum_str]:
-                        if 'status' in self._cached_planning_data[datum_str][user_id]:
-                            self._cached_planning_data[datum_str][user_id]['status'] = 'gepubliceerd'
+            # Grid edit state bijwerken (v0.6.29 - in-memory concept check)
+            self.kalender.zet_maand_status('gepubliceerd')
 
             # Update UI (GEEN grid reload nodig - data is hetzelfde!)
             self.current_status = 'gepubliceerd'
-            self._show_only_gepubliceerd = False  # Reset filter (toon alles in gepubliceerd modus)
             self.update_status_ui()
 
             QMessageBox.information(
@@ -634,37 +573,14 @@ class PlanningEditorScreen(QWidget):
 
         # Update database
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
-            # Bepaal datum range
-            eerste_dag = f"{jaar:04d}-{maand:02d}-01"
-            if maand == 12:
-                volgende_maand = f"{jaar + 1:04d}-01-01"
-            else:
-                volgende_maand = f"{jaar:04d}-{maand + 1:02d}-01"
-
-            # Update alle planning records naar concept
-            cursor.execute("""
-                UPDATE planning
-                SET status = 'concept'
-                WHERE datum >= ? AND datum < ?
-            """, (eerste_dag, volgende_maand))
+            # Constante write: 1 rij in maand_status (v0.6.29)
+            zet_maand_status(jaar, maand, 'concept')
 
-            conn.commit()
-            conn.close()
-
-            # PERFORMANCE FIX (v0.6.25): Update cache ipv volledige reload
-            # Update cache: markeer alle records als concept
-            if self._cached_planning_data:
-                for datum_str in self._cached_planning_data:
-                    for user_id in self._cached_planning_data[datum_str]:
-                        if 'status' in self._cached_planning_data[datum_str][user_id]:
-                            self._cached_planning_data[datum_str][user_id]['status'] = 'concept'
+            # Grid edit state bijwerken (v0.6.29 - in-memory concept check)
+            self.kalender.zet_maand_status('concept')
 
             # Update UI (GEEN grid reload nodig - data is hetzelfde!)
             self.current_status = 'concept'
-            self._show_only_gepubliceerd = False  # Reset filter
             self.update_status_ui()
 
             QMessageBox.information(
@@ -706,34 +622,6 @@ class PlanningEditorScreen(QWidget):
         """
         self._cached_planning_data = planning_data.copy()
 
-    def get_filtered_planning_cache(self) -> Dict:
-        """
-        PERFORMANCE HELPER (v0.6.25): Get gefilterde planning data uit cache
-
-        Returns:
-            Filtered planning data op basis van _show_only_gepubliceerd flag
-        """
-        if not self._cached_planning_data:
-            return {}
-
-        if not self._show_only_gepubliceerd:
-            # Geen filter: return alles
-            return self._cached_planning_data
-
-        # Filter: alleen gepubliceerde records
-        filtered = {}
-        for datum_str, users_dict in self._cached_planning_data.items():
-            filtered[datum_str] = {}
-            for user_id, shift_info in users_dict.items():
-                if shift_info.get('status') == 'gepubliceerd':
-                    filtered[datum_str][user_id] = shift_info
-
-            # Verwijder lege datum entries
-            if not filtered[datum_str]:
-                del filtered[datum_str]
-
-        return filtered
-
     def get_shift_codes_text(self) -> str:
         """Haal shift codes tekst voor sidebar"""
         conn = get_connection()
@@ -900,6 +788,13 @@ class PlanningEditorScreen(QWidget):
             # Refresh kalender na generatie
             self.kalender.load_initial_data()
 
+    def show_batch_export_dialog(self):
+        """Toon batch export dialog (meerdere maanden / per teamlid)"""
+        from gui.dialogs.batch_export_dialog import BatchExportDialog
+
+        dialog = BatchExportDialog(self, self.kalender.jaar, self.kalender.maand)
+        dialog.exec()
+
     def show_bulk_delete_dialog(self):
         """Wis alle planning van huidige maand (behalve beschermde codes)"""
         from services.term_code_service import TermCodeService
@@ -15,6 +15,7 @@ from gui.dialogs.speciale_code_dialog import SpecialeCodeDialog
 from gui.dialogs.werkpost_naam_dialog import WerkpostNaamDialog
 from gui.dialogs.shift_codes_grid_dialog import ShiftCodesGridDialog
 from services.term_code_service import TermCodeService
+from services.referentie_catalogus import ReferentieCatalogus
 import sqlite3
 
 
@@ -492,6 +493,7 @@ class ShiftCodesScreen(QWidget):
                 werkpost_id = cursor.lastrowid
                 conn.commit()
                 conn.close()
+                ReferentieCatalogus.invalideer()
 
                 # Stap 2: Direct naar shift codes grid
                 grid_dialog = ShiftCodesGridDialog(self, werkpost_id, data['naam'])
@@ -554,6 +556,7 @@ class ShiftCodesScreen(QWidget):
 
                 conn.commit()
                 conn.close()
+                ReferentieCatalogus.invalideer()
 
                 self.load_werkposten()
 
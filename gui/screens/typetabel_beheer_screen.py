@@ -15,6 +15,11 @@ from database.connection import get_connection
 from gui.styles import Styles, Colors, Fonts, Dimensions
 from datetime import datetime, timedelta, date
 from services.constraint_checker import ConstraintChecker, PlanningRegel, Violation
+from services.rooster_projectie import (
+    RoosterProjectie, ProjectieGebruiker, laad_typetabel, laad_shift_codes_map
+)
+from services.typetabel_cyclus_validator import CyclusValidator
+from services.rode_lijnen_service import periodes_rond
 import sqlite3
 
 
@@ -299,6 +304,8 @@ class TypetabelBeheerScreen(QWidget):
                 lambda checked, v=versie: self.bekijk_typetabel(v, readonly=True))  # type: ignore
             buttons_layout.addWidget(bekijk_btn)
 
+            self._voeg_analyse_knoppen_toe(buttons_layout, versie)
+
             kopieer_btn = QPushButton("Kopiëren")
             kopieer_btn.setStyleSheet(Styles.button_primary(Dimensions.BUTTON_HEIGHT_TINY))
             kopieer_btn.setMinimumHeight(Dimensions.BUTTON_HEIGHT_TINY)
@@ -318,6 +325,8 @@ class TypetabelBeheerScreen(QWidget):
             valideer_btn.clicked.connect(lambda checked, v=versie: self.valideer_typetabel(v))  # type: ignore
             buttons_layout.addWidget(valideer_btn)
 
+            self._voeg_analyse_knoppen_toe(buttons_layout, versie)
+
             activeer_btn = QPushButton("Activeren")
             activeer_btn.setStyleSheet(Styles.button_success(Dimensions.BUTTON_HEIGHT_TINY))
             activeer_btn.setMinimumHeight(Dimensions.BUTTON_HEIGHT_TINY)
@@ -343,6 +352,50 @@ class TypetabelBeheerScreen(QWidget):
 
         return card
 
+    def _voeg_analyse_knoppen_toe(self, buttons_layout: QHBoxLayout, versie: Dict[str, Any]):
+        """Dekking heatmap + prognose knoppen (v0.6.29)"""
+        dekking_btn = QPushButton("Dekking")
+        dekking_btn.setStyleSheet(Styles.button_secondary(Dimensions.BUTTON_HEIGHT_TINY))
+        dekking_btn.setMinimumHeight(Dimensions.BUTTON_HEIGHT_TINY)
+        dekking_btn.setToolTip("Bemanning van kritische shifts per cyclusdag met het huidige team")
+        dekking_btn.clicked.connect(lambda checked, v=versie: self.toon_dekking(v))  # type: ignore
+        buttons_layout.addWidget(dekking_btn)
+
+        prognose_btn = QPushButton("Prognose")
+        prognose_btn.setStyleSheet(Styles.button_secondary(Dimensions.BUTTON_HEIGHT_TINY))
+        prognose_btn.setMinimumHeight(Dimensions.BUTTON_HEIGHT_TINY)
+        prognose_btn.setToolTip("Verwachte HR overtredingen en onderbemanning per maand (incl. verlof)")
+        prognose_btn.clicked.connect(lambda checked, v=versie: self.toon_prognose(v))  # type: ignore
+        buttons_layout.addWidget(prognose_btn)
+
+    def toon_dekking(self, versie: Dict[str, Any]):
+        """Dekkingsanalyse heatmap voor typetabel versie (v0.6.29)"""
+        from gui.dialogs.typetabel_dekking_dialog import TypetabelDekkingDialog
+
+        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
+        try:
+            dialog = TypetabelDekkingDialog(self, versie)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Fout", f"Kon dekking niet berekenen:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        dialog.exec()
+
+    def toon_prognose(self, versie: Dict[str, Any]):
+        """HR + bemanning prognose voor de komende maanden (v0.6.29)"""
+        from gui.dialogs.planning_prognose_dialog import PlanningPrognoseDialog
+
+        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
+        try:
+            dialog = PlanningPrognoseDialog(self, versie)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Fout", f"Kon prognose niet berekenen:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        dialog.exec()
+
     def nieuwe_typetabel(self):
         """Maak nieuwe typetabel concept"""
         from gui.dialogs.typetabel_dialogs import NieuweTypetabelDialog
@@ -648,91 +701,6 @@ class TypetabelBeheerScreen(QWidget):
     # FASE 5: TYPETABEL PRE-ACTIVATIE HR VALIDATIE (v0.6.27)
     # ========================================================================
 
-    def bereken_shift_slim(self, datum, actief_vanaf, aantal_weken, startweek,
-                           typetabel_data, werkposten, shift_codes_map,
-                           feestdagen) -> Optional[str]:
-        """
-        Bereken shift code voor een specifieke datum en gebruiker (SLIM - v0.6.14)
-
-        Args:
-            datum: Datum waarvoor shift berekend wordt
-            actief_vanaf: Start datum typetabel
-            aantal_weken: Aantal weken in typetabel cyclus
-            startweek: Gebruiker's startweek in cyclus
-            typetabel_data: {(week, dag): shift_type} - bijv. "V", "L", "N"
-            werkposten: [(werkpost_id, prioriteit), ...] voor deze gebruiker
-            shift_codes_map: {(werkpost_id, dag_type, shift_type): code}
-            feestdagen: {datum_str: is_zondagsrust} - feestdagen mapping
-
-        Returns:
-            Concrete shift code (bijv. "7101") of None
-        """
-        # Bereken aantal dagen sinds actief_vanaf
-        dagen_verschil = (datum - actief_vanaf).days
-
-        # Bereken week in cyclus (0-based, dan +1 voor 1-based)
-        # Met startweek offset
-        week_in_cyclus = ((dagen_verschil // 7 + startweek - 1) % aantal_weken) + 1
-
-        # Dag nummer (1=maandag, 7=zondag)
-        dag_nummer = datum.isoweekday()
-
-        # Haal shift_type op uit typetabel (bijv. "V", "L", "N", "dag")
-        key = (week_in_cyclus, dag_nummer)
-        shift_type = typetabel_data.get(key)
-
-        if not shift_type:
-            return None
-
-        # CHECK FEESTDAG: Feestdagen worden behandeld als zondag voor shift codes
-        datum_str = datum.isoformat()
-        is_feestdag = datum_str in feestdagen
-
-        # Bereken dag_type op basis van dag nummer (of feestdag!)
-        if is_feestdag:
-            # Feestdag = altijd zondag shift codes gebruiken (bijv. V -> 7701)
-            dag_type = 'zondag'
-        elif dag_nummer == 6:  # Zaterdag
-            dag_type = 'zaterdag'
-        elif dag_nummer == 7:  # Zondag
-            dag_type = 'zondag'
-        else:  # Ma-Vr
-            dag_type = 'weekdag'
-
-        # Check of dit een directe code is (RX, CX, T)
-        # Deze codes moeten niet gemapt worden maar direct overgenomen
-        shift_type_upper = shift_type.upper()
-        if shift_type_upper in ['RX', 'CX', 'T']:
-            # Directe code - return as-is
-            return shift_type_upper
-
-        # Normaliseer shift_type naar shift_codes formaat (V, L, N, D)
-        # Typetabel kan "V", "v", "vroeg" bevatten
-        shift_type_lower = shift_type.lower()
-        if shift_type_lower in ['v', 'vroeg']:
-            shift_type_normalized = 'vroeg'
-        elif shift_type_lower in ['l', 'laat']:
-            shift_type_normalized = 'laat'
-        elif shift_type_lower in ['n', 'nacht']:
-            shift_type_normalized = 'nacht'
-        elif shift_type_lower in ['d', 'dag']:
-            shift_type_normalized = 'dag'
-        else:
-            # Onbekend shift type - return None
-            return None
-
-        # Loop door werkposten (op prioriteit) om match te vinden
-        for werkpost_id, _ in sorted(werkposten, key=lambda x: x[1]):
-            lookup_key = (werkpost_id, dag_type, shift_type_normalized)
-            shift_code = shift_codes_map.get(lookup_key)
-
-            if shift_code:
-                # Match gevonden!
-                return shift_code
-
-        # Geen match gevonden in shift_codes - return None
-        return None
-
     def _load_hr_config(self) -> Dict[str, Any]:
         """Laad HR regels configuratie uit database met fallback defaults"""
         conn = get_connection()
@@ -834,36 +802,6 @@ class TypetabelBeheerScreen(QWidget):
         conn.close()
         return shift_tijden
 
-    def _load_rode_lijnen(self) -> List[Dict[str, Any]]:
-        """Laad rode lijnen periodes als lijst"""
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT start_datum, eind_datum, periode_nummer
-            FROM rode_lijnen
-            ORDER BY start_datum
-        """)
-
-        rode_lijnen = []
-        for row in cursor.fetchall():
-            # Strip timestamp indien aanwezig
-            start_str = row['start_datum'].split('T')[0] if 'T' in row['start_datum'] else row['start_datum']
-            eind_str = row['eind_datum'].split('T')[0] if 'T' in row['eind_datum'] else row['eind_datum']
-
-            # Converteer naar date objecten
-            start_datum = datetime.strptime(start_str, '%Y-%m-%d').date()
-            eind_datum = datetime.strptime(eind_str, '%Y-%m-%d').date()
-
-            rode_lijnen.append({
-                'start_datum': start_datum,
-                'eind_datum': eind_datum,
-                'periode_nummer': row['periode_nummer']
-            })
-
-        conn.close()
-        return rode_lijnen
-
     def _get_friendly_violation_name(self, type_name: str) -> str:
         """Vertaal violation type naar leesbare naam"""
         mapping = {
@@ -921,102 +859,68 @@ class TypetabelBeheerScreen(QWidget):
         conn = get_connection()
         cursor = conn.cursor()
 
-        # 1. Haal typetabel metadata op
-        cursor.execute("""
-            SELECT aantal_weken
-            FROM typetabel_versies
-            WHERE id = ?
-        """, (versie_id,))
-
-        row = cursor.fetchone()
-        if not row:
+        # 1. Haal typetabel op (metadata + cellen)
+        typetabel = laad_typetabel(conn, versie_id)
+        if typetabel is None:
             conn.close()
             return []
 
-        aantal_weken = row['aantal_weken']
+        aantal_weken, _, typetabel_data = typetabel
 
         # 2. Bereken simulatie lengte
         dagen_per_cyclus = aantal_weken * 7
         simulatie_dagen = int(dagen_per_cyclus * cycli)
 
-        # 3. Haal typetabel data op
-        cursor.execute("""
-            SELECT week_nummer, dag_nummer, shift_type
-            FROM typetabel_data
-            WHERE versie_id = ?
-        """, (versie_id,))
+        # 3. Haal shift codes mapping op
+        shift_codes_map = laad_shift_codes_map(conn)
 
-        typetabel_data = {}
-        for row in cursor.fetchall():
-            key = (row['week_nummer'], row['dag_nummer'])
-            typetabel_data[key] = row['shift_type']
-
-        # 4. Haal shift codes mapping op
-        cursor.execute("""
-            SELECT werkpost_id, dag_type, shift_type, code
-            FROM shift_codes
-            WHERE code IS NOT NULL AND code != ''
-        """)
-
-        shift_codes_map = {}
-        for row in cursor.fetchall():
-            key = (row['werkpost_id'], row['dag_type'], row['shift_type'])
-            shift_codes_map[key] = row['code']
-
-        # 5. Haal ALLE werkposten op (voor theoretische gebruiker)
+        # 4. Haal ALLE werkposten op (voor theoretische gebruiker)
         cursor.execute("""
             SELECT id
             FROM werkposten
             WHERE is_actief = 1
             ORDER BY id
         """)
-        werkposten = [(row['id'], idx + 1) for idx, row in enumerate(cursor.fetchall())]
+        werkposten = tuple(row['id'] for row in cursor.fetchall())
 
         conn.close()
 
-        if not werkposten:
+        if not werkposten or simulatie_dagen <= 0:
             # Geen werkposten = geen shift codes mogelijk
             return []
 
-        # 6. Simuleer planning voor THEORETISCHE gebruiker
-        planning_regels = []
-
+        # 5. Projecteer voor THEORETISCHE gebruiker (v0.6.29 - RoosterProjectie)
         # Start op een theoretische MAANDAG (Week 1 Dag 1 moet maandag zijn!)
         # Gebruik eerste maandag van 2025 voor consistente simulatie
         start_datum = date(2025, 1, 6)  # 6 januari 2025 = maandag
 
-        # Dummy gebruiker: id = 0, startweek = 1 (begin van cyclus)
-        gebruiker_id = 0
-        startweek = 1
-
-        # Lege feestdagen dict (negeren voor theoretisch patroon)
-        feestdagen = {}
+        # Geen feestdagen (theoretisch patroon)
+        projectie = RoosterProjectie(aantal_weken, start_datum, typetabel_data, shift_codes_map)
 
-        # Simuleer voor alle dagen
-        for dagen_offset in range(simulatie_dagen):
-            datum = start_datum + timedelta(days=dagen_offset)
+        # Dummy gebruiker: id = 0, startweek = 1 (begin van cyclus)
+        rooster = projectie.projecteer(
+            start_datum, start_datum + timedelta(days=simulatie_dagen - 1),
+            [ProjectieGebruiker(gebruiker_id=0, startweek=1, werkposten=werkposten)]
+        )
 
-            # Bereken shift code via bestaande logica (zonder feestdagen)
-            shift_code = self.bereken_shift_slim(
-                datum, start_datum, aantal_weken, startweek,
-                typetabel_data, werkposten, shift_codes_map, feestdagen
+        return [
+            PlanningRegel(
+                gebruiker_id=gebruiker_id,
+                datum=date.fromisoformat(datum_str),
+                shift_code=shift_code,
+                is_goedgekeurd_verlof=False,
+                is_feestdag=False  # Altijd False voor theoretisch patroon
             )
-
-            if shift_code:
-                planning_regels.append(PlanningRegel(
-                    gebruiker_id=gebruiker_id,
-                    datum=datum,
-                    shift_code=shift_code,
-                    is_goedgekeurd_verlof=False,
-                    is_feestdag=False  # Altijd False voor theoretisch patroon
-                ))
-
-        return planning_regels
+            for datum_str, gebruiker_id, shift_code in rooster.iter_codes()
+        ]
 
     def pre_valideer_typetabel(self, versie: Dict[str, Any]) -> Dict[str, Any]:
         """
         Pre-activatie HR validatie (FASE 5)
 
+        v0.6.29: cyclische validatie (CyclusValidator) - 1 cyclus met
+        wrap-around, geldig voor ALLE startweken i.p.v. 2.5 cycli startweek 1.
+
         Args:
             versie: Typetabel versie dict
 
@@ -1026,90 +930,70 @@ class TypetabelBeheerScreen(QWidget):
                 'errors': int,
                 'warnings': int,
                 'violations_by_type': {type_name: count},
-                'violations_list': [Violation, ...],  # NIEUW: volledige lijst
-                'simulatie_dagen': int,
-                'aantal_cycli': float,
-                'aantal_weken': int,  # NIEUW: voor week berekening
-                'start_datum': date  # NIEUW: voor week berekening
+                'violations_list': [Violation, ...],  # details['startweken'] per violation
+                'violations_per_startweek': {startweek: count},
+                'simulatie_dagen': int,  # 1 cyclus
+                'aantal_weken': int,
+                'start_datum': date  # theoretische maandag (week 1, dag 1)
             }
         """
-        # 1. Simuleer planning (start op theoretische maandag in simulatie)
-        planning_regels = self.simuleer_typetabel_planning(versie['id'], cycli=2.5)
-
-        # Start datum = eerste datum in planning (theoretische maandag)
-        start_datum = min(p.datum for p in planning_regels) if planning_regels else date.today()
-
+        # 1. Eén cyclus van het patroon (startweek 1, theoretische maandag)
+        planning_regels = self.simuleer_typetabel_planning(versie['id'], cycli=1)
+
+        result = {
+            'total_violations': 0,
+            'errors': 0,
+            'warnings': 0,
+            'violations_by_type': {},
+            'violations_list': [],
+            'violations_per_startweek': {},
+            'simulatie_dagen': len(planning_regels),
+            'aantal_weken': versie['aantal_weken'],
+            'start_datum': planning_regels[0].datum if planning_regels else date.today()
+        }
         if not planning_regels:
-            return {
-                'total_violations': 0,
-                'errors': 0,
-                'warnings': 0,
-                'violations_by_type': {},
-                'violations_list': [],
-                'simulatie_dagen': 0,
-                'aantal_cycli': 2.5,
-                'aantal_weken': versie['aantal_weken'],
-                'start_datum': start_datum
-            }
+            return result
 
         # 2. Load HR config + shift tijden + rode lijnen
         hr_config = self._load_hr_config()
         shift_tijden = self._load_shift_tijden()
-        rode_lijnen = self._load_rode_lijnen()
-
-        # 3. Setup ConstraintChecker
-        checker = ConstraintChecker(hr_config, shift_tijden)
-
-        # 4. Run validaties op theoretisch patroon
-        all_violations = []
-        gebruiker_ids = set(p.gebruiker_id for p in planning_regels)
-
-        for gebruiker_id in gebruiker_ids:
-            gebruiker_planning = [p for p in planning_regels if p.gebruiker_id == gebruiker_id]
-
-            results = checker.check_all(
-                planning=gebruiker_planning,
-                gebruiker_id=gebruiker_id,
-                rode_lijnen=rode_lijnen
-            )
-
-            for result in results.values():
-                all_violations.extend(result.violations)
-
-        # 5. Count + aggregate (deduplicatie op object ID)
-        seen_violation_ids = set()
-        unique_violations = []
-        violations_by_type = {}
-        errors = 0
-        warnings = 0
-
-        for v in all_violations:
-            violation_id = id(v)
-            if violation_id in seen_violation_ids:
-                continue  # Skip duplicaat
+        # Rode lijn periodes rond de simulatie (v0.6.29 - berekend, geen tabel)
+        rode_lijnen = periodes_rond(
+            result['start_datum'], result['start_datum'] + timedelta(weeks=versie['aantal_weken'])
+        )
 
-            seen_violation_ids.add(violation_id)
-            unique_violations.append(v)
+        # 3. Cyclische validatie over alle startweken
+        validator = CyclusValidator(
+            ConstraintChecker(hr_config, shift_tijden),
+            [p.shift_code for p in planning_regels],
+            rode_lijnen,
+            anker=result['start_datum']
+        )
+        violations = validator.valideer()
 
+        # 4. Count + aggregate
+        for v in violations:
             if v.severity.value == 'error':
-                errors += 1
+                result['errors'] += 1
             else:
-                warnings += 1
+                result['warnings'] += 1
 
             type_name = v.type.value
-            violations_by_type[type_name] = violations_by_type.get(type_name, 0) + 1
-
-        return {
-            'total_violations': len(seen_violation_ids),
-            'errors': errors,
-            'warnings': warnings,
-            'violations_by_type': violations_by_type,
-            'violations_list': unique_violations,
-            'simulatie_dagen': int(versie['aantal_weken'] * 7 * 2.5),
-            'aantal_cycli': 2.5,
-            'aantal_weken': versie['aantal_weken'],
-            'start_datum': start_datum
-        }
+            result['violations_by_type'][type_name] = result['violations_by_type'].get(type_name, 0) + 1
+
+            for startweek in v.details['startweken']:
+                per_startweek = result['violations_per_startweek']
+                per_startweek[startweek] = per_startweek.get(startweek, 0) + 1
+
+        result['total_violations'] = len(violations)
+        result['violations_list'] = violations
+        return result
+
+    def _startweken_tekst(self, startweken: List[int], aantal_weken: int) -> str:
+        """'alle startweken' of 'startweek 2, 4'"""
+        if len(startweken) == aantal_weken:
+            return "alle startweken"
+        return "startweek " + ", ".join(str(s) for s in startweken)
 
     def toon_validatie_resultaten_dialog(self, versie: Dict, result: Dict):
         """
@@ -1122,8 +1006,8 @@ class TypetabelBeheerScreen(QWidget):
         msg_parts = [
             f"<h3>Typetabel: '{versie['versie_naam']}'</h3>",
             f"<p><b>HR Validatie Resultaten</b></p>",
-            f"<p>Simulatie: {result['aantal_cycli']} cycli × {versie['aantal_weken']} weken = ",
-            f"{result['simulatie_dagen']} dagen</p>",
+            f"<p>Cyclische validatie: {result['simulatie_dagen']} dagen × ",
+            f"{versie['aantal_weken']} startweken</p>",
             "<hr>",
         ]
 
@@ -1194,7 +1078,10 @@ class TypetabelBeheerScreen(QWidget):
                         # Toon beschrijving (kort, eerste 80 chars)
                         beschrijving = v.beschrijving[:80] + "..." if len(v.beschrijving) > 80 else v.beschrijving
 
-                        msg_parts.append(f"<li><i>{locatie}</i>: {beschrijving}</li>")
+                        startweken = self._startweken_tekst(
+                            v.details.get('startweken', []), result['aantal_weken']
+                        )
+                        msg_parts.append(f"<li><i>{locatie} ({startweken})</i>: {beschrijving}</li>")
 
                     # Toon "... en X meer" als er meer zijn
                     if count > max_show:
@@ -1236,8 +1123,8 @@ class TypetabelBeheerScreen(QWidget):
         """
         msg_parts = [
             f"<b>Typetabel '{versie['versie_naam']}' Pre-Activatie Validatie</b><br><br>",
-            f"Simulatie: {result['aantal_cycli']} cycli × {versie['aantal_weken']} weken = ",
-            f"{result['simulatie_dagen']} dagen<br><br>",
+            f"Cyclische validatie: {result['simulatie_dagen']} dagen × ",
+            f"{versie['aantal_weken']} startweken<br><br>",
             f"<b>Gevonden violations:</b><br>",
             f"<span style='color: #dc3545;'>✗ {result['errors']} errors</span> | ",
             f"<span style='color: #ffc107;'>⚠ {result['warnings']} warnings</span><br><br>",
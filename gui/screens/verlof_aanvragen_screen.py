@@ -11,6 +11,7 @@ from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont
 from datetime import datetime, timedelta
 from database.connection import get_connection
+from services.maand_status_service import get_gepubliceerde_maanden
 from gui.styles import Styles, Colors, Fonts, Dimensions, TableConfig
 import sqlite3
 
@@ -549,10 +550,11 @@ class VerlofAanvragenScreen(QWidget):
             QMessageBox.critical(self, "Database Fout", f"Kon aanvraag niet opslaan:\n{e}")
 
     def check_gepubliceerde_maanden(self, start: datetime.date, eind: datetime.date) -> bool:
-        """Check of periode gepubliceerde maanden bevat"""
-        # TODO: Implementeren wanneer planning.status wordt gebruikt
-        # Voor nu: return False (alles is concept)
-        return False
+        """Check of periode gepubliceerde maanden bevat (maand_status - v0.6.29)"""
+        try:
+            return bool(get_gepubliceerde_maanden(start.isoformat(), eind.isoformat()))
+        except sqlite3.Error:
+            return False
 
     def check_overlap(self, start: datetime.date, eind: datetime.date) -> Dict[str, str]:
         """
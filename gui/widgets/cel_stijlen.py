@@ -0,0 +1,206 @@
+# gui/widgets/cel_stijlen.py
+"""
+Cel Stijlen Cache
+v0.6.29 - Geïnterneerde cel stijlen voor de grid kalenders
+
+Probleem: elke cel bouwde een eigen multi-line QSS f-string en riep setStyleSheet()
+aan (bij bouwen, edit, selectie en overlay update). Qt parsed en re-polisht dan
+elke widget apart, ook al zijn er maar een handvol unieke combinaties.
+
+Oplossing: één cache, gekeyed op (achtergrond, overlay, border flags, selectie, notitie):
+- CelStijlCache.get(): voorberekende QColor/QPen objecten voor de delegate
+  (PlannerCelDelegate) - geen CSS parsing of kleur mixing tijdens paint
+- CelStijlCache.stijl_id() + container_stylesheet(): voor QLabel cellen
+  (TeamlidGridKalender) krijgt elke cel enkel een dynamic property
+  (celStijl="s3"); de container krijgt 1 stylesheet met alle gebruikte regels
+
+Cache is per thema (Colors wijzigt bij dark mode).
+
+USAGE:
+    stijl = CelStijlCache.get(achtergrond, overlay, is_rode_lijn_start=True)
+    painter.fillRect(rect, stijl.vulling)
+"""
+from typing import Dict, List, Optional, Tuple, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+import re
+from PyQt6.QtGui import QColor, QPen
+from gui.styles import Colors, Fonts, ThemeManager
+
+
+# Border kleuren
+RODE_LIJN_KLEUR = "#dc3545"
+MAAND_KADER_KLEUR = "#2196F3"
+NOTITIE_KLEUR = "#00E676"
+SELECTIE_KLEUR = "rgba(33, 150, 243, 0.3)"
+
+# Dynamic property naam voor QLabel cellen
+STIJL_PROPERTY = "celStijl"
+
+
+_RGBA_PATROON = re.compile(r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+)\s*)?\)")
+
+
+@lru_cache(maxsize=128)
+def css_naar_qcolor(css: str) -> QColor:
+    """
+    Converteer CSS kleur (zoals gebruikt in overlays) naar QColor
+
+    Ondersteunt: #RRGGBB, named colors, rgba(r, g, b, a) met a in 0..1
+    en qlineargradient met gelijke stops (eerste stop wordt gebruikt).
+    """
+    match = _RGBA_PATROON.search(css)
+    if match:
+        r, g, b, a = match.groups()
+        alpha = float(a) if a is not None else 1.0
+        return QColor(int(r), int(g), int(b), int(round(alpha * 255)))
+    return QColor(css)
+
+
+def meng_kleur(boven: QColor, onder: QColor) -> QColor:
+    """Alpha-blend semi-transparante kleur over ondoorzichtige kleur → ondoorzichtig"""
+    alpha = boven.alphaF()
+    return QColor(
+        round(boven.red() * alpha + onder.red() * (1 - alpha)),
+        round(boven.green() * alpha + onder.green() * (1 - alpha)),
+        round(boven.blue() * alpha + onder.blue() * (1 - alpha)),
+    )
+
+
+@dataclass
+class CelStijl:
+    """Voorberekende stijl voor één combinatie van cel eigenschappen"""
+    vulling: QColor                     # Achtergrond incl. overlay en selectie (ondoorzichtig)
+    rand_pen: QPen                      # Basis 1px border
+    borders: List[Tuple[str, QColor, int]] = field(default_factory=list)  # (zijde, kleur, breedte)
+    qss_body: str = ""                  # Equivalente QSS declaraties (voor QLabel cellen)
+
+
+# Key: (thema, achtergrond, overlay, rode_lijn, notitie, onder, links, rechts, geselecteerd)
+StijlKey = Tuple[str, str, Optional[str], bool, bool, bool, bool, bool, bool]
+
+
+class CelStijlCache:
+    """Singleton cache met geïnterneerde cel stijlen"""
+
+    _stijlen: Dict[StijlKey, CelStijl] = {}
+    _ids: Dict[StijlKey, str] = {}
+
+    @classmethod
+    def _key(cls, achtergrond: str, overlay: Optional[str], is_rode_lijn_start: bool,
+             heeft_notitie: bool, onder_kader: bool, links_kader: bool,
+             rechts_kader: bool, is_geselecteerd: bool) -> StijlKey:
+        return (ThemeManager.get_theme(), achtergrond, overlay, is_rode_lijn_start,
+                heeft_notitie, onder_kader, links_kader, rechts_kader, is_geselecteerd)
+
+    @classmethod
+    def get(cls, achtergrond: str, overlay: Optional[str] = None, is_rode_lijn_start: bool = False,
+            heeft_notitie: bool = False, onder_kader: bool = False, links_kader: bool = False,
+            rechts_kader: bool = False, is_geselecteerd: bool = False) -> CelStijl:
+        """Haal (of bouw eenmalig) stijl op voor deze combinatie"""
+        key = cls._key(achtergrond, overlay, is_rode_lijn_start, heeft_notitie,
+                       onder_kader, links_kader, rechts_kader, is_geselecteerd)
+        stijl = cls._stijlen.get(key)
+        if stijl is None:
+            stijl = cls._bouw(key)
+            cls._stijlen[key] = stijl
+        return stijl
+
+    @classmethod
+    def _bouw(cls, key: StijlKey) -> CelStijl:
+        (_, achtergrond, overlay, is_rode_lijn_start, heeft_notitie,
+         onder_kader, links_kader, rechts_kader, is_geselecteerd) = key
+
+        # Overlay vervangt weekend/feestdag kleur en ligt op de (witte) container achtergrond
+        if overlay:
+            vulling = meng_kleur(css_naar_qcolor(overlay), css_naar_qcolor(Colors.BG_WHITE))
+            qss_achtergrond = overlay
+        else:
+            vulling = QColor(css_naar_qcolor(achtergrond))
+            qss_achtergrond = achtergrond
+
+        if is_geselecteerd:
+            vulling = meng_kleur(css_naar_qcolor(SELECTIE_KLEUR), vulling)
+            qss_achtergrond = vulling.name()
+
+        # Extra borders (volgorde = prioriteit, later tekent over eerder - zoals in QSS)
+        borders: List[Tuple[str, QColor, int]] = []
+        if is_rode_lijn_start:
+            borders.append(('left', css_naar_qcolor(RODE_LIJN_KLEUR), 4))
+        if heeft_notitie:
+            borders.append(('top', css_naar_qcolor(NOTITIE_KLEUR), 3))
+            borders.append(('right', css_naar_qcolor(NOTITIE_KLEUR), 3))
+        if onder_kader:
+            borders.append(('bottom', css_naar_qcolor(MAAND_KADER_KLEUR), 3))
+        if links_kader:
+            borders.append(('left', css_naar_qcolor(MAAND_KADER_KLEUR), 3))
+        if rechts_kader:
+            borders.append(('right', css_naar_qcolor(MAAND_KADER_KLEUR), 3))
+
+        qss_regels = [
+            f"background-color: {qss_achtergrond};",
+            "color: #000000;",
+            f"font-size: {Fonts.SIZE_SMALL}px;",
+            "font-weight: bold;",
+            f"border: 1px solid {Colors.BORDER_LIGHT};",
+            "padding: 4px;",
+        ]
+        for zijde, kleur, breedte in borders:
+            qss_regels.append(f"border-{zijde}: {breedte}px solid {kleur.name()};")
+        qss_regels.append("qproperty-alignment: AlignCenter;")
+
+        return CelStijl(
+            vulling=vulling,
+            rand_pen=QPen(css_naar_qcolor(Colors.BORDER_LIGHT), 1),
+            borders=borders,
+            qss_body="\n    ".join(qss_regels)
+        )
+
+    # ---------- QLabel cellen (dynamic property) ----------
+
+    @classmethod
+    def stijl_id(cls, achtergrond: str, overlay: Optional[str] = None, is_rode_lijn_start: bool = False,
+                 heeft_notitie: bool = False, onder_kader: bool = False, links_kader: bool = False,
+                 rechts_kader: bool = False, is_geselecteerd: bool = False) -> str:
+        """Korte id voor stijl combinatie (waarde voor de celStijl property)"""
+        key = cls._key(achtergrond, overlay, is_rode_lijn_start, heeft_notitie,
+                       onder_kader, links_kader, rechts_kader, is_geselecteerd)
+        stijl_id = cls._ids.get(key)
+        if stijl_id is None:
+            if key not in cls._stijlen:
+                cls._stijlen[key] = cls._bouw(key)
+            stijl_id = f"s{len(cls._ids)}"
+            cls._ids[key] = stijl_id
+        return stijl_id
+
+    @classmethod
+    def container_stylesheet(cls, stijl_ids: Iterable[str]) -> str:
+        """
+        Eén stylesheet met een regel per gebruikte stijl id
+
+        Zet dit op de container: cellen matchen via QLabel[celStijl="sX"]
+        """
+        gewenst = set(stijl_ids)
+        regels = []
+        for key, stijl_id in cls._ids.items():
+            if stijl_id in gewenst:
+                regels.append(
+                    f'QLabel[{STIJL_PROPERTY}="{stijl_id}"] {{\n    {cls._stijlen[key].qss_body}\n}}'
+                )
+        return "\n".join(regels)
+
+    @classmethod
+    def qss(cls, achtergrond: str, overlay: Optional[str] = None) -> str:
+        """Geïnterneerde QLabel stylesheet voor losse cellen (basis stijl)"""
+        stijl = cls.get(achtergrond, overlay)
+        return f"QLabel {{\n    {stijl.qss_body}\n}}"
+
+    @classmethod
+    def clear(cls) -> None:
+        """Wis cache (bijv. voor tests)"""
+        cls._stijlen.clear()
+        cls._ids.clear()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        return {'stijlen': len(cls._stijlen), 'property_ids': len(cls._ids)}
@@ -4,13 +4,19 @@ Grid Kalender Base Class
 Gemeenschappelijke functionaliteit voor planner en teamlid kalenders
 UPDATED: Database compatibiliteit met nieuwe planning tabel structuur
 """
-from typing import Dict, Any, List, Optional, Tuple
-from PyQt6.QtWidgets import QWidget, QDialog, QPushButton, QLabel, QComboBox, QHBoxLayout
+from typing import Dict, Any, List, Optional, Set, Tuple
+from PyQt6.QtWidgets import QWidget, QDialog, QPushButton, QLabel, QComboBox, QHBoxLayout, QMessageBox
 from PyQt6.QtGui import QFont
 from datetime import datetime, timedelta
 from database.connection import get_connection
-from gui.styles import Colors, Fonts, Styles, Dimensions
+from gui.styles import Fonts, Styles, Dimensions
 from services.term_code_service import TermCodeService
+from services.dag_kalender import DagKalender
+from services.rode_lijnen_service import RodeLijnenKalender, RodeLijnStarts
+from services.rooster_store import RoosterStore, VerlofPerioden, laad_rooster, laad_verlof_perioden
+from gui.widgets.cel_stijlen import CelStijlCache
+from gui.widgets.maand_loader import MaandLoader, LaadStap
+from collections import OrderedDict
 import calendar
 
 
@@ -27,27 +33,141 @@ class GridKalenderBase(QWidget):
         self.jaar: int = jaar
         self.maand: int = maand
         self.gebruikers_data: List[Dict[str, Any]] = []
-        self.planning_data: Dict[str, Dict[int, Dict[str, Any]]] = {}  # {datum_str: {gebruiker_id: shift_info}}
-        self.feestdagen: List[str] = []  # List van datum strings
-        self.verlof_data: Dict[str, Dict[int, Dict[str, Any]]] = {}  # {datum_str: {gebruiker_id: verlof_info}}
+        self.rooster: RoosterStore = RoosterStore()  # Planning (compact, v0.6.29 - was planning_data dicts)
+        self.dag_kalender: DagKalender = DagKalender.leeg()  # Weekdag/dag_type/feestdag per dag (v0.6.29)
+        self.feestdagen: Dict[str, str] = {}  # {datum_str: naam}
+        self.verlof_perioden: VerlofPerioden = VerlofPerioden()  # Verlof als intervallen (was verlof_data per dag)
         self.filter_gebruikers: Dict[int, bool] = {}  # {gebruiker_id: zichtbaar}
 
         # UI components (gedefinieerd in subclasses)
         self.grid_container: Optional[QWidget] = None
 
+        # Asynchroon laden bij maand navigatie (v0.6.29)
+        self.maand_loader = MaandLoader(self)
+        self.maand_loader.dataset_geladen.connect(self.on_dataset_geladen)  # type: ignore
+        self.maand_loader.laden_fout.connect(self.on_laden_fout)  # type: ignore
+        self.maand_cache: Dict[Tuple, Dict[str, Any]] = OrderedDict()  # {get_cache_sleutel(): datasets}
+        self.geladen_datasets: Set[str] = set()  # Verse datasets van de lopende load
+
+    # ---------- Asynchroon laden (v0.6.29) ----------
+
+    # Aantal maanden waarvan datasets bewaard worden voor directe weergave
+    MAX_GECACHTE_MAANDEN = 3
+
+    def laad_maand_async(self) -> None:
+        """
+        Laad huidige maand in de achtergrond (maand navigatie)
+
+        1. Direct: gecachte datasets van deze maand, anders skelet (lege cellen)
+        2. Worker levert datasets één voor één → verwerk_dataset() vult de grid aan
+        Een nieuwe aanroep annuleert de vorige load (generatie token).
+        """
+        self.geladen_datasets.clear()
+        gecacht = self.maand_cache.get(self.get_cache_sleutel())
+        if gecacht:
+            for naam, data in list(gecacht.items()):
+                self.verwerk_dataset(naam, data)
+        else:
+            self.toon_skelet()
+
+        self.maand_loader.start(self.get_laad_stappen())
+
+    def annuleer_laden(self) -> None:
+        """Annuleer lopende async load (voor synchrone reload na bewerkingen)"""
+        self.maand_loader.annuleer()
+        self.maand_cache.pop(self.get_cache_sleutel(), None)
+
+    def on_dataset_geladen(self, naam: str, data: Any) -> None:
+        """Dataset van actuele load: cachen en tonen"""
+        key = self.get_cache_sleutel()
+        self.maand_cache.setdefault(key, {})[naam] = data
+        self.maand_cache.move_to_end(key)
+        while len(self.maand_cache) > self.MAX_GECACHTE_MAANDEN:
+            self.maand_cache.popitem(last=False)
+
+        self.geladen_datasets.add(naam)
+        self.verwerk_dataset(naam, data)
+
+    def get_cache_sleutel(self) -> Tuple:
+        """Sleutel voor maand_cache: subclasses met andere weergave periodes breiden dit uit"""
+        return (self.jaar, self.maand)
+
+    def is_dataset_actueel(self, naam: str) -> bool:
+        """True als dataset niet (meer) aan het laden is"""
+        return not self.maand_loader.bezig or naam in self.geladen_datasets
+
+    def opruimen(self) -> None:
+        """
+        Geef data vrij bij sluiten van het scherm (v0.6.29)
+
+        Wordt aangeroepen vóór deleteLater: lopende load annuleren zodat de
+        worker geen resultaten meer aflevert, en caches direct vrijgeven i.p.v.
+        te wachten tot Qt de widget effectief verwijdert.
+        """
+        self.maand_loader.annuleer()
+        self.maand_cache.clear()
+        self.geladen_datasets.clear()
+        self.rooster = RoosterStore()
+        self.verlof_perioden = VerlofPerioden()
+
+    def get_geheugen_stats(self) -> Dict[str, Any]:
+        """Omvang van de in-memory data (geheugen diagnose)"""
+        return {
+            'gecachte_maanden': len(self.maand_cache),
+            'gebruikers': len(self.gebruikers_data),
+            'verlof_perioden': len(self.verlof_perioden),
+            **self.rooster.get_stats(),
+        }
+
+    def on_laden_fout(self, naam: str, melding: str) -> None:
+        QMessageBox.critical(self, "Database Fout", f"Kon {naam} niet laden:\n{melding}")
+
+    def toon_skelet(self) -> None:
+        """Grid met nieuwe datums maar zonder planning/verlof (data volgt)"""
+        self.rooster = RoosterStore()
+        self.verlof_perioden = VerlofPerioden()
+        self.build_grid()
+
+    def get_laad_stappen(self) -> List[LaadStap]:
+        """
+        Template method: (naam, functie) stappen voor async load
+
+        Functies draaien in een worker thread: enkel fetch_* / waarden
+        gebruiken, geen widget state.
+        """
+        return []
+
+    def verwerk_dataset(self, naam: str, data: Any) -> None:
+        """Template method: pas geladen dataset toe (GUI thread)"""
+        pass
+
+    def build_grid(self) -> None:
+        """Template method: bouw/herbind grid"""
+        pass
+
+    # ---------- Data laden ----------
+
     def load_feestdagen(self) -> None:
-        """Laad feestdagen voor huidig jaar"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT datum FROM feestdagen 
-            WHERE datum LIKE ?
-        """, (f"{self.jaar}-%",))
-        self.feestdagen = [row['datum'] for row in cursor.fetchall()]
-        conn.close()
+        """Laad kalender (feestdagen, dag types) voor huidig jaar ± 1"""
+        self.zet_dag_kalender(self.fetch_dag_kalender(self.jaar))
+
+    @staticmethod
+    def fetch_dag_kalender(jaar: int) -> DagKalender:
+        """Gedeelde DagKalender voor jaar ± 1 (GUI thread: kan de singleton herladen)"""
+        return DagKalender.voor_jaren(jaar - 1, jaar + 1)
+
+    def zet_dag_kalender(self, kalender: DagKalender) -> None:
+        """Zet kalender + feestdagen (GUI thread)"""
+        self.dag_kalender = kalender
+        self.feestdagen = kalender.feestdagen()
 
     def load_gebruikers(self, alleen_actief: bool = True) -> None:
         """Laad gebruikers lijst"""
+        self.zet_gebruikers(self.fetch_gebruikers(alleen_actief))
+
+    @staticmethod
+    def fetch_gebruikers(alleen_actief: bool = True) -> List[Dict[str, Any]]:
+        """Gebruikers lijst uit database (thread-safe: geen widget state)"""
         conn = get_connection()
         cursor = conn.cursor()
 
@@ -59,9 +179,12 @@ class GridKalenderBase(QWidget):
         query += " ORDER BY is_reserve, achternaam, voornaam"
 
         cursor.execute(query)
-        nieuwe_gebruikers_data = cursor.fetchall()
+        gebruikers = cursor.fetchall()
         conn.close()
+        return gebruikers
 
+    def zet_gebruikers(self, nieuwe_gebruikers_data: List[Dict[str, Any]]) -> None:
+        """Zet gebruikers lijst en werk filter bij (GUI thread)"""
         # Update gebruikers data
         nieuwe_gebruiker_ids = {user['id'] for user in nieuwe_gebruikers_data}
         self.gebruikers_data = nieuwe_gebruikers_data
@@ -93,65 +216,13 @@ class GridKalenderBase(QWidget):
             eind_datum: YYYY-MM-DD
             alleen_gepubliceerd: Als True, toon alleen gepubliceerde planning (voor teamleden)
         """
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # Bouw WHERE clause
-        where_clause = "WHERE p.datum BETWEEN ? AND ?"
-        if alleen_gepubliceerd:
-            where_clause += " AND p.status = 'gepubliceerd'"
-
-        # Haal planning op met details van shift_codes en speciale_codes
-        query = f"""
-            SELECT
-                p.gebruiker_id,
-                p.datum,
-                p.shift_code,
-                p.notitie,
-                p.status,
-                -- Details van shift_codes (indien match)
-                sc.shift_type as shift_naam,
-                sc.start_uur,
-                sc.eind_uur,
-                w.naam as werkpost_naam,
-                -- Details van speciale_codes (indien match)
-                spc.naam as speciale_naam
-            FROM planning p
-            LEFT JOIN shift_codes sc ON p.shift_code = sc.code
-            LEFT JOIN werkposten w ON sc.werkpost_id = w.id
-            LEFT JOIN speciale_codes spc ON p.shift_code = spc.code
-            {where_clause}
-        """
-        cursor.execute(query, (start_datum, eind_datum))
-
-        # Organiseer per datum per gebruiker
-        self.planning_data = {}
-        for row in cursor.fetchall():
-            datum = row['datum']
-            gebruiker_id = row['gebruiker_id']
-
-            if datum not in self.planning_data:
-                self.planning_data[datum] = {}
-
-            # Bepaal of het een shift of speciale code is
-            is_speciale_code = row['speciale_naam'] is not None
-
-            self.planning_data[datum][gebruiker_id] = {
-                'shift_code': row['shift_code'],
-                'notitie': row['notitie'],
-                'status': row['status'],
-                # Shift details (None als speciale code)
-                'shift_naam': row['shift_naam'],
-                'start_tijd': row['start_uur'],
-                'eind_tijd': row['eind_uur'],
-                'werkpost_naam': row['werkpost_naam'],
-                # Speciale code details (None als shift)
-                'speciale_code': row['shift_code'] if is_speciale_code else None,
-                'speciale_naam': row['speciale_naam'],
-                'is_speciale_code': is_speciale_code
-            }
+        self.rooster = self.fetch_planning_data(start_datum, eind_datum, alleen_gepubliceerd)
 
-        conn.close()
+    @staticmethod
+    def fetch_planning_data(start_datum: str, eind_datum: str,
+                            alleen_gepubliceerd: bool = False) -> RoosterStore:
+        """Planning voor periode als compacte RoosterStore (thread-safe: geen widget state)"""
+        return laad_rooster(start_datum, eind_datum, alleen_gepubliceerd)
 
     def load_verlof_data(self, start_datum: str, eind_datum: str) -> None:
         """
@@ -160,60 +231,26 @@ class GridKalenderBase(QWidget):
             start_datum: YYYY-MM-DD
             eind_datum: YYYY-MM-DD
         """
-        conn = get_connection()
-        cursor = conn.cursor()
+        self.verlof_perioden = self.fetch_verlof_data(start_datum, eind_datum)
 
-        cursor.execute("""
-            SELECT 
-                gebruiker_id,
-                start_datum,
-                eind_datum,
-                status,
-                aangevraagd_op
-            FROM verlof_aanvragen
-            WHERE (start_datum BETWEEN ? AND ?)
-               OR (eind_datum BETWEEN ? AND ?)
-               OR (start_datum <= ? AND eind_datum >= ?)
-        """, (start_datum, eind_datum, start_datum, eind_datum, start_datum, eind_datum))
-
-        # Organiseer per datum per gebruiker
-        self.verlof_data = {}
-        for row in cursor.fetchall():
-            gebruiker_id = row['gebruiker_id']
-            start = datetime.strptime(row['start_datum'], '%Y-%m-%d')
-            eind = datetime.strptime(row['eind_datum'], '%Y-%m-%d')
-
-            # Voor elke dag in de verlof periode
-            huidige = start
-            while huidige <= eind:
-                datum_str = huidige.strftime('%Y-%m-%d')
-
-                if datum_str not in self.verlof_data:
-                    self.verlof_data[datum_str] = {}
-
-                self.verlof_data[datum_str][gebruiker_id] = {
-                    'status': row['status'],
-                    'aangevraagd_op': row['aangevraagd_op']
-                }
-
-                huidige += timedelta(days=1)
-
-        conn.close()
+    @staticmethod
+    def fetch_verlof_data(start_datum: str, eind_datum: str) -> VerlofPerioden:
+        """Verlof intervallen per gebruiker voor periode (thread-safe: geen widget state)"""
+        return laad_verlof_perioden(start_datum, eind_datum)
 
     def get_datum_achtergrond(self, datum_str: str) -> str:
         """
         Bepaal achtergrondkleur voor datum
         Returns: Hex kleur code
         """
-        datum = datetime.strptime(datum_str, '%Y-%m-%d')
-        weekdag = datum.weekday()  # 0=Ma, 6=Zo
+        dag_type = self.dag_kalender.dag_type(datum_str)  # Vooraf berekend (per cel aangeroepen)
 
         # Zondag of feestdag
-        if weekdag == 6 or datum_str in self.feestdagen:
+        if dag_type == 'zondag':
             return '#FFF9C4'  # Geel
 
         # Zaterdag
-        elif weekdag == 5:
+        elif dag_type == 'zaterdag':
             return '#EEEEEE'  # Lichtgrijs
 
         # Weekdag
@@ -229,31 +266,21 @@ class GridKalenderBase(QWidget):
             mode: 'planner' of 'teamlid'
         Returns: RGBA kleur string of None
         """
-        # Check verlof data
-        verlof_info = None
-        if datum_str in self.verlof_data and gebruiker_id in self.verlof_data[datum_str]:
-            verlof_info = self.verlof_data[datum_str][gebruiker_id]
-
-        # Check shift data voor VV/DA/VD
-        shift_info = None
-        if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-            shift_info = self.planning_data[datum_str][gebruiker_id]
-
         if mode == 'planner':
             # Planner ziet verlof aanvragen status
-            if verlof_info:
-                if verlof_info['status'] == 'goedgekeurd':
+            verlof = self.verlof_perioden.get(datum_str, gebruiker_id)
+            if verlof:
+                if verlof.status == 'goedgekeurd':
                     return 'rgba(144, 238, 144, 0.4)'  # Lichtgroen
-                elif verlof_info['status'] == 'geweigerd':
+                elif verlof.status == 'geweigerd':
                     return 'rgba(255, 182, 193, 0.4)'  # Lichtrood
-                elif verlof_info['status'] == 'pending':
+                elif verlof.status == 'pending':
                     return 'rgba(173, 216, 230, 0.4)'  # Lichtblauw
 
         elif mode == 'teamlid':
             # Teamlid ziet eigen verlof/DA/VD via shift_code
-            if shift_info:
-                code = shift_info.get('shift_code', '')
-
+            code = self.rooster.get_code(datum_str, gebruiker_id)
+            if code:
                 # Gebruik term-based checks voor systeem codes
                 verlof_code = TermCodeService.get_code_for_term('verlof')
                 adv_code = TermCodeService.get_code_for_term('arbeidsduurverkorting')
@@ -272,16 +299,7 @@ class GridKalenderBase(QWidget):
         Haal shift code op voor weergave
         Returns: Shift code string (7101, RX, VV, etc.) of lege string
         """
-        if datum_str not in self.planning_data:
-            return ""
-
-        if gebruiker_id not in self.planning_data[datum_str]:
-            return ""
-
-        shift_info = self.planning_data[datum_str][gebruiker_id]
-
-        # Return gewoon de shift_code
-        return shift_info.get('shift_code', '')
+        return self.rooster.get_code(datum_str, gebruiker_id)
 
     def get_cel_tooltip(self, datum_str: str, gebruiker_id: int, mode: str) -> str:
         """
@@ -290,52 +308,45 @@ class GridKalenderBase(QWidget):
         tooltip_lines = []
 
         # Datum info
-        datum = datetime.strptime(datum_str, '%Y-%m-%d')
+        datum = datetime.fromisoformat(datum_str)
         tooltip_lines.append(f"Datum: {datum.strftime('%d-%m-%Y')}")
 
-        # Shift info
-        if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-            shift_info = self.planning_data[datum_str][gebruiker_id]
-
-            code = shift_info.get('shift_code', '')
+        # Shift info (gedeelde metadata uit code catalogus)
+        info = self.rooster.get_code_info(datum_str, gebruiker_id)
+        if info:
+            code = info.code
 
-            if shift_info.get('is_speciale_code'):
+            if info.is_speciale_code:
                 # Speciale code
-                tooltip_lines.append(f"{code}: {shift_info.get('speciale_naam', '')}")
-            elif code:
+                tooltip_lines.append(f"{code}: {info.speciale_naam}")
+            else:
                 # Reguliere shift
-                shift_naam = shift_info.get('shift_naam', '')
-                start = shift_info.get('start_tijd', '')
-                eind = shift_info.get('eind_tijd', '')
-                werkpost = shift_info.get('werkpost_naam', '')
-
                 tooltip_lines.append(f"Shift: {code}")
-                if shift_naam:
-                    tooltip_lines.append(f"Type: {shift_naam}")
-                if werkpost:
-                    tooltip_lines.append(f"Werkpost: {werkpost}")
-                if start and eind:
-                    tooltip_lines.append(f"Tijden: {start} - {eind}")
+                if info.shift_naam:
+                    tooltip_lines.append(f"Type: {info.shift_naam}")
+                if info.werkpost_naam:
+                    tooltip_lines.append(f"Werkpost: {info.werkpost_naam}")
+                if info.start_tijd and info.eind_tijd:
+                    tooltip_lines.append(f"Tijden: {info.start_tijd} - {info.eind_tijd}")
 
         # Verlof info (alleen voor planner mode)
-        if mode == 'planner' and datum_str in self.verlof_data and gebruiker_id in self.verlof_data[datum_str]:
-            verlof_info = self.verlof_data[datum_str][gebruiker_id]
+        verlof = self.verlof_perioden.get(datum_str, gebruiker_id) if mode == 'planner' else None
+        if verlof:
             status_tekst = {
                 'pending': '⏳ Verlof aanvraag in behandeling',
                 'goedgekeurd': '✓ Verlof goedgekeurd',
                 'geweigerd': '✗ Verlof geweigerd'
             }
             tooltip_lines.append("")
-            tooltip_lines.append(status_tekst[verlof_info['status']])
-            tooltip_lines.append(f"Aangevraagd op: {verlof_info['aangevraagd_op']}")
+            tooltip_lines.append(status_tekst[verlof.status])
+            tooltip_lines.append(f"Aangevraagd op: {verlof.aangevraagd_op}")
 
         # Notitie info (voor alle modes)
-        if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-            notitie = self.planning_data[datum_str][gebruiker_id].get('notitie', '')
-            if notitie:
-                tooltip_lines.append("")
-                tooltip_lines.append("--- NOTITIE ---")
-                tooltip_lines.append(notitie)
+        notitie = self.rooster.get_notitie(datum_str, gebruiker_id)
+        if notitie:
+            tooltip_lines.append("")
+            tooltip_lines.append("--- NOTITIE ---")
+            tooltip_lines.append(notitie)
 
         return '\n'.join(tooltip_lines) if tooltip_lines else ""
 
@@ -360,7 +371,14 @@ class GridKalenderBase(QWidget):
         # Eind datum (met offset)
         eind = laatste_dag + timedelta(days=eind_offset)
 
-        # Genereer alle datums
+        return self.maak_datum_lijst(start, eind)
+
+    def maak_datum_lijst(self, start: datetime, eind: datetime) -> List[Tuple[str, str]]:
+        """
+        (datum_str, label) voor elke dag van start t/m eind (v0.6.29 - ook vrije periodes)
+
+        Dagen buiten de huidige maand krijgen de maand naam in hun label.
+        """
         datum_lijst = []
         huidige = start
         while huidige <= eind:
@@ -412,56 +430,21 @@ class GridKalenderBase(QWidget):
         Genereer stylesheet voor cel met optionele overlay
 
         Overlay wordt als achtergrondkleur gebruikt (met opacity voor transparantie)
+        v0.6.29: string komt geïnterneerd uit CelStijlCache (1x opgebouwd per combinatie)
         """
-        if overlay:
-            # Overlay overschrijft achtergrond (overlay heeft al opacity voor transparantie effect)
-            return f"""
-                QLabel {{
-                    background-color: {overlay};
-                    color: #000000;
-                    font-size: {Fonts.SIZE_SMALL}px;
-                    font-weight: bold;
-                    border: 1px solid {Colors.BORDER_LIGHT};
-                    padding: 4px;
-                    qproperty-alignment: AlignCenter;
-                }}
-            """
-        else:
-            return f"""
-                QLabel {{
-                    background-color: {achtergrond};
-                    color: #000000;
-                    font-size: {Fonts.SIZE_SMALL}px;
-                    font-weight: bold;
-                    border: 1px solid {Colors.BORDER_LIGHT};
-                    padding: 4px;
-                    qproperty-alignment: AlignCenter;
-                }}
-            """
+        return CelStijlCache.qss(achtergrond, overlay)
 
     def load_rode_lijnen(self) -> None:
         """Laad rode lijnen (28-daagse HR-cycli) voor huidige periode"""
-        conn = get_connection()
-        cursor = conn.cursor()
+        self.rode_lijnen_starts: RodeLijnStarts = self.fetch_rode_lijnen_starts()
 
-        # Laad alle rode lijnen start datums (deze markeren begin van een nieuwe periode)
-        cursor.execute("""
-            SELECT start_datum, eind_datum, periode_nummer
-            FROM rode_lijnen
-            ORDER BY start_datum
-        """)
-
-        # Dictionary met start_datum als key voor snelle lookup
-        # Converteer datetime naar date string (YYYY-MM-DD)
-        self.rode_lijnen_starts: Dict[str, int] = {}
-        for row in cursor.fetchall():
-            datum_str = row['start_datum']
-            # Strip timestamp als die er is (2024-07-28T00:00:00 -> 2024-07-28)
-            if 'T' in datum_str:
-                datum_str = datum_str.split('T')[0]
-            self.rode_lijnen_starts[datum_str] = row['periode_nummer']
-
-        conn.close()
+    @staticmethod
+    def fetch_rode_lijnen_starts() -> RodeLijnStarts:
+        """
+        Start datum → periode nummer van alle rode lijnen (GUI thread: gedeelde kalender)
+        v0.6.29: berekend uit rode_lijnen_config (RodeLijnenKalender), geen tabel query
+        """
+        return RodeLijnenKalender.get_instance().starts()
 
     def update_title(self) -> None:
         """Update titel met maand/jaar"""
@@ -469,6 +452,20 @@ class GridKalenderBase(QWidget):
                    'Juli', 'Augustus', 'September', 'Oktober', 'November', 'December']
         self.title_label.setText(f"Planning {maanden[self.maand - 1]} {self.jaar}")
 
+    def sync_maand_selectors(self) -> None:
+        """
+        Zet jaar/maand combo's op huidige periode zonder refresh te triggeren (v0.6.29)
+
+        Vorige/volgende knoppen laden de data al zelf; zonder signal blokkering
+        zou elke combo wijziging de volledige maand nog eens herladen.
+        """
+        for combo in (self.jaar_combo, self.maand_combo):
+            combo.blockSignals(True)
+        self.jaar_combo.setCurrentText(str(self.jaar))
+        self.maand_combo.setCurrentIndex(self.maand - 1)
+        for combo in (self.jaar_combo, self.maand_combo):
+            combo.blockSignals(False)
+
     def on_jaar_changed(self, jaar_str: str) -> None:
         """Jaar gewijzigd"""
         self.refresh_data(int(jaar_str), self.maand)
@@ -0,0 +1,136 @@
+# gui/widgets/maand_loader.py
+"""
+Maand Loader
+v0.6.29 - Asynchroon laden van maand data voor de grid kalenders
+
+Probleem: load_initial_data() voerde alle queries (gebruikers, feestdagen,
+rode lijnen, planning, verlof, cache preload) uit op de GUI thread. Het venster
+bevroor en snel doorklikken stapelde meerdere volledige loads op.
+
+Oplossing:
+- Laad stappen draaien sequentieel in een QThreadPool worker
+- Elke load krijgt een generatie nummer; een nieuwe load maakt de vorige
+  ongeldig (worker stopt bij de volgende stap, resultaten worden genegeerd)
+- Elke stap levert zijn dataset apart op (dataset_geladen) zodat de grid
+  progressief gevuld kan worden
+
+Stap functies draaien in de worker thread: ze mogen GEEN widget state lezen
+of schrijven en openen hun eigen database connectie. Ze doen enkel leesqueries
+en geven nieuwe objecten terug: schrijven (ensure_jaar_data) en gedeelde
+singletons (DagKalender, RodeLijnenKalender, ReferentieCatalogus,
+ValidationCache) horen op de GUI thread, vóór start() of in de dataset handler.
+
+USAGE:
+    loader = MaandLoader(self)
+    loader.dataset_geladen.connect(self.verwerk_dataset)
+    loader.start([('planning', lambda: fetch_planning(start, eind)), ...])
+"""
+from typing import Any, Callable, List, Tuple
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+LaadStap = Tuple[str, Callable[[], Any]]
+
+
+class _LaadSignalen(QObject):
+    """Signalen vanuit worker thread (QRunnable is geen QObject)"""
+    dataset = pyqtSignal(int, str, object)   # generatie, stap naam, data
+    klaar = pyqtSignal(int)                  # generatie
+    fout = pyqtSignal(int, str, str)         # generatie, stap naam, foutmelding
+
+
+class _LaadTaak(QRunnable):
+    """Worker die de laad stappen van één generatie uitvoert"""
+
+    def __init__(self, generatie: int, stappen: List[LaadStap],
+                 is_actueel: Callable[[int], bool]):
+        super().__init__()
+        self.generatie = generatie
+        self.stappen = stappen
+        self.is_actueel = is_actueel
+        self.signalen = _LaadSignalen()
+        self.afgelopen = False
+
+    def run(self) -> None:
+        try:
+            for naam, functie in self.stappen:
+                # Geannuleerd (nieuwere load gestart) → stop zonder verdere queries
+                if not self.is_actueel(self.generatie):
+                    return
+                try:
+                    data = functie()
+                except Exception as e:
+                    self.signalen.fout.emit(self.generatie, naam, str(e))
+                    return
+                self.signalen.dataset.emit(self.generatie, naam, data)
+            self.signalen.klaar.emit(self.generatie)
+        finally:
+            self.afgelopen = True
+
+
+class MaandLoader(QObject):
+    """
+    Start/annuleer asynchrone maand loads met generatie tokens
+
+    Signals (enkel voor de actuele generatie, altijd op de GUI thread):
+        dataset_geladen(naam, data): één stap klaar
+        laden_klaar(): alle stappen klaar
+        laden_fout(naam, melding): stap mislukt (volgende stappen niet uitgevoerd)
+    """
+
+    dataset_geladen: pyqtSignal = pyqtSignal(str, object)
+    laden_klaar: pyqtSignal = pyqtSignal()
+    laden_fout: pyqtSignal = pyqtSignal(str, str)
+
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self.generatie = 0
+        self.bezig = False
+        self._taken: List[_LaadTaak] = []
+
+        # Eén worker: geannuleerde loads stoppen bij de volgende stap en
+        # blokkeren de database dus niet parallel met de nieuwe load
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    def start(self, stappen: List[LaadStap]) -> int:
+        """Start nieuwe load (vorige wordt geannuleerd). Returns generatie nummer"""
+        self.generatie += 1
+        self.bezig = True
+
+        # Referenties naar afgelopen taken opruimen
+        self._taken = [taak for taak in self._taken if not taak.afgelopen]
+
+        taak = _LaadTaak(self.generatie, stappen, self.is_actueel)
+        taak.signalen.dataset.connect(self._on_dataset)  # type: ignore
+        taak.signalen.klaar.connect(self._on_klaar)  # type: ignore
+        taak.signalen.fout.connect(self._on_fout)  # type: ignore
+        self._taken.append(taak)
+        self.pool.start(taak)
+        return self.generatie
+
+    def annuleer(self) -> None:
+        """Maak lopende load ongeldig (bijv. voor synchrone reload)"""
+        self.generatie += 1
+        self.bezig = False
+
+    def is_actueel(self, generatie: int) -> bool:
+        return generatie == self.generatie
+
+    def wacht(self, timeout_ms: int = -1) -> bool:
+        """Wacht tot worker klaar is (tests/afsluiten)"""
+        return self.pool.waitForDone(timeout_ms)
+
+    def _on_dataset(self, generatie: int, naam: str, data: Any) -> None:
+        if self.is_actueel(generatie):
+            self.dataset_geladen.emit(naam, data)  # type: ignore
+
+    def _on_klaar(self, generatie: int) -> None:
+        if self.is_actueel(generatie):
+            self.bezig = False
+            self.laden_klaar.emit()  # type: ignore
+
+    def _on_fout(self, generatie: int, naam: str, melding: str) -> None:
+        if self.is_actueel(generatie):
+            self.bezig = False
+            self.laden_fout.emit(naam, melding)  # type: ignore
@@ -20,170 +20,40 @@ VERSION HISTORY:
   * HR Summary Box toont instructie: "Klik op 'Valideer Planning' om HR regels te controleren"
   * Batch validatie via "Valideer Planning" knop (alle 6 HR checks + bemannings controle on-demand)
   * Scroll functionaliteit in summary box (max 200px)
+- v0.6.29: PERFORMANCE - Gevirtualiseerde grid (QTableView + delegate)
+  * Geen EditableLabel/QLabel per cel meer: alleen zichtbare cellen worden getekend
+  * Frozen naam/HR kolommen via tweede QTableView (gedeelde verticale scroll)
+  * Edit, keyboard navigatie, selectie en context menu via PlannerGridView
+  * Vrije weergave periode (rode lijn cyclus, 13 weken, aangepast) naast maand + buffer
 """
-from typing import Dict, Optional, Set, List
+from typing import Dict, Iterable, Optional, Set, List, Any, Tuple
 from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-                             QComboBox, QScrollArea, QWidget, QGridLayout,
-                             QDialog, QLineEdit, QMessageBox, QMenu)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QScrollArea, QDialog, QLineEdit, QMessageBox, QMenu,
+                             QDateEdit, QFormLayout, QDialogButtonBox)
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QDate
 from PyQt6.QtGui import QFont, QCursor
 from gui.widgets.grid_kalender_base import GridKalenderBase
+from gui.widgets.maand_loader import LaadStap
+from gui.widgets.planner_grid_view import (PlannerGridModel, PlannerFrozenModel,
+                                           PlannerCelDelegate, PlannerGridView,
+                                           PlannerFrozenView, ROL_DATUM, ROL_GEBRUIKER)
 from gui.styles import Styles, Colors, Fonts, Dimensions
 from datetime import datetime, timedelta, date
 from database.connection import get_connection
 from services.data_ensure_service import ensure_jaar_data
 from services.bemannings_controle_service import controleer_bemanning
 from services.planning_validator_service import PlanningValidator
+from services.dag_kalender import DagKalender
+from services.rode_lijnen_service import RodeLijnenKalender
+from services.referentie_catalogus import ReferentieCatalogus
 from services.constraint_checker import Violation
+from services.maand_status_service import (get_maand_status, maanden_in_periode, actie_maand_in_periode,
+                                          SQL_MAAND_NIET_GEPUBLICEERD, SQL_SHIFT_OPSLAAN)
+from services.planning_batch_service import (Wijziging, schrijf_shifts, parse_patroon,
+                                             patroon_toewijzing, PATROON_LEEG)
 import sqlite3
 
 
-class EditableLabel(QLabel):
-    """
-    Label die editable wordt bij klik
-    """
-    edit_started: pyqtSignal = pyqtSignal()
-    edit_finished: pyqtSignal = pyqtSignal(str)  # nieuwe waarde
-
-    def __init__(self, text: str, datum_str: str, gebruiker_id: int, parent_grid):
-        super().__init__(text)
-        self.datum_str = datum_str
-        self.gebruiker_id = gebruiker_id
-        self.parent_grid = parent_grid
-        self.editor: Optional[QLineEdit] = None
-        self.is_editing = False
-        self.overlay_kleur: Optional[str] = None  # Track HR/verlof overlay (v0.6.28 - ISSUE-005 fix)
-
-    def mousePressEvent(self, event):
-        """Start edit mode bij klik (of toggle selectie met Ctrl/Shift)"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            modifiers = event.modifiers()
-
-            # Ctrl/Shift = toggle selectie (niet editeren)
-            if modifiers & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier):
-                self.parent_grid.toggle_cell_selection(self.datum_str, self.gebruiker_id, modifiers)
-            else:
-                # Normale klik = start edit
-                self.start_edit()
-        super().mousePressEvent(event)
-
-    def start_edit(self):
-        """Start edit mode"""
-        if self.is_editing:
-            return
-
-        self.is_editing = True
-        self.edit_started.emit()  # type: ignore
-
-        # Maak editor
-        self.editor = QLineEdit(self)
-        self.editor.setText(self.text())
-        self.editor.setMaxLength(5)
-        self.editor.setGeometry(self.rect())
-
-        # Bepaal achtergrond kleur (gebruik overlay als die er is - v0.6.28 ISSUE-005 fix)
-        if self.overlay_kleur:
-            background = self.overlay_kleur  # Behoud HR/verlof overlay tijdens edit
-        else:
-            background = "white"  # Default wit voor normale cellen
-
-        self.editor.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {background};
-                border: 2px solid #2196F3;
-                padding: 2px;
-                font-weight: bold;
-            }}
-        """)
-
-        # Uppercase automatisch
-        def to_upper():
-            pos = self.editor.cursorPosition()
-            self.editor.setText(self.editor.text().upper())
-            self.editor.setCursorPosition(pos)
-
-        self.editor.textChanged.connect(to_upper)  # type: ignore
-        self.editor.editingFinished.connect(self.finish_edit)  # type: ignore
-
-        # Focus en selecteer alles
-        self.editor.show()
-        self.editor.setFocus()
-        self.editor.selectAll()
-
-        # Install event filter voor keyboard
-        self.editor.installEventFilter(self)
-
-    def finish_edit(self):
-        """Beëindig edit mode"""
-        if not self.is_editing or not self.editor:
-            return
-
-        nieuwe_waarde = self.editor.text().strip().upper()
-        self.editor.deleteLater()
-        self.editor = None
-        self.is_editing = False
-
-        # Emit signal met nieuwe waarde
-        self.edit_finished.emit(nieuwe_waarde)  # type: ignore
-
-    def eventFilter(self, obj, event):
-        """Handle keyboard events in editor"""
-        if obj == self.editor and event.type() == event.Type.KeyPress:
-            key = event.key()
-
-            if key == Qt.Key.Key_Return or key == Qt.Key.Key_Enter:
-                # ENTER = finish en ga naar cel eronder
-                self.finish_edit()
-                self.parent_grid.navigate_to_cell(self.datum_str, self.gebruiker_id, 'down')
-                return True
-
-            elif key == Qt.Key.Key_Tab:
-                # TAB = finish en ga naar volgende cel
-                self.finish_edit()
-                self.parent_grid.navigate_to_cell(self.datum_str, self.gebruiker_id, 'next')
-                return True
-
-            elif key == Qt.Key.Key_Backtab:  # SHIFT+TAB
-                # SHIFT+TAB = finish en ga naar vorige cel
-                self.finish_edit()
-                self.parent_grid.navigate_to_cell(self.datum_str, self.gebruiker_id, 'prev')
-                return True
-
-            elif key == Qt.Key.Key_Escape:
-                # ESC = cancel
-                if self.editor:
-                    self.editor.setText(self.text())  # Reset to original
-                self.finish_edit()
-                return True
-
-            # NIEUW: Arrow keys
-            elif key == Qt.Key.Key_Up:
-                # Arrow UP = finish en ga naar cel erboven
-                self.finish_edit()
-                self.parent_grid.navigate_to_cell(self.datum_str, self.gebruiker_id, 'up')
-                return True
-
-            elif key == Qt.Key.Key_Down:
-                # Arrow DOWN = finish en ga naar cel eronder
-                self.finish_edit()
-                self.parent_grid.navigate_to_cell(self.datum_str, self.gebruiker_id, 'down')
-                return True
-
-            elif key == Qt.Key.Key_Left:
-                # Arrow LEFT = finish en ga naar vorige cel (links)
-                self.finish_edit()
-                self.parent_grid.navigate_to_cell(self.datum_str, self.gebruiker_id, 'left')
-                return True
-
-            elif key == Qt.Key.Key_Right:
-                # Arrow RIGHT = finish en ga naar volgende cel (rechts)
-                self.finish_edit()
-                self.parent_grid.navigate_to_cell(self.datum_str, self.gebruiker_id, 'right')
-                return True
-
-        return super().eventFilter(obj, event)
-
-
 class PlannerGridKalender(GridKalenderBase):
     """
     Grid kalender voor planners
@@ -213,8 +83,9 @@ class PlannerGridKalender(GridKalenderBase):
             'zondag': set()
         }  # Codes per dag_type
         self.speciale_codes: Set[str] = set()  # Speciale codes (altijd geldig)
-        self.cel_widgets: Dict[str, Dict[int, EditableLabel]] = {}  # {datum: {user_id: widget}}
-        self.feestdag_namen: Dict[str, str] = {}  # {datum_str: naam} - feestdag namen
+
+        # Vrije weergave periode (v0.6.29): (start, eind) of None = maand + 8 dagen buffer
+        self.periode: Optional[Tuple[str, str]] = None
 
         # Multi-cell selection state
         self.selected_cells: Set[tuple] = set()  # Set van (datum_str, gebruiker_id) tuples
@@ -224,15 +95,22 @@ class PlannerGridKalender(GridKalenderBase):
         # HR rules state (rode lijnen werkdagen tracking)
         self.rode_lijn_periodes: Optional[Dict[str, Dict[str, str]]] = None  # {periode_type: {start, eind, nummer}}
         self.hr_werkdagen_cache: Dict[int, Dict[str, int]] = {}  # {gebruiker_id: {voor: X, na: Y}}
-        self.hr_cel_widgets: Dict[int, Dict[str, QLabel]] = {}  # {gebruiker_id: {voor: QLabel, na: QLabel}}
+        self.werkdag_codes: Set[str] = set()  # Codes met telt_als_werkdag = 1
+
+        # In-memory edit state (v0.6.29) - cel edit voert enkel de write uit op de database
+        self.code_index: Dict[str, Dict[str, Set[int]]] = {}  # {datum_str: {shift_code: {gebruiker_id}}}
+        self.maand_is_concept: bool = True
 
         # Bemannings controle state (v0.6.20)
         self.bemannings_status: Dict[str, Dict] = {}  # {datum_str: {status, ontbrekende_codes, dubbele_codes, ...}}
-        self.datum_header_widgets: Dict[str, QLabel] = {}  # {datum_str: QLabel} - voor real-time overlay updates
 
         # HR violations state (v0.6.26 - Fase 3)
         self.hr_violations: Dict[str, Dict[int, List]] = {}  # {datum_str: {gebruiker_id: [Violation, ...]}}
 
+        # Model/view grid (v0.6.29) - vervangt cel_widgets/hr_cel_widgets/datum_header_widgets
+        self.grid_model = PlannerGridModel(self)
+        self.frozen_model = PlannerFrozenModel(self)
+
         self.init_ui()
         self.load_initial_data()
 
@@ -288,36 +166,46 @@ class PlannerGridKalender(GridKalenderBase):
         # ALTIJD zichtbaar (met spatie of tekst), nooit hide()
         layout.addWidget(self.selection_label)
 
-        # FROZEN COLUMNS (v0.6.25) - Dual scroll area pattern
-        # Splits grid in frozen deel (naam + HR) en scrollable deel (datums)
+        # FROZEN COLUMNS (v0.6.25) - Dual view pattern (v0.6.29: QTableView ipv QScrollArea)
+        # Links frozen kolommen (naam + HR), rechts scrollable datum cellen
         h_layout = QHBoxLayout()
         h_layout.setSpacing(0)
         h_layout.setContentsMargins(0, 0, 0, 0)
 
         # LINKER deel: Frozen kolommen (naam + Voor RL + Na RL)
-        self.frozen_scroll = QScrollArea()
-        self.frozen_scroll.setWidgetResizable(True)
-        self.frozen_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.frozen_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)  # Sync met rechts
-        self.frozen_container = QWidget()
-        self.frozen_scroll.setWidget(self.frozen_container)
+        self.frozen_view = PlannerFrozenView()
+        self.frozen_view.setModel(self.frozen_model)
         # Width wordt dynamisch gezet in build_grid() (afhankelijk van HR kolommen)
 
-        # RECHTER deel: Scrollable kolommen (datums)
-        self.scrollable_scroll = QScrollArea()
-        self.scrollable_scroll.setWidgetResizable(True)
-        self.scrollable_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
-        self.scrollable_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scrollable_container = QWidget()
-        self.scrollable_scroll.setWidget(self.scrollable_container)
+        # RECHTER deel: Datum cellen (alleen zichtbare cellen worden getekend)
+        self.grid_view = PlannerGridView()
+        self.grid_view.setModel(self.grid_model)
+        self.cel_delegate = PlannerCelDelegate(self.grid_view)
+        self.grid_view.setItemDelegate(self.cel_delegate)
+
+        self.grid_view.cel_aangeklikt.connect(self.on_cel_aangeklikt)  # type: ignore
+        self.grid_view.customContextMenuRequested.connect(self.on_context_menu_requested)  # type: ignore
+        # Queued: editor is gesloten voor validatie dialogs verschijnen
+        self.cel_delegate.cel_bewerkt.connect(  # type: ignore
+            self.on_cel_edited, Qt.ConnectionType.QueuedConnection
+        )
+        self.cel_delegate.navigatie.connect(  # type: ignore
+            self.navigate_to_cell, Qt.ConnectionType.QueuedConnection
+        )
 
         # Synchroniseer vertical scrollbars (frozen volgt scrollable)
-        self.scrollable_scroll.verticalScrollBar().valueChanged.connect(  # type: ignore
-            self.frozen_scroll.verticalScrollBar().setValue
+        self.grid_view.verticalScrollBar().valueChanged.connect(  # type: ignore
+            self.frozen_view.verticalScrollBar().setValue
         )
 
-        h_layout.addWidget(self.frozen_scroll)
-        h_layout.addWidget(self.scrollable_scroll)
+        # Placeholder als geen gebruikers geselecteerd zijn
+        self.geen_gebruikers_label = QLabel("Geen teamleden geselecteerd. Gebruik de filter knop.")
+        self.geen_gebruikers_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; padding: 20px;")
+        self.geen_gebruikers_label.setVisible(False)
+        layout.addWidget(self.geen_gebruikers_label)
+
+        h_layout.addWidget(self.frozen_view)
+        h_layout.addWidget(self.grid_view)
 
         layout.addLayout(h_layout)
 
@@ -368,6 +256,22 @@ class PlannerGridKalender(GridKalenderBase):
         volgende_btn.setStyleSheet(Styles.button_secondary())
         buttons.append(volgende_btn)
 
+        # Weergave periode (v0.6.29): maand + buffer, rode lijn cyclus, 13 weken of aangepast
+        periode_btn = QPushButton("Periode ▾")
+        periode_btn.setFixedSize(110, Dimensions.BUTTON_HEIGHT_NORMAL)
+        periode_btn.setStyleSheet(Styles.button_secondary())
+        periode_menu = QMenu(periode_btn)
+        periode_menu.addAction("Maand + buffer").triggered.connect(self.toon_maand)  # type: ignore
+        periode_menu.addAction("Rode lijn cyclus (28 dagen)").triggered.connect(  # type: ignore
+            lambda: self.kies_periode(self.rode_lijn_cyclus_periode())
+        )
+        periode_menu.addAction("13 weken").triggered.connect(  # type: ignore
+            lambda: self.kies_periode(self.weken_periode(13))
+        )
+        periode_menu.addAction("Aangepast...").triggered.connect(self.open_periode_dialog)  # type: ignore
+        periode_btn.setMenu(periode_menu)
+        buttons.append(periode_btn)
+
         # Valideer Planning knop (v0.6.26 - BUG FIX voor batch validatie)
         valideer_btn = QPushButton("Valideer Planning")
         valideer_btn.setFixedSize(140, Dimensions.BUTTON_HEIGHT_NORMAL)
@@ -398,19 +302,18 @@ class PlannerGridKalender(GridKalenderBase):
         )
 
     def load_initial_data(self) -> None:
-        """Laad initiële data"""
+        """Laad initiële data (synchroon - na bewerkingen en bij opstart)"""
+        # Lopende async load zou deze data anders overschrijven (v0.6.29)
+        self.annuleer_laden()
+
         # Laad gebruikers (filter wordt automatisch behouden door base class)
         self.load_gebruikers(alleen_actief=True)
 
         # PERFORMANCE (v0.6.25): Filter gebruikers als filtered_gebruiker_ids opgegeven
-        if self.filtered_gebruiker_ids:
-            self.gebruikers_data = [
-                user for user in self.gebruikers_data
-                if user['id'] in self.filtered_gebruiker_ids
-            ]
+        self.pas_gebruikers_filter_toe()
 
-        # Laad feestdagen voor huidig jaar EN aangrenzende jaren (voor buffer dagen)
-        self.load_feestdagen_extended()
+        # Laad kalender (feestdagen) voor huidig jaar EN aangrenzende jaren (voor buffer dagen)
+        self.load_feestdagen()
 
         # Laad rode lijnen (28-daagse HR-cycli)
         self.load_rode_lijnen()
@@ -418,167 +321,271 @@ class PlannerGridKalender(GridKalenderBase):
         # Laad relevante rode lijn periodes voor HR columns
         self.get_relevante_rode_lijn_periodes()
 
-        # Reset HR cache (data is ververst)
-        self.hr_werkdagen_cache.clear()
+        # Publicatie status (v0.6.29 - maand_status lookup)
+        self.maand_is_concept = get_maand_status(self.jaar, self.maand) == 'concept'
+
+        # HR kolommen voor alle gebruikers in 1 query (v0.6.29)
+        self.werkdag_codes = self.fetch_werkdag_codes()
+        self.load_hr_werkdagen()
 
-        # Datum range: maand + 8 dagen buffer
-        datum_lijst = self.get_datum_lijst(start_offset=8, eind_offset=8)
-        if datum_lijst:
-            start_datum = datum_lijst[0][0]
-            eind_datum = datum_lijst[-1][0]
+        # Datum range: maand + 8 dagen buffer of vrije periode
+        datum_lijst = self.get_weergave_datum_lijst()
+        start_datum = datum_lijst[0][0]
+        eind_datum = datum_lijst[-1][0]
 
-            # Laad planning en verlof
-            self.load_planning_data(start_datum, eind_datum)
-            self.load_verlof_data(start_datum, eind_datum)
+        # Laad planning en verlof
+        self.load_planning_data(start_datum, eind_datum)
+        self.load_verlof_data(start_datum, eind_datum)
+        self.indexeer_rooster()
 
         # PERFORMANCE FIX (v0.6.25): Preload ValidationCache VOOR bemannings status
         # Dit voorkomt N+1 query probleem (900+ queries → 5 queries)
         # v0.6.26.2: Conditioneel obv config.ENABLE_VALIDATION_CACHE flag
+        # v0.6.29: voor de getoonde periode (incl. buffer dagen) i.p.v. enkel de maand
+        self.preload_validatie_cache(start_datum, eind_datum, self.gebruikers_data)
+
+        # Clear bemannings controle status (v0.6.26: REAL-TIME DISABLED)
+        # Bemannings status wordt alleen geladen bij "Valideer Planning" knop
+        self.bemannings_status.clear()
+
+        # Clear HR violations (v0.6.26 - Fase 3: REAL-TIME DISABLED)
+        # Violations worden alleen geladen bij "Valideer Planning" knop
+        self.hr_violations.clear()
+
+        # Bouw grid
+        self.build_grid()
+
+    def pas_gebruikers_filter_toe(self) -> None:
+        """Beperk gebruikers tot filtered_gebruiker_ids (indien opgegeven)"""
+        if self.filtered_gebruiker_ids:
+            self.gebruikers_data = [
+                user for user in self.gebruikers_data
+                if user['id'] in self.filtered_gebruiker_ids
+            ]
+
+    @staticmethod
+    def preload_validatie_cache(start_datum: str, eind_datum: str, gebruikers: List) -> None:
+        """Preload ValidationCache voor getoonde periode (GUI thread: vult de gedeelde cache)"""
         from config import ENABLE_VALIDATION_CACHE
         if ENABLE_VALIDATION_CACHE:
             from services.validation_cache import ValidationCache
             cache = ValidationCache.get_instance()
 
             # Haal gebruiker IDs op voor preload
-            gebruiker_ids = [user['id'] for user in self.gebruikers_data] if self.gebruikers_data else None
+            gebruiker_ids = [user['id'] for user in gebruikers] if gebruikers else None
 
-            # Preload cache voor deze maand (batch loading)
-            cache.preload_month(self.jaar, self.maand, gebruiker_ids)
+            # Preload cache voor deze periode (batch loading)
+            cache.preload_range(date.fromisoformat(start_datum), date.fromisoformat(eind_datum), gebruiker_ids)
 
-        # Clear bemannings controle status (v0.6.26: REAL-TIME DISABLED)
-        # Bemannings status wordt alleen geladen bij "Valideer Planning" knop
+    # ---------- Asynchroon laden bij maand navigatie (v0.6.29) ----------
+
+    def get_laad_stappen(self) -> List[LaadStap]:
+        """
+        Stappen voor async maand load, in volgorde van zichtbaarheid:
+        basis (gebruikers/feestdagen/rode lijnen) → planning → verlof → HR kolommen
+        → validatie cache. Waarden worden hier gecaptured: workers lezen geen widget state.
+
+        Draait op de GUI thread: ensure_jaar_data (schrijft) en de gedeelde kalenders/
+        catalogus worden hier voorbereid en meegegeven. Workers doen enkel leesqueries;
+        de validatie cache wordt pas in verwerk_dataset() gevuld.
+        """
+        from config import ENABLE_VALIDATION_CACHE
+        from services.validation_cache import CacheEntry, ValidationCache
+
+        jaar, maand = self.jaar, self.maand
+        datum_lijst = self.get_weergave_datum_lijst()
+        start_datum, eind_datum = datum_lijst[0][0], datum_lijst[-1][0]
+        filtered_ids = set(self.filtered_gebruiker_ids) if self.filtered_gebruiker_ids else None
+        gedeeld: Dict[str, Any] = {}  # Resultaten van eerdere stappen (zelfde worker)
+
+        dag_kalender = self.fetch_dag_kalender(jaar, self.get_weergave_jaren())
+        rode_lijnen_starts = self.fetch_rode_lijnen_starts()
+        periodes = self.fetch_rode_lijn_periodes(jaar, maand)
+        catalogus = ReferentieCatalogus.get_instance()
+        werkdag_codes = set(catalogus.werkdag_codes())
+        cache = ValidationCache.get_instance()
+
+        def basis() -> Dict[str, Any]:
+            gebruikers = self.fetch_gebruikers(alleen_actief=True)
+            gedeeld['gebruikers'] = [
+                user for user in gebruikers if not filtered_ids or user['id'] in filtered_ids
+            ]
+            return {
+                'gebruikers': gebruikers,
+                'dag_kalender': dag_kalender,
+                'rode_lijnen_starts': rode_lijnen_starts,
+                'rode_lijn_periodes': periodes,
+                'werkdag_codes': werkdag_codes,
+                'maand_status': get_maand_status(jaar, maand),
+            }
+
+        def hr() -> Dict[int, Dict[str, int]]:
+            if not periodes:
+                return {}
+            return self.fetch_hr_werkdagen(periodes, [user['id'] for user in gedeeld['gebruikers']])
+
+        def validatie_cache() -> List[CacheEntry]:
+            if not ENABLE_VALIDATION_CACHE:
+                return []
+            return cache.bereken_range(
+                date.fromisoformat(start_datum), date.fromisoformat(eind_datum),
+                [user['id'] for user in gedeeld['gebruikers']] or None, catalogus
+            )
+
+        return [
+            ('basis', basis),
+            ('planning', lambda: self.fetch_planning_data(start_datum, eind_datum)),
+            ('verlof', lambda: self.fetch_verlof_data(start_datum, eind_datum)),
+            ('hr', hr),
+            ('validatie_cache', validatie_cache),
+        ]
+
+    def toon_skelet(self) -> None:
+        """Nieuwe datums tonen; HR kolommen en validatie state wachten op de worker"""
+        self.hr_werkdagen_cache.clear()
         self.bemannings_status.clear()
+        self.hr_violations.clear()
+        super().toon_skelet()
 
-        # Clear HR violations (v0.6.26 - Fase 3: REAL-TIME DISABLED)
-        # Violations worden alleen geladen bij "Valideer Planning" knop
+    def opruimen(self) -> None:
+        """Ook validatie state en index vrijgeven (v0.6.29)"""
+        super().opruimen()
+        self.hr_werkdagen_cache.clear()
+        self.bemannings_status.clear()
         self.hr_violations.clear()
+        self.code_index.clear()
+        self.selected_cells.clear()
 
-        # Bouw grid
-        self.build_grid()
+    def get_geheugen_stats(self) -> Dict[str, Any]:
+        stats = super().get_geheugen_stats()
+        stats['hr_violation_dagen'] = len(self.hr_violations)
+        stats['bemannings_dagen'] = len(self.bemannings_status)
+        return stats
+
+    def verwerk_dataset(self, naam: str, data: Any) -> None:
+        """Pas dataset toe en repaint enkel wat er van afhangt"""
+        if naam == 'basis':
+            self.zet_gebruikers(data['gebruikers'])
+            self.pas_gebruikers_filter_toe()
+            self.zet_dag_kalender(data['dag_kalender'])
+            self.rode_lijnen_starts = data['rode_lijnen_starts']
+            self.rode_lijn_periodes = data['rode_lijn_periodes']
+            self.werkdag_codes = data['werkdag_codes']
+            self.maand_is_concept = data['maand_status'] == 'concept'
+            self.bemannings_status.clear()
+            self.hr_violations.clear()
+            self.build_grid()
+        elif naam == 'planning':
+            self.rooster = data
+            self.indexeer_rooster()
+            self.grid_model.refresh_alles()
+        elif naam == 'verlof':
+            self.verlof_perioden = data
+            self.grid_model.refresh_alles()
+        elif naam == 'hr':
+            self.hr_werkdagen_cache = dict(data)
+            self.frozen_model.refresh_alles()
+        elif naam == 'validatie_cache':
+            from services.validation_cache import ValidationCache
+            ValidationCache.get_instance().bewaar_entries(data)
 
-    def load_feestdagen_extended(self) -> None:
-        """Laad feestdagen voor huidig jaar + vorig/volgend jaar (voor buffer dagen)"""
-        jaren = [self.jaar - 1, self.jaar, self.jaar + 1]
+    def on_dataset_geladen(self, naam: str, data: Any) -> None:
+        """Validatie entries zijn een momentopname: niet in maand_cache (replay overschrijft latere edits)"""
+        if naam == 'validatie_cache':
+            self.geladen_datasets.add(naam)
+            self.verwerk_dataset(naam, data)
+            return
+        super().on_dataset_geladen(naam, data)
 
-        # Zorg dat feestdagen bestaan voor alle jaren
-        for jaar in jaren:
-            ensure_jaar_data(jaar)
+    def load_feestdagen(self) -> None:
+        """Kalender voor jaar ± 1 en alle jaren van de getoonde periode"""
+        self.zet_dag_kalender(self.fetch_dag_kalender(self.jaar, self.get_weergave_jaren()))
 
-        # Laad feestdagen met namen
-        conn = get_connection()
-        cursor = conn.cursor()
-        self.feestdagen = []
-        self.feestdag_namen = {}  # Reset dictionary
-        for jaar in jaren:
-            cursor.execute("""
-                SELECT datum, naam FROM feestdagen
-                WHERE datum LIKE ?
-            """, (f"{jaar}-%",))
-            for row in cursor.fetchall():
-                datum_str = row['datum']
-                self.feestdagen.append(datum_str)
-                self.feestdag_namen[datum_str] = row['naam']
-        conn.close()
+    @staticmethod
+    def fetch_dag_kalender(jaar: int, weergave_jaren: Iterable[int] = ()) -> DagKalender:
+        """
+        DagKalender voor jaar ± 1 plus de weergave jaren, feestdagen eerst gegenereerd
+        (GUI thread: schrijft ontbrekende jaren)
+        """
+        jaren = {jaar - 1, jaar, jaar + 1, *weergave_jaren}
+        # Zorg dat feestdagen bestaan voor alle jaren (buffer dagen, vrije periode over jaargrens)
+        for j in sorted(jaren):
+            ensure_jaar_data(j)
+        return DagKalender.voor_jaren(min(jaren), max(jaren))
 
     def get_relevante_rode_lijn_periodes(self) -> None:
+        """Haal relevante rode lijn periodes op voor huidige maand"""
+        self.rode_lijn_periodes = self.fetch_rode_lijn_periodes(self.jaar, self.maand)
+
+    @staticmethod
+    def fetch_rode_lijn_periodes(jaar: int, maand: int) -> Optional[Dict[str, Dict[str, str]]]:
         """
-        Haal relevante rode lijn periodes op voor huidige maand
+        Relevante rode lijn periodes voor maand (thread-safe: geen widget state)
         - Zoek EERST rode lijn die START binnen deze maand (meest zichtbaar)
         - Als die er niet is, gebruik de rode lijn waar de maand in valt
         - Vorige periode: periode_nummer - 1
+        Returns: {'vorig': {...}, 'huidig': {...}} of None (geen HR kolommen)
         """
-        conn = get_connection()
-        cursor = conn.cursor()
+        kalender = RodeLijnenKalender.get_instance()
+        maand_start = date(jaar, maand, 1)
+        maand_eind = (maand_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
 
-        # Eerste dag van maand
-        maand_start = f"{self.jaar}-{self.maand:02d}-01"
+        # Rode lijn die START binnen deze maand (meest zichtbaar), anders de periode
+        # waar de maand in valt (berekend, v0.6.29 - geen rode_lijnen queries meer)
+        periodes = kalender.periodes(maand_start, maand_eind)
+        start_in_maand = [periode for periode in periodes if periode.start_datum >= maand_start]
+        huidige = (start_in_maand or periodes or [None])[0]
 
-        # STAP 1: Zoek rode lijn die START binnen deze maand
-        cursor.execute("""
-            SELECT periode_nummer, start_datum, eind_datum
-            FROM rode_lijnen
-            WHERE start_datum LIKE ?
-            ORDER BY start_datum ASC
-            LIMIT 1
-        """, (f"{self.jaar}-{self.maand:02d}-%",))
-
-        huidige = cursor.fetchone()
-
-        # STAP 2: Als geen rode lijn start in deze maand, gebruik de periode waar maand in valt
-        if not huidige:
-            cursor.execute("""
-                SELECT periode_nummer, start_datum, eind_datum
-                FROM rode_lijnen
-                WHERE start_datum <= ? AND eind_datum >= ?
-                ORDER BY start_datum DESC
-                LIMIT 1
-            """, (maand_start, maand_start))
-
-            huidige = cursor.fetchone()
-
-        if not huidige:
+        if huidige is None:
             # Geen rode lijn gevonden - skip HR columns
-            self.rode_lijn_periodes = None
-            conn.close()
-            return
-
-        huidige_periode_nr = huidige['periode_nummer']
-        huidige_start = huidige['start_datum']
-        huidige_eind = huidige['eind_datum']
-
-        # Haal vorige periode op (periode_nummer - 1)
-        vorig_periode_nr = huidige_periode_nr - 1
-        cursor.execute("""
-            SELECT periode_nummer, start_datum, eind_datum
-            FROM rode_lijnen
-            WHERE periode_nummer = ?
-        """, (vorig_periode_nr,))
-
-        vorige = cursor.fetchone()
+            return None
 
-        if not vorige:
+        # Vorige periode (periode_nummer - 1)
+        vorige = kalender.periode_nummer(huidige.periode_nummer - 1)
+        if vorige is None:
             # Geen vorige periode - skip HR columns
-            self.rode_lijn_periodes = None
-            conn.close()
-            return
+            return None
 
-        vorige_start = vorige['start_datum']
-        vorige_eind = vorige['eind_datum']
-
-        # Sla op
-        self.rode_lijn_periodes = {
-            'vorig': {
-                'nummer': str(vorig_periode_nr),
-                'start': vorige_start,
-                'eind': vorige_eind
-            },
-            'huidig': {
-                'nummer': str(huidige_periode_nr),
-                'start': huidige_start,
-                'eind': huidige_eind
+        return {
+            periode_type: {
+                'nummer': str(periode.periode_nummer),
+                'start': periode.start_datum.isoformat(),
+                'eind': periode.eind_datum.isoformat()
             }
+            for periode_type, periode in (('vorig', vorige), ('huidig', huidige))
         }
 
-        conn.close()
-
-    def tel_gewerkte_dagen(self, gebruiker_id: int, start_datum: str, eind_datum: str) -> int:
+    @staticmethod
+    def fetch_hr_werkdagen(periodes: Dict[str, Dict[str, str]],
+                           gebruiker_ids: List[int]) -> Dict[int, Dict[str, int]]:
         """
-        Tel aantal gewerkte dagen in periode voor gebruiker
-        Alleen tellen als telt_als_werkdag = 1 (uit werkposten of speciale_codes)
+        Gewerkte dagen voor/na rode lijn voor alle gebruikers in 1 query (v0.6.29)
+
+        Vervangt 2 tel_gewerkte_dagen() queries per gebruiker (60 queries voor 30 gebruikers).
+        Alleen tellen als telt_als_werkdag = 1 (uit werkposten of speciale_codes);
+        concept EN gepubliceerde planning, lege cellen tellen niet mee.
+        Thread-safe: geen widget state.
         """
+        resultaat = {gebruiker_id: {'voor': 0, 'na': 0} for gebruiker_id in gebruiker_ids}
+        if not gebruiker_ids:
+            return resultaat
+
+        vorig, huidig = periodes['vorig'], periodes['huidig']
+        placeholders = ','.join('?' * len(gebruiker_ids))
+
         conn = get_connection()
         cursor = conn.cursor()
-
-        # Query beide concept EN gepubliceerde planning (status niet filteren)
-        # Empty cells (shift_code IS NULL or '') tellen NIET mee
-        cursor.execute("""
-            SELECT COUNT(*) as werkdagen
+        cursor.execute(f"""
+            SELECT
+                p.gebruiker_id,
+                SUM(CASE WHEN p.datum BETWEEN ? AND ? THEN 1 ELSE 0 END) as voor,
+                SUM(CASE WHEN p.datum BETWEEN ? AND ? THEN 1 ELSE 0 END) as na
             FROM planning p
             LEFT JOIN shift_codes sc ON p.shift_code = sc.code
             LEFT JOIN werkposten w ON sc.werkpost_id = w.id
             LEFT JOIN speciale_codes spc ON p.shift_code = spc.code
-            WHERE p.gebruiker_id = ?
-              AND p.datum BETWEEN ? AND ?
+            WHERE p.gebruiker_id IN ({placeholders})
+              AND (p.datum BETWEEN ? AND ? OR p.datum BETWEEN ? AND ?)
               AND p.shift_code IS NOT NULL
               AND p.shift_code != ''
               AND (
@@ -586,12 +593,48 @@ class PlannerGridKalender(GridKalenderBase):
                   OR
                   (spc.code IS NOT NULL AND spc.telt_als_werkdag = 1)
               )
-        """, (gebruiker_id, start_datum, eind_datum))
+            GROUP BY p.gebruiker_id
+        """, (vorig['start'], vorig['eind'], huidig['start'], huidig['eind'],
+              *gebruiker_ids,
+              vorig['start'], vorig['eind'], huidig['start'], huidig['eind']))
+
+        for row in cursor.fetchall():
+            resultaat[row['gebruiker_id']] = {'voor': row['voor'], 'na': row['na']}
 
-        row = cursor.fetchone()
         conn.close()
+        return resultaat
+
+    @staticmethod
+    def fetch_werkdag_codes() -> Set[str]:
+        """Codes die als werkdag tellen (voor incrementele HR telling na edits)"""
+        return set(ReferentieCatalogus.get_instance().werkdag_codes())
+
+    def load_hr_werkdagen(self) -> None:
+        """Vul hr_werkdagen_cache voor alle gebruikers (1 query)"""
+        self.hr_werkdagen_cache.clear()
+        if self.rode_lijn_periodes:
+            self.hr_werkdagen_cache.update(self.fetch_hr_werkdagen(
+                self.rode_lijn_periodes, [user['id'] for user in self.gebruikers_data]
+            ))
+
+    def pas_hr_werkdagen_aan(self, gebruiker_id: int, datum_str: str,
+                             oude_code: Optional[str], nieuwe_code: Optional[str]) -> None:
+        """
+        Incrementele HR telling na edit (±1) i.p.v. opnieuw queryen
 
-        return row['werkdagen'] if row else 0
+        Periodes zijn ISO datum strings → string vergelijking volstaat.
+        """
+        if not self.rode_lijn_periodes or gebruiker_id not in self.hr_werkdagen_cache:
+            return
+
+        delta = int(nieuwe_code in self.werkdag_codes) - int(oude_code in self.werkdag_codes)
+        if delta == 0:
+            return
+
+        for sleutel, periode_type in (('voor', 'vorig'), ('na', 'huidig')):
+            periode = self.rode_lijn_periodes[periode_type]
+            if periode['start'] <= datum_str <= periode['eind']:
+                self.hr_werkdagen_cache[gebruiker_id][sleutel] += delta
 
     def load_bemannings_status(self) -> None:
         """
@@ -607,7 +650,7 @@ class PlannerGridKalender(GridKalenderBase):
         cache = ValidationCache.get_instance()
 
         # Haal datum lijst op (met buffer)
-        datum_lijst = self.get_datum_lijst(start_offset=8, eind_offset=8)
+        datum_lijst = self.get_weergave_datum_lijst()
 
         for datum_str, _ in datum_lijst:
             # Converteer naar date object
@@ -735,16 +778,20 @@ class PlannerGridKalender(GridKalenderBase):
         if not self.gebruikers_data:
             return
 
-        # Loop door alle zichtbare gebruikers
-        for user in self.gebruikers_data:
+        # Loop door alle zichtbare gebruikers (en alle maanden van een vrije periode)
+        for user, (jaar, maand) in ((u, m) for u in self.gebruikers_data for m in self.get_weergave_maanden()):
             gebruiker_id = user['id']
 
+            def in_bereik(datum_obj: date) -> bool:
+                # Per validator enkel eigen maand: geen dubbels bij aangrenzende maanden
+                return (datum_obj.year, datum_obj.month) == (jaar, maand) and self.in_weergave(datum_obj)
+
             try:
                 # Create validator voor deze gebruiker + maand
                 validator = PlanningValidator(
                     gebruiker_id=gebruiker_id,
-                    jaar=self.jaar,
-                    maand=self.maand
+                    jaar=jaar,
+                    maand=maand
                 )
 
                 # Run batch validatie (alle 6 HR checks)
@@ -755,8 +802,8 @@ class PlannerGridKalender(GridKalenderBase):
                     for violation in violations_list:
                         # Violation kan exacte datum of datum_range hebben
                         if violation.datum:
-                            # Filter: alleen violations in huidige maand (ISSUE-009 fix)
-                            if violation.datum.year != self.jaar or violation.datum.month != self.maand:
+                            # Filter: alleen violations in huidige maand/periode (ISSUE-009 fix)
+                            if not in_bereik(violation.datum):
                                 continue  # Skip violations buiten huidige maand
 
                             datum_str = violation.datum.strftime('%Y-%m-%d')
@@ -778,8 +825,8 @@ class PlannerGridKalender(GridKalenderBase):
                             huidige_datum = start_datum
 
                             while huidige_datum <= eind_datum:
-                                # Filter: alleen datums in huidige maand (ISSUE-009 fix)
-                                if huidige_datum.year != self.jaar or huidige_datum.month != self.maand:
+                                # Filter: alleen datums in huidige maand/periode (ISSUE-009 fix)
+                                if not in_bereik(huidige_datum):
                                     huidige_datum += timedelta(days=1)
                                     continue  # Skip datums buiten huidige maand
 
@@ -832,8 +879,8 @@ class PlannerGridKalender(GridKalenderBase):
             # Run batch validatie - Bemannings controle
             self.load_bemannings_status()
 
-            # Rebuild grid om violations en bemannings status te tonen
-            self.build_grid()
+            # Herteken grid om violations en bemannings status te tonen (structuur ongewijzigd)
+            self.grid_model.refresh_alles()
 
             # Tel violations
             totaal_violations = 0
@@ -851,7 +898,7 @@ class PlannerGridKalender(GridKalenderBase):
                 QMessageBox.information(
                     self,
                     "Validatie Compleet",
-                    f"Geen HR violations gevonden voor {self.get_maand_naam()} {self.jaar}!\n\n"
+                    f"Geen HR violations gevonden voor {self.get_weergave_naam()}!\n\n"
                     "Alle gebruikers voldoen aan de HR regels."
                 )
             else:
@@ -876,7 +923,7 @@ class PlannerGridKalender(GridKalenderBase):
                 QMessageBox.warning(
                     self,
                     "HR Violations Gevonden",
-                    f"Gevonden: {totaal_violations} violation(s) voor {self.get_maand_naam()} {self.jaar}\n\n"
+                    f"Gevonden: {totaal_violations} violation(s) voor {self.get_weergave_naam()}\n\n"
                     f"{details_str}\n\n"
                     f"Violations zijn nu zichtbaar in de grid met rode overlays.\n"
                     f"Hover over cellen voor details."
@@ -892,6 +939,13 @@ class PlannerGridKalender(GridKalenderBase):
                    'Juli', 'Augustus', 'September', 'Oktober', 'November', 'December']
         return maanden[self.maand - 1]
 
+    def get_weergave_naam(self) -> str:
+        """Naam van getoonde periode voor titels en meldingen"""
+        if self.periode:
+            start, eind = (datetime.strptime(d, '%Y-%m-%d') for d in self.periode)
+            return f"{start:%d-%m-%Y} t/m {eind:%d-%m-%Y}"
+        return f"{self.get_maand_naam()} {self.jaar}"
+
     def update_hr_summary(self) -> None:
         """
         Update HR violations summary box onderaan grid (v0.6.26 - Fase 3 UX)
@@ -1098,400 +1152,55 @@ class PlannerGridKalender(GridKalenderBase):
         return "\n".join(tooltip_parts)
 
     def build_grid(self) -> None:
-        """Bouw de grid met namen en datums - SPLIT in frozen + scrollable (v0.6.25)"""
-        # Clear bestaande layouts
-        if self.frozen_container.layout():
-            QWidget().setLayout(self.frozen_container.layout())
-        if self.scrollable_container.layout():
-            QWidget().setLayout(self.scrollable_container.layout())
-
-        # Reset cel widgets
-        self.cel_widgets.clear()
-        self.hr_cel_widgets.clear()
-        self.datum_header_widgets.clear()
-
-        # Maak twee aparte layouts
-        frozen_layout = QGridLayout()
-        frozen_layout.setSpacing(0)
-        frozen_layout.setContentsMargins(0, 0, 0, 0)
-
-        scrollable_layout = QGridLayout()
-        scrollable_layout.setSpacing(0)
-        scrollable_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Haal datum lijst en zichtbare gebruikers
-        datum_lijst = self.get_datum_lijst(start_offset=8, eind_offset=8)
-        zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-
-        if not zichtbare_gebruikers:
-            # Geen gebruikers geselecteerd
-            info = QLabel("Geen teamleden geselecteerd. Gebruik de filter knop.")
-            info.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; padding: 20px;")
-            frozen_layout.addWidget(info, 0, 0)
-            self.frozen_container.setLayout(frozen_layout)
-            self.scrollable_container.setLayout(scrollable_layout)
-            return
-
-        # ============== FROZEN HEADERS (naam + HR kolommen) ==============
-        # Dynamische frozen width: 280px (naam) of 380px (naam + HR)
-        frozen_width = 280
-        if self.rode_lijn_periodes:
-            frozen_width = 380  # 280 + 50 + 50
-        self.frozen_scroll.setFixedWidth(frozen_width)
-
-        # Naam header → frozen kolom 0
-        naam_header = QLabel("Teamlid")
-        naam_header.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold))
-        naam_header.setStyleSheet(f"""
-            QLabel {{
-                background-color: {Colors.PRIMARY};
-                color: white;
-                padding: 8px;
-                border: 1px solid {Colors.BORDER_LIGHT};
-                qproperty-alignment: AlignCenter;
-            }}
-        """)
-        naam_header.setFixedWidth(280)
-        frozen_layout.addWidget(naam_header, 0, 0)
-
-        # HR kolom headers (alleen als rode lijn periodes beschikbaar zijn)
-        frozen_col_offset = 1  # Start positie voor HR kolommen in frozen layout
-        if self.rode_lijn_periodes:
-            # Voor RL header → frozen kolom 1
-            hr_voor_header = QLabel("Voor\nRL")
-            hr_voor_header.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_TINY, QFont.Weight.Bold))
-            hr_voor_header.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {Colors.PRIMARY};
-                    color: white;
-                    padding: 4px;
-                    border: 1px solid {Colors.BORDER_LIGHT};
-                    qproperty-alignment: AlignCenter;
-                }}
-            """)
-            hr_voor_header.setFixedWidth(50)
-            vorig_periode = self.rode_lijn_periodes['vorig']
-            hr_voor_header.setToolTip(
-                f"Gewerkte dagen vóór rode lijn\n"
-                f"Periode {vorig_periode['nummer']}: {vorig_periode['start']} t/m {vorig_periode['eind']}"
-            )
-            frozen_layout.addWidget(hr_voor_header, 0, 1)
-
-            # Na RL header → frozen kolom 2
-            hr_na_header = QLabel("Na\nRL")
-            hr_na_header.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_TINY, QFont.Weight.Bold))
-            hr_na_header.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {Colors.PRIMARY};
-                    color: white;
-                    padding: 4px;
-                    border: 1px solid {Colors.BORDER_LIGHT};
-                    border-left: 3px solid #dc3545;
-                    qproperty-alignment: AlignCenter;
-                }}
-            """)
-            hr_na_header.setFixedWidth(50)
-            huidig_periode = self.rode_lijn_periodes['huidig']
-            hr_na_header.setToolTip(
-                f"Gewerkte dagen ná rode lijn\n"
-                f"Periode {huidig_periode['nummer']}: {huidig_periode['start']} t/m {huidig_periode['eind']}"
-            )
-            frozen_layout.addWidget(hr_na_header, 0, 2)
-
-        # ============== SCROLLABLE HEADERS (datum kolommen) ==============
-        # Datum headers starten bij scrollable kolom 0
-        for col, (datum_str, label) in enumerate(datum_lijst):
-            datum_header = QLabel(label)
-            datum_header.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_TINY, QFont.Weight.Bold))
-
-            # Achtergrond kleur voor header (weekend/feestdag basis)
-            achtergrond = self.get_datum_achtergrond(datum_str)
-
-            # Bemannings overlay (v0.6.20 - qlineargradient zoals cell selection)
-            bemannings_overlay = self.get_bemannings_overlay_kleur(datum_str)
-
-            # Check of dit het begin van een rode lijn periode is
-            is_rode_lijn_start = datum_str in self.rode_lijnen_starts
-
-            # Blauwe kader ROND de hele huidige maand (v0.6.25)
-            datum_obj = datetime.strptime(datum_str, '%Y-%m-%d')
-            is_huidige_maand = datum_obj.month == self.maand
-            is_eerste_dag_maand = is_huidige_maand and datum_obj.day == 1
-            is_laatste_dag_maand = is_huidige_maand and datum_obj.day == self.get_laatste_dag_van_maand()
-
-            # Base border
-            border_style = f"1px solid {Colors.BORDER_LIGHT}"
-
-            # Blauwe kader rondom hele maand
-            extra_borders = []
-            if is_huidige_maand:
-                extra_borders.append("border-top: 3px solid #2196F3")  # Boven border voor alle maand dagen
-            if is_eerste_dag_maand:
-                extra_borders.append("border-left: 3px solid #2196F3")  # Linker border voor eerste dag
-            if is_laatste_dag_maand:
-                extra_borders.append("border-right: 3px solid #2196F3")  # Rechter border voor laatste dag
-
-            # Tooltip met bemanningsstatus (v0.6.20)
-            bemannings_tooltip = self.get_bemannings_tooltip(datum_str)
-            base_tooltip = ""
-            if is_rode_lijn_start:
-                periode_nr = self.rode_lijnen_starts[datum_str]
-                base_tooltip = f"Start Rode Lijn Periode {periode_nr}"
-
-            # Combineer tooltips
-            if bemannings_tooltip and base_tooltip:
-                full_tooltip = f"{bemannings_tooltip}\n\n{base_tooltip}"
-            elif bemannings_tooltip:
-                full_tooltip = bemannings_tooltip
-            else:
-                full_tooltip = base_tooltip
-
-            # Build style met borders
-            border_parts = [f"border: {border_style}"]
-
-            # Rode lijn: dikke rode linker border (kan combineren met blauwe maand border)
-            if is_rode_lijn_start:
-                border_parts.append("border-left: 4px solid #dc3545")
-
-            # Blauwe maand borders (kunnen rode lijn overschrijven als beide aanwezig)
-            border_parts.extend(extra_borders)
-
-            base_style = f"""
-                QLabel {{
-                    background-color: {achtergrond};
-                    color: #000000;
-                    padding: 4px;
-                    {'; '.join(border_parts)};
-                    qproperty-alignment: AlignCenter;
-                }}
-            """
-
-            # Bemannings overlay toepassen (replace background-color met background + qlineargradient)
-            if bemannings_overlay:
-                base_style = base_style.replace(
-                    f"background-color: {achtergrond}",
-                    f"background: {bemannings_overlay}"
-                )
-
-            datum_header.setStyleSheet(base_style)
-
-            if full_tooltip:
-                datum_header.setToolTip(full_tooltip)
-
-            datum_header.setFixedWidth(60)
-            scrollable_layout.addWidget(datum_header, 0, col)  # Scrollable headers
-
-            # Sla datum header op voor later updaten (v0.6.20)
-            self.datum_header_widgets[datum_str] = datum_header
-
-        # ============== DATA RIJEN (split in frozen + scrollable) ==============
-        for row, gebruiker in enumerate(zichtbare_gebruikers, start=1):
-            gebruiker_id = gebruiker['id']
-            is_laatste_rij = (row == len(zichtbare_gebruikers))
-
-            # ---- FROZEN: Naam kolom → frozen kolom 0 ----
-            naam_label = QLabel(gebruiker['volledige_naam'])
-            naam_label.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL))
-            naam_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {Colors.BG_LIGHT};
-                    padding: 8px;
-                    border: 1px solid {Colors.BORDER_LIGHT};
-                }}
-            """)
-            naam_label.setFixedWidth(280)
-            frozen_layout.addWidget(naam_label, row, 0)
-
-            # ---- FROZEN: HR kolom cellen → frozen kolom 1, 2 ----
-            if self.rode_lijn_periodes:
-                # Bereken werkdagen (gebruik cache)
-                if gebruiker_id not in self.hr_werkdagen_cache:
-                    vorig_periode = self.rode_lijn_periodes['vorig']
-                    huidig_periode = self.rode_lijn_periodes['huidig']
-
-                    voor_dagen = self.tel_gewerkte_dagen(
-                        gebruiker_id,
-                        vorig_periode['start'],
-                        vorig_periode['eind']
-                    )
-                    na_dagen = self.tel_gewerkte_dagen(
-                        gebruiker_id,
-                        huidig_periode['start'],
-                        huidig_periode['eind']
-                    )
-
-                    self.hr_werkdagen_cache[gebruiker_id] = {
-                        'voor': voor_dagen,
-                        'na': na_dagen
-                    }
-
-                voor_dagen = self.hr_werkdagen_cache[gebruiker_id]['voor']
-                na_dagen = self.hr_werkdagen_cache[gebruiker_id]['na']
-                totaal_dagen = voor_dagen + na_dagen
-
-                # Check ELKE periode apart (niet het totaal!)
-                is_voor_overschrijding = voor_dagen > 19
-                is_na_overschrijding = na_dagen > 19
-
-                # Kolom 1: "Voor RL" aantal (rood als deze periode > 19)
-                voor_achtergrond = "rgba(255, 0, 0, 0.3)" if is_voor_overschrijding else Colors.BG_LIGHT
-                hr_voor_cel = QLabel(str(voor_dagen))
-                hr_voor_cel.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold))
-                hr_voor_cel.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: {voor_achtergrond};
-                        padding: 8px;
-                        border: 1px solid {Colors.BORDER_LIGHT};
-                        qproperty-alignment: AlignCenter;
-                    }}
-                """)
-                hr_voor_cel.setFixedWidth(50)
-                vorig_periode = self.rode_lijn_periodes['vorig']
-                hr_voor_cel.setToolTip(
-                    f"Gewerkte dagen: {voor_dagen}/19\n"
-                    f"Periode {vorig_periode['nummer']}: {vorig_periode['start']} t/m {vorig_periode['eind']}"
-                )
-                frozen_layout.addWidget(hr_voor_cel, row, 1)  # Frozen kolom 1
-
-                # Kolom 2: "Na RL" aantal met rode linker border (rood als deze periode > 19)
-                na_achtergrond = "rgba(255, 0, 0, 0.3)" if is_na_overschrijding else Colors.BG_LIGHT
-                hr_na_cel = QLabel(str(na_dagen))
-                hr_na_cel.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold))
-                hr_na_cel.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: {na_achtergrond};
-                        padding: 8px;
-                        border: 1px solid {Colors.BORDER_LIGHT};
-                        border-left: 3px solid #dc3545;
-                        qproperty-alignment: AlignCenter;
-                    }}
-                """)
-                hr_na_cel.setFixedWidth(50)
-                huidig_periode = self.rode_lijn_periodes['huidig']
-                hr_na_cel.setToolTip(
-                    f"Gewerkte dagen: {na_dagen}/19\n"
-                    f"Periode {huidig_periode['nummer']}: {huidig_periode['start']} t/m {huidig_periode['eind']}"
-                )
-                frozen_layout.addWidget(hr_na_cel, row, 2)  # Frozen kolom 2
-
-                # Sla HR cellen op voor latere updates
-                self.hr_cel_widgets[gebruiker_id] = {
-                    'voor': hr_voor_cel,
-                    'na': hr_na_cel
-                }
+        """
+        Vul de grid modellen met datums en zichtbare gebruikers (v0.6.29)
 
-            # ---- SCROLLABLE: Datum cellen → scrollable kolom 0+ ----
-            for col, (datum_str, _) in enumerate(datum_lijst):  # Start bij kolom 0 in scrollable
-                cel = self.create_editable_cel(datum_str, gebruiker_id, is_laatste_rij)
-                cel.setFixedWidth(60)
-                scrollable_layout.addWidget(cel, row, col)  # Scrollable layout
+        Geen widgets per cel meer: de views vragen data op bij de modellen
+        en tekenen alleen wat zichtbaar is.
+        """
+        datum_lijst = self.get_weergave_datum_lijst()
+        zichtbare_gebruikers = self.get_zichtbare_gebruikers()
 
-                # Track widget
-                if datum_str not in self.cel_widgets:
-                    self.cel_widgets[datum_str] = {}
-                self.cel_widgets[datum_str][gebruiker_id] = cel
+        # Geen gebruikers geselecteerd → placeholder tonen
+        self.geen_gebruikers_label.setVisible(not zichtbare_gebruikers)
 
-        # Set layouts op containers
-        self.frozen_container.setMaximumHeight(frozen_layout.rowCount() * Dimensions.TABLE_ROW_HEIGHT)
-        self.frozen_container.setLayout(frozen_layout)
+        self.grid_model.herlaad(datum_lijst, zichtbare_gebruikers)
+        self.frozen_model.herlaad(zichtbare_gebruikers, toon_hr=self.rode_lijn_periodes is not None)
 
-        self.scrollable_container.setMaximumHeight(scrollable_layout.rowCount() * Dimensions.TABLE_ROW_HEIGHT)
-        self.scrollable_container.setLayout(scrollable_layout)
+        # Dynamische frozen width: 280px (naam) of 380px (naam + HR)
+        self.frozen_view.pas_kolommen_aan(self.rode_lijn_periodes is not None)
 
-    def create_editable_cel(self, datum_str: str, gebruiker_id: int, is_laatste_rij: bool = False) -> EditableLabel:
-        """Maak editable cel voor shift weergave"""
-        # Haal shift code op
-        shift_code = self.get_display_code(datum_str, gebruiker_id)
+    def get_hr_werkdagen(self, gebruiker_id: int) -> Optional[Dict[str, int]]:
+        """
+        Gewerkte dagen voor/na rode lijn voor gebruiker (lazy, met cache)
 
-        # Check of er een notitie is
-        heeft_notitie = False
-        if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-            notitie = self.planning_data[datum_str][gebruiker_id].get('notitie', '')
-            heeft_notitie = bool(notitie and notitie.strip())
+        Wordt door PlannerFrozenModel opgevraagd bij tekenen, dus enkel
+        voor zichtbare rijen. None = wordt nog geladen (async maand load).
+        """
+        if gebruiker_id not in self.hr_werkdagen_cache:
+            if not self.is_dataset_actueel('hr'):
+                return None
+            # Gebruiker buiten batch (bv. net toegevoegd) → zelfde batch query voor 1 gebruiker
+            self.hr_werkdagen_cache.update(self.fetch_hr_werkdagen(self.rode_lijn_periodes, [gebruiker_id]))
 
-        # Display text (zonder notitie indicator - die komt via CSS)
-        display_text = shift_code
+        return self.hr_werkdagen_cache[gebruiker_id]
 
-        # Bepaal achtergrond (weekend kleurtjes blijven behouden)
-        achtergrond = self.get_datum_achtergrond(datum_str)
+    def heeft_notitie(self, datum_str: str, gebruiker_id: int) -> bool:
+        """Check of cel een (niet-lege) notitie heeft"""
+        return bool(self.rooster.get_notitie(datum_str, gebruiker_id).strip())
 
-        # Bepaal overlay (verlof + HR violations, bemannings overlay alleen op datum headers)
+    def get_cel_overlay(self, datum_str: str, gebruiker_id: int) -> Optional[str]:
+        """
+        Overlay kleur voor cel (bemannings overlay staat alleen op datum headers)
+        Prioriteit: verlof overlay eerst, dan HR overlay (v0.6.28 - ISSUE-005 fix)
+        """
         verlof_overlay = self.get_verlof_overlay(datum_str, gebruiker_id, 'planner')
-        hr_overlay = self.get_hr_overlay_kleur(datum_str, gebruiker_id)
+        if verlof_overlay:
+            return verlof_overlay
+        return self.get_hr_overlay_kleur(datum_str, gebruiker_id)
 
-        # Prioriteit: verlof overlay eerst, dan HR overlay
-        overlay = verlof_overlay if verlof_overlay else hr_overlay
-
-        # Check of dit een buffer dag is
-        datum_obj = datetime.strptime(datum_str, '%Y-%m-%d')
-        is_buffer = datum_obj.month != self.maand
-
-        # Check of dit het begin van een rode lijn periode is
-        is_rode_lijn_start = datum_str in self.rode_lijnen_starts
-
-        # Blauwe kader ROND de hele huidige maand (v0.6.25) - onderste border voor data cellen
-        is_huidige_maand = datum_obj.month == self.maand
-        is_eerste_dag_maand = is_huidige_maand and datum_obj.day == 1
-        is_laatste_dag_maand = is_huidige_maand and datum_obj.day == self.get_laatste_dag_van_maand()
-
-        # Maak editable label (met display_text ipv shift_code)
-        cel = EditableLabel(display_text, datum_str, gebruiker_id, self)
-        cel.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold))
-
-        # Sla overlay kleur op voor editor styling (v0.6.28 - ISSUE-005 fix)
-        if overlay:
-            cel.overlay_kleur = overlay
-
-        # Stylesheet met optionele rode lijn en notitie indicator
-        base_style = self.create_cel_stylesheet(achtergrond, overlay)
-
-        # Rode lijn indicator (linker border)
-        if is_rode_lijn_start:
-            base_style = base_style.replace(
-                "border: 1px solid",
-                "border: 1px solid"
-            ).replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-left: 4px solid #dc3545;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Notitie indicator (rechter boven corner accent)
-        if heeft_notitie:
-            base_style = base_style.replace(
-                "border: 1px solid",
-                "border: 1px solid"
-            ).replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-top: 3px solid #00E676;\n                    border-right: 3px solid #00E676;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Blauwe maand kader - onder border voor ALLEEN de laatste rij (v0.6.25)
-        if is_huidige_maand and is_laatste_rij:
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-bottom: 3px solid #2196F3;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Blauwe maand kader - linker border voor eerste dag
-        if is_eerste_dag_maand:
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-left: 3px solid #2196F3;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Blauwe maand kader - rechter border voor laatste dag
-        if is_laatste_dag_maand:
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-right: 3px solid #2196F3;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        if is_buffer:
-            cel.setStyleSheet(base_style + " QLabel { opacity: 0.7; }")
-        else:
-            cel.setStyleSheet(base_style)
-
-        # Tooltip (combineer alle tooltip components)
+    def get_volledige_cel_tooltip(self, datum_str: str, gebruiker_id: int) -> str:
+        """Tooltip voor cel: shift/verlof info + HR violations + rode lijn + notitie"""
         tooltip = self.get_cel_tooltip(datum_str, gebruiker_id, 'planner')
 
         # Add HR violations tooltip (v0.6.26)
@@ -1500,51 +1209,76 @@ class PlannerGridKalender(GridKalenderBase):
             tooltip = f"{tooltip}\n\n{hr_tooltip}" if tooltip else hr_tooltip
 
         # Add rode lijn tooltip
-        if is_rode_lijn_start:
+        if datum_str in self.rode_lijnen_starts:
             periode_nr = self.rode_lijnen_starts[datum_str]
             rode_lijn_tooltip = f"Start Rode Lijn Periode {periode_nr}"
             tooltip = f"{tooltip}\n{rode_lijn_tooltip}" if tooltip else rode_lijn_tooltip
 
         # Add notitie tooltip
-        if heeft_notitie:
+        if self.heeft_notitie(datum_str, gebruiker_id):
             notitie_tooltip = "Heeft notitie (klik rechts -> Notitie bewerken)"
             tooltip = f"{tooltip}\n{notitie_tooltip}" if tooltip else notitie_tooltip
 
-        if tooltip:
-            cel.setToolTip(tooltip)
+        return tooltip
 
-        # Connect signals
-        cel.edit_finished.connect(lambda code: self.on_cel_edited(datum_str, gebruiker_id, code))  # type: ignore
+    def get_datum_header_tooltip(self, datum_str: str) -> str:
+        """Tooltip voor datum header: bemanningsstatus (v0.6.20) + rode lijn start"""
+        bemannings_tooltip = self.get_bemannings_tooltip(datum_str)
+        base_tooltip = ""
+        if datum_str in self.rode_lijnen_starts:
+            periode_nr = self.rode_lijnen_starts[datum_str]
+            base_tooltip = f"Start Rode Lijn Periode {periode_nr}"
 
-        # Context menu
-        cel.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        cel.customContextMenuRequested.connect(  # type: ignore
-            lambda pos: self.show_context_menu(cel, datum_str, gebruiker_id)
-        )
+        if bemannings_tooltip and base_tooltip:
+            return f"{bemannings_tooltip}\n\n{base_tooltip}"
+        return bemannings_tooltip or base_tooltip
+
+    def on_cel_aangeklikt(self, datum_str: str, gebruiker_id: int, modifiers) -> None:
+        """Klik op cel: Ctrl/Shift = selectie, anders edit starten"""
+        if modifiers & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier):
+            self.toggle_cell_selection(datum_str, gebruiker_id, modifiers)
+            return
+
+        self.cel_clicked.emit(datum_str, gebruiker_id)  # type: ignore
+        self.start_edit(datum_str, gebruiker_id)
 
-        # Cursor
-        cel.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+    def kan_bewerken(self) -> bool:
+        """Geen bewerkingen tot de verse planning geladen is (anders overschreven)"""
+        return self.is_dataset_actueel('planning')
+
+    def start_edit(self, datum_str: str, gebruiker_id: int) -> None:
+        """Open inline editor voor cel"""
+        if not self.kan_bewerken():
+            return
+        index = self.grid_model.index_voor(datum_str, gebruiker_id)
+        if not index.isValid():
+            return
+        self.grid_view.setCurrentIndex(index)
+        self.grid_view.scrollTo(index)
+        self.grid_view.edit(index)
 
-        return cel
+    def on_context_menu_requested(self, pos: QPoint) -> None:
+        """Rechtsklik op datum cel"""
+        index = self.grid_view.indexAt(pos)
+        if index.isValid():
+            self.show_context_menu(index.data(ROL_DATUM), index.data(ROL_GEBRUIKER))
+
+    def refresh_cel(self, datum_str: str, gebruiker_id: int) -> None:
+        """Herteken cel na wijziging (code, overlay, notitie)"""
+        self.grid_model.refresh_cel(datum_str, gebruiker_id)
 
     def on_cel_edited(self, datum_str: str, gebruiker_id: int, code: str):
         """Handle cel edit"""
         # Check of maand in concept is (niet gepubliceerd)
-        if not self.check_maand_is_concept():
+        if not self.check_maand_is_concept(datum_str):
             QMessageBox.warning(
                 self,
                 "Gepubliceerde Maand",
                 "Deze maand is gepubliceerd en kan niet worden bewerkt.\n\n"
                 "Zet de maand eerst terug naar concept via de Planning Editor."
             )
-            # Reset cel naar oude waarde met stylesheet rebuild (v0.6.25)
-            if datum_str in self.cel_widgets and gebruiker_id in self.cel_widgets[datum_str]:
-                zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-                is_laatste_rij = False
-                if zichtbare_gebruikers:
-                    laatste_gebruiker_id = zichtbare_gebruikers[-1]['id']
-                    is_laatste_rij = (gebruiker_id == laatste_gebruiker_id)
-                self.rebuild_cel_style(datum_str, gebruiker_id, is_laatste_rij)
+            # Geen wijziging in model: cel toont automatisch oude waarde
+            self.refresh_cel(datum_str, gebruiker_id)
             return
 
         if not code:
@@ -1560,14 +1294,8 @@ class PlannerGridKalender(GridKalenderBase):
                 f"'{code}' is geen geldige shift code.\n\n"
                 f"Check de codes lijst in het scherm."
             )
-            # Reset cel met stylesheet rebuild (v0.6.25)
-            if datum_str in self.cel_widgets and gebruiker_id in self.cel_widgets[datum_str]:
-                zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-                is_laatste_rij = False
-                if zichtbare_gebruikers:
-                    laatste_gebruiker_id = zichtbare_gebruikers[-1]['id']
-                    is_laatste_rij = (gebruiker_id == laatste_gebruiker_id)
-                self.rebuild_cel_style(datum_str, gebruiker_id, is_laatste_rij)
+            # Geen wijziging in model: cel toont automatisch oude waarde
+            self.refresh_cel(datum_str, gebruiker_id)
             return
 
         # Check of het een speciale code is (altijd geldig)
@@ -1586,7 +1314,7 @@ class PlannerGridKalender(GridKalenderBase):
                 types_str = ', '.join(gevonden_types)
 
                 # Check of het een feestdag is voor specifieke melding
-                is_feestdag = datum_str in self.feestdagen
+                is_feestdag = self.dag_kalender.is_feestdag(datum_str)
                 if is_feestdag:
                     # Haal feestdag naam op
                     feestdag_naam = self.get_feestdag_naam(datum_str)
@@ -1611,14 +1339,8 @@ class PlannerGridKalender(GridKalenderBase):
                     f"'{code}' is geen geldige shift code."
                 )
 
-            # Reset cel met stylesheet rebuild (v0.6.25)
-            if datum_str in self.cel_widgets and gebruiker_id in self.cel_widgets[datum_str]:
-                zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-                is_laatste_rij = False
-                if zichtbare_gebruikers:
-                    laatste_gebruiker_id = zichtbare_gebruikers[-1]['id']
-                    is_laatste_rij = (gebruiker_id == laatste_gebruiker_id)
-                self.rebuild_cel_style(datum_str, gebruiker_id, is_laatste_rij)
+            # Geen wijziging in model: cel toont automatisch oude waarde
+            self.refresh_cel(datum_str, gebruiker_id)
             return
 
         # Check voor dubbele shift_code (v0.6.20 - waarschuwing, maar kan doorgaan)
@@ -1638,14 +1360,8 @@ class PlannerGridKalender(GridKalenderBase):
                 )
 
                 if antwoord == QMessageBox.StandardButton.No:
-                    # Annuleren - reset cel met stylesheet rebuild (v0.6.25)
-                    if datum_str in self.cel_widgets and gebruiker_id in self.cel_widgets[datum_str]:
-                        zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-                        is_laatste_rij = False
-                        if zichtbare_gebruikers:
-                            laatste_gebruiker_id = zichtbare_gebruikers[-1]['id']
-                            is_laatste_rij = (gebruiker_id == laatste_gebruiker_id)
-                        self.rebuild_cel_style(datum_str, gebruiker_id, is_laatste_rij)
+                    # Geen wijziging in model: cel toont automatisch oude waarde
+                    self.refresh_cel(datum_str, gebruiker_id)
                     return
                 # Anders: gebruiker heeft "Yes" gekozen, ga door met opslaan
 
@@ -1664,45 +1380,71 @@ class PlannerGridKalender(GridKalenderBase):
         Returns:
             Naam van gebruiker die code al gebruikt, of None als code niet dubbel is
         """
-        conn = get_connection()
-        cursor = conn.cursor()
+        # In-memory index i.p.v. query per edit (v0.6.29)
+        for gebruiker_id in self.code_index.get(datum_str, {}).get(code, ()):
+            if gebruiker_id != huidige_gebruiker_id:
+                naam = self.rooster.get_gebruiker_naam(gebruiker_id)
+                if naam:
+                    return naam
+        return None
+
+    def indexeer_rooster(self) -> None:
+        """Bouw code_index op uit rooster: welke gebruikers hebben code X op datum Y (v0.6.29)"""
+        self.code_index.clear()
+        for datum_str, gebruiker_id, code in self.rooster.iter_codes():
+            self.code_index.setdefault(datum_str, {}).setdefault(code, set()).add(gebruiker_id)
+
+    def indexeer_shift(self, datum_str: str, gebruiker_id: int,
+                       oude_code: Optional[str], nieuwe_code: Optional[str]) -> None:
+        """Werk code_index bij na edit van 1 cel"""
+        codes = self.code_index.setdefault(datum_str, {})
+        if oude_code and oude_code in codes:
+            codes[oude_code].discard(gebruiker_id)
+            if not codes[oude_code]:
+                del codes[oude_code]
+        if nieuwe_code:
+            codes.setdefault(nieuwe_code, set()).add(gebruiker_id)
+        if not codes:
+            del self.code_index[datum_str]
+
+    def zet_maand_status(self, status: str) -> None:
+        """
+        Maand status gewijzigd buiten de grid (publiceren / terug naar concept)
 
-        cursor.execute("""
-            SELECT g.volledige_naam
-            FROM planning p
-            JOIN gebruikers g ON p.gebruiker_id = g.id
-            WHERE p.datum = ?
-            AND p.shift_code = ?
-            AND p.gebruiker_id != ?
-            LIMIT 1
-        """, (datum_str, code, huidige_gebruiker_id))
-
-        row = cursor.fetchone()
-        conn.close()
+        Planning Editor herlaadt de grid niet → in-memory state hier bijwerken.
+        """
+        self.rooster.zet_maand_status(self.jaar, self.maand, status)
+        self.maand_is_concept = status == 'concept'
 
-        return row['volledige_naam'] if row else None
+    def meld_maand_intussen_gepubliceerd(self, datum_strs: Iterable[str]) -> None:
+        """
+        Write geweigerd door de maand_status guard: een andere client publiceerde
+        de maand na het laden. Maand read-only maken en de gebruiker verwittigen.
+        """
+        maanden = sorted({(int(datum_str[:4]), int(datum_str[5:7])) for datum_str in datum_strs})
+        for jaar, maand in maanden:
+            self.rooster.zet_maand_status(jaar, maand, 'gepubliceerd')
+            if (jaar, maand) == (self.jaar, self.maand):
+                self.maand_is_concept = False
+
+        namen = ', '.join(datetime(jaar, maand, 1).strftime('%B %Y') for jaar, maand in maanden)
+        QMessageBox.warning(
+            self,
+            "Gepubliceerde Maand",
+            f"Niet opgeslagen: {namen} is intussen gepubliceerd (door een andere gebruiker).\n\n"
+            "Zet de maand eerst terug naar concept via de Planning Editor."
+        )
 
     def bepaal_dag_type(self, datum_str: str) -> str:
         """
-        Bepaal dag_type voor een datum
+        Bepaal dag_type voor een datum (zondag of feestdag = 'zondag')
         Returns: 'weekdag', 'zaterdag', of 'zondag'
         """
-        datum = datetime.strptime(datum_str, '%Y-%m-%d')
-        weekdag = datum.weekday()  # 0=Ma, 6=Zo
-
-        # Zondag of feestdag
-        if weekdag == 6 or datum_str in self.feestdagen:
-            return 'zondag'
-        # Zaterdag
-        elif weekdag == 5:
-            return 'zaterdag'
-        # Weekdag (ma-vr)
-        else:
-            return 'weekdag'
+        return self.dag_kalender.dag_type(datum_str)
 
     def get_feestdag_naam(self, datum_str: str) -> str:
         """Haal feestdag naam op voor een datum"""
-        return self.feestdag_namen.get(datum_str, "Feestdag")
+        return self.dag_kalender.feestdag_naam(datum_str) or "Feestdag"
 
     def update_hr_cijfers_voor_gebruiker(self, gebruiker_id: int) -> None:
         """Update HR cijfers voor specifieke gebruiker zonder volledige rebuild"""
@@ -1710,69 +1452,8 @@ class PlannerGridKalender(GridKalenderBase):
         if not self.rode_lijn_periodes:
             return
 
-        # Check of deze gebruiker HR cellen heeft
-        if gebruiker_id not in self.hr_cel_widgets:
-            return
-
-        # Bereken nieuwe werkdagen
-        vorig_periode = self.rode_lijn_periodes['vorig']
-        huidig_periode = self.rode_lijn_periodes['huidig']
-
-        voor_dagen = self.tel_gewerkte_dagen(
-            gebruiker_id,
-            vorig_periode['start'],
-            vorig_periode['eind']
-        )
-        na_dagen = self.tel_gewerkte_dagen(
-            gebruiker_id,
-            huidig_periode['start'],
-            huidig_periode['eind']
-        )
-
-        # Update cache
-        self.hr_werkdagen_cache[gebruiker_id] = {
-            'voor': voor_dagen,
-            'na': na_dagen
-        }
-
-        # Check overschrijdingen per cel
-        is_voor_overschrijding = voor_dagen > 19
-        is_na_overschrijding = na_dagen > 19
-
-        # Update "Voor RL" cel
-        voor_cel = self.hr_cel_widgets[gebruiker_id]['voor']
-        voor_cel.setText(str(voor_dagen))
-        voor_achtergrond = "rgba(255, 0, 0, 0.3)" if is_voor_overschrijding else Colors.BG_LIGHT
-        voor_cel.setStyleSheet(f"""
-            QLabel {{
-                background-color: {voor_achtergrond};
-                padding: 8px;
-                border: 1px solid {Colors.BORDER_LIGHT};
-                qproperty-alignment: AlignCenter;
-            }}
-        """)
-        voor_cel.setToolTip(
-            f"Gewerkte dagen: {voor_dagen}/19\n"
-            f"Periode {vorig_periode['nummer']}: {vorig_periode['start']} t/m {vorig_periode['eind']}"
-        )
-
-        # Update "Na RL" cel
-        na_cel = self.hr_cel_widgets[gebruiker_id]['na']
-        na_cel.setText(str(na_dagen))
-        na_achtergrond = "rgba(255, 0, 0, 0.3)" if is_na_overschrijding else Colors.BG_LIGHT
-        na_cel.setStyleSheet(f"""
-            QLabel {{
-                background-color: {na_achtergrond};
-                padding: 8px;
-                border: 1px solid {Colors.BORDER_LIGHT};
-                border-left: 3px solid #dc3545;
-                qproperty-alignment: AlignCenter;
-            }}
-        """)
-        na_cel.setToolTip(
-            f"Gewerkte dagen: {na_dagen}/19\n"
-            f"Periode {huidig_periode['nummer']}: {huidig_periode['start']} t/m {huidig_periode['eind']}"
-        )
+        # Telling is al incrementeel bijgewerkt (pas_hr_werkdagen_aan) → enkel repaint
+        self.frozen_model.refresh_gebruiker(gebruiker_id)
 
     def update_bemannings_status_voor_datum(self, datum_str: str) -> None:
         """
@@ -1784,254 +1465,52 @@ class PlannerGridKalender(GridKalenderBase):
 
         v0.6.26.2: Conditioneel obv config.ENABLE_VALIDATION_CACHE flag
         """
+        self.update_bemannings_status_voor_datums([datum_str])
+
+    def update_bemannings_status_voor_datums(self, datum_strs: List[str], alleen_getoond: bool = False) -> None:
+        """
+        Update bemannings status voor meerdere datums na een (bulk) wijziging (v0.6.29)
+
+        1 cache herlading over de geraakte periode, daarna enkel de geraakte
+        kolommen + datum headers hertekenen (overlay kleur en tooltip).
+
+        Args:
+            alleen_getoond: cache altijd verversen, maar enkel datums bijwerken die al
+                een status tonen (na "Valideer Planning"; real-time controle blijft uit)
+        """
         from config import ENABLE_VALIDATION_CACHE
 
-        # Converteer naar date object
-        datum_obj = datetime.strptime(datum_str, '%Y-%m-%d').date()
+        datum_objs = {datum_str: datetime.strptime(datum_str, '%Y-%m-%d').date() for datum_str in datum_strs}
 
         # PERFORMANCE FIX: Gebruik cache indien ingeschakeld
+        statussen: Dict[str, Optional[str]] = {}
         if ENABLE_VALIDATION_CACHE:
             from services.validation_cache import ValidationCache
 
-            cache = ValidationCache.get_instance()
-            cache.invalidate_date(datum_obj)
-
-            # Re-preload cache voor deze maand (snel - gebruikt batch queries)
             gebruiker_ids = [user['id'] for user in self.gebruikers_data] if self.gebruikers_data else None
-            cache.preload_month(self.jaar, self.maand, gebruiker_ids)
-
-            # Haal nieuwe status uit cache
-            status = cache.get_bemannings_status(datum_obj)
-        else:
-            # Fallback: Direct query (v0.6.26.2)
-            from services.bemannings_controle_service import controleer_bemanning
-            status_dict = controleer_bemanning(datum_obj)
-            status = status_dict.get('status', 'groen')
-
-        if status:
-            # Update status dictionary (minimale data voor UI)
-            self.bemannings_status[datum_str] = {
-                'status': status,
-                'details': f"Status: {status}",
-                'verwachte_codes': [],
-                'werkelijke_codes': [],
-                'ontbrekende_codes': [],
-                'dubbele_codes': []
-            }
-        else:
-            # Fallback naar oude methode
-            resultaat = controleer_bemanning(datum_obj)
-            self.bemannings_status[datum_str] = resultaat
-
-        # Update alle cellen voor deze datum (alleen tooltips, geen overlay wijziging)
-        if datum_str in self.cel_widgets:
-            # Haal basis achtergrond op (weekend kleurtjes blijven behouden)
-            nieuwe_achtergrond = self.get_datum_achtergrond(datum_str)
-
-            for gebruiker_id, cel in self.cel_widgets[datum_str].items():
-                # Bepaal overlay (verlof + HR, bemannings overlay alleen op datum headers)
-                verlof_overlay = self.get_verlof_overlay(datum_str, gebruiker_id, 'planner')
-                hr_overlay = self.get_hr_overlay_kleur(datum_str, gebruiker_id)
-
-                # Prioriteit: verlof overlay eerst, dan HR overlay (v0.6.28 - ISSUE-005 fix)
-                overlay = verlof_overlay if verlof_overlay else hr_overlay
-
-                # Bepaal of het een buffer dag is
-                datum_obj_check = datetime.strptime(datum_str, '%Y-%m-%d')
-                is_buffer = datum_obj_check.month != self.maand
-
-                # Check rode lijn
-                is_rode_lijn_start = datum_str in self.rode_lijnen_starts
-
-                # Check notitie
-                heeft_notitie = False
-                if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-                    notitie = self.planning_data[datum_str][gebruiker_id].get('notitie', '')
-                    heeft_notitie = bool(notitie and notitie.strip())
-
-                # Maak stylesheet (geen bemannings overlay op cellen)
-                base_style = self.create_cel_stylesheet(nieuwe_achtergrond, overlay)
-
-                # Rode lijn indicator
-                if is_rode_lijn_start:
-                    base_style = base_style.replace(
-                        "border: 1px solid",
-                        "border: 1px solid"
-                    ).replace(
-                        "qproperty-alignment: AlignCenter;",
-                        "border-left: 4px solid #dc3545;\n                    qproperty-alignment: AlignCenter;"
-                    )
-
-                # Notitie indicator
-                if heeft_notitie:
-                    base_style = base_style.replace(
-                        "border: 1px solid",
-                        "border: 1px solid"
-                    ).replace(
-                        "qproperty-alignment: AlignCenter;",
-                        "border-top: 3px solid #00E676;\n                    border-right: 3px solid #00E676;\n                    qproperty-alignment: AlignCenter;"
-                    )
-
-                if is_buffer:
-                    cel.setStyleSheet(base_style + " QLabel { opacity: 0.7; }")
-                else:
-                    cel.setStyleSheet(base_style)
+            per_datum = ValidationCache.get_instance().ververs_datums(datum_objs.values(), gebruiker_ids)
+            statussen = {datum_str: per_datum.get(datum_obj) for datum_str, datum_obj in datum_objs.items()}
 
-                # Update overlay kleur voor editor styling (v0.6.28 - ISSUE-005 fix)
-                cel.overlay_kleur = overlay if overlay else None
-
-        # Update ook de datum header (v0.6.20 - real-time overlay update)
-        if datum_str in self.datum_header_widgets:
-            header = self.datum_header_widgets[datum_str]
-
-            # Haal basis achtergrond op
-            achtergrond = self.get_datum_achtergrond(datum_str)
-
-            # Haal bemannings overlay op (v0.6.20)
-            bemannings_overlay = self.get_bemannings_overlay_kleur(datum_str)
-
-            # Check rode lijn
-            is_rode_lijn_start = datum_str in self.rode_lijnen_starts
-
-            # Highlight huidige maand
-            datum_obj_check = datetime.strptime(datum_str, '%Y-%m-%d')
-            if datum_obj_check.month == self.maand:
-                border_style = f"2px solid {Colors.PRIMARY}"
-            else:
-                border_style = f"1px solid {Colors.BORDER_LIGHT}"
-
-            # Update tooltip
-            bemannings_tooltip = self.get_bemannings_tooltip(datum_str)
-            base_tooltip = ""
-            if is_rode_lijn_start:
-                periode_nr = self.rode_lijnen_starts[datum_str]
-                base_tooltip = f"Start Rode Lijn Periode {periode_nr}"
-
-            if bemannings_tooltip and base_tooltip:
-                full_tooltip = f"{bemannings_tooltip}\n\n{base_tooltip}"
-            elif bemannings_tooltip:
-                full_tooltip = bemannings_tooltip
-            else:
-                full_tooltip = base_tooltip
-
-            # Build base stylesheet
-            if is_rode_lijn_start:
-                base_style = f"""
-                    QLabel {{
-                        background-color: {achtergrond};
-                        color: #000000;
-                        padding: 4px;
-                        border: {border_style};
-                        border-left: 4px solid #dc3545;
-                        qproperty-alignment: AlignCenter;
-                    }}
-                """
+        for datum_str, datum_obj in datum_objs.items():
+            if alleen_getoond and datum_str not in self.bemannings_status:
+                continue
+            status = statussen.get(datum_str)
+            if status:
+                # Update status dictionary (minimale data voor UI)
+                self.bemannings_status[datum_str] = {
+                    'status': status,
+                    'details': f"Status: {status}",
+                    'verwachte_codes': [],
+                    'werkelijke_codes': [],
+                    'ontbrekende_codes': [],
+                    'dubbele_codes': []
+                }
             else:
-                base_style = f"""
-                    QLabel {{
-                        background-color: {achtergrond};
-                        color: #000000;
-                        padding: 4px;
-                        border: {border_style};
-                        qproperty-alignment: AlignCenter;
-                    }}
-                """
-
-            # Bemannings overlay toepassen (replace background-color met background + qlineargradient)
-            if bemannings_overlay:
-                base_style = base_style.replace(
-                    f"background-color: {achtergrond}",
-                    f"background: {bemannings_overlay}"
-                )
-
-            header.setStyleSheet(base_style)
-
-            if full_tooltip:
-                header.setToolTip(full_tooltip)
-
-    def rebuild_cel_style(self, datum_str: str, gebruiker_id: int, is_laatste_rij: bool = False) -> None:
-        """
-        Rebuild cel stylesheet na wijziging (v0.6.25)
-        Herstelt alle custom borders: blauwe maand kader, rode lijn, notitie indicator
-        """
-        if datum_str not in self.cel_widgets or gebruiker_id not in self.cel_widgets[datum_str]:
-            return
-
-        cel = self.cel_widgets[datum_str][gebruiker_id]
-
-        # Haal shift code en notitie op
-        shift_code = self.get_display_code(datum_str, gebruiker_id)
+                # Fallback: Direct query (v0.6.26.2 - cache uitgeschakeld of geen status)
+                self.bemannings_status[datum_str] = controleer_bemanning(datum_obj)
 
-        heeft_notitie = False
-        if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-            notitie = self.planning_data[datum_str][gebruiker_id].get('notitie', '')
-            heeft_notitie = bool(notitie and notitie.strip())
-
-        # Bepaal achtergrond en overlay
-        achtergrond = self.get_datum_achtergrond(datum_str)
-        verlof_overlay = self.get_verlof_overlay(datum_str, gebruiker_id, 'planner')
-        hr_overlay = self.get_hr_overlay_kleur(datum_str, gebruiker_id)
-
-        # Prioriteit: verlof overlay eerst, dan HR overlay (v0.6.28 - ISSUE-005 fix)
-        overlay = verlof_overlay if verlof_overlay else hr_overlay
-
-        # Check flags
-        datum_obj = datetime.strptime(datum_str, '%Y-%m-%d')
-        is_buffer = datum_obj.month != self.maand
-        is_rode_lijn_start = datum_str in self.rode_lijnen_starts
-        is_huidige_maand = datum_obj.month == self.maand
-        is_eerste_dag_maand = is_huidige_maand and datum_obj.day == 1
-        is_laatste_dag_maand = is_huidige_maand and datum_obj.day == self.get_laatste_dag_van_maand()
-
-        # Rebuild stylesheet (same logic as create_editable_cel)
-        base_style = self.create_cel_stylesheet(achtergrond, overlay)
-
-        # Rode lijn indicator
-        if is_rode_lijn_start:
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-left: 4px solid #dc3545;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Notitie indicator
-        if heeft_notitie:
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-top: 3px solid #00E676;\n                    border-right: 3px solid #00E676;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Blauwe maand kader - onder border voor laatste rij
-        if is_huidige_maand and is_laatste_rij:
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-bottom: 3px solid #2196F3;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Blauwe maand kader - linker border voor eerste dag
-        if is_eerste_dag_maand:
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-left: 3px solid #2196F3;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Blauwe maand kader - rechter border voor laatste dag
-        if is_laatste_dag_maand:
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-right: 3px solid #2196F3;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Apply stylesheet
-        if is_buffer:
-            cel.setStyleSheet(base_style + " QLabel { opacity: 0.7; }")
-        else:
-            cel.setStyleSheet(base_style)
-
-        # Update overlay kleur voor editor styling (v0.6.28 - ISSUE-005 fix)
-        cel.overlay_kleur = overlay if overlay else None
-
-        # Update text
-        cel.setText(shift_code)
+            # Herteken cellen + datum header (overlay en tooltip worden on-demand opgevraagd)
+            self.grid_model.refresh_kolom(datum_str)
 
     def save_shift(self, datum_str: str, gebruiker_id: int, shift_code: str):
         """Sla shift op in database"""
@@ -2039,47 +1518,31 @@ class PlannerGridKalender(GridKalenderBase):
             conn = get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                INSERT INTO planning (gebruiker_id, datum, shift_code, status)
-                VALUES (?, ?, ?, 'concept')
-                ON CONFLICT(gebruiker_id, datum)
-                DO UPDATE SET shift_code = ?
-                WHERE status = 'concept'
-            """, (gebruiker_id, datum_str, shift_code, shift_code))
+            # Gepubliceerde maand beschermd via maand_status (v0.6.29, planning.status is legacy),
+            # zowel bij nieuwe rij als bij update
+            cursor.execute(SQL_SHIFT_OPSLAAN, (gebruiker_id, datum_str, shift_code))
+            geschreven = cursor.rowcount > 0
 
             conn.commit()
             conn.close()
 
+            if not geschreven:
+                # Andere client publiceerde intussen: niets geschreven, cel toont oude waarde
+                self.refresh_cel(datum_str, gebruiker_id)
+                self.meld_maand_intussen_gepubliceerd([datum_str])
+                return
+
             # UPDATE PLANNING DATA CACHE (v0.6.26 - CRITICAL FIX)
             # Anders verschijnen nieuwe shifts niet in de grid tot herstart
-            if datum_str not in self.planning_data:
-                self.planning_data[datum_str] = {}
-
-            # Behoud bestaande notitie als die er is
-            bestaande_notitie = ""
-            if gebruiker_id in self.planning_data.get(datum_str, {}):
-                bestaande_notitie = self.planning_data[datum_str][gebruiker_id].get('notitie', '')
-
-            self.planning_data[datum_str][gebruiker_id] = {
-                'shift_code': shift_code,
-                'notitie': bestaande_notitie,
-                'status': 'concept'
-            }
+            # (bestaande notitie blijft behouden in het rooster)
+            oude_code = self.rooster.zet_code(datum_str, gebruiker_id, shift_code)
+            self.indexeer_shift(datum_str, gebruiker_id, oude_code, shift_code)
 
             # Update cel display met volledige stylesheet rebuild (v0.6.25 fix)
-            if datum_str in self.cel_widgets and gebruiker_id in self.cel_widgets[datum_str]:
-                # Bepaal of dit de laatste rij is voor blauwe border
-                is_laatste_rij = False
-                zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-                if zichtbare_gebruikers:
-                    laatste_gebruiker_id = zichtbare_gebruikers[-1]['id']
-                    is_laatste_rij = (gebruiker_id == laatste_gebruiker_id)
-
-                self.rebuild_cel_style(datum_str, gebruiker_id, is_laatste_rij)
+            self.refresh_cel(datum_str, gebruiker_id)
 
-            # Clear HR cache voor deze gebruiker
-            if gebruiker_id in self.hr_werkdagen_cache:
-                del self.hr_werkdagen_cache[gebruiker_id]
+            # HR telling incrementeel bijwerken (v0.6.29 - geen herberekening)
+            self.pas_hr_werkdagen_aan(gebruiker_id, datum_str, oude_code, shift_code)
 
             # Update alleen HR cijfers (geen volledige rebuild)
             self.update_hr_cijfers_voor_gebruiker(gebruiker_id)
@@ -2110,39 +1573,34 @@ class PlannerGridKalender(GridKalenderBase):
             conn = get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
+            cursor.execute(f"""
                 DELETE FROM planning
                 WHERE gebruiker_id = ? AND datum = ?
-                  AND status = 'concept'
+                  AND {SQL_MAAND_NIET_GEPUBLICEERD}
             """, (gebruiker_id, datum_str))
+            # 0 rijen: maand intussen gepubliceerd, of rij al weg (andere client)
+            geweigerd = (cursor.rowcount == 0 and
+                         get_maand_status(int(datum_str[:4]), int(datum_str[5:7]), conn) == 'gepubliceerd')
 
             conn.commit()
             conn.close()
 
+            if geweigerd:
+                self.refresh_cel(datum_str, gebruiker_id)
+                self.meld_maand_intussen_gepubliceerd([datum_str])
+                return
+
             # UPDATE PLANNING DATA CACHE (v0.6.26 - CRITICAL FIX)
             # Anders blijven verwijderde shifts zichtbaar in de grid tot herstart
-            if datum_str in self.planning_data:
-                if gebruiker_id in self.planning_data[datum_str]:
-                    del self.planning_data[datum_str][gebruiker_id]
+            oude_code = self.rooster.verwijder(datum_str, gebruiker_id)
 
-                # Verwijder datum entry als geen gebruikers meer shifts hebben
-                if not self.planning_data[datum_str]:
-                    del self.planning_data[datum_str]
+            self.indexeer_shift(datum_str, gebruiker_id, oude_code, None)
 
             # Update cel display met volledige stylesheet rebuild (v0.6.25 fix)
-            if datum_str in self.cel_widgets and gebruiker_id in self.cel_widgets[datum_str]:
-                # Bepaal of dit de laatste rij is voor blauwe border
-                is_laatste_rij = False
-                zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-                if zichtbare_gebruikers:
-                    laatste_gebruiker_id = zichtbare_gebruikers[-1]['id']
-                    is_laatste_rij = (gebruiker_id == laatste_gebruiker_id)
-
-                self.rebuild_cel_style(datum_str, gebruiker_id, is_laatste_rij)
+            self.refresh_cel(datum_str, gebruiker_id)
 
-            # Clear HR cache voor deze gebruiker
-            if gebruiker_id in self.hr_werkdagen_cache:
-                del self.hr_werkdagen_cache[gebruiker_id]
+            # HR telling incrementeel bijwerken (v0.6.29 - geen herberekening)
+            self.pas_hr_werkdagen_aan(gebruiker_id, datum_str, oude_code, None)
 
             # Update alleen HR cijfers (geen volledige rebuild)
             self.update_hr_cijfers_voor_gebruiker(gebruiker_id)
@@ -2169,7 +1627,7 @@ class PlannerGridKalender(GridKalenderBase):
         from datetime import datetime
 
         # Check of maand in concept is (niet gepubliceerd)
-        if not self.check_maand_is_concept():
+        if not self.check_maand_is_concept(datum_str):
             QMessageBox.warning(
                 self,
                 "Gepubliceerde Maand",
@@ -2178,10 +1636,8 @@ class PlannerGridKalender(GridKalenderBase):
             )
             return
 
-        # Haal huidige notitie op (uit planning_data of database)
-        huidige_notitie = ""
-        if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-            huidige_notitie = self.planning_data[datum_str][gebruiker_id].get('notitie', '') or ""
+        # Haal huidige notitie op (uit rooster)
+        huidige_notitie = self.rooster.get_notitie(datum_str, gebruiker_id)
 
         # Haal gebruikersnaam op
         gebruiker_naam = "Onbekend"
@@ -2302,14 +1758,7 @@ class PlannerGridKalender(GridKalenderBase):
                 del self.hr_violations[datum_str]
 
         # Update cel styling om overlay te verwijderen
-        if datum_str in self.cel_widgets and gebruiker_id in self.cel_widgets[datum_str]:
-            zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-            is_laatste_rij = False
-            if zichtbare_gebruikers:
-                laatste_gebruiker_id = zichtbare_gebruikers[-1]['id']
-                is_laatste_rij = (gebruiker_id == laatste_gebruiker_id)
-
-            self.rebuild_cel_style(datum_str, gebruiker_id, is_laatste_rij)
+        self.refresh_cel(datum_str, gebruiker_id)
 
     def update_hr_violations_voor_gebruiker(self, datum_str: str, gebruiker_id: int, shift_code: str) -> List[Violation]:
         """
@@ -2356,14 +1805,7 @@ class PlannerGridKalender(GridKalenderBase):
                         del self.hr_violations[datum_str]
 
             # Update cel styling om overlay te reflecteren
-            if datum_str in self.cel_widgets and gebruiker_id in self.cel_widgets[datum_str]:
-                zichtbare_gebruikers = self.get_zichtbare_gebruikers()
-                is_laatste_rij = False
-                if zichtbare_gebruikers:
-                    laatste_gebruiker_id = zichtbare_gebruikers[-1]['id']
-                    is_laatste_rij = (gebruiker_id == laatste_gebruiker_id)
-
-                self.rebuild_cel_style(datum_str, gebruiker_id, is_laatste_rij)
+            self.refresh_cel(datum_str, gebruiker_id)
 
             # Update summary box (real-time)
             self.update_hr_summary()
@@ -2404,7 +1846,7 @@ class PlannerGridKalender(GridKalenderBase):
 
     def navigate_to_cell(self, huidige_datum: str, huidige_gebruiker_id: int, richting: str):
         """Navigeer naar andere cel"""
-        datum_lijst = self.get_datum_lijst(start_offset=8, eind_offset=8)
+        datum_lijst = self.get_weergave_datum_lijst()
         gebruikers = self.get_zichtbare_gebruikers()
 
         # Vind huidige positie
@@ -2450,8 +1892,7 @@ class PlannerGridKalender(GridKalenderBase):
         nieuwe_datum = datum_lijst[nieuwe_datum_index][0]
         nieuwe_gebruiker_id = gebruikers[nieuwe_gebruiker_index]['id']
 
-        if nieuwe_datum in self.cel_widgets and nieuwe_gebruiker_id in self.cel_widgets[nieuwe_datum]:
-            self.cel_widgets[nieuwe_datum][nieuwe_gebruiker_id].start_edit()
+        self.start_edit(nieuwe_datum, nieuwe_gebruiker_id)
 
     def toggle_cell_selection(self, datum_str: str, gebruiker_id: int, modifiers):
         """Toggle cel selectie met Ctrl/Shift support"""
@@ -2482,7 +1923,7 @@ class PlannerGridKalender(GridKalenderBase):
         end_datum, end_user = end
 
         # Haal datum lijst en gebruikers op
-        datum_lijst = self.get_datum_lijst(start_offset=8, eind_offset=8)
+        datum_lijst = self.get_weergave_datum_lijst()
         gebruikers = self.get_zichtbare_gebruikers()
 
         # Vind indices
@@ -2525,74 +1966,8 @@ class PlannerGridKalender(GridKalenderBase):
         else:
             self.selection_label.setText(" ")  # Spatie als placeholder
 
-        # Update cel styling
-        for datum_str in self.cel_widgets:
-            for gebruiker_id in self.cel_widgets[datum_str]:
-                cel = self.cel_widgets[datum_str][gebruiker_id]
-                cel_key = (datum_str, gebruiker_id)
-                self.apply_selection_styling(cel, datum_str, gebruiker_id, cel_key in self.selected_cells)
-
-    def apply_selection_styling(self, cel: EditableLabel, datum_str: str, gebruiker_id: int, is_selected: bool):
-        """Pas selectie styling toe op cel"""
-        # Haal basis styling op
-        shift_code = self.get_display_code(datum_str, gebruiker_id)
-        achtergrond = self.get_datum_achtergrond(datum_str)
-        verlof_overlay = self.get_verlof_overlay(datum_str, gebruiker_id, 'planner')
-        hr_overlay = self.get_hr_overlay_kleur(datum_str, gebruiker_id)
-
-        # Prioriteit: verlof overlay eerst, dan HR overlay (v0.6.28 - ISSUE-005 fix)
-        overlay = verlof_overlay if verlof_overlay else hr_overlay
-
-        # Check buffer dag
-        datum_obj = datetime.strptime(datum_str, '%Y-%m-%d')
-        is_buffer = datum_obj.month != self.maand
-
-        # Check rode lijn en notitie
-        is_rode_lijn_start = datum_str in self.rode_lijnen_starts
-        heeft_notitie = False
-        if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-            notitie = self.planning_data[datum_str][gebruiker_id].get('notitie', '')
-            heeft_notitie = bool(notitie and notitie.strip())
-
-        # Bouw stylesheet
-        base_style = self.create_cel_stylesheet(achtergrond, overlay)
-
-        # Rode lijn indicator
-        if is_rode_lijn_start:
-            base_style = base_style.replace(
-                "border: 1px solid",
-                "border: 1px solid"
-            ).replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-left: 4px solid #dc3545;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # Notitie indicator
-        if heeft_notitie:
-            base_style = base_style.replace(
-                "border: 1px solid",
-                "border: 1px solid"
-            ).replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-top: 3px solid #00E676;\n                    border-right: 3px solid #00E676;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # SELECTIE OVERLAY (lichtblauw semi-transparant)
-        if is_selected:
-            # Extract de achtergrondkleur en mix met blauw
-            base_style = base_style.replace(
-                f"background-color: {achtergrond}",
-                f"background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 rgba(33, 150, 243, 0.3), stop:1 rgba(33, 150, 243, 0.2))"
-            )
-
-        # Buffer opacity
-        if is_buffer:
-            cel.setStyleSheet(base_style + " QLabel { opacity: 0.7; }")
-        else:
-            cel.setStyleSheet(base_style)
-
-        # Update overlay kleur voor editor styling (v0.6.28 - ISSUE-005 fix)
-        cel.overlay_kleur = overlay if overlay else None
+        # Selectie wordt door de delegate getekend: enkel repaint van zichtbare cellen
+        self.grid_view.viewport().update()
 
     def keyPressEvent(self, event):
         """Handle keyboard events (ESC voor selectie wissen)"""
@@ -2603,41 +1978,27 @@ class PlannerGridKalender(GridKalenderBase):
                 return
         super().keyPressEvent(event)
 
-    def check_maand_is_concept(self) -> bool:
+    def check_maand_is_concept(self, datum_str: Optional[str] = None) -> bool:
         """
         Check of huidige maand in concept status is.
         Returns True als concept (editable), False als gepubliceerd (read-only).
-        """
-        try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
-            # Haal eerste dag van maand
-            eerste_dag = f"{self.jaar}-{self.maand:02d}-01"
-
-            # Check of er gepubliceerde records zijn voor deze maand
-            cursor.execute("""
-                SELECT COUNT(*) as aantal
-                FROM planning
-                WHERE datum LIKE ?
-                  AND status = 'gepubliceerd'
-            """, (f"{self.jaar}-{self.maand:02d}-%",))
-
-            row = cursor.fetchone()
-            conn.close()
-
-            # Als er gepubliceerde records zijn, is maand gepubliceerd
-            if row and row['aantal'] > 0:
-                return False  # Gepubliceerd = niet editable
 
-            return True  # Concept of leeg = editable
-
-        except sqlite3.Error:
-            # Bij fout: assume concept (veiliger)
-            return True
+        v0.6.29: maand_status wordt bij laden opgehaald, geen LIKE query per edit.
+        Publiceren/terugzetten via de Planning Editor werkt dit bij (zet_maand_status).
+        Vrije periode: status van de maand van datum_str, zonder datum volstaat
+        één concept maand (bulk acties slaan gepubliceerde cellen zelf over).
+        """
+        if not self.periode:
+            return self.maand_is_concept
+        if datum_str:
+            return self.rooster.get_status(datum_str) == 'concept'
+        return any(maand not in self.rooster.gepubliceerde_maanden for maand in self.get_weergave_maanden())
 
-    def show_context_menu(self, cel: EditableLabel, datum_str: str, gebruiker_id: int):
+    def show_context_menu(self, datum_str: str, gebruiker_id: int):
         """Toon context menu bij rechtsklik"""
+        if not self.kan_bewerken():
+            return
+
         menu = QMenu(self)
 
         # Check of er selectie is
@@ -2653,6 +2014,9 @@ class PlannerGridKalender(GridKalenderBase):
             vul_selectie_action = menu.addAction(f"Vul Selectie In... ({len(self.selected_cells)} cellen)")
             vul_selectie_action.triggered.connect(self.bulk_fill_selected)  # type: ignore
 
+            patroon_action = menu.addAction(f"Patroon Toepassen... ({len(self.selected_cells)} cellen)")
+            patroon_action.triggered.connect(self.bulk_patroon_selected)  # type: ignore
+
             menu.addSeparator()
 
         # Notitie toevoegen/bewerken
@@ -2666,11 +2030,12 @@ class PlannerGridKalender(GridKalenderBase):
         delete_action.triggered.connect(lambda: self.delete_shift(datum_str, gebruiker_id))  # type: ignore
 
         # Vul week (als cel niet leeg)
-        if cel.text():
+        huidige_code = self.get_display_code(datum_str, gebruiker_id)
+        if huidige_code:
             menu.addSeparator()
-            vul_week_action = menu.addAction(f"Vul hele week met '{cel.text()}'")
+            vul_week_action = menu.addAction(f"Vul hele week met '{huidige_code}'")
             vul_week_action.triggered.connect(  # type: ignore
-                lambda: self.vul_week(datum_str, gebruiker_id, cel.text())
+                lambda: self.vul_week(datum_str, gebruiker_id, huidige_code)
             )
 
         menu.exec(QCursor.pos())
@@ -2738,34 +2103,15 @@ class PlannerGridKalender(GridKalenderBase):
         if dialog.exec():
             verwijder_speciale_codes = checkbox.isChecked()
 
-            try:
-                conn = get_connection()
-                cursor = conn.cursor()
-                verwijderd_count = 0
-
-                for datum_str, gebruiker_id in self.selected_cells:
-                    # Haal huidige shift code op
-                    shift_code = self.get_display_code(datum_str, gebruiker_id)
-
-                    # Skip als speciale code EN bescherming aan staat
-                    if not verwijder_speciale_codes and shift_code in self.speciale_codes:
-                        continue
-
-                    # Verwijder shift (maar NIET notitie!)
-                    cursor.execute("""
-                        UPDATE planning
-                        SET shift_code = NULL
-                        WHERE gebruiker_id = ? AND datum = ?
-                          AND status = 'concept'
-                    """, (gebruiker_id, datum_str))
-
-                    verwijderd_count += 1
-
-                conn.commit()
-                conn.close()
+            # Verwijder shift (maar NIET notitie!), speciale codes enkel indien gevraagd
+            wijzigingen = self.filter_beschermde_codes(
+                [(datum_str, gebruiker_id, None) for datum_str, gebruiker_id in self.selected_cells],
+                verwijder_speciale_codes
+            )
 
-                # Refresh grid
-                self.load_initial_data()
+            try:
+                # 1 transactie + enkel geraakte cellen hertekenen (v0.6.29)
+                verwijderd_count = self.pas_cellen_toe(wijzigingen)
 
                 # Clear selectie
                 self.clear_selection()
@@ -2882,35 +2228,14 @@ class PlannerGridKalender(GridKalenderBase):
 
             overschrijf_speciale_codes = checkbox.isChecked()
 
-            try:
-                conn = get_connection()
-                cursor = conn.cursor()
-                ingevuld_count = 0
-
-                for datum_str, gebruiker_id in self.selected_cells:
-                    # Haal huidige shift code op
-                    oude_code = self.get_display_code(datum_str, gebruiker_id)
-
-                    # Skip als speciale code EN bescherming aan staat
-                    if not overschrijf_speciale_codes and oude_code in self.speciale_codes:
-                        continue
-
-                    # Save shift (notitie blijft behouden)
-                    cursor.execute("""
-                        INSERT INTO planning (gebruiker_id, datum, shift_code, status)
-                        VALUES (?, ?, ?, 'concept')
-                        ON CONFLICT(gebruiker_id, datum)
-                        DO UPDATE SET shift_code = ?
-                        WHERE status = 'concept'
-                    """, (gebruiker_id, datum_str, nieuwe_code, nieuwe_code))
-
-                    ingevuld_count += 1
-
-                conn.commit()
-                conn.close()
+            wijzigingen = self.filter_beschermde_codes(
+                [(datum_str, gebruiker_id, nieuwe_code) for datum_str, gebruiker_id in self.selected_cells],
+                overschrijf_speciale_codes
+            )
 
-                # Refresh grid
-                self.load_initial_data()
+            try:
+                # Save shifts in 1 transactie (notitie blijft behouden)
+                ingevuld_count = self.pas_cellen_toe(wijzigingen)
 
                 # Clear selectie
                 self.clear_selection()
@@ -2925,10 +2250,119 @@ class PlannerGridKalender(GridKalenderBase):
             except sqlite3.Error as e:
                 QMessageBox.critical(self, "Database Fout", f"Kon cellen niet invullen:\n{e}")
 
+    def bulk_patroon_selected(self):
+        """
+        Patroon kwast (v0.6.29): herhalende reeks codes over de selectie schilderen
+
+        Reeks loopt per kalenderdag vanaf de eerste geselecteerde datum,
+        bv. "V V L L N N - -" over meerdere weken voor meerdere teamleden.
+        """
+        from PyQt6.QtWidgets import QCheckBox
+
+        if not self.selected_cells:
+            return
+
+        # Check of maand in concept is (niet gepubliceerd)
+        if not self.check_maand_is_concept():
+            QMessageBox.warning(
+                self,
+                "Gepubliceerde Maand",
+                "Deze maand is gepubliceerd en kan niet worden bewerkt.\n\n"
+                "Zet de maand eerst terug naar concept via de Planning Editor."
+            )
+            return
+
+        # Maak dialog
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Patroon Toepassen")
+        dialog.setModal(True)
+        dialog.resize(500, 250)
+
+        layout = QVBoxLayout(dialog)
+
+        info_label = QLabel(f"Herhaal een reeks codes over {len(self.selected_cells)} cellen:")
+        info_label.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_NORMAL))
+        layout.addWidget(info_label)
+
+        patroon_label = QLabel(f"Patroon (1 code per dag, '{PATROON_LEEG}' = lege dag):")
+        patroon_label.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL))
+        layout.addWidget(patroon_label)
+
+        patroon_input = QLineEdit()
+        patroon_input.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_NORMAL))
+        patroon_input.setPlaceholderText("Bijv: V V L L N N - -")
+        patroon_input.setStyleSheet(Styles.input_field())
+        layout.addWidget(patroon_input)
+
+        # Checkbox: ook speciale codes overschrijven?
+        checkbox = QCheckBox("Ook speciale codes overschrijven (VV, Z, RX, etc.)")
+        checkbox.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL))
+        checkbox.setChecked(False)  # Standaard UIT (bescherm speciale codes)
+        layout.addWidget(checkbox)
+
+        warning = QLabel("Let op: Notities blijven altijd behouden.")
+        warning.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_TINY))
+        warning.setStyleSheet(f"color: {Colors.WARNING}; font-style: italic;")
+        layout.addWidget(warning)
+
+        layout.addStretch()
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        annuleer_btn = QPushButton("Annuleren")
+        annuleer_btn.clicked.connect(dialog.reject)  # type: ignore
+        button_layout.addWidget(annuleer_btn)
+
+        toepassen_btn = QPushButton("Toepassen")
+        toepassen_btn.setStyleSheet(Styles.button_primary())
+        toepassen_btn.clicked.connect(dialog.accept)  # type: ignore
+        button_layout.addWidget(toepassen_btn)
+
+        layout.addLayout(button_layout)
+
+        patroon_input.setFocus()
+
+        if not dialog.exec():
+            return
+
+        patroon = parse_patroon(patroon_input.text())
+        if not patroon:
+            QMessageBox.warning(self, "Geen Patroon", "Vul minstens 1 code in.")
+            return
+
+        # Validatie: bestaan alle codes?
+        ongeldig = sorted({code for code in patroon if code and code not in self.valid_codes})
+        if ongeldig:
+            QMessageBox.warning(
+                self,
+                "Ongeldige Code",
+                f"{', '.join(ongeldig)}: geen geldige shift code(s).\n\n"
+                f"Check de codes lijst in het scherm."
+            )
+            return
+
+        wijzigingen = self.filter_beschermde_codes(
+            patroon_toewijzing(self.selected_cells, patroon), checkbox.isChecked()
+        )
+
+        try:
+            gewijzigd_count = self.pas_cellen_toe(wijzigingen)
+            self.clear_selection()
+            QMessageBox.information(
+                self,
+                "Patroon Toegepast",
+                f"Patroon van {len(patroon)} dagen toegepast: {gewijzigd_count} cellen gewijzigd.\n"
+                f"Notities zijn behouden."
+            )
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Fout", f"Kon patroon niet toepassen:\n{e}")
+
     def vul_week(self, start_datum: str, gebruiker_id: int, code: str):
         """Vul 7 dagen met zelfde code"""
         # Check of maand in concept is (niet gepubliceerd)
-        if not self.check_maand_is_concept():
+        if not self.check_maand_is_concept(start_datum):
             QMessageBox.warning(
                 self,
                 "Gepubliceerde Maand",
@@ -2947,11 +2381,83 @@ class PlannerGridKalender(GridKalenderBase):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Vul 7 dagen
+        # Vul 7 dagen (1 transactie, 1 HR update i.p.v. 7x save_shift)
         datum = datetime.strptime(start_datum, '%Y-%m-%d')
-        for i in range(7):
-            nieuwe_datum = (datum + timedelta(days=i)).strftime('%Y-%m-%d')
-            self.save_shift(nieuwe_datum, gebruiker_id, code)
+        wijzigingen: List[Wijziging] = [
+            ((datum + timedelta(days=i)).strftime('%Y-%m-%d'), gebruiker_id, code)
+            for i in range(7)
+        ]
+        try:
+            self.pas_cellen_toe(wijzigingen)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Fout", f"Kon week niet invullen:\n{e}")
+
+    def filter_beschermde_codes(self, wijzigingen: List[Wijziging],
+                                overschrijf_speciale_codes: bool) -> List[Wijziging]:
+        """Laat cellen met een speciale code (VV, Z, RX, ...) ongemoeid tenzij expliciet gevraagd"""
+        if overschrijf_speciale_codes:
+            return wijzigingen
+        return [
+            (datum_str, gebruiker_id, code) for datum_str, gebruiker_id, code in wijzigingen
+            if self.get_display_code(datum_str, gebruiker_id) not in self.speciale_codes
+        ]
+
+    def pas_cellen_toe(self, wijzigingen: List[Wijziging]) -> int:
+        """
+        Schrijf meerdere cellen in 1 transactie en werk enkel de geraakte state bij (v0.6.29)
+
+        Gedeeld snel pad voor bulk invullen/wissen, vul week en patroon:
+        - executemany i.p.v. query per cel, geen load_initial_data() achteraf
+        - rooster, code index en HR telling incrementeel (geen hertelling)
+        - 1 repaint voor de cellen, HR kolommen 1x per geraakte gebruiker
+        - bemannings status enkel voor de geraakte datums (1 cache herlading)
+
+        Cellen in gepubliceerde (buur)maanden worden overgeslagen, zoals de
+        write guard in de database ook doet. Weigert de guard cellen omdat een
+        andere client intussen publiceerde, dan blijven die ongewijzigd in de grid.
+
+        Returns:
+            Aantal gewijzigde cellen
+
+        Raises:
+            sqlite3.Error: batch wordt volledig teruggedraaid, grid blijft ongewijzigd
+        """
+        wijzigingen = [
+            (datum_str, gebruiker_id, code) for datum_str, gebruiker_id, code in wijzigingen
+            if self.rooster.get_status(datum_str) != 'gepubliceerd'
+            and self.get_display_code(datum_str, gebruiker_id) != (code or '')
+        ]
+        if not wijzigingen:
+            return 0
+
+        geweigerd = schrijf_shifts(wijzigingen)
+        if geweigerd:
+            # Maand intussen gepubliceerd (andere client): niet in het rooster zetten
+            self.meld_maand_intussen_gepubliceerd(datum_str for datum_str, _, _ in geweigerd)
+            geweigerd_set = set(geweigerd)
+            wijzigingen = [w for w in wijzigingen if w not in geweigerd_set]
+            if not wijzigingen:
+                return 0
+
+        geraakte_gebruikers = set()
+        geraakte_datums = set()
+        for datum_str, gebruiker_id, code in wijzigingen:
+            oude_code = self.rooster.zet_code(datum_str, gebruiker_id, code)
+            self.indexeer_shift(datum_str, gebruiker_id, oude_code, code)
+            self.pas_hr_werkdagen_aan(gebruiker_id, datum_str, oude_code, code)
+            geraakte_gebruikers.add(gebruiker_id)
+            geraakte_datums.add(datum_str)
+
+        # Bemanning van de geraakte datums: cache + getoonde header kleur/tooltip
+        # (vroeger via load_initial_data(), dat de getoonde status wiste)
+        self.update_bemannings_status_voor_datums(sorted(geraakte_datums), alleen_getoond=True)
+
+        self.grid_model.refresh_cellen([(datum_str, gebruiker_id) for datum_str, gebruiker_id, _ in wijzigingen])
+        for gebruiker_id in geraakte_gebruikers:
+            self.update_hr_cijfers_voor_gebruiker(gebruiker_id)
+
+        self.data_changed.emit()  # type: ignore
+        return len(wijzigingen)
 
     def open_filter_dialog(self) -> None:
         """
@@ -3012,30 +2518,165 @@ class PlannerGridKalender(GridKalenderBase):
             self.build_grid()
 
     def vorige_maand(self) -> None:
-        """Navigeer naar vorige maand"""
+        """Navigeer naar vorige maand (vrije periode: vorige periode van zelfde lengte)"""
+        if self.periode:
+            self.schuif_periode(-1)
+            return
         if self.maand == 1:
             self.refresh_data(self.jaar - 1, 12)
-            self.jaar_combo.setCurrentText(str(self.jaar))
-            self.maand_combo.setCurrentIndex(11)
         else:
             self.refresh_data(self.jaar, self.maand - 1)
-            self.maand_combo.setCurrentIndex(self.maand - 1)
+        self.sync_maand_selectors()
 
     def volgende_maand(self) -> None:
-        """Navigeer naar volgende maand"""
+        """Navigeer naar volgende maand (vrije periode: volgende periode van zelfde lengte)"""
+        if self.periode:
+            self.schuif_periode(1)
+            return
         if self.maand == 12:
             self.refresh_data(self.jaar + 1, 1)
-            self.jaar_combo.setCurrentText(str(self.jaar))
-            self.maand_combo.setCurrentIndex(0)
         else:
             self.refresh_data(self.jaar, self.maand + 1)
-            self.maand_combo.setCurrentIndex(self.maand - 1)
+        self.sync_maand_selectors()
 
     def refresh_data(self, jaar: int, maand: int) -> None:
-        """Herlaad data voor nieuwe jaar/maand"""
+        """Herlaad data voor nieuwe jaar/maand (verlaat vrije periode weergave)"""
+        self.periode = None
+        self.laad_weergave(jaar, maand)
+
+    # ---------- Vrije weergave periode (v0.6.29) ----------
+
+    # Langste vrije periode (± een half jaar rond de actie maand)
+    MAX_PERIODE_DAGEN = 184
+
+    def get_weergave_datum_lijst(self) -> List[Tuple[str, str]]:
+        """Getoonde datums: vrije periode of maand + 8 dagen buffer"""
+        if self.periode:
+            start, eind = (datetime.strptime(d, '%Y-%m-%d') for d in self.periode)
+            return self.maak_datum_lijst(start, eind)
+        return self.get_datum_lijst(start_offset=8, eind_offset=8)
+
+    def get_weergave_maanden(self) -> List[Tuple[int, int]]:
+        """(jaar, maand) paren om te valideren: huidige maand of alle maanden van de periode"""
+        if not self.periode:
+            return [(self.jaar, self.maand)]
+        return maanden_in_periode(*self.periode)
+
+    def get_weergave_jaren(self) -> List[int]:
+        """Jaren die de getoonde datums raken (vrije periode kan over een jaargrens lopen)"""
+        datum_lijst = self.get_weergave_datum_lijst()
+        return list(range(int(datum_lijst[0][0][:4]), int(datum_lijst[-1][0][:4]) + 1))
+
+    def in_weergave(self, datum_obj: date) -> bool:
+        """Valt datum in de gevalideerde periode (maand zonder buffer, of vrije periode)"""
+        if self.periode:
+            return self.periode[0] <= datum_obj.isoformat() <= self.periode[1]
+        return datum_obj.year == self.jaar and datum_obj.month == self.maand
+
+    def get_cache_sleutel(self) -> Tuple:
+        """Maand cache apart per weergave periode"""
+        return (self.jaar, self.maand, self.periode)
+
+    def toon_periode(self, start_datum: str, eind_datum: str) -> None:
+        """
+        Toon vrije periode (bv. rode lijn cyclus of 13 weken) i.p.v. maand + buffer
+
+        Enkel de periode wordt geladen (planning, verlof, validatie cache); de
+        gevirtualiseerde grid tekent enkel zichtbare kolommen. Jaar/maand zijn de
+        actie maand (ook in de titel): publiceren, auto-generatie, batch export en
+        de Voor/Na RL kolommen werken op die maand. De actie maand blijft altijd
+        binnen de periode: valt de gekozen maand erbuiten (andere maand of jaar),
+        dan schuift ze mee naar de maand met de meeste getoonde dagen.
+
+        Raises:
+            ValueError: eind voor start of periode langer dan MAX_PERIODE_DAGEN
+        """
+        aantal_dagen = (date.fromisoformat(eind_datum) - date.fromisoformat(start_datum)).days + 1
+        if not 1 <= aantal_dagen <= self.MAX_PERIODE_DAGEN:
+            raise ValueError(
+                f"Periode moet 1 tot {self.MAX_PERIODE_DAGEN} dagen lang zijn (nu {aantal_dagen})."
+            )
+        self.periode = (start_datum, eind_datum)
+        self.laad_weergave(*actie_maand_in_periode(self.jaar, self.maand, start_datum, eind_datum))
+        self.sync_maand_selectors()
+
+    def toon_maand(self) -> None:
+        """Terug naar standaard weergave: maand + 8 dagen buffer"""
+        if self.periode:
+            self.refresh_data(self.jaar, self.maand)
+
+    def schuif_periode(self, richting: int) -> None:
+        """Vrije periode een volledige lengte vooruit (+1) of achteruit (-1)"""
+        start, eind = (date.fromisoformat(d) for d in self.periode)
+        verschuiving = timedelta(days=((eind - start).days + 1) * richting)
+        self.toon_periode((start + verschuiving).isoformat(), (eind + verschuiving).isoformat())
+
+    def rode_lijn_cyclus_periode(self) -> Optional[Tuple[str, str]]:
+        """Rode lijn cyclus van de actie maand (zelfde periode als de Na RL kolom, ligt in de weergave)"""
+        if not self.rode_lijn_periodes:
+            return None
+        huidig = self.rode_lijn_periodes['huidig']
+        return huidig['start'][:10], huidig['eind'][:10]
+
+    def weken_periode(self, aantal_weken: int) -> Tuple[str, str]:
+        """Aantal weken vanaf de maandag van de week waarin maand/periode start"""
+        start = date.fromisoformat(self.periode[0]) if self.periode else date(self.jaar, self.maand, 1)
+        start -= timedelta(days=start.weekday())
+        return start.isoformat(), (start + timedelta(weeks=aantal_weken, days=-1)).isoformat()
+
+    def kies_periode(self, periode: Optional[Tuple[str, str]]) -> None:
+        """Periode keuze uit header menu"""
+        if not periode:
+            QMessageBox.information(self, "Geen Rode Lijn", "Geen rode lijn cyclus gevonden voor deze maand.")
+            return
+        self.toon_periode(*periode)
+
+    def open_periode_dialog(self) -> None:
+        """Aangepaste periode kiezen (start/eind datum)"""
+        datum_lijst = self.get_weergave_datum_lijst()
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Periode Kiezen")
+        dialog.setModal(True)
+        layout = QFormLayout(dialog)
+
+        datum_edits = []
+        for label, datum_str in (("Van:", datum_lijst[0][0]), ("Tot en met:", datum_lijst[-1][0])):
+            datum_edit = QDateEdit(QDate.fromString(datum_str, 'yyyy-MM-dd'))
+            datum_edit.setCalendarPopup(True)
+            datum_edit.setDisplayFormat('dd-MM-yyyy')
+            layout.addRow(label, datum_edit)
+            datum_edits.append(datum_edit)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(dialog.accept)  # type: ignore
+        buttons.rejected.connect(dialog.reject)  # type: ignore
+        layout.addRow(buttons)
+
+        if not dialog.exec():
+            return
+        try:
+            self.toon_periode(*(edit.date().toString('yyyy-MM-dd') for edit in datum_edits))
+        except ValueError as e:
+            QMessageBox.warning(self, "Ongeldige Periode", str(e))
+
+    def update_title(self) -> None:
+        """Titel: maand of vrije periode met aantal dagen en de actie maand"""
+        if not self.periode:
+            super().update_title()
+            return
+        aantal_dagen = len(self.get_weergave_datum_lijst())
+        self.title_label.setText(
+            f"Planning {self.get_weergave_naam()} ({aantal_dagen} dagen) - "
+            f"acties op {self.get_maand_naam()} {self.jaar}"
+        )
+
+    def laad_weergave(self, jaar: int, maand: int) -> None:
+        """Laad maand of vrije periode (async) en meld de wissel aan het parent screen"""
         self.jaar = jaar
         self.maand = maand
         self.update_title()
-        self.load_initial_data()
+        # v0.6.29: async - grid toont direct skelet/cache, data volgt per dataset
+        self.laad_maand_async()
         # Emit signal zodat parent screen kan reageren (bijv. status reload)
         self.maand_changed.emit()  # type: ignore
\ No newline at end of file
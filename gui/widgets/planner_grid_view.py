@@ -0,0 +1,645 @@
+# gui/widgets/planner_grid_view.py
+"""
+Planner Grid View
+v0.6.29 - Gevirtualiseerde model/view grid voor PlannerGridKalender
+
+Vervangt de QGridLayout met 1 EditableLabel per cel (30 gebruikers x 47 dagen
+= 1400+ gestylede widgets) door QTableView + custom delegate:
+- PlannerGridModel: datum cellen (rijen = gebruikers, kolommen = datums)
+- PlannerFrozenModel: frozen kolommen (naam + Voor RL + Na RL)
+- PlannerCelDelegate: tekent achtergrond, overlays, borders, notitie hoek en selectie
+  (kleuren/pens komen geïnterneerd uit CelStijlCache - geen CSS parsing per paint)
+- DatumHeaderView: datum headers met weekend/feestdag kleur en bemannings overlay
+
+Alleen zichtbare cellen worden getekend. Alle data komt uit de kalender
+(rooster, verlof_perioden, hr_violations, ...) - het model houdt zelf geen kopie bij.
+"""
+from calendar import monthrange
+from typing import Dict, Any, List, Tuple
+from PyQt6.QtWidgets import (QTableView, QHeaderView, QStyledItemDelegate,
+                             QLineEdit, QStyleOptionViewItem, QAbstractItemView)
+from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QRect, QEvent,
+                          pyqtSignal)
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen
+from gui.styles import Colors, Fonts
+from gui.widgets.cel_stijlen import (CelStijlCache, css_naar_qcolor,
+                                     RODE_LIJN_KLEUR, MAAND_KADER_KLEUR)
+
+
+# Custom data roles
+ROL_DATUM = Qt.ItemDataRole.UserRole + 1
+ROL_GEBRUIKER = Qt.ItemDataRole.UserRole + 2
+
+# Afmetingen (gelijk aan oude QLabel grid)
+CEL_BREEDTE = 60
+NAAM_BREEDTE = 280
+HR_BREEDTE = 50
+RIJ_HOOGTE = 36
+HEADER_HOOGTE = 56
+
+def teken_border(painter: QPainter, rect: QRect, zijde: str, kleur: QColor, breedte: int) -> None:
+    """Teken dikke border aan één zijde van rect (binnen de cel)"""
+    if zijde == 'left':
+        painter.fillRect(QRect(rect.left(), rect.top(), breedte, rect.height()), kleur)
+    elif zijde == 'right':
+        painter.fillRect(QRect(rect.right() - breedte + 1, rect.top(), breedte, rect.height()), kleur)
+    elif zijde == 'top':
+        painter.fillRect(QRect(rect.left(), rect.top(), rect.width(), breedte), kleur)
+    elif zijde == 'bottom':
+        painter.fillRect(QRect(rect.left(), rect.bottom() - breedte + 1, rect.width(), breedte), kleur)
+
+
+class PlannerGridModel(QAbstractTableModel):
+    """
+    Table model voor datum cellen
+
+    Rijen = zichtbare gebruikers, kolommen = datums (maand + buffer of vrije periode).
+    Data wordt on-demand opgevraagd bij de kalender.
+    """
+
+    def __init__(self, kalender):
+        super().__init__()
+        self.kalender = kalender
+        self.datums: List[str] = []
+        self.labels: List[str] = []
+        self.gebruikers: List[Dict[str, Any]] = []
+        self.kolom_info: List[Dict[str, Any]] = []
+        self._datum_index: Dict[str, int] = {}
+        self._gebruiker_index: Dict[int, int] = {}
+
+    def herlaad(self, datum_lijst: List[Tuple[str, str]], gebruikers: List[Dict[str, Any]]) -> None:
+        """
+        Herlaad model voor nieuwe maand of andere gebruikers (v0.6.29 - diff i.p.v. reset)
+
+        Bestaande rijen/kolommen blijven behouden en worden opnieuw gebonden aan de
+        nieuwe data; enkel het verschil in aantal rijen/kolommen wordt toegevoegd of
+        verwijderd. Views behouden zo scroll positie, selectie model en editor state.
+        """
+        nieuwe_datums = [d for d, _ in datum_lijst]
+        nieuwe_labels = [label for _, label in datum_lijst]
+        nieuwe_gebruikers = list(gebruikers)
+
+        # Kolom info vooraf berekenen zodat cel_info geldig blijft tijdens insert
+        nieuwe_kolom_info = self.bereken_kolom_info(nieuwe_datums)
+
+        oud_kolommen, nieuw_kolommen = len(self.datums), len(nieuwe_datums)
+        if nieuw_kolommen < oud_kolommen:
+            self.beginRemoveColumns(QModelIndex(), nieuw_kolommen, oud_kolommen - 1)
+            del self.datums[nieuw_kolommen:], self.labels[nieuw_kolommen:], self.kolom_info[nieuw_kolommen:]
+            self.endRemoveColumns()
+        elif nieuw_kolommen > oud_kolommen:
+            self.beginInsertColumns(QModelIndex(), oud_kolommen, nieuw_kolommen - 1)
+            self.datums, self.labels, self.kolom_info = nieuwe_datums, nieuwe_labels, nieuwe_kolom_info
+            self.endInsertColumns()
+
+        oud_rijen, nieuw_rijen = len(self.gebruikers), len(nieuwe_gebruikers)
+        self.datums, self.labels, self.kolom_info = nieuwe_datums, nieuwe_labels, nieuwe_kolom_info
+        if nieuw_rijen < oud_rijen:
+            self.beginRemoveRows(QModelIndex(), nieuw_rijen, oud_rijen - 1)
+            del self.gebruikers[nieuw_rijen:]
+            self.endRemoveRows()
+        elif nieuw_rijen > oud_rijen:
+            self.beginInsertRows(QModelIndex(), oud_rijen, nieuw_rijen - 1)
+            self.gebruikers = nieuwe_gebruikers
+            self.endInsertRows()
+
+        self.gebruikers = nieuwe_gebruikers
+        self._datum_index = {d: i for i, d in enumerate(self.datums)}
+        self._gebruiker_index = {u['id']: i for i, u in enumerate(self.gebruikers)}
+
+        # Behouden rijen/kolommen opnieuw binden
+        self.refresh_alles()
+
+    def bereken_kolom_info(self, datums: List[str]) -> List[Dict[str, Any]]:
+        """
+        Precompute per-datum info (achtergrond, borders) - 1x per kolom ipv per cel
+
+        Maand kader rond de huidige maand; bij een vrije periode (v0.6.29) rond
+        elke maand zodat maandgrenzen zichtbaar blijven.
+        """
+        kolom_info = []
+
+        for datum_str in datums:
+            jaar, maand, dag = (int(x) for x in datum_str.split('-'))
+            is_huidige_maand = self.kalender.periode is not None or maand == self.kalender.maand
+            kolom_info.append({
+                'achtergrond': self.kalender.get_datum_achtergrond(datum_str),
+                'is_rode_lijn_start': datum_str in self.kalender.rode_lijnen_starts,
+                'is_huidige_maand': is_huidige_maand,
+                'is_eerste_dag': is_huidige_maand and dag == 1,
+                'is_laatste_dag': is_huidige_maand and dag == monthrange(jaar, maand)[1],
+            })
+
+        return kolom_info
+
+    # ---------- Qt model interface ----------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.gebruikers)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.datums)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        datum_str = self.datums[index.column()]
+        gebruiker_id = self.gebruikers[index.row()]['id']
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.kalender.get_display_code(datum_str, gebruiker_id)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.kalender.get_volledige_cel_tooltip(datum_str, gebruiker_id) or None
+        if role == ROL_DATUM:
+            return datum_str
+        if role == ROL_GEBRUIKER:
+            return gebruiker_id
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation != Qt.Orientation.Horizontal or section >= len(self.datums):
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.labels[section]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.kalender.get_datum_header_tooltip(self.datums[section]) or None
+        if role == ROL_DATUM:
+            return self.datums[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if not self.kalender.kan_bewerken():
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsEditable
+
+    # ---------- Helpers voor delegate en kalender ----------
+
+    def cel_info(self, row: int, col: int) -> Dict[str, Any]:
+        """Alle info die de delegate nodig heeft om één cel te tekenen"""
+        datum_str = self.datums[col]
+        gebruiker_id = self.gebruikers[row]['id']
+        kolom = self.kolom_info[col]
+
+        return {
+            'code': self.kalender.get_display_code(datum_str, gebruiker_id),
+            'achtergrond': kolom['achtergrond'],
+            'overlay': self.kalender.get_cel_overlay(datum_str, gebruiker_id),
+            'is_rode_lijn_start': kolom['is_rode_lijn_start'],
+            'heeft_notitie': self.kalender.heeft_notitie(datum_str, gebruiker_id),
+            'onder_kader': kolom['is_huidige_maand'] and row == len(self.gebruikers) - 1,
+            'links_kader': kolom['is_eerste_dag'],
+            'rechts_kader': kolom['is_laatste_dag'],
+            'is_geselecteerd': (datum_str, gebruiker_id) in self.kalender.selected_cells,
+        }
+
+    def header_info(self, col: int) -> Dict[str, Any]:
+        """Info voor datum header (achtergrond, bemannings overlay, borders)"""
+        kolom = self.kolom_info[col]
+        return {
+            'achtergrond': kolom['achtergrond'],
+            'overlay': self.kalender.get_bemannings_overlay_kleur(self.datums[col]),
+            'is_rode_lijn_start': kolom['is_rode_lijn_start'],
+            'boven_kader': kolom['is_huidige_maand'],
+            'links_kader': kolom['is_eerste_dag'],
+            'rechts_kader': kolom['is_laatste_dag'],
+        }
+
+    def index_voor(self, datum_str: str, gebruiker_id: int) -> QModelIndex:
+        """QModelIndex voor (datum, gebruiker) of ongeldige index"""
+        row = self._gebruiker_index.get(gebruiker_id)
+        col = self._datum_index.get(datum_str)
+        if row is None or col is None:
+            return QModelIndex()
+        return self.index(row, col)
+
+    def refresh_cel(self, datum_str: str, gebruiker_id: int) -> None:
+        index = self.index_voor(datum_str, gebruiker_id)
+        if index.isValid():
+            self.dataChanged.emit(index, index)  # type: ignore
+
+    def refresh_cellen(self, cellen: List[Tuple[str, int]]) -> None:
+        """Herteken set cellen (bulk wijziging) met 1 dataChanged over hun bounding box"""
+        rijen = [self._gebruiker_index[g] for _, g in cellen if g in self._gebruiker_index]
+        kolommen = [self._datum_index[d] for d, _ in cellen if d in self._datum_index]
+        if rijen and kolommen:
+            self.dataChanged.emit(  # type: ignore
+                self.index(min(rijen), min(kolommen)), self.index(max(rijen), max(kolommen))
+            )
+
+    def refresh_kolom(self, datum_str: str) -> None:
+        col = self._datum_index.get(datum_str)
+        if col is None or not self.gebruikers:
+            return
+        self.dataChanged.emit(self.index(0, col), self.index(len(self.gebruikers) - 1, col))  # type: ignore
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, col, col)  # type: ignore
+
+    def refresh_alles(self) -> None:
+        """Repaint alle cellen + headers (overlays gewijzigd, structuur gelijk)"""
+        if not self.gebruikers or not self.datums:
+            return
+        self.dataChanged.emit(  # type: ignore
+            self.index(0, 0), self.index(len(self.gebruikers) - 1, len(self.datums) - 1)
+        )
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.datums) - 1)  # type: ignore
+
+
+class PlannerFrozenModel(QAbstractTableModel):
+    """
+    Table model voor frozen kolommen: naam + (optioneel) Voor RL / Na RL
+    """
+
+    KOLOM_NAAM = 0
+    KOLOM_VOOR = 1
+    KOLOM_NA = 2
+
+    def __init__(self, kalender):
+        super().__init__()
+        self.kalender = kalender
+        self.gebruikers: List[Dict[str, Any]] = []
+        self.toon_hr = False
+        self._gebruiker_index: Dict[int, int] = {}
+        self._naam_font = QFont(Fonts.FAMILY, Fonts.SIZE_SMALL)
+        self._hr_font = QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold)
+
+    def herlaad(self, gebruikers: List[Dict[str, Any]], toon_hr: bool) -> None:
+        """Herlaad gebruikers/HR kolommen - enkel verschil invoegen/verwijderen (v0.6.29)"""
+        nieuwe_gebruikers = list(gebruikers)
+
+        # HR kolommen aan/uit
+        if toon_hr != self.toon_hr:
+            if toon_hr:
+                self.beginInsertColumns(QModelIndex(), self.KOLOM_VOOR, self.KOLOM_NA)
+                self.toon_hr = True
+                self.endInsertColumns()
+            else:
+                self.beginRemoveColumns(QModelIndex(), self.KOLOM_VOOR, self.KOLOM_NA)
+                self.toon_hr = False
+                self.endRemoveColumns()
+
+        oud_rijen, nieuw_rijen = len(self.gebruikers), len(nieuwe_gebruikers)
+        if nieuw_rijen < oud_rijen:
+            self.beginRemoveRows(QModelIndex(), nieuw_rijen, oud_rijen - 1)
+            del self.gebruikers[nieuw_rijen:]
+            self.endRemoveRows()
+        elif nieuw_rijen > oud_rijen:
+            self.beginInsertRows(QModelIndex(), oud_rijen, nieuw_rijen - 1)
+            self.gebruikers = nieuwe_gebruikers
+            self.endInsertRows()
+
+        self.gebruikers = nieuwe_gebruikers
+        self._gebruiker_index = {u['id']: i for i, u in enumerate(self.gebruikers)}
+
+        if self.gebruikers:
+            self.dataChanged.emit(  # type: ignore
+                self.index(0, 0), self.index(len(self.gebruikers) - 1, self.columnCount() - 1)
+            )
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.columnCount() - 1)  # type: ignore
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.gebruikers)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return 3 if self.toon_hr else 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        gebruiker = self.gebruikers[index.row()]
+        col = index.column()
+
+        if col == self.KOLOM_NAAM:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return gebruiker['volledige_naam']
+            if role == Qt.ItemDataRole.FontRole:
+                return self._naam_font
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return css_naar_qcolor(Colors.BG_LIGHT)
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return None
+
+        # HR kolommen (None = nog aan het laden)
+        sleutel = 'voor' if col == self.KOLOM_VOOR else 'na'
+        werkdagen = self.kalender.get_hr_werkdagen(gebruiker['id'])
+        if werkdagen is None:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return "…"
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return css_naar_qcolor(Colors.BG_LIGHT)
+            return None
+        dagen = werkdagen[sleutel]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(dagen)
+        if role == Qt.ItemDataRole.FontRole:
+            return self._hr_font
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return css_naar_qcolor("rgba(255, 0, 0, 0.3)" if dagen > 19 else Colors.BG_LIGHT)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            periode = self.kalender.rode_lijn_periodes['vorig' if sleutel == 'voor' else 'huidig']
+            return (
+                f"Gewerkte dagen: {dagen}/19\n"
+                f"Periode {periode['nummer']}: {periode['start']} t/m {periode['eind']}"
+            )
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return ["Teamlid", "Voor\nRL", "Na\nRL"][section]
+        if role == Qt.ItemDataRole.ToolTipRole and section != self.KOLOM_NAAM and self.toon_hr:
+            if section == self.KOLOM_VOOR:
+                periode = self.kalender.rode_lijn_periodes['vorig']
+                return (f"Gewerkte dagen vóór rode lijn\n"
+                        f"Periode {periode['nummer']}: {periode['start']} t/m {periode['eind']}")
+            periode = self.kalender.rode_lijn_periodes['huidig']
+            return (f"Gewerkte dagen ná rode lijn\n"
+                    f"Periode {periode['nummer']}: {periode['start']} t/m {periode['eind']}")
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return Qt.ItemFlag.ItemIsEnabled if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    def refresh_alles(self) -> None:
+        if self.gebruikers:
+            self.dataChanged.emit(  # type: ignore
+                self.index(0, 0), self.index(len(self.gebruikers) - 1, self.columnCount() - 1)
+            )
+
+    def refresh_gebruiker(self, gebruiker_id: int) -> None:
+        row = self._gebruiker_index.get(gebruiker_id)
+        if row is not None and self.toon_hr:
+            self.dataChanged.emit(self.index(row, self.KOLOM_VOOR), self.index(row, self.KOLOM_NA))  # type: ignore
+
+
+class PlannerFrozenDelegate(QStyledItemDelegate):
+    """Standaard weergave + cel border en rode lijn tussen Voor RL en Na RL"""
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        painter.save()
+        painter.fillRect(option.rect, index.data(Qt.ItemDataRole.BackgroundRole))
+        painter.restore()
+
+        opt = QStyleOptionViewItem(option)
+        opt.rect = option.rect.adjusted(8, 0, -4, 0) if index.column() == 0 else option.rect
+        super().paint(painter, opt, index)
+
+        painter.save()
+        painter.setPen(QPen(css_naar_qcolor(Colors.BORDER_LIGHT), 1))
+        painter.drawRect(option.rect.adjusted(0, 0, -1, -1))
+        if index.column() == PlannerFrozenModel.KOLOM_NA:
+            teken_border(painter, option.rect, 'left', css_naar_qcolor(RODE_LIJN_KLEUR), 3)
+        painter.restore()
+
+
+class PlannerCelDelegate(QStyledItemDelegate):
+    """
+    Tekent datum cellen en levert de inline editor
+
+    Signals:
+        cel_bewerkt(datum_str, gebruiker_id, code): nieuwe code na edit
+        navigatie(datum_str, gebruiker_id, richting): Enter/Tab/pijltjes in editor
+    """
+
+    cel_bewerkt: pyqtSignal = pyqtSignal(str, int, str)
+    navigatie: pyqtSignal = pyqtSignal(str, int, str)
+
+    NAVIGATIE_TOETSEN = {
+        Qt.Key.Key_Return: 'down',
+        Qt.Key.Key_Enter: 'down',
+        Qt.Key.Key_Tab: 'next',
+        Qt.Key.Key_Backtab: 'prev',
+        Qt.Key.Key_Up: 'up',
+        Qt.Key.Key_Down: 'down',
+        Qt.Key.Key_Left: 'left',
+        Qt.Key.Key_Right: 'right',
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        info = index.model().cel_info(index.row(), index.column())
+        rect = option.rect
+
+        painter.save()
+
+        # Voorberekende stijl: overlay/selectie al gemengd, borders in prioriteit volgorde
+        stijl = CelStijlCache.get(
+            info['achtergrond'], info['overlay'], info['is_rode_lijn_start'],
+            info['heeft_notitie'], info['onder_kader'], info['links_kader'],
+            info['rechts_kader'], info['is_geselecteerd']
+        )
+        painter.fillRect(rect, stijl.vulling)
+
+        painter.setPen(stijl.rand_pen)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+        for zijde, kleur, breedte in stijl.borders:
+            teken_border(painter, rect, zijde, kleur, breedte)
+
+        # Shift code
+        if info['code']:
+            painter.setFont(self.font)
+            painter.setPen(QColor("#000000"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, info['code'])
+
+        painter.restore()
+
+    # ---------- Editor ----------
+
+    def createEditor(self, parent, option: QStyleOptionViewItem, index: QModelIndex) -> QLineEdit:
+        editor = QLineEdit(parent)
+        editor.setMaxLength(5)
+        editor.setFont(self.font)
+        editor.setProperty('datum_str', index.data(ROL_DATUM))
+        editor.setProperty('gebruiker_id', index.data(ROL_GEBRUIKER))
+
+        # Behoud HR/verlof overlay tijdens edit (v0.6.28 - ISSUE-005 fix)
+        overlay = index.model().cel_info(index.row(), index.column())['overlay']
+        editor.setStyleSheet(f"""
+            QLineEdit {{
+                background-color: {CelStijlCache.get('white', overlay).vulling.name()};
+                border: 2px solid {MAAND_KADER_KLEUR};
+                padding: 2px;
+                font-weight: bold;
+            }}
+        """)
+
+        # Uppercase automatisch
+        def to_upper(tekst: str):
+            if tekst != tekst.upper():
+                pos = editor.cursorPosition()
+                editor.setText(tekst.upper())
+                editor.setCursorPosition(pos)
+
+        editor.textChanged.connect(to_upper)  # type: ignore
+        return editor
+
+    def setEditorData(self, editor: QLineEdit, index: QModelIndex) -> None:
+        editor.setText(index.data(Qt.ItemDataRole.EditRole) or "")
+        editor.selectAll()
+
+    def setModelData(self, editor: QLineEdit, model, index: QModelIndex) -> None:
+        """Model wordt niet rechtstreeks gewijzigd: kalender valideert en slaat op"""
+        nieuwe_code = editor.text().strip().upper()
+        if nieuwe_code != (index.data(Qt.ItemDataRole.EditRole) or ""):
+            self.cel_bewerkt.emit(index.data(ROL_DATUM), index.data(ROL_GEBRUIKER), nieuwe_code)  # type: ignore
+
+    def updateEditorGeometry(self, editor: QLineEdit, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        editor.setGeometry(option.rect)
+
+    def eventFilter(self, editor, event) -> bool:  # type: ignore
+        """Enter/Tab/pijltjes: bewaar en navigeer (ESC wordt door Qt afgehandeld = annuleer)"""
+        if event.type() == QEvent.Type.KeyPress and event.key() in self.NAVIGATIE_TOETSEN:
+            richting = self.NAVIGATIE_TOETSEN[event.key()]
+            self.commitData.emit(editor)  # type: ignore
+            self.closeEditor.emit(editor, QStyledItemDelegate.EndEditHint.NoHint)  # type: ignore
+            self.navigatie.emit(  # type: ignore
+                editor.property('datum_str'), editor.property('gebruiker_id'), richting
+            )
+            return True
+        return super().eventFilter(editor, event)
+
+
+class DatumHeaderView(QHeaderView):
+    """Horizontale header met weekend/feestdag kleuren, bemannings overlay en rode lijn"""
+
+    def __init__(self, parent=None):
+        super().__init__(Qt.Orientation.Horizontal, parent)
+        self.font_header = QFont(Fonts.FAMILY, Fonts.SIZE_TINY, QFont.Weight.Bold)
+        self.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.setDefaultSectionSize(CEL_BREEDTE)
+        self.setFixedHeight(HEADER_HOOGTE)
+        self.setHighlightSections(False)
+
+    def paintSection(self, painter: QPainter, rect: QRect, logical_index: int) -> None:
+        model = self.model()
+        if not isinstance(model, PlannerGridModel) or logical_index >= model.columnCount():
+            return
+
+        info = model.header_info(logical_index)
+        painter.save()
+
+        # Header gebruikt boven_kader i.p.v. onder_kader: enkel vulling + basis pen uit cache
+        stijl = CelStijlCache.get(info['achtergrond'], info['overlay'], info['is_rode_lijn_start'])
+        painter.fillRect(rect, stijl.vulling)
+
+        painter.setPen(stijl.rand_pen)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+        for zijde, kleur, breedte in stijl.borders:
+            teken_border(painter, rect, zijde, kleur, breedte)
+        kader_kleur = css_naar_qcolor(MAAND_KADER_KLEUR)
+        if info['boven_kader']:
+            teken_border(painter, rect, 'top', kader_kleur, 3)
+        if info['links_kader']:
+            teken_border(painter, rect, 'left', kader_kleur, 3)
+        if info['rechts_kader']:
+            teken_border(painter, rect, 'right', kader_kleur, 3)
+
+        painter.setFont(self.font_header)
+        painter.setPen(QColor("#000000"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, model.labels[logical_index])
+        painter.restore()
+
+
+class PlannerGridView(QTableView):
+    """
+    QTableView voor datum cellen
+
+    Klik = edit (zoals oude EditableLabel), Ctrl/Shift+klik = selectie.
+    ESC wordt doorgegeven aan de kalender (selectie wissen).
+    """
+
+    cel_aangeklikt: pyqtSignal = pyqtSignal(str, int, object)  # (datum_str, gebruiker_id, modifiers)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHorizontalHeader(DatumHeaderView(self))
+        self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(RIJ_HOOGTE)
+        self.setShowGrid(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(
+            QAbstractItemView.EditTrigger.EditKeyPressed | QAbstractItemView.EditTrigger.AnyKeyPressed
+        )
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def mousePressEvent(self, event):
+        index = self.indexAt(event.position().toPoint())
+        if event.button() == Qt.MouseButton.LeftButton and index.isValid():
+            self.setFocus()
+            self.cel_aangeklikt.emit(  # type: ignore
+                index.data(ROL_DATUM), index.data(ROL_GEBRUIKER), event.modifiers()
+            )
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_Escape:
+            event.ignore()  # Naar PlannerGridKalender.keyPressEvent
+            return
+        super().keyPressEvent(event)
+
+
+class PlannerFrozenView(QTableView):
+    """Frozen kolommen (naam + HR), volgt verticale scroll van de datum grid"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(RIJ_HOOGTE)
+        self.horizontalHeader().setFixedHeight(HEADER_HOOGTE)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.horizontalHeader().setHighlightSections(False)
+        self.horizontalHeader().setStyleSheet(f"""
+            QHeaderView::section {{
+                background-color: {Colors.PRIMARY};
+                color: white;
+                padding: 4px;
+                border: 1px solid {Colors.BORDER_LIGHT};
+                font-weight: bold;
+            }}
+        """)
+        self.setShowGrid(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setItemDelegate(PlannerFrozenDelegate(self))
+
+    def pas_kolommen_aan(self, toon_hr: bool) -> None:
+        """Kolom breedtes + totale breedte (280px of 380px met HR kolommen)"""
+        self.setColumnWidth(PlannerFrozenModel.KOLOM_NAAM, NAAM_BREEDTE)
+        breedte = NAAM_BREEDTE
+        if toon_hr:
+            self.setColumnWidth(PlannerFrozenModel.KOLOM_VOOR, HR_BREEDTE)
+            self.setColumnWidth(PlannerFrozenModel.KOLOM_NA, HR_BREEDTE)
+            breedte += 2 * HR_BREEDTE
+        self.setFixedWidth(breedte + 2 * self.frameWidth())
@@ -3,13 +3,15 @@
 Teamlid Grid Kalender
 Read-only kalender voor teamleden om eigen/collega shifts te bekijken
 """
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                              QComboBox, QScrollArea, QWidget, QGridLayout,
-                             QCheckBox, QDialog, QDialogButtonBox)
-from PyQt6.QtCore import pyqtSignal, Qt
+                             QCheckBox, QDialog, QDialogButtonBox, QToolTip)
+from PyQt6.QtCore import pyqtSignal, Qt, QEvent, QObject
 from PyQt6.QtGui import QFont
 from gui.widgets.grid_kalender_base import GridKalenderBase
+from gui.widgets.maand_loader import LaadStap
+from gui.widgets.cel_stijlen import CelStijlCache, STIJL_PROPERTY
 from gui.styles import Styles, Colors, Fonts, Dimensions
 from datetime import datetime
 from database.connection import get_connection
@@ -29,6 +31,16 @@ class TeamlidGridKalender(GridKalenderBase):
 
     def __init__(self, jaar: int, maand: int, huidige_gebruiker_id: int):
         self.huidige_gebruiker_id = huidige_gebruiker_id
+        self.gebruikte_stijl_ids: Set[str] = set()
+
+        # Widget pool (v0.6.29) - hergebruikt bij maand wissel
+        self.datum_headers: List[QLabel] = []
+        self.naam_labels: List[QLabel] = []
+        self.cel_rijen: List[List[QLabel]] = []
+
+        # Wat de pool momenteel toont: kolom → datum, rij → gebruiker (lazy tooltips)
+        self.getoonde_datums: List[str] = []
+        self.getoonde_gebruiker_ids: List[int] = []
         super().__init__(jaar, maand)
         self.init_ui()
         self.load_initial_data()
@@ -70,6 +82,40 @@ class TeamlidGridKalender(GridKalenderBase):
         self.scrollable_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.scrollable_container = QWidget()
         self.scrollable_scroll.setWidget(self.scrollable_container)
+        # Tooltips pas bij hover opbouwen (v0.6.29): ToolTip events van cellen
+        # zonder eigen tooltip bubbelen naar de container
+        self.scrollable_container.installEventFilter(self)
+
+        # Vaste grid layouts - cellen worden hergebruikt (v0.6.29)
+        self.frozen_layout = QGridLayout(self.frozen_container)
+        self.frozen_layout.setSpacing(0)
+        self.frozen_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.scrollable_layout = QGridLayout(self.scrollable_container)
+        self.scrollable_layout.setSpacing(0)
+        self.scrollable_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Naam header → frozen kolom 0
+        self.naam_header = QLabel("Teamlid")
+        self.naam_header.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold))
+        self.naam_header.setStyleSheet(f"""
+            QLabel {{
+                background-color: {Colors.PRIMARY};
+                color: white;
+                padding: 8px;
+                border: 1px solid {Colors.BORDER_LIGHT};
+                qproperty-alignment: AlignCenter;
+            }}
+        """)
+        self.naam_header.setFixedWidth(280)
+        self.frozen_layout.addWidget(self.naam_header, 0, 0)
+
+        # Placeholder als geen gebruikers geselecteerd
+        self.geen_gebruikers_label = QLabel("Geen teamleden geselecteerd. Gebruik de filter knop.")
+        self.geen_gebruikers_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; padding: 20px;")
+        self.geen_gebruikers_label.setWordWrap(True)
+        self.geen_gebruikers_label.setVisible(False)
+        self.frozen_layout.addWidget(self.geen_gebruikers_label, 0, 0)
 
         # Synchroniseer vertical scrollbars (frozen volgt scrollable)
         self.scrollable_scroll.verticalScrollBar().valueChanged.connect(  # type: ignore
@@ -105,21 +151,17 @@ class TeamlidGridKalender(GridKalenderBase):
         """Navigeer naar vorige maand"""
         if self.maand == 1:
             self.refresh_data(self.jaar - 1, 12)
-            self.jaar_combo.setCurrentText(str(self.jaar))
-            self.maand_combo.setCurrentIndex(11)
         else:
             self.refresh_data(self.jaar, self.maand - 1)
-            self.maand_combo.setCurrentIndex(self.maand - 1)
+        self.sync_maand_selectors()
 
     def volgende_maand(self) -> None:
         """Navigeer naar volgende maand"""
         if self.maand == 12:
             self.refresh_data(self.jaar + 1, 1)
-            self.jaar_combo.setCurrentText(str(self.jaar))
-            self.maand_combo.setCurrentIndex(0)
         else:
             self.refresh_data(self.jaar, self.maand + 1)
-            self.maand_combo.setCurrentIndex(self.maand - 1)  # BUG FIX: index is 0-based
+        self.sync_maand_selectors()
 
     def get_initial_filter_state(self, user_id: int) -> bool:
         """
@@ -129,7 +171,9 @@ class TeamlidGridKalender(GridKalenderBase):
         return user_id == self.huidige_gebruiker_id
 
     def load_initial_data(self) -> None:
-        """Laad initiële data"""
+        """Laad initiële data (synchroon - bij opstart)"""
+        self.annuleer_laden()
+
         # Laad gebruikers (filter wordt behouden bij refresh, geforceerd bij init)
         self.load_gebruikers(alleen_actief=True)
 
@@ -152,97 +196,116 @@ class TeamlidGridKalender(GridKalenderBase):
         # Bouw grid
         self.build_grid()
 
+    def get_laad_stappen(self) -> List[LaadStap]:
+        """
+        Async maand load (v0.6.29): basis → gepubliceerde planning → verlof
+        Gedeelde kalenders hier op de GUI thread, de worker doet enkel leesqueries.
+        """
+        datum_lijst = self.get_datum_lijst(start_offset=0, eind_offset=0)
+        start_datum, eind_datum = datum_lijst[0][0], datum_lijst[-1][0]
+        dag_kalender = self.fetch_dag_kalender(self.jaar)
+        rode_lijnen_starts = self.fetch_rode_lijnen_starts()
+
+        def basis() -> Dict[str, Any]:
+            return {
+                'gebruikers': self.fetch_gebruikers(alleen_actief=True),
+                'dag_kalender': dag_kalender,
+                'rode_lijnen_starts': rode_lijnen_starts,
+            }
+
+        return [
+            ('basis', basis),
+            ('planning', lambda: self.fetch_planning_data(start_datum, eind_datum, alleen_gepubliceerd=True)),
+            ('verlof', lambda: self.fetch_verlof_data(start_datum, eind_datum)),
+        ]
+
+    def verwerk_dataset(self, naam: str, data: Any) -> None:
+        """Pas dataset toe en herbind de cellen (widget pool, geen nieuwe widgets)"""
+        if naam == 'basis':
+            self.zet_gebruikers(data['gebruikers'])
+            self.zet_dag_kalender(data['dag_kalender'])
+            self.rode_lijnen_starts = data['rode_lijnen_starts']
+        elif naam == 'planning':
+            self.rooster = data
+        elif naam == 'verlof':
+            self.verlof_perioden = data
+        self.build_grid()
+
     def build_grid(self) -> None:
-        """Bouw de grid met namen en datums - SPLIT in frozen + scrollable (v0.6.25)"""
-        # Clear bestaande layouts
-        if self.frozen_container.layout():
-            QWidget().setLayout(self.frozen_container.layout())
-        if self.scrollable_container.layout():
-            QWidget().setLayout(self.scrollable_container.layout())
-
-        # Maak twee aparte layouts
-        frozen_layout = QGridLayout()
-        frozen_layout.setSpacing(0)
-        frozen_layout.setContentsMargins(0, 0, 0, 0)
-
-        scrollable_layout = QGridLayout()
-        scrollable_layout.setSpacing(0)
-        scrollable_layout.setContentsMargins(0, 0, 0, 0)
+        """
+        Bouw/herbind de grid met namen en datums - SPLIT in frozen + scrollable (v0.6.25)
 
+        v0.6.29: widget pool i.p.v. alles weggooien. Bestaande labels worden opnieuw
+        gebonden aan de nieuwe data; enkel rijen/kolommen die er bij komen of weg
+        vallen worden aangemaakt of verwijderd (maand wisselen = meestal 0 nieuwe widgets).
+        """
         # Haal datum lijst en zichtbare gebruikers
         datum_lijst = self.get_datum_lijst(start_offset=0, eind_offset=0)
         zichtbare_gebruikers = self.get_zichtbare_gebruikers()
 
+        # Geen gebruikers geselecteerd → placeholder tonen
+        self.geen_gebruikers_label.setVisible(not zichtbare_gebruikers)
+        self.naam_header.setVisible(bool(zichtbare_gebruikers))
+        self.scrollable_container.setVisible(bool(zichtbare_gebruikers))
+        self.getoonde_datums = [datum_str for datum_str, _ in datum_lijst]
+        self.getoonde_gebruiker_ids = [gebruiker['id'] for gebruiker in zichtbare_gebruikers]
         if not zichtbare_gebruikers:
-            # Geen gebruikers geselecteerd
-            info = QLabel("Geen teamleden geselecteerd. Gebruik de filter knop.")
-            info.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; padding: 20px;")
-            frozen_layout.addWidget(info, 0, 0)
-            self.frozen_container.setLayout(frozen_layout)
-            self.scrollable_container.setLayout(scrollable_layout)
+            self.pas_pool_aan(0, 0)
             return
 
-        # ============== FROZEN HEADER (naam kolom) ==============
-        # Naam header → frozen kolom 0
-        naam_header = QLabel("Teamlid")
-        naam_header.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold))
-        naam_header.setStyleSheet(f"""
-            QLabel {{
-                background-color: {Colors.PRIMARY};
-                color: white;
-                padding: 8px;
-                border: 1px solid {Colors.BORDER_LIGHT};
-                qproperty-alignment: AlignCenter;
-            }}
-        """)
-        naam_header.setFixedWidth(280)
-        frozen_layout.addWidget(naam_header, 0, 0)
-
-        # ============== SCROLLABLE HEADERS (datum kolommen) ==============
-        # Datum headers starten bij scrollable kolom 0
-        for col, (datum_str, label) in enumerate(datum_lijst):
-            datum_header = QLabel(label)
-            datum_header.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_TINY, QFont.Weight.Bold))
+        self.pas_pool_aan(len(zichtbare_gebruikers), len(datum_lijst))
 
-            # Achtergrond kleur voor header (geel voor zondag/feestdag, grijs voor zaterdag)
-            achtergrond = self.get_datum_achtergrond(datum_str)
-
-            # Check of dit het begin van een rode lijn periode is
-            is_rode_lijn_start = datum_str in self.rode_lijnen_starts
-
-            if is_rode_lijn_start:
-                periode_nr = self.rode_lijnen_starts[datum_str]
-                datum_header.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: {achtergrond};
-                        color: #000000;
-                        padding: 4px;
-                        border: 1px solid {Colors.BORDER_LIGHT};
-                        border-left: 4px solid #dc3545;
-                        qproperty-alignment: AlignCenter;
-                    }}
-                """)
-                datum_header.setToolTip(f"Start Rode Lijn Periode {periode_nr}")
-            else:
-                datum_header.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: {achtergrond};
-                        color: #000000;
-                        padding: 4px;
-                        border: 1px solid {Colors.BORDER_LIGHT};
-                        qproperty-alignment: AlignCenter;
-                    }}
-                """)
+        # Cel inhoud vooraf bepalen: nieuwe stijl ids moeten in de container
+        # stylesheet staan vóór de cellen opnieuw gepolished worden
+        inhoud = [
+            [self.bepaal_cel_inhoud(datum_str, gebruiker['id'], mode='teamlid')
+             for datum_str, _ in datum_lijst]
+            for gebruiker in zichtbare_gebruikers
+        ]
+        nieuwe_ids = {stijl_id for rij in inhoud for _, stijl_id in rij} - self.gebruikte_stijl_ids
+        if nieuwe_ids:
+            self.gebruikte_stijl_ids |= nieuwe_ids
+            self.scrollable_container.setStyleSheet(
+                CelStijlCache.container_stylesheet(self.gebruikte_stijl_ids)
+            )
 
-            datum_header.setFixedWidth(60)
-            scrollable_layout.addWidget(datum_header, 0, col)  # Scrollable headers
+        # ============== SCROLLABLE HEADERS (datum kolommen) ==============
+        for datum_header, (datum_str, label) in zip(self.datum_headers, datum_lijst):
+            self.bind_datum_header(datum_header, datum_str, label)
 
         # ============== DATA RIJEN (split in frozen + scrollable) ==============
-        for row, gebruiker in enumerate(zichtbare_gebruikers, start=1):
-            gebruiker_id = gebruiker['id']
-
-            # ---- FROZEN: Naam kolom → frozen kolom 0 ----
-            naam_label = QLabel(gebruiker['volledige_naam'])
+        for naam_label, cel_rij, gebruiker, rij_inhoud in zip(
+                self.naam_labels, self.cel_rijen, zichtbare_gebruikers, inhoud):
+            naam_label.setText(gebruiker['volledige_naam'])
+            for cel, (shift_code, stijl_id) in zip(cel_rij, rij_inhoud):
+                self.bind_shift_cel(cel, shift_code, stijl_id)
+
+    def pas_pool_aan(self, aantal_rijen: int, aantal_kolommen: int) -> None:
+        """Voeg enkel ontbrekende rijen/kolommen toe of verwijder overtollige (v0.6.29)"""
+        # Kolommen (datum headers + cellen in bestaande rijen)
+        while len(self.datum_headers) > aantal_kolommen:
+            self.datum_headers.pop().deleteLater()
+            for cel_rij in self.cel_rijen:
+                cel_rij.pop().deleteLater()
+        while len(self.datum_headers) < aantal_kolommen:
+            col = len(self.datum_headers)
+            datum_header = QLabel()
+            datum_header.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_TINY, QFont.Weight.Bold))
+            datum_header.setFixedWidth(60)
+            self.scrollable_layout.addWidget(datum_header, 0, col)
+            self.datum_headers.append(datum_header)
+            for row, cel_rij in enumerate(self.cel_rijen, start=1):
+                cel_rij.append(self.create_shift_cel())
+                self.scrollable_layout.addWidget(cel_rij[-1], row, col)
+
+        # Rijen (naam label + cellen)
+        while len(self.naam_labels) > aantal_rijen:
+            self.naam_labels.pop().deleteLater()
+            for cel in self.cel_rijen.pop():
+                cel.deleteLater()
+        while len(self.naam_labels) < aantal_rijen:
+            row = len(self.naam_labels) + 1
+            naam_label = QLabel()
             naam_label.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL))
             naam_label.setStyleSheet(f"""
                 QLabel {{
@@ -252,22 +315,59 @@ class TeamlidGridKalender(GridKalenderBase):
                 }}
             """)
             naam_label.setFixedWidth(280)
-            frozen_layout.addWidget(naam_label, row, 0)
+            self.frozen_layout.addWidget(naam_label, row, 0)
+            self.naam_labels.append(naam_label)
+
+            cel_rij = []
+            for col in range(aantal_kolommen):
+                cel = self.create_shift_cel()
+                self.scrollable_layout.addWidget(cel, row, col)
+                cel_rij.append(cel)
+            self.cel_rijen.append(cel_rij)
+
+    def bind_datum_header(self, datum_header: QLabel, datum_str: str, label: str) -> None:
+        """Zet tekst/stijl van datum header - stylesheet enkel bij wijziging"""
+        datum_header.setText(label)
+
+        # Achtergrond kleur voor header (geel voor zondag/feestdag, grijs voor zaterdag)
+        achtergrond = self.get_datum_achtergrond(datum_str)
+
+        # Check of dit het begin van een rode lijn periode is
+        is_rode_lijn_start = datum_str in self.rode_lijnen_starts
+
+        stijl_key = f"{achtergrond}|{is_rode_lijn_start}"
+        if datum_header.property('stijl_key') != stijl_key:
+            rode_lijn = "border-left: 4px solid #dc3545;" if is_rode_lijn_start else ""
+            datum_header.setStyleSheet(f"""
+                QLabel {{
+                    background-color: {achtergrond};
+                    color: #000000;
+                    padding: 4px;
+                    border: 1px solid {Colors.BORDER_LIGHT};
+                    {rode_lijn}
+                    qproperty-alignment: AlignCenter;
+                }}
+            """)
+            datum_header.setProperty('stijl_key', stijl_key)
 
-            # ---- SCROLLABLE: Datum cellen → scrollable kolom 0+ ----
-            for col, (datum_str, _) in enumerate(datum_lijst):  # Start bij kolom 0 in scrollable
-                cel = self.create_shift_cel(datum_str, gebruiker_id, mode='teamlid')
-                cel.setFixedWidth(60)
-                scrollable_layout.addWidget(cel, row, col)  # Scrollable layout
+    def create_shift_cel(self) -> QLabel:
+        """Maak lege (pool) cel voor shift weergave - read-only voor teamlid view"""
+        cel = QLabel()
+        cel.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold))
+        cel.setFixedWidth(60)
+        return cel
 
-        # Set layouts op containers
-        self.frozen_container.setLayout(frozen_layout)
-        self.scrollable_container.setLayout(scrollable_layout)
+    def bind_shift_cel(self, cel: QLabel, shift_code: str, stijl_id: str) -> None:
+        """Bind cel aan nieuwe inhoud; re-polish enkel als de stijl wijzigt"""
+        cel.setText(shift_code)
+        if cel.property(STIJL_PROPERTY) != stijl_id:
+            cel.setProperty(STIJL_PROPERTY, stijl_id)
+            cel.style().unpolish(cel)
+            cel.style().polish(cel)
 
-    def create_shift_cel(self, datum_str: str, gebruiker_id: int, mode: str) -> QLabel:
+    def bepaal_cel_inhoud(self, datum_str: str, gebruiker_id: int, mode: str) -> Tuple[str, str]:
         """
-        Maak cel voor shift weergave
-        Read-only voor teamlid view
+        Bepaal (shift code, stijl id) voor cel - tooltip volgt lazy bij hover
 
         ISSUE-004 FIX: Notitie indicator (groen hoekje) toegevoegd
         - Alleen voor ingelogde gebruiker's eigen notities
@@ -285,52 +385,70 @@ class TeamlidGridKalender(GridKalenderBase):
         # ISSUE-004 FIX: Check of er een notitie is (alleen voor ingelogde gebruiker)
         heeft_notitie = False
         if gebruiker_id == self.huidige_gebruiker_id:  # Alleen eigen notities tonen
-            if datum_str in self.planning_data and gebruiker_id in self.planning_data[datum_str]:
-                notitie = self.planning_data[datum_str][gebruiker_id].get('notitie', '')
-                heeft_notitie = bool(notitie and notitie.strip())
-
-        # Maak label
-        cel = QLabel(shift_code)
-        cel.setFont(QFont(Fonts.FAMILY, Fonts.SIZE_SMALL, QFont.Weight.Bold))
-
-        # Stylesheet met optionele rode lijn
-        base_style = self.create_cel_stylesheet(achtergrond, overlay)
-        if is_rode_lijn_start:
-            # Voeg rode linker border toe
-            base_style = base_style.replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-left: 4px solid #dc3545;\n                    qproperty-alignment: AlignCenter;"
-            )
-
-        # ISSUE-004 FIX: Notitie indicator (rechter boven corner accent)
-        if heeft_notitie:
-            base_style = base_style.replace(
-                "border: 1px solid",
-                "border: 1px solid"
-            ).replace(
-                "qproperty-alignment: AlignCenter;",
-                "border-top: 3px solid #00E676;\n                    border-right: 3px solid #00E676;\n                    qproperty-alignment: AlignCenter;"
-            )
+            heeft_notitie = bool(self.rooster.get_notitie(datum_str, gebruiker_id).strip())
+
+        # Geïnterneerde stijl (rode lijn + notitie indicator) via dynamic property
+        # i.p.v. een eigen QSS string per cel (v0.6.29)
+        stijl_id = CelStijlCache.stijl_id(
+            achtergrond, overlay,
+            is_rode_lijn_start=is_rode_lijn_start,
+            heeft_notitie=heeft_notitie
+        )
 
-        cel.setStyleSheet(base_style)
+        return shift_code, stijl_id
 
-        # Tooltip
-        tooltip = self.get_cel_tooltip(datum_str, gebruiker_id, mode)
-        if is_rode_lijn_start:
+    def get_volledige_cel_tooltip(self, datum_str: str, gebruiker_id: int) -> str:
+        """Tooltip voor cel: shift/notitie info + rode lijn start"""
+        tooltip = self.get_cel_tooltip(datum_str, gebruiker_id, 'teamlid')
+        if datum_str in self.rode_lijnen_starts:
             periode_nr = self.rode_lijnen_starts[datum_str]
             rode_lijn_tooltip = f"Start Rode Lijn Periode {periode_nr}"
             tooltip = f"{tooltip}\n{rode_lijn_tooltip}" if tooltip else rode_lijn_tooltip
-        if tooltip:
-            cel.setToolTip(tooltip)
-
-        return cel
+        return tooltip
+
+    def get_datum_header_tooltip(self, datum_str: str) -> str:
+        """Tooltip voor datum header: rode lijn start"""
+        if datum_str in self.rode_lijnen_starts:
+            return f"Start Rode Lijn Periode {self.rode_lijnen_starts[datum_str]}"
+        return ""
+
+    def tooltip_voor_positie(self, rij: int, kolom: int) -> str:
+        """Tooltip voor grid positie (rij 0 = datum headers, rij n = gebruiker n-1)"""
+        if not 0 <= kolom < len(self.getoonde_datums):
+            return ""
+        datum_str = self.getoonde_datums[kolom]
+        if rij == 0:
+            return self.get_datum_header_tooltip(datum_str)
+        if rij - 1 < len(self.getoonde_gebruiker_ids):
+            return self.get_volledige_cel_tooltip(datum_str, self.getoonde_gebruiker_ids[rij - 1])
+        return ""
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore
+        """
+        Lazy tooltips (v0.6.29): tekst pas opbouwen voor de cel onder de muis
+        i.p.v. bij elke (her)bind voor alle cellen van de maand
+        """
+        if obj is self.scrollable_container and event.type() == QEvent.Type.ToolTip:
+            widget = self.scrollable_container.childAt(event.pos())
+            index = self.scrollable_layout.indexOf(widget) if widget else -1
+            tooltip = ""
+            if index >= 0:
+                rij, kolom, _, _ = self.scrollable_layout.getItemPosition(index)
+                tooltip = self.tooltip_voor_positie(rij, kolom)
+            if tooltip:
+                QToolTip.showText(event.globalPos(), tooltip, widget)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().eventFilter(obj, event)
 
     def refresh_data(self, jaar: int, maand: int) -> None:
         """Herlaad data voor nieuwe jaar/maand"""
         self.jaar = jaar
         self.maand = maand
         self.update_title()
-        self.load_initial_data()
+        self.laad_maand_async()  # v0.6.29: skelet/cache direct, data volgt
         self.maand_changed.emit()  # Emit signal voor status update
 
 
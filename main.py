@@ -4,9 +4,10 @@ Main entry point voor Planning Tool
 FIXED: Signal namen + type hints + instance attributes
 UPDATED: Dark mode support met theme toggle (v0.6.12: per gebruiker)
 """
+import multiprocessing
 import sys
-from typing import Dict, Any, Optional
-from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox
+from typing import Dict, Any, Optional, Callable
+from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox, QWidget
 from PyQt6.QtGui import QKeySequence, QShortcut
 from pathlib import Path
 from database.connection import init_database, check_db_compatibility
@@ -15,7 +16,9 @@ from gui.screens.dashboard_screen import DashboardScreen
 from gui.screens.feestdagen_screen import FeestdagenScherm
 from gui.screens.gebruikersbeheer_screen import GebruikersbeheerScreen
 from gui.screens.mijn_planning_screen import MijnPlanningScreen
+from gui.scherm_cache import SchermCache, sluit_scherm, SLEUTEL_PROPERTY
 from gui.styles import ThemeManager, Colors
+from services.referentie_catalogus import ReferentieCatalogus
 
 
 def ensure_application_folders():
@@ -43,6 +46,9 @@ class MainWindow(QMainWindow):
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
+        # Verborgen beheer schermen voor snel heropenen (begrensd, v0.6.29)
+        self.scherm_cache = SchermCache()
+
         self.setWindowTitle("Planning Tool")
         self.resize(1000, 700)
 
@@ -53,6 +59,10 @@ class MainWindow(QMainWindow):
         self.help_shortcut = QShortcut(QKeySequence("F1"), self)
         self.help_shortcut.activated.connect(self.show_handleiding)  # type: ignore
 
+        # Geheugen diagnose (v0.6.29)
+        self.geheugen_shortcut = QShortcut(QKeySequence("Ctrl+Shift+M"), self)
+        self.geheugen_shortcut.activated.connect(self.show_geheugen_diagnose)  # type: ignore
+
         self.show_login()
 
     def show_login(self) -> None:
@@ -65,6 +75,12 @@ class MainWindow(QMainWindow):
     def on_login_success(self, user_data: Dict[str, Any]) -> None:
         """Na succesvolle login"""
         self.current_user = user_data
+
+        # Referentie data 1x per login laden (v0.6.29): wijzigingen van andere
+        # clients zijn zichtbaar vanaf de volgende login
+        ReferentieCatalogus.invalideer()
+        ReferentieCatalogus.get_instance()
+
         self.maximize_on_primary_screen()  # Maximaliseer op primair scherm (multiscreen compatible)
         self.show_dashboard()
 
@@ -89,22 +105,62 @@ class MainWindow(QMainWindow):
         # Optioneel: gebruik showNormal() om te voorkomen dat Qt het window toch maximaliseert
         self.showNormal()
 
+    def toon_scherm(self, scherm: QWidget, sleutel: Optional[str] = None) -> None:
+        """
+        Toon scherm boven het dashboard (v0.6.29)
+
+        Schermen die nog boven het dashboard staan (navigatie vanuit een
+        ander scherm) worden eerst gesloten: de stack bevat hoogstens
+        login + dashboard + 1 scherm.
+
+        Args:
+            sleutel: cache sleutel; bij terug() wordt het scherm dan bewaard
+                     in scherm_cache i.p.v. verwijderd
+        """
+        self.sluit_schermen_boven_dashboard()
+        scherm.setProperty(SLEUTEL_PROPERTY, sleutel)
+        self.stack.addWidget(scherm)
+        self.stack.setCurrentWidget(scherm)
+
+    def haal_scherm(self, sleutel: str, maak: Callable[[], QWidget]) -> None:
+        """Toon gecacht (ververst) scherm of maak een nieuw"""
+        scherm = self.scherm_cache.haal(sleutel)
+        self.toon_scherm(scherm if scherm is not None else maak(), sleutel)
+
+    def verwijder_uit_stack(self, scherm: QWidget) -> None:
+        """Haal scherm uit de stack: bewaren in cache of definitief sluiten"""
+        self.stack.removeWidget(scherm)
+        sleutel = scherm.property(SLEUTEL_PROPERTY)
+        if sleutel:
+            self.scherm_cache.bewaar(sleutel, scherm)
+        else:
+            sluit_scherm(scherm)
+
+    def sluit_schermen_boven_dashboard(self) -> None:
+        if self.dashboard is None:
+            return
+        while self.stack.count() > self.stack.indexOf(self.dashboard) + 1:
+            self.verwijder_uit_stack(self.stack.widget(self.stack.count() - 1))
+
     def terug(self) -> None:
         """Ga terug naar vorig scherm (dashboard)"""
         if self.stack.count() > 1:
             # Verwijder huidig scherm
             current = self.stack.currentWidget()
-            self.stack.removeWidget(current)
             if current:
-                current.deleteLater()
+                self.verwijder_uit_stack(current)
 
     def rebuild_dashboard(self) -> None:
         """Rebuild dashboard met huidige theme (gebruikt na theme toggle)"""
+        # Gecachte schermen hebben de stylesheets van het oude thema
+        self.scherm_cache.leeg()
+
         # Verwijder huidig dashboard
         current = self.stack.currentWidget()
         if current:
             self.stack.removeWidget(current)
-            current.deleteLater()
+            sluit_scherm(current)
+        self.dashboard = None
 
         # Maak nieuw dashboard
         self.show_dashboard()
@@ -138,6 +194,7 @@ class MainWindow(QMainWindow):
         dashboard.notities_overzicht_clicked.connect(self.on_notities_overzicht_clicked)  # type: ignore
         dashboard.verlof_saldo_beheer_clicked.connect(self.on_verlof_saldo_beheer_clicked)  # type: ignore
         dashboard.werkpost_koppeling_clicked.connect(self.on_werkpost_koppeling_clicked)  # type: ignore
+        dashboard.db_onderhoud_clicked.connect(self.on_db_onderhoud_clicked)  # type: ignore
 
         self.stack.addWidget(dashboard)
         self.stack.setCurrentWidget(dashboard)
@@ -146,8 +203,7 @@ class MainWindow(QMainWindow):
     def on_gebruikers_clicked(self) -> None:
         """Open gebruikersbeheer scherm"""
         scherm = GebruikersbeheerScreen(self.terug)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.toon_scherm(scherm)
 
     def on_typedienst_clicked(self) -> None:
         """Open typetabel beheer scherm"""
@@ -155,9 +211,7 @@ class MainWindow(QMainWindow):
             return
 
         from gui.screens.typetabel_beheer_screen import TypetabelBeheerScreen
-        scherm = TypetabelBeheerScreen(self.terug)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.haal_scherm('typetabel', lambda: TypetabelBeheerScreen(self.terug))
 
     def on_voorkeuren_clicked(self) -> None:
         """Open voorkeuren scherm"""
@@ -166,16 +220,13 @@ class MainWindow(QMainWindow):
 
         from gui.screens.voorkeuren_screen import VoorkeurenScreen
         scherm = VoorkeurenScreen(self.terug, self.current_user)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.toon_scherm(scherm)
 
     # Handlers voor Instellingen tab
     def on_hr_regels_clicked(self) -> None:
         """Open HR regels beheer scherm"""
         from gui.screens.hr_regels_beheer_screen import HRRegelsBeheerScreen
-        scherm = HRRegelsBeheerScreen(self.terug)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.haal_scherm('hr_regels', lambda: HRRegelsBeheerScreen(self.terug))
 
     def on_shift_codes_clicked(self) -> None:
         """Open shift codes & posten scherm"""
@@ -183,9 +234,7 @@ class MainWindow(QMainWindow):
             return
 
         from gui.screens.shift_codes_screen import ShiftCodesScreen
-        scherm = ShiftCodesScreen(self.terug)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.haal_scherm('shift_codes', lambda: ShiftCodesScreen(self.terug))
 
     def on_feestdagen_clicked(self) -> None:
         """Feestdagen scherm openen"""
@@ -194,8 +243,7 @@ class MainWindow(QMainWindow):
         from types import SimpleNamespace
         router = SimpleNamespace(terug=self.terug)
         feestdagen_scherm = FeestdagenScherm(self, router)  # type: ignore[arg-type]
-        self.stack.addWidget(feestdagen_scherm)
-        self.stack.setCurrentWidget(feestdagen_scherm)
+        self.toon_scherm(feestdagen_scherm)
 
     def on_rode_lijnen_clicked(self) -> None:
         """Open rode lijnen beheer scherm"""
@@ -203,9 +251,7 @@ class MainWindow(QMainWindow):
             return
 
         from gui.screens.rode_lijnen_beheer_screen import RodeLijnenBeheerScreen
-        scherm = RodeLijnenBeheerScreen(self.terug)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.haal_scherm('rode_lijnen', lambda: RodeLijnenBeheerScreen(self.terug))
 
     def on_verlof_saldo_beheer_clicked(self) -> None:
         """Open verlof & KD saldo beheer scherm"""
@@ -213,9 +259,7 @@ class MainWindow(QMainWindow):
             return
 
         from gui.screens.verlof_saldo_beheer_screen import VerlofSaldoBeheerScreen
-        scherm = VerlofSaldoBeheerScreen(self.terug)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.haal_scherm('verlof_saldo', lambda: VerlofSaldoBeheerScreen(self.terug))
 
     def on_werkpost_koppeling_clicked(self) -> None:
         """Open werkpost koppeling beheer scherm"""
@@ -223,9 +267,15 @@ class MainWindow(QMainWindow):
             return
 
         from gui.screens.werkpost_koppeling_screen import WerkpostKoppelingScreen
-        scherm = WerkpostKoppelingScreen(self.terug)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.haal_scherm('werkpost_koppeling', lambda: WerkpostKoppelingScreen(self.terug))
+
+    def on_db_onderhoud_clicked(self) -> None:
+        """Open database onderhoud scherm (v0.6.29)"""
+        if not self.current_user:
+            return
+
+        from gui.screens.database_onderhoud_screen import DatabaseOnderhoudScreen
+        self.haal_scherm('db_onderhoud', lambda: DatabaseOnderhoudScreen(self.terug))
 
     def on_logout(self) -> None:
         """Uitloggen"""
@@ -240,7 +290,9 @@ class MainWindow(QMainWindow):
             widget = self.stack.widget(1)
             if widget:
                 self.stack.removeWidget(widget)
-                widget.deleteLater()
+                sluit_scherm(widget)
+        self.scherm_cache.leeg()
+        self.dashboard = None
 
         if self.login_screen:
             self.stack.setCurrentWidget(self.login_screen)
@@ -261,8 +313,7 @@ class MainWindow(QMainWindow):
         from types import SimpleNamespace
         router = SimpleNamespace(terug=self.terug)
         scherm = MijnPlanningScreen(router, self.current_user['id'])  # type: ignore[arg-type]
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.toon_scherm(scherm)
 
     #vervangen door verlof_aanvragen
     #def on_verlof_clicked(self) -> None:
@@ -297,10 +348,10 @@ class MainWindow(QMainWindow):
                 router=self.terug,
                 jaar=config['jaar'],
                 maand=config['maand'],
-                gebruiker_ids=config['gebruiker_ids']
+                gebruiker_ids=config['gebruiker_ids'],
+                huidige_gebruiker_id=self.current_user['id'] if self.current_user else None
             )
-            self.stack.addWidget(scherm)
-            self.stack.setCurrentWidget(scherm)
+            self.toon_scherm(scherm)
 
     def on_verlof_aanvragen_clicked(self) -> None:
         """Open verlof aanvragen scherm"""
@@ -309,8 +360,7 @@ class MainWindow(QMainWindow):
 
         from gui.screens.verlof_aanvragen_screen import VerlofAanvragenScreen
         scherm = VerlofAanvragenScreen(self.terug, self.current_user['id'])
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.toon_scherm(scherm)
 
     def on_verlof_goedkeuring_clicked(self) -> None:
         """Open verlof goedkeuring scherm"""
@@ -321,8 +371,7 @@ class MainWindow(QMainWindow):
         scherm = VerlofGoedkeuringScreen(self.terug, self.current_user['id'])
         if self.dashboard:
             scherm.verlofGoedgekeurd.connect(self.dashboard.refresh_verlof_badge)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.toon_scherm(scherm)
 
     def on_notities_overzicht_clicked(self) -> None:
         """Open notities overzicht scherm (v0.6.29)"""
@@ -331,8 +380,7 @@ class MainWindow(QMainWindow):
 
         from gui.screens.notities_overzicht_screen import NotitiesOverzichtScreen
         scherm = NotitiesOverzichtScreen(self.terug, dashboard_ref=self.dashboard)
-        self.stack.addWidget(scherm)
-        self.stack.setCurrentWidget(scherm)
+        self.toon_scherm(scherm)
 
     def show_handleiding(self) -> None:
         """Toon handleiding dialog (F1)"""
@@ -340,6 +388,12 @@ class MainWindow(QMainWindow):
         dialog = HandleidingDialog(self)
         dialog.exec()
 
+    def show_geheugen_diagnose(self) -> None:
+        """Toon geheugen diagnose (Ctrl+Shift+M, v0.6.29)"""
+        from gui.dialogs.geheugen_diagnose_dialog import GeheugenDiagnoseDialog
+        dialog = GeheugenDiagnoseDialog(self, self.stack, self.scherm_cache)
+        dialog.exec()
+
     def load_theme_preference(self) -> None:
         """Laad theme voorkeur van ingelogde gebruiker uit database"""
         if not self.current_user:
@@ -476,9 +530,18 @@ def main() -> None:
     # Pas initieel thema toe
     window.apply_theme()
 
+    # Database onderhoud op de achtergrond (v0.6.29)
+    from config import ENABLE_DB_ONDERHOUD, DB_ONDERHOUD_IDLE_MINUTEN
+    if ENABLE_DB_ONDERHOUD:
+        from gui.onderhoud_scheduler import DatabaseOnderhoudScheduler
+        window.onderhoud_scheduler = DatabaseOnderhoudScheduler(app, DB_ONDERHOUD_IDLE_MINUTEN)
+        window.onderhoud_scheduler.start()
+
     window.show()
     sys.exit(app.exec())
 
 
 if __name__ == '__main__':
+    # Batch export workers (process pool) in een bevroren .exe build (v0.6.29)
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Database upgrade script: v0.6.28 -> v0.6.29
+Publicatie status per maand (maand_status tabel)
+
+Wijzigingen:
+- Nieuwe tabel: maand_status (1 rij per maand, bron van waarheid voor publicatie)
+- Maanden met gepubliceerde planning rijen worden overgenomen
+- Behouden: planning.status (legacy kolom, wordt niet meer bijgewerkt)
+
+HARDE OVERSTAP:
+v0.6.28 clients lezen/schrijven publicatie via planning.status, v0.6.29 clients
+via maand_status. Beide naast elkaar laten draaien geeft verschillende status
+per client. Na deze upgrade staat de database op 0.6.29 en weigeren oude
+clients te starten (database nieuwer dan applicatie).
+- Sluit eerst alle clients af, voer dan de upgrade uit
+- Script is herhaalbaar: opnieuw uitvoeren neemt publicaties van oude clients
+  (na een eerdere run) alsnog over
+
+Database versie wordt ge-update naar 0.6.29
+"""
+
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+
+
+def check_already_upgraded(cursor):
+    """Check of upgrade al is uitgevoerd"""
+    cursor.execute("SELECT COUNT(*) FROM db_metadata WHERE version_number = '0.6.29'")
+    if cursor.fetchone()[0] == 0:
+        return False
+
+    print("  OK Database versie 0.6.29 al geregistreerd")
+    return True
+
+
+def create_maand_status_tabel(cursor):
+    """Maak maand_status tabel aan (idempotent)"""
+    print("\n[1/3] Aanmaken maand_status tabel...")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS maand_status (
+            jaar INTEGER NOT NULL,
+            maand INTEGER NOT NULL CHECK(maand BETWEEN 1 AND 12),
+            status TEXT NOT NULL DEFAULT 'concept'
+                   CHECK(status IN ('concept', 'gepubliceerd')),
+            gepubliceerd_op TIMESTAMP,
+            gepubliceerd_door INTEGER,
+            versie INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (jaar, maand),
+            FOREIGN KEY (gepubliceerd_door) REFERENCES gebruikers(id)
+        )
+    """)
+
+    print("  OK maand_status tabel aanwezig")
+
+
+def backfill_maand_status(cursor):
+    """Neem gepubliceerde maanden over uit planning.status"""
+    print("\n[2/3] Overnemen gepubliceerde maanden uit planning.status...")
+
+    # Ook maanden die al een rij hebben: een oude client kan intussen
+    # (na lazy aanmaak door een nieuwe client) nog gepubliceerd hebben
+    cursor.execute("""
+        INSERT INTO maand_status (jaar, maand, status, versie)
+        SELECT DISTINCT
+            CAST(substr(datum, 1, 4) AS INTEGER),
+            CAST(substr(datum, 6, 2) AS INTEGER),
+            'gepubliceerd',
+            1
+        FROM planning
+        WHERE status = 'gepubliceerd'
+        ON CONFLICT(jaar, maand) DO UPDATE SET
+            status = 'gepubliceerd',
+            versie = maand_status.versie + 1
+        WHERE maand_status.status != 'gepubliceerd'
+    """)
+
+    cursor.execute("SELECT COUNT(*) FROM maand_status WHERE status = 'gepubliceerd'")
+    print(f"  OK {cursor.fetchone()[0]} gepubliceerde maanden")
+
+
+def update_db_version(cursor):
+    """Update database versie naar 0.6.29"""
+    print("\n[3/3] Updaten database versie...")
+
+    cursor.execute("""
+        INSERT INTO db_metadata (version_number, migration_description)
+        VALUES (?, ?)
+    """, ("0.6.29", "Publicatie status per maand (maand_status tabel, harde overstap)"))
+
+    print("  OK Database versie ge-update naar 0.6.29")
+
+
+def main():
+    """Voer upgrade uit"""
+    db_path = Path("data/planning.db")
+
+    if not db_path.exists():
+        print("ERROR: Database niet gevonden op:", db_path)
+        print("   Zorg dat het script wordt uitgevoerd vanuit de project root.")
+        return
+
+    print("\n" + "="*60)
+    print("Database Upgrade: v0.6.28 -> v0.6.29")
+    print("Publicatie Status per Maand")
+    print("="*60)
+    print("\nLET OP: alle clients moeten afgesloten zijn en naar v0.6.29 updaten.")
+
+    # Backup maken
+    backup_path = db_path.parent / f"planning.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+    print(f"\nBackup maken naar: {backup_path.name}")
+
+    import shutil
+    shutil.copy2(db_path, backup_path)
+    print("  OK Backup compleet")
+
+    # Database connectie
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    try:
+        # Tabel + backfill altijd (herhaalbaar), versie maar 1 keer registreren
+        create_maand_status_tabel(cursor)
+        backfill_maand_status(cursor)
+        if check_already_upgraded(cursor):
+            print("\nWaarschuwing: Database is al ge-upgrade naar v0.6.29")
+            print("  Enkel maand_status opnieuw gesynchroniseerd.")
+        else:
+            update_db_version(cursor)
+
+        # Commit
+        conn.commit()
+
+        print("\n" + "="*60)
+        print("SUCCESS: Upgrade succesvol afgerond!")
+        print("="*60)
+        print("\nWijzigingen:")
+        print("  - Nieuwe tabel: maand_status (publicatie per maand)")
+        print("  - planning.status behouden maar niet meer bijgewerkt")
+        print("  - Database versie: 0.6.29 (v0.6.28 clients starten niet meer)")
+        print("\nVolgende stappen:")
+        print("  1. Installeer v0.6.29 op alle clients")
+        print("  2. Start de applicatie")
+        print("  3. Verifieer in Planning Editor: gepubliceerde maanden tonen status 'Gepubliceerd'")
+        print(f"\nBackup bewaard als: {backup_path.name}")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\nERROR: Fout tijdens upgrade: {e}")
+        print(f"   Database is NIET gewijzigd (rollback uitgevoerd)")
+        print(f"   Backup beschikbaar: {backup_path.name}")
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# services/auto_generatie_service.py
+"""
+Auto-Generatie Service
+v0.6.29 - Planning genereren uit typetabel als diff + gechunkte writes
+
+Probleem: genereer_planning() deed 1 INSERT OR REPLACE per gebruiker per dag
+in één lange transactie op de GUI thread. Voor een jaar x 30 gebruikers hield
+dat de schrijf lock op de netwerkshare vast voor de volledige run, en cellen
+die al gelijk waren aan de typetabel werden toch herschreven.
+
+Oplossing:
+1. bereken_generatie_diff(): dry-run - typetabel projectie (RoosterProjectie)
+   vergelijken met de bestaande planning (RoosterStore). Geen writes.
+2. pas_diff_toe(): enkel de echte wijzigingen, via executemany in chunks van
+   CHUNK_GROOTTE. Elke chunk is een eigen transactie: de lock wordt tussen
+   chunks vrijgegeven, voortgang + annuleren per chunk.
+
+Beslissingslogica per cel (ongewijzigd t.o.v. v0.6.14):
+- Lege cel               → invullen met typetabel code
+- Speciale code          → beschermd (verlof, ziekte, RX, ...)
+- Gelijk aan typetabel   → ongewijzigd (wordt NIET meer herschreven)
+- Andere code            → beschermd (handmatig aangepast)
+- Gepubliceerde maand    → beschermd
+Notities blijven altijd behouden.
+
+GEBRUIK:
+    projectie = RoosterProjectie.laad()
+    diff = bereken_generatie_diff(projectie, date(2026, 1, 1), date(2026, 12, 31))
+    print(diff.samenvatting())
+    pas_diff_toe(diff.invullen, voortgang=lambda gedaan, totaal: True)
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence
+
+from database.connection import get_connection
+from services.planning_batch_service import Wijziging, schrijf_shifts
+from services.rooster_projectie import RoosterProjectie
+from services.rooster_store import laad_rooster
+
+
+# Rijen per transactie bij toepassen (korte locks op de share)
+CHUNK_GROOTTE = 500
+
+# voortgang(gedaan, totaal) → False = annuleren na huidige chunk
+VoortgangCallback = Callable[[int, int], bool]
+
+
+@dataclass
+class GeneratieDiff:
+    """Resultaat van een dry-run: wat generatie zou doen"""
+    invullen: List[Wijziging] = field(default_factory=list)
+    ongewijzigd: int = 0
+    beschermd_speciaal: int = 0
+    beschermd_handmatig: int = 0
+    beschermd_gepubliceerd: int = 0
+    invullen_per_gebruiker: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def beschermd(self) -> int:
+        return self.beschermd_speciaal + self.beschermd_handmatig + self.beschermd_gepubliceerd
+
+    def samenvatting(self) -> str:
+        return (f"{len(self.invullen)} invullen, {self.ongewijzigd} ongewijzigd, "
+                f"{self.beschermd} beschermd")
+
+
+def bereken_generatie_diff(projectie: RoosterProjectie, start_datum: date, eind_datum: date,
+                           conn: Optional[sqlite3.Connection] = None) -> GeneratieDiff:
+    """
+    Dry-run: vergelijk typetabel projectie met bestaande planning
+
+    Enkel gebruikers uit projectie.gebruikers (actief, niet-reserve, met werkposten).
+    """
+    geprojecteerd = projectie.projecteer(start_datum, eind_datum)
+    bestaand = laad_rooster(start_datum.isoformat(), eind_datum.isoformat(), conn=conn)
+
+    diff = GeneratieDiff()
+    for gebruiker in projectie.gebruikers:
+        gebruiker_id = gebruiker.gebruiker_id
+        for datum_str in geprojecteerd.datums:
+            code = geprojecteerd.get_code(datum_str, gebruiker_id)
+            bestaande_info = bestaand.get_code_info(datum_str, gebruiker_id)
+
+            if bestaand.get_status(datum_str) == 'gepubliceerd':
+                if code or bestaande_info:
+                    diff.beschermd_gepubliceerd += 1
+            elif bestaande_info is None:
+                # Lege cel - invullen (typetabel zonder code: niets te doen)
+                if code:
+                    diff.invullen.append((datum_str, gebruiker_id, code))
+                    diff.invullen_per_gebruiker[gebruiker_id] = \
+                        diff.invullen_per_gebruiker.get(gebruiker_id, 0) + 1
+            elif bestaande_info.is_speciale_code:
+                diff.beschermd_speciaal += 1
+            elif bestaande_info.code == code:
+                diff.ongewijzigd += 1
+            else:
+                diff.beschermd_handmatig += 1
+    return diff
+
+
+def pas_diff_toe(wijzigingen: Sequence[Wijziging], chunk_grootte: int = CHUNK_GROOTTE,
+                 voortgang: Optional[VoortgangCallback] = None,
+                 conn: Optional[sqlite3.Connection] = None) -> int:
+    """
+    Schrijf wijzigingen in chunks (1 transactie per chunk)
+
+    Enkel lege cellen worden ingevuld: een cel die sinds de dry-run
+    handmatig ingevuld werd, blijft behouden.
+
+    Returns:
+        Aantal verwerkte wijzigingen (< len(wijzigingen) bij annuleren)
+    """
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        gedaan = 0
+        totaal = len(wijzigingen)
+        while gedaan < totaal:
+            chunk = wijzigingen[gedaan:gedaan + chunk_grootte]
+            schrijf_shifts(chunk, conn, alleen_lege_cellen=True)
+            gedaan += len(chunk)
+            if voortgang is not None and not voortgang(gedaan, totaal):
+                break
+        return gedaan
+    finally:
+        if eigen:
+            conn.close()
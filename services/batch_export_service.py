@@ -0,0 +1,336 @@
+# services/batch_export_service.py
+"""
+Batch Export Service
+v0.6.29 - Meerdere maanden en persoonlijke roosters in 1 run, over een process pool
+
+Probleem: elke maand werd apart vanuit de editor geëxporteerd; elk bestand
+deed zijn eigen queries (planning, bemanning per dag, notities).
+
+Oplossing:
+1. laad_export_snapshot(): 1x laden voor de volledige periode - RoosterStore
+   (laad_rooster), gebruikers, dag kolommen per maand, bemannings controle
+   per maand (uit de snapshot, geen query per dag) en planner notities.
+2. Per bestand een taak met enkel zijn eigen deel van de snapshot (picklable,
+   geen database toegang in de workers).
+3. exporteer_batch(): taken over een ProcessPoolExecutor; voortgang +
+   annuleren zoals pas_diff_toe (callback → False = stoppen). Lopende
+   bestanden worden afgewerkt, wachtende taken geannuleerd.
+
+Bestanden:
+- Maand:    exports/<maandnaam>_<jaar>.xlsx (zelfde als export_maand_naar_excel,
+            met Validatie Rapport)
+- Teamlid:  exports/teamleden/<naam>_<eerste maand>_<laatste maand>.xlsx, 1 tab
+            per maand met enkel de eigen rij (zonder Validatie Rapport: die
+            bevat notities en bezetting van het hele team)
+
+GEBRUIK:
+    maanden = maanden_tussen((2025, 1), (2025, 12))
+    resultaat = exporteer_batch(maanden, per_teamlid=True,
+                                voortgang=lambda gedaan, totaal: True)
+    print(resultaat.samenvatting())
+"""
+
+import os
+import re
+import sqlite3
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from database.connection import get_connection
+from services.bemannings_controle_service import controleer_maand
+from services.export_service import (MAAND_NAMEN, DagKolom, bepaal_dag_kolommen, maand_bestand_naam,
+                                     schrijf_maand_bestand, schrijf_teamlid_bestand)
+from services.rooster_store import RoosterStore, laad_rooster
+
+
+# (jaar, maand)
+Maand = Tuple[int, int]
+
+# voortgang(gedaan, totaal) → False = annuleren (lopende bestanden worden afgewerkt)
+VoortgangCallback = Callable[[int, int], bool]
+
+# Exports folder (aangemaakt bij app start)
+EXPORT_DIR = Path("exports")
+TEAMLEDEN_SUBDIR = "teamleden"
+
+# Bovengrens workers (schrijven naar dezelfde share, Excel opbouw is CPU werk)
+MAX_PROCESSEN = 4
+
+# Seconden tussen voortgang callbacks tijdens het wachten (annuleren blijft responsief)
+POLL_INTERVAL = 0.2
+
+
+def maanden_tussen(eerste: Maand, laatste: Maand) -> List[Maand]:
+    """Alle maanden van eerste t/m laatste"""
+    jaar, maand = eerste
+    maanden = []
+    while (jaar, maand) <= laatste:
+        maanden.append((jaar, maand))
+        jaar, maand = (jaar + 1, 1) if maand == 12 else (jaar, maand + 1)
+    return maanden
+
+
+def _datums_van(jaar: int, maand: int) -> List[str]:
+    prefix = f"{jaar:04d}-{maand:02d}-"
+    dag = 1
+    datums = []
+    while True:
+        try:
+            date(jaar, maand, dag)
+        except ValueError:
+            return datums
+        datums.append(f"{prefix}{dag:02d}")
+        dag += 1
+
+
+@dataclass
+class ExportSnapshot:
+    """Alles wat de export bestanden nodig hebben, 1x geladen"""
+    maanden: List[Maand]
+    rooster: RoosterStore
+    teamleden: List[Tuple[int, str]]  # Export volgorde: actief, geen admin, reserves achteraan
+    dag_kolommen: Dict[Maand, List[DagKolom]] = field(default_factory=dict)
+    validatie: Dict[Maand, Dict] = field(default_factory=dict)
+    notities: Dict[str, List[str]] = field(default_factory=dict)  # {datum_str: ['Naam: tekst']}
+
+    def maand_planning(self, gebruiker_id: int, jaar: int, maand: int) -> Dict[str, str]:
+        """{datum_str: code} van 1 gebruiker in 1 maand"""
+        planning = {}
+        for datum_str in _datums_van(jaar, maand):
+            code = self.rooster.get_code(datum_str, gebruiker_id)
+            if code:
+                planning[datum_str] = code
+        return planning
+
+    def maand_rijen(self, jaar: int, maand: int) -> List[Dict[str, Any]]:
+        """Rijen voor de HR planning tab (zelfde formaat als iter_planning_data)"""
+        return [{'naam': naam, 'planning': self.maand_planning(gebruiker_id, jaar, maand)}
+                for gebruiker_id, naam in self.teamleden]
+
+    def maand_notities(self, jaar: int, maand: int) -> Dict[str, List[str]]:
+        prefix = f"{jaar:04d}-{maand:02d}-"
+        return {datum_str: notities for datum_str, notities in self.notities.items()
+                if datum_str.startswith(prefix)}
+
+
+def laad_export_snapshot(maanden: Sequence[Maand],
+                         conn: Optional[sqlite3.Connection] = None) -> ExportSnapshot:
+    """
+    Laad planning, gebruikers, kalender en bemanning voor alle maanden
+
+    Queries: laad_rooster (codes + planning range + gebruikers) en 1 gebruikers
+    query voor volgorde/actief; bemanning en notities worden uit de rooster
+    snapshot afgeleid met dezelfde filters als de losse queries.
+    """
+    maanden = sorted(set(maanden))
+    if not maanden:
+        raise ValueError("Geen maanden om te exporteren")
+    eerste_jaar, eerste_maand = maanden[0]
+    laatste_jaar, laatste_maand = maanden[-1]
+    start_datum = f"{eerste_jaar:04d}-{eerste_maand:02d}-01"
+    eind_datum = _datums_van(laatste_jaar, laatste_maand)[-1]
+
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        rooster = laad_rooster(start_datum, eind_datum, conn=conn)
+
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, gebruikersnaam, volledige_naam, is_reserve, is_actief
+            FROM gebruikers
+            ORDER BY is_reserve ASC, volledige_naam ASC, id
+        """)
+        gebruikers = cursor.fetchall()
+    finally:
+        if eigen:
+            conn.close()
+
+    # Zelfde selectie als iter_planning_data / get_werkelijke_codes
+    teamleden = [(row['id'], row['volledige_naam']) for row in gebruikers
+                 if row['is_actief'] == 1 and row['gebruikersnaam'] != 'admin']
+    actief: Set[int] = {row['id'] for row in gebruikers if row['is_actief'] == 1}
+    namen = {row['id']: row['volledige_naam'] for row in gebruikers}
+
+    snapshot = ExportSnapshot(list(maanden), rooster, teamleden)
+    for datum_str in rooster.datums:
+        # Planner notities ("[Planner]: ..."), op naam gesorteerd
+        notities = sorted(
+            (naam, notitie) for gebruiker_id, naam in namen.items()
+            for notitie in [rooster.get_notitie(datum_str, gebruiker_id)]
+            if notitie.lower().startswith('[planner]:')
+        )
+        if notities:
+            snapshot.notities[datum_str] = [f"{naam}: {notitie.replace('[Planner]: ', '').strip()}"
+                                            for naam, notitie in notities]
+
+    for jaar, maand in maanden:
+        werkelijke_per_dag = {}
+        for datum_str in _datums_van(jaar, maand):
+            werkelijke_per_dag[datum_str] = sorted(
+                ({'code': code, 'gebruiker_naam': namen[gebruiker_id], 'gebruiker_id': gebruiker_id}
+                 for gebruiker_id, code in rooster.codes_op_datum(datum_str) if gebruiker_id in actief),
+                key=lambda item: (item['code'], item['gebruiker_naam'])
+            )
+        snapshot.validatie[(jaar, maand)] = controleer_maand(jaar, maand, werkelijke_per_dag)
+        snapshot.dag_kolommen[(jaar, maand)] = bepaal_dag_kolommen(jaar, maand)
+    return snapshot
+
+
+# ============================================================================
+# TAKEN (draaien in worker processen - enkel picklable data, geen database)
+# ============================================================================
+
+def _maand_taak(bestand_pad: str, jaar: int, maand: int, rijen: List[Dict[str, Any]],
+                dag_kolommen: List[DagKolom], validatie: Dict, notities: Dict[str, List[str]]) -> str:
+    schrijf_maand_bestand(Path(bestand_pad), jaar, maand, rijen, dag_kolommen, validatie, notities)
+    return bestand_pad
+
+
+def _teamlid_taak(bestand_pad: str, naam: str,
+                  maanden: List[Tuple[int, int, Dict[str, str], List[DagKolom]]]) -> str:
+    schrijf_teamlid_bestand(Path(bestand_pad), naam, maanden)
+    return bestand_pad
+
+
+def teamlid_bestand_naam(naam: str, maanden: Sequence[Maand]) -> str:
+    """<naam>_<eerste maand>[_<laatste maand>].xlsx, veilig als bestandsnaam"""
+    veilige_naam = re.sub(r'[^\w\-]+', '_', naam).strip('_') or 'teamlid'
+    (eerste_jaar, eerste_maand), (laatste_jaar, laatste_maand) = maanden[0], maanden[-1]
+    periode = f"{MAAND_NAMEN[eerste_maand]}_{eerste_jaar}"
+    if len(maanden) > 1:
+        periode += f"_{MAAND_NAMEN[laatste_maand]}_{laatste_jaar}"
+    return f"{veilige_naam}_{periode}.xlsx"
+
+
+Taak = Tuple[str, Callable[..., str], tuple]  # (bestandsnaam, functie, args)
+
+
+def maak_taken(snapshot: ExportSnapshot, export_dir: Path = EXPORT_DIR, maand_bestanden: bool = True,
+               per_teamlid: bool = False, gebruiker_ids: Optional[Iterable[int]] = None) -> List[Taak]:
+    """Verdeel de snapshot in 1 taak per bestand"""
+    taken: List[Taak] = []
+    if maand_bestanden:
+        for jaar, maand in snapshot.maanden:
+            pad = export_dir / maand_bestand_naam(jaar, maand)
+            taken.append((pad.name, _maand_taak, (
+                str(pad), jaar, maand, snapshot.maand_rijen(jaar, maand),
+                snapshot.dag_kolommen[(jaar, maand)], snapshot.validatie[(jaar, maand)],
+                snapshot.maand_notities(jaar, maand)
+            )))
+
+    if per_teamlid:
+        teamleden_dir = export_dir / TEAMLEDEN_SUBDIR
+        teamleden_dir.mkdir(parents=True, exist_ok=True)
+        gekozen = set(gebruiker_ids) if gebruiker_ids is not None else None
+        for gebruiker_id, naam in snapshot.teamleden:
+            if gekozen is not None and gebruiker_id not in gekozen:
+                continue
+            pad = teamleden_dir / teamlid_bestand_naam(naam, snapshot.maanden)
+            maanden = [(jaar, maand, snapshot.maand_planning(gebruiker_id, jaar, maand),
+                        snapshot.dag_kolommen[(jaar, maand)])
+                       for jaar, maand in snapshot.maanden]
+            taken.append((pad.name, _teamlid_taak, (str(pad), naam, maanden)))
+    return taken
+
+
+# ============================================================================
+# UITVOEREN
+# ============================================================================
+
+@dataclass
+class BatchExportResultaat:
+    bestanden: List[str] = field(default_factory=list)
+    fouten: List[Tuple[str, str]] = field(default_factory=list)  # (bestandsnaam, melding)
+    totaal: int = 0
+    geannuleerd: bool = False
+
+    def samenvatting(self) -> str:
+        tekst = f"{len(self.bestanden)} van {self.totaal} bestanden geëxporteerd"
+        if self.fouten:
+            tekst += f", {len(self.fouten)} mislukt"
+        if self.geannuleerd:
+            tekst += " (geannuleerd)"
+        return tekst
+
+
+def exporteer_batch(maanden: Sequence[Maand], maand_bestanden: bool = True, per_teamlid: bool = False,
+                    gebruiker_ids: Optional[Iterable[int]] = None, export_dir: Path = EXPORT_DIR,
+                    processen: Optional[int] = None, voortgang: Optional[VoortgangCallback] = None,
+                    snapshot: Optional[ExportSnapshot] = None) -> BatchExportResultaat:
+    """
+    Exporteer maand bestanden en/of persoonlijke roosters
+
+    Args:
+        maanden: Te exporteren maanden (zie maanden_tussen)
+        maand_bestanden: 1 bestand per maand (HR formaat + Validatie Rapport)
+        per_teamlid: 1 bestand per teamlid over alle maanden
+        gebruiker_ids: Enkel deze teamleden (None = alle)
+        processen: Aantal workers (None = automatisch, 1 = in dit proces)
+        voortgang: voortgang(gedaan, totaal) → False = annuleren
+        snapshot: Eerder geladen snapshot (None = nu laden)
+
+    Returns:
+        BatchExportResultaat (fouten per bestand, bv. bestand open in Excel,
+        stoppen de rest van de batch niet)
+    """
+    if snapshot is None:
+        snapshot = laad_export_snapshot(maanden)
+    taken = maak_taken(snapshot, export_dir, maand_bestanden, per_teamlid, gebruiker_ids)
+
+    resultaat = BatchExportResultaat(totaal=len(taken))
+    if processen is None:
+        processen = min(MAX_PROCESSEN, max(1, (os.cpu_count() or 2) - 1))
+    processen = min(processen, len(taken))
+
+    if processen <= 1:
+        _voer_uit_in_proces(taken, voortgang, resultaat)
+    else:
+        _voer_uit_in_pool(taken, processen, voortgang, resultaat)
+    resultaat.bestanden.sort()
+    return resultaat
+
+
+def _voer_uit_in_proces(taken: List[Taak], voortgang: Optional[VoortgangCallback],
+                        resultaat: BatchExportResultaat) -> None:
+    for gedaan, (naam, functie, args) in enumerate(taken, start=1):
+        try:
+            resultaat.bestanden.append(functie(*args))
+        except Exception as e:
+            resultaat.fouten.append((naam, str(e)))
+        if voortgang is not None and not voortgang(gedaan, len(taken)) and gedaan < len(taken):
+            resultaat.geannuleerd = True
+            return
+
+
+def _voer_uit_in_pool(taken: List[Taak], processen: int, voortgang: Optional[VoortgangCallback],
+                      resultaat: BatchExportResultaat) -> None:
+    totaal = len(taken)
+    with ProcessPoolExecutor(max_workers=processen) as pool:
+        lopend = {pool.submit(functie, *args): naam for naam, functie, args in taken}
+        while lopend:
+            klaar, _ = wait(lopend, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in klaar:
+                _verzamel(future, lopend.pop(future), resultaat)
+
+            if voortgang is not None and not voortgang(totaal - len(lopend), totaal) and lopend:
+                # Wachtende taken annuleren, lopende afwerken
+                resultaat.geannuleerd = True
+                for future in lopend:
+                    future.cancel()
+                pool.shutdown(wait=True)
+                for future, naam in lopend.items():
+                    if not future.cancelled():
+                        _verzamel(future, naam, resultaat)
+                return
+
+
+def _verzamel(future, naam: str, resultaat: BatchExportResultaat) -> None:
+    try:
+        resultaat.bestanden.append(future.result())
+    except Exception as e:
+        resultaat.fouten.append((naam, str(e)))
@@ -23,6 +23,8 @@ Statussen:
 from datetime import datetime, date
 from typing import Dict, List, Tuple, Optional
 from database.connection import get_connection
+from services.dag_kalender import DagKalender
+from services.referentie_catalogus import ReferentieCatalogus
 
 
 def get_dag_type(datum: date) -> str:
@@ -32,25 +34,15 @@ def get_dag_type(datum: date) -> str:
     BELANGRIJK: Feestdagen worden behandeld als 'zondag' (v0.6.25 fix)
     Dit zorgt voor consistentie met shift invoer (waar feestdagen ook zondag shifts accepteren)
 
+    v0.6.29: opgezocht in de gedeelde DagKalender (geen query per datum)
+
     Args:
         datum: Date object
 
     Returns:
         'weekdag', 'zaterdag', of 'zondag'
     """
-    # Check eerst of het een feestdag is (feestdag = zondag)
-    if is_feestdag(datum):
-        return 'zondag'
-
-    # Anders: normale weekdag bepaling
-    weekdag = datum.weekday()  # 0=maandag, 6=zondag
-
-    if weekdag == 6:  # Zondag
-        return 'zondag'
-    elif weekdag == 5:  # Zaterdag
-        return 'zaterdag'
-    else:
-        return 'weekdag'
+    return DagKalender.get_instance(datum, datum).dag_type(datum)
 
 
 def is_feestdag(datum: date) -> bool:
@@ -63,21 +55,7 @@ def is_feestdag(datum: date) -> bool:
     Returns:
         True als feestdag, anders False
     """
-    datum_str = datum.strftime('%Y-%m-%d')
-
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT COUNT(*) as count
-        FROM feestdagen
-        WHERE datum = ?
-    """, (datum_str,))
-
-    result = cursor.fetchone()
-    conn.close()
-
-    return result['count'] > 0 if result else False
+    return DagKalender.get_instance(datum, datum).is_feestdag(datum)
 
 
 def get_verwachte_codes(datum: date) -> List[Dict]:
@@ -104,37 +82,18 @@ def get_verwachte_codes(datum: date) -> List[Dict]:
     """
     dag_type = get_dag_type(datum)
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            sc.code,
-            sc.shift_type,
-            sc.start_uur,
-            sc.eind_uur,
-            w.naam as werkpost_naam,
-            w.id as werkpost_id
-        FROM shift_codes sc
-        JOIN werkposten w ON sc.werkpost_id = w.id
-        WHERE sc.dag_type = ?
-        AND w.is_actief = 1
-        AND sc.is_kritisch = 1
-        ORDER BY w.naam, sc.shift_type
-    """, (dag_type,))
-
-    results = []
-    for row in cursor.fetchall():
-        results.append({
-            'code': row['code'],
-            'shift_type': row['shift_type'],
-            'start_uur': row['start_uur'],
-            'eind_uur': row['eind_uur'],
-            'werkpost_naam': row['werkpost_naam'],
-            'werkpost_id': row['werkpost_id']
-        })
-
-    return results
+    # v0.6.29: uit de ReferentieCatalogus (geen query per datum)
+    return [
+        {
+            'code': shift.code,
+            'shift_type': shift.shift_type,
+            'start_uur': shift.start_uur,
+            'eind_uur': shift.eind_uur,
+            'werkpost_naam': shift.werkpost.naam,
+            'werkpost_id': shift.werkpost_id
+        }
+        for shift in ReferentieCatalogus.get_instance().kritische_codes(dag_type)
+    ]
 
 
 def get_werkelijke_codes(datum: date) -> List[Dict]:
@@ -185,12 +144,14 @@ def get_werkelijke_codes(datum: date) -> List[Dict]:
     return results
 
 
-def controleer_bemanning(datum: date) -> Dict:
+def controleer_bemanning(datum: date, werkelijke_codes: Optional[List[Dict]] = None) -> Dict:
     """
     Controleer of bemanning compleet is voor een datum.
 
     Args:
         datum: Date object
+        werkelijke_codes: Planning in get_werkelijke_codes formaat; None = uit
+            de database (v0.6.29: batch export geeft een snapshot mee)
 
     Returns:
         Dict met validatie resultaten:
@@ -204,7 +165,8 @@ def controleer_bemanning(datum: date) -> Dict:
         }
     """
     verwachte_codes = get_verwachte_codes(datum)
-    werkelijke_codes = get_werkelijke_codes(datum)
+    if werkelijke_codes is None:
+        werkelijke_codes = get_werkelijke_codes(datum)
 
     # Maak lookup dictionaries
     verwacht_dict = {code['code']: code for code in verwachte_codes}
@@ -290,7 +252,7 @@ def valideer_datum_from_data(
     # Bepaal dag type
     dag_type = get_dag_type(datum)
 
-    # Haal verwachte kritische codes op (MOET nog steeds uit database)
+    # Haal verwachte kritische codes op (v0.6.29: uit ReferentieCatalogus)
     verwachte_codes = get_verwachte_codes(datum)
 
     if not verwachte_codes:
@@ -331,13 +293,15 @@ def valideer_datum_from_data(
         return 'groen'  # Volledig
 
 
-def controleer_maand(jaar: int, maand: int) -> Dict:
+def controleer_maand(jaar: int, maand: int,
+                     werkelijke_per_dag: Optional[Dict[str, List[Dict]]] = None) -> Dict:
     """
     Controleer bemanning voor hele maand.
 
     Args:
         jaar: Jaar (bijv. 2025)
         maand: Maand nummer (1-12)
+        werkelijke_per_dag: {datum_str: werkelijke codes} (v0.6.29); None = 1 query per dag
 
     Returns:
         Dict met validatie resultaten per dag:
@@ -372,7 +336,10 @@ def controleer_maand(jaar: int, maand: int) -> Dict:
     current_datum = eerste_dag
     while current_datum < volgende_maand_datum:
         datum_str = current_datum.strftime('%Y-%m-%d')
-        resultaat = controleer_bemanning(current_datum)
+        if werkelijke_per_dag is None:
+            resultaat = controleer_bemanning(current_datum)
+        else:
+            resultaat = controleer_bemanning(current_datum, werkelijke_per_dag.get(datum_str, []))
         dagen_resultaten[datum_str] = resultaat
 
         if resultaat['status'] == 'groen':
@@ -28,7 +28,7 @@ Datum: 3 November 2025
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
 
 # ============================================================================
@@ -182,16 +182,21 @@ class ConstraintChecker:
             }
     """
 
-    def __init__(self, hr_config: Dict[str, Any], shift_tijden: Dict[str, Dict[str, Any]]):
+    def __init__(self, hr_config: Dict[str, Any], shift_tijden: Dict[str, Dict[str, Any]],
+                 regels_index: Optional[Any] = None):
         """
         Initialize checker met configuratie
 
         Args:
             hr_config: HR regel waarden
             shift_tijden: Shift timing + flags
+            regels_index: Optioneel HRRegelsIndex (v0.6.29): regel waarden per
+                venster zoals ze op die datum golden; zonder index geldt hr_config
         """
         self.hr_config = hr_config
         self.shift_tijden = shift_tijden
+        self.regels_index = regels_index
+        self._breek_terms_cache: Dict[str, set] = {}
 
         # Validatie
         self._validate_config()
@@ -220,6 +225,35 @@ class ConstraintChecker:
     # HELPER METHODS (Sectie 1.2)
     # ========================================================================
 
+    def _regel_op(self, naam: str, datum: date, standaard: Any) -> Any:
+        """
+        Regel waarde die op datum gold (v0.6.29)
+
+        Args:
+            naam: hr_regels naam
+            datum: Referentie datum van het venster (week start, reeks start, ...)
+            standaard: Waarde uit hr_config (zonder index of bij gat in de versies)
+        """
+        if self.regels_index is None:
+            return standaard
+        waarde = self.regels_index.waarde_op(naam, datum)
+        return standaard if waarde is None else waarde
+
+    def _definitie_segmenten(self, naam: str, min_datum: date, max_datum: date,
+                             standaard: str) -> List[Tuple[date, date, str]]:
+        """
+        Deel [min_datum, max_datum] op waar een periode definitie wijzigt (v0.6.29)
+
+        Returns:
+            [(segment_start, segment_eind, definitie), ...] - 1 segment zonder index
+        """
+        if self.regels_index is None:
+            return [(min_datum, max_datum, standaard)]
+        starts = [min_datum] + self.regels_index.grenzen(naam, min_datum, max_datum)
+        return [(start, (starts[i + 1] - timedelta(days=1)) if i + 1 < len(starts) else max_datum,
+                 self._regel_op(naam, start, standaard))
+                for i, start in enumerate(starts)]
+
     def _bereken_shift_duur(self, shift_code: str) -> Optional[float]:
         """
         Bereken shift duur in uren
@@ -467,7 +501,7 @@ class ConstraintChecker:
             ConstraintCheckResult met violations
         """
         violations = []
-        min_rust_uren = float(self.hr_config['min_rust_uren'])
+        standaard_rust_uren = float(self.hr_config['min_rust_uren'])
 
         # Filter op gebruiker indien opgegeven
         if gebruiker_id:
@@ -513,7 +547,8 @@ class ConstraintChecker:
                 p2.datum, shift2_info['start_uur']
             )
 
-            # Violation als < min_rust_uren
+            # Violation als < min_rust_uren (versie geldig op dag 2)
+            min_rust_uren = float(self._regel_op('min_rust_uren', p2.datum, standaard_rust_uren))
             if rust_uren < min_rust_uren:
                 violations.append(Violation(
                     type=ViolationType.MIN_RUST_12U,
@@ -628,16 +663,12 @@ class ConstraintChecker:
             ConstraintCheckResult met violations
         """
         violations = []
-        max_uren = float(self.hr_config['max_uren_week'])
-        week_def = self.hr_config['week_definitie']
+        standaard_max_uren = float(self.hr_config['max_uren_week'])
 
         # Filter op gebruiker indien opgegeven
         if gebruiker_id:
             planning = [p for p in planning if p.gebruiker_id == gebruiker_id]
 
-        # Parse week definitie
-        start_dag, start_uur, eind_dag, eind_uur = self._parse_periode_definitie(week_def)
-
         # Bepaal weken in planning periode
         if not planning:
             return ConstraintCheckResult(passed=True, violations=[], metadata={})
@@ -645,14 +676,19 @@ class ConstraintChecker:
         min_datum = min(p.datum for p in planning)
         max_datum = max(p.datum for p in planning)
 
-        # Generate weken (sliding window)
-        weken = self._generate_weken(min_datum, max_datum, start_dag, start_uur, eind_dag, eind_uur)
+        # Generate weken (sliding window), per week_definitie versie (v0.6.29)
+        weken = self.week_vensters(min_datum, max_datum)
+
+        # Index per datum: per week enkel de dagen rond de week bekijken (v0.6.29)
+        per_datum = self._index_per_datum(planning)
 
         # Check elke week
         for week_start, week_eind, week_nummer in weken:
+            max_uren = float(self._regel_op('max_uren_week', week_start.date(), standaard_max_uren))
+
             # Haal shifts in deze week
             shifts_in_week = []
-            for p in planning:
+            for p in self._regels_rond_periode(per_datum, week_start, week_eind):
                 if not p.shift_code:
                     continue
 
@@ -702,6 +738,50 @@ class ConstraintChecker:
             metadata={'checked_weeks': len(weken), 'violations_count': len(violations)}
         )
 
+    def _index_per_datum(
+        self,
+        planning: List[PlanningRegel]
+    ) -> Dict[date, List[Tuple[int, PlanningRegel]]]:
+        """
+        Index planning per datum (v0.6.29)
+
+        Returns:
+            {datum: [(positie in planning, regel), ...]}
+        """
+        per_datum: Dict[date, List[Tuple[int, PlanningRegel]]] = {}
+        for i, p in enumerate(planning):
+            per_datum.setdefault(p.datum, []).append((i, p))
+        return per_datum
+
+    def _regels_rond_periode(
+        self,
+        per_datum: Dict[date, List[Tuple[int, PlanningRegel]]],
+        periode_start: datetime,
+        periode_eind: datetime
+    ) -> List[PlanningRegel]:
+        """
+        Regels die met periode kunnen overlappen (v0.6.29)
+
+        Een shift duurt hoogstens tot de volgende dag (middernacht crossing),
+        dus enkel de dag voor periode_start t/m de dag van periode_eind.
+        Volgorde = volgorde in planning (zelfde resultaat als volledige scan).
+
+        Args:
+            per_datum: Resultaat van _index_per_datum
+            periode_start: Periode start datetime
+            periode_eind: Periode eind datetime
+
+        Returns:
+            Kandidaat regels (overlap nog te checken)
+        """
+        kandidaten = []
+        dag = periode_start.date() - timedelta(days=1)
+        while dag <= periode_eind.date():
+            kandidaten.extend(per_datum.get(dag, ()))
+            dag += timedelta(days=1)
+        kandidaten.sort(key=lambda item: item[0])
+        return [p for _, p in kandidaten]
+
     def _parse_periode_definitie(self, waarde: str) -> Tuple[str, str, str, str]:
         """
         Parse 'ma-00:00|zo-23:59' -> (start_dag, start_uur, eind_dag, eind_uur)
@@ -722,6 +802,79 @@ class ConstraintChecker:
         return (start_dag.strip(), start_uur.strip(),
                 eind_dag.strip(), eind_uur.strip())
 
+    def _generate_vensters(
+        self,
+        generator: Callable[..., List[Tuple]],
+        naam: str,
+        min_datum: date,
+        max_datum: date,
+        standaard: str,
+        overlap_overslaan: bool = False
+    ) -> List[Tuple]:
+        """
+        Week/weekend vensters met de definitie die per segment gold (v0.6.29)
+
+        Per segment worden enkel vensters behouden die in het segment starten;
+        het eerste segment houdt ook het venster rond min_datum. Zonder
+        wijziging in de periode = exact generator(min_datum, max_datum, ...).
+
+        Args:
+            generator: _generate_weken of _generate_weekends
+            naam: 'week_definitie' of 'weekend_definitie'
+            overlap_overslaan: Venster dat het vorige overlapt weglaten (weekends:
+                hetzelfde weekend niet 2x tellen). Weken overlappen wel, anders
+                vallen dagen rond de wijziging buiten elke week.
+        """
+        vensters = []
+        for i, (start, eind, definitie) in enumerate(
+                self._definitie_segmenten(naam, min_datum, max_datum, standaard)):
+            for venster in generator(start, eind, *self._parse_periode_definitie(definitie)):
+                if i > 0 and venster[0].date() < start:
+                    continue
+                if overlap_overslaan and vensters and venster[0] < vensters[-1][1]:
+                    continue
+                vensters.append(venster)
+        return vensters
+
+    def week_vensters(self, min_datum: date, max_datum: date) -> List[Tuple[datetime, datetime, int]]:
+        """Weken rond [min_datum, max_datum] volgens week_definitie (ook gebruikt door DagKalender)"""
+        return self._generate_vensters(
+            self._generate_weken, 'week_definitie', min_datum, max_datum,
+            self.hr_config['week_definitie']
+        )
+
+    def weekend_vensters(self, min_datum: date, max_datum: date) -> List[Tuple[datetime, datetime]]:
+        """Weekends rond [min_datum, max_datum] volgens weekend_definitie (ook gebruikt door DagKalender)"""
+        return self._generate_vensters(
+            self._generate_weekends, 'weekend_definitie', min_datum, max_datum,
+            self.hr_config.get('weekend_definitie', 'vr-22:00|ma-06:00'),
+            overlap_overslaan=True
+        )
+
+    # Publieke shift helpers (v0.6.29) - voor validators buiten de checker
+    # (CyclusValidator), zelfde regels als de checks zelf
+
+    def is_werkdag_shift(self, shift_code: Optional[str]) -> bool:
+        """Shift telt als werkdag (telt_als_werkdag=1)"""
+        return self._is_werkdag_shift(shift_code)
+
+    def breekt_werk_reeks(self, shift_code: Optional[str]) -> bool:
+        """Shift breekt een werk reeks (RX, CX, verlof, geen shift)"""
+        return self._breekt_werk_reeks(shift_code)
+
+    def shift_duur(self, shift_code: str) -> Optional[float]:
+        """Shift duur in uren, None als geen tijden (speciale code)"""
+        return self._bereken_shift_duur(shift_code)
+
+    def shift_overlapt_venster(self, shift_datum: date, shift_code: str,
+                               venster_start: datetime, venster_eind: datetime) -> bool:
+        """Shift overlapt een week/weekend venster (exclusieve grenzen)"""
+        return self._shift_overlapt_week(shift_datum, shift_code, venster_start, venster_eind)
+
+    def check_rx_gaps(self, segment: List[PlanningRegel], max_gap: int) -> List[Violation]:
+        """RX gaps in 1 continu segment (zonder opsplitsen op lege cellen)"""
+        return self._check_rx_gap_in_segment(segment, max_gap)
+
     def _generate_weken(
         self,
         min_datum: date,
@@ -846,7 +999,7 @@ class ConstraintChecker:
             ConstraintCheckResult met violations
         """
         violations = []
-        max_dagen = int(self.hr_config.get('max_werkdagen_cyclus', 19))
+        standaard_max_dagen = int(self.hr_config.get('max_werkdagen_cyclus', 19))
 
         # Filter op gebruiker indien opgegeven
         if gebruiker_id:
@@ -865,6 +1018,7 @@ class ConstraintChecker:
             start = periode['start_datum']
             eind = periode['eind_datum']
             periode_nr = periode.get('periode_nummer', 0)
+            max_dagen = int(self._regel_op('max_werkdagen_cyclus', start, standaard_max_dagen))
 
             # Tel werkdagen in deze periode
             werkdagen = 0
@@ -1026,12 +1180,14 @@ class ConstraintChecker:
 
         Args:
             segment: Continu segment van planning regels (geen lege cellen)
-            max_gap: Maximaal aantal dagen tussen RX codes
+            max_gap: Maximaal aantal dagen tussen RX codes (versie op het
+                einde van elke gap gaat voor, v0.6.29)
 
         Returns:
             List van Violation objects
         """
         violations = []
+        standaard_gap = max_gap
 
         # Vind alle RX codes in segment (v0.6.26 - CRITICAL FIX: alleen RX, niet CX/Z)
         rx_dagen = []
@@ -1045,6 +1201,7 @@ class ConstraintChecker:
             rx2 = rx_dagen[i + 1]
 
             dagen_tussen = (rx2.datum - rx1.datum).days - 1  # Exclusief RX dagen zelf
+            max_gap = int(self._regel_op('max_dagen_tussen_rx', rx2.datum, standaard_gap))
 
             if dagen_tussen > max_gap:
                 violations.append(Violation(
@@ -1082,6 +1239,7 @@ class ConstraintChecker:
             if shifts_na_rx:
                 # Bereken gap tussen laatste RX en laatste shift
                 dagen_na_rx = (laatste_datum - laatste_rx.datum).days - 1  # Exclusief RX zelf
+                max_gap = int(self._regel_op('max_dagen_tussen_rx', laatste_datum, standaard_gap))
 
                 if dagen_na_rx > max_gap:
                     violations.append(Violation(
@@ -1130,7 +1288,7 @@ class ConstraintChecker:
             ConstraintCheckResult met violations
         """
         violations = []
-        max_reeks = int(self.hr_config.get('max_werkdagen_reeks', 7))
+        standaard_max_reeks = int(self.hr_config.get('max_werkdagen_reeks', 7))
 
         # Filter op gebruiker indien opgegeven
         if gebruiker_id:
@@ -1170,7 +1328,9 @@ class ConstraintChecker:
                     werkdagen_reeks += 1
                     reeks_shifts.append(p)
 
-                    # Check violation
+                    # Check violation (versie geldig bij start van de reeks)
+                    max_reeks = int(self._regel_op('max_werkdagen_reeks', reeks_start_datum,
+                                                   standaard_max_reeks))
                     if werkdagen_reeks > max_reeks:
                         violations.append(Violation(
                             type=ViolationType.MAX_WERKDAGEN_REEKS,
@@ -1231,8 +1391,7 @@ class ConstraintChecker:
             ConstraintCheckResult met violations
         """
         violations = []
-        max_weekends = int(self.hr_config.get('max_weekends_achter_elkaar', 6))
-        weekend_def = self.hr_config.get('weekend_definitie', 'vr-22:00|ma-06:00')
+        standaard_max_weekends = int(self.hr_config.get('max_weekends_achter_elkaar', 6))
 
         # Filter op gebruiker indien opgegeven
         if gebruiker_id:
@@ -1241,23 +1400,23 @@ class ConstraintChecker:
         if not planning:
             return ConstraintCheckResult(passed=True, violations=[], metadata={})
 
-        # Parse weekend definitie
-        start_dag, start_uur, eind_dag, eind_uur = self._parse_periode_definitie(weekend_def)
-
         # Bepaal datumbereik
         min_datum = min(p.datum for p in planning)
         max_datum = max(p.datum for p in planning)
 
-        # Generate weekends
-        weekends = self._generate_weekends(min_datum, max_datum, start_dag, start_uur, eind_dag, eind_uur)
+        # Generate weekends, per weekend_definitie versie (v0.6.29)
+        weekends = self.weekend_vensters(min_datum, max_datum)
+
+        # Index per datum: per weekend enkel de dagen rond het weekend bekijken (v0.6.29)
+        per_datum = self._index_per_datum(planning)
 
         # Check welke weekends gewerkt zijn
         gewerkte_weekends = []
-        for weekend_start, weekend_eind in weekends:
+        for weekend_index, (weekend_start, weekend_eind) in enumerate(weekends):
             heeft_shifts = False
             weekend_shifts = []
 
-            for p in planning:
+            for p in self._regels_rond_periode(per_datum, weekend_start, weekend_eind):
                 if not p.shift_code:
                     continue
 
@@ -1268,6 +1427,7 @@ class ConstraintChecker:
 
             if heeft_shifts:
                 gewerkte_weekends.append({
+                    'index': weekend_index,
                     'start': weekend_start,
                     'eind': weekend_eind,
                     'shifts': weekend_shifts
@@ -1279,13 +1439,15 @@ class ConstraintChecker:
             reeks_start = gewerkte_weekends[0]
 
             for i in range(1, len(gewerkte_weekends)):
-                # Check of opeenvolgend (7 dagen verschil)
-                dagen_verschil = (gewerkte_weekends[i]['start'].date() - gewerkte_weekends[i-1]['start'].date()).days
-
-                if dagen_verschil == 7:  # Opeenvolgend weekend
+                # Check of opeenvolgend (volgend venster = 7 dagen verder, ook over
+                # een wijziging van de weekend definitie heen - v0.6.29)
+                if gewerkte_weekends[i]['index'] - gewerkte_weekends[i-1]['index'] == 1:
                     reeks_length += 1
 
-                    # Check violation
+                    # Check violation (versie geldig in het laatste weekend)
+                    max_weekends = int(self._regel_op('max_weekends_achter_elkaar',
+                                                      gewerkte_weekends[i]['start'].date(),
+                                                      standaard_max_weekends))
                     if reeks_length > max_weekends:
                         all_shifts = []
                         for j in range(i - reeks_length + 1, i + 1):
@@ -1447,8 +1609,7 @@ class ConstraintChecker:
             ConstraintCheckResult met violations
         """
         # Lees breek terms uit HR config (default: verlof,ziek)
-        breek_terms_str = self.hr_config.get('Nacht gevolgd door vroeg verboden', 'verlof,ziek')
-        breek_terms = {term.strip() for term in breek_terms_str.split(',')}
+        standaard_breek_terms = self.hr_config.get('Nacht gevolgd door vroeg verboden', 'verlof,ziek')
 
         # Filter planning op gebruiker
         if gebruiker_id is not None:
@@ -1472,6 +1633,9 @@ class ConstraintChecker:
             # Nacht gevonden - activeer "nacht-modus" en scan vooruit
             nacht_datum = huidige.datum
             verwachte_datum = nacht_datum
+            breek_terms = self._breek_terms(
+                self._regel_op('Nacht gevolgd door vroeg verboden', nacht_datum, standaard_breek_terms)
+            )
 
             # Scan vooruit totdat patroon doorbroken wordt
             for j in range(i + 1, len(planning)):
@@ -1548,6 +1712,14 @@ class ConstraintChecker:
             metadata={'violations_count': len(violations)}
         )
 
+    def _breek_terms(self, waarde: str) -> set:
+        """'verlof,ziek' -> {'verlof', 'ziek'} (gecachet per waarde, v0.6.29)"""
+        terms = self._breek_terms_cache.get(waarde)
+        if terms is None:
+            terms = {term.strip() for term in waarde.split(',')}
+            self._breek_terms_cache[waarde] = terms
+        return terms
+
     def _is_rx_of_cx(self, shift_code: str) -> bool:
         """
         Check of shift_code een RX (zondagrust) of CX (zaterdagrust) is
@@ -0,0 +1,233 @@
+# services/dag_kalender.py
+"""
+Dag Kalender
+v0.6.29 - Kalender feiten per dag 1x vooraf berekend, gedeeld door services en grids
+
+Probleem: dezelfde kalender feiten werden per cel of per check opnieuw
+bepaald: is_feestdag() deed een query per aanroep (get_dag_type →
+get_verwachte_codes, per datum), get_datum_achtergrond/bepaal_dag_type
+parsten de datum en zochten in een feestdagen lijst, export en validator
+hadden elk een eigen feestdagen query en weken/weekends werden per check
+opnieuw gegenereerd.
+
+Oplossing: voor een datum bereik [van, tot] arrays geïndexeerd op dag
+nummer (datum - van):
+- weekdagen:      0=ma .. 6=zo
+- dag_types:      index in DAG_TYPES, feestdag = zondag (zelfde regel als
+                  bemannings controle, shift invoer en typetabel projectie)
+- feestdag_namen: naam of None
+- iso_weken:      ISO weeknummer
+- week_ids / weekend_ids: volgnummer van het geconfigureerde venster
+                  (week_definitie / weekend_definitie, zoals ConstraintChecker
+                  ze genereert, per regel versie); -1 = geen venster
+                  (weekdag buiten het weekend). Opeenvolgende vensters hebben
+                  opeenvolgende ids binnen 1 kalender.
+- rode_lijn_ids:  rode lijn periode nummer (RodeLijnenKalender), 0 = geen
+
+Lookups zijn een dict/array index. Datums buiten het bereik worden
+rechtstreeks berekend (zonder feestdag, venster of rode lijn).
+
+GEBRUIK:
+    kalender = DagKalender.get_instance(van, tot)   # breidt gedeelde kalender uit indien nodig
+    kalender.dag_type('2025-12-25')                 # 'zondag' (Kerstmis)
+    kalender.feestdag_naam(date(2025, 12, 25))      # 'Kerstmis'
+    i = kalender.dag_nummer(datum); kalender.weekend_ids[i]
+    DagKalender.refresh()                           # na wijziging feestdagen / HR regels / rode lijnen
+"""
+
+import sqlite3
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from database.connection import get_connection
+from services.constraint_checker import ConstraintChecker
+from services.hr_regels_index import HRRegelsIndex
+from services.rode_lijnen_service import RodeLijnenKalender
+
+# dag_type index (gedeeld met RoosterProjectie lookup tabellen)
+DAG_TYPES = ('weekdag', 'zaterdag', 'zondag')
+ZONDAG = DAG_TYPES.index('zondag')
+DAG_TYPE_PER_WEEKDAG = (0, 0, 0, 0, 0, 1, 2)  # weekday() → dag_type index
+
+# date, datetime of 'YYYY-MM-DD' (eventueel met tijd)
+Datum = Union[date, str]
+
+# (venster_start, venster_eind, ...) zoals ConstraintChecker.week_vensters
+Venster = Tuple[datetime, ...]
+
+
+def _als_date(datum: Datum) -> date:
+    if isinstance(datum, datetime):
+        return datum.date()
+    if isinstance(datum, date):
+        return datum
+    return date.fromisoformat(datum[:10])
+
+
+class DagKalender:
+    """Kalender feiten voor elke dag in [van, tot], geïndexeerd op dag nummer"""
+
+    _instance: Optional['DagKalender'] = None
+
+    def __init__(self, van: date, tot: date,
+                 feestdagen: Optional[Mapping[str, str]] = None,
+                 week_vensters: Sequence[Venster] = (),
+                 weekend_vensters: Sequence[Venster] = (),
+                 rode_lijnen: Optional[RodeLijnenKalender] = None):
+        """
+        Args:
+            van, tot: Bereik (inclusief); tot < van = lege kalender
+            feestdagen: {datum_str: naam}
+            week_vensters / weekend_vensters: ConstraintChecker vensters rond [van, tot]
+            rode_lijnen: Kalender voor rode_lijn_ids (None = geen rode lijnen)
+        """
+        self.van = van
+        self.tot = tot
+        aantal = max((tot - van).days + 1, 0)
+        datums = [van + timedelta(days=i) for i in range(aantal)]
+        feestdagen = feestdagen or {}
+
+        self._index: Dict[str, int] = {datum.isoformat(): i for i, datum in enumerate(datums)}
+        self.weekdagen = array('b', (datum.weekday() for datum in datums))
+        self.feestdag_namen: List[Optional[str]] = [feestdagen.get(datum.isoformat()) for datum in datums]
+        self.dag_types = array('b', (ZONDAG if naam else DAG_TYPE_PER_WEEKDAG[weekdag]
+                                     for weekdag, naam in zip(self.weekdagen, self.feestdag_namen)))
+        self.iso_weken = array('b', (datum.isocalendar()[1] for datum in datums))
+        self.week_ids = self._venster_ids(week_vensters, aantal)
+        self.weekend_ids = self._venster_ids(weekend_vensters, aantal)
+
+        self.rode_lijn_ids = array('i', bytes(4 * aantal))
+        if rode_lijnen is not None and aantal:
+            for periode in rode_lijnen.periodes(van, tot):
+                eerste = max((periode.start_datum - van).days, 0)
+                laatste = min((periode.eind_datum - van).days, aantal - 1)
+                self.rode_lijn_ids[eerste:laatste + 1] = array('i', [periode.periode_nummer]) * (laatste - eerste + 1)
+
+    def _venster_ids(self, vensters: Sequence[Venster], aantal: int) -> array:
+        """Dag → eerste venster dat de dag (00:00-24:00) overlapt, -1 = geen"""
+        ids = array('i', [-1]) * aantal
+        for venster_id, venster in enumerate(vensters):
+            start, eind = venster[0], venster[1]
+            dag = max((start.date() - self.van).days, 0)
+            while dag < aantal:
+                dag_start = datetime.combine(self.van + timedelta(days=dag), datetime.min.time())
+                if dag_start >= eind:
+                    break
+                # Zelfde exclusieve grenzen als ConstraintChecker._check_periode_overlap
+                if dag_start + timedelta(days=1) > start and ids[dag] == -1:
+                    ids[dag] = venster_id
+                dag += 1
+        return ids
+
+    # ---------------------------------------------------------------- lookups
+
+    def dag_nummer(self, datum: Datum) -> Optional[int]:
+        """Index in de arrays (None buiten het bereik)"""
+        if isinstance(datum, str):
+            return self._index.get(datum[:10])
+        nummer = (_als_date(datum) - self.van).days
+        return nummer if 0 <= nummer < len(self.weekdagen) else None
+
+    def bevat(self, van: date, tot: date) -> bool:
+        return self.van <= van and tot <= self.tot
+
+    def weekdag(self, datum: Datum) -> int:
+        i = self.dag_nummer(datum)
+        return self.weekdagen[i] if i is not None else _als_date(datum).weekday()
+
+    def dag_type(self, datum: Datum) -> str:
+        """'weekdag', 'zaterdag' of 'zondag' (feestdag = zondag)"""
+        i = self.dag_nummer(datum)
+        if i is None:
+            return DAG_TYPES[DAG_TYPE_PER_WEEKDAG[_als_date(datum).weekday()]]
+        return DAG_TYPES[self.dag_types[i]]
+
+    def is_feestdag(self, datum: Datum) -> bool:
+        return self.feestdag_naam(datum) is not None
+
+    def feestdag_naam(self, datum: Datum) -> Optional[str]:
+        i = self.dag_nummer(datum)
+        return self.feestdag_namen[i] if i is not None else None
+
+    def iso_week(self, datum: Datum) -> int:
+        i = self.dag_nummer(datum)
+        return self.iso_weken[i] if i is not None else _als_date(datum).isocalendar()[1]
+
+    def week_id(self, datum: Datum) -> Optional[int]:
+        i = self.dag_nummer(datum)
+        return self.week_ids[i] if i is not None and self.week_ids[i] >= 0 else None
+
+    def weekend_id(self, datum: Datum) -> Optional[int]:
+        """Weekend venster van de dag (None = geen weekend dag of buiten bereik)"""
+        i = self.dag_nummer(datum)
+        return self.weekend_ids[i] if i is not None and self.weekend_ids[i] >= 0 else None
+
+    def rode_lijn_periode(self, datum: Datum) -> Optional[int]:
+        i = self.dag_nummer(datum)
+        return (self.rode_lijn_ids[i] or None) if i is not None else None
+
+    def feestdagen(self) -> Dict[str, str]:
+        """{datum_str: naam} binnen het bereik"""
+        return {datum_str: self.feestdag_namen[i] for datum_str, i in self._index.items()
+                if self.feestdag_namen[i] is not None}
+
+    # ---------------------------------------------------------------- laden
+
+    @classmethod
+    def leeg(cls) -> 'DagKalender':
+        """Kalender zonder dagen (alle lookups rechtstreeks berekend)"""
+        vandaag = date.today()
+        return cls(vandaag, vandaag - timedelta(days=1))
+
+    @classmethod
+    def laad(cls, van: date, tot: date, conn: Optional[sqlite3.Connection] = None) -> 'DagKalender':
+        """Feestdagen (1 query), HR regel versies en rode lijn config voor [van, tot]"""
+        eigen = conn is None
+        if eigen:
+            conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT datum, naam FROM feestdagen
+                WHERE datum >= ? AND datum <= ?
+            """, (van.isoformat(), tot.isoformat()))
+            feestdagen = {row['datum']: row['naam'] for row in cursor.fetchall()}
+
+            index = HRRegelsIndex.laad(conn)
+            checker = ConstraintChecker(index.config_op(van), {}, regels_index=index)
+            return cls(van, tot, feestdagen,
+                       week_vensters=checker.week_vensters(van, tot),
+                       weekend_vensters=checker.weekend_vensters(van, tot),
+                       rode_lijnen=RodeLijnenKalender.laad(conn))
+        finally:
+            if eigen:
+                conn.close()
+
+    @classmethod
+    def get_instance(cls, van: Optional[date] = None, tot: Optional[date] = None) -> 'DagKalender':
+        """
+        Gedeelde kalender die minstens [van, tot] bevat
+
+        Standaard vorig jaar t/m volgend jaar; een groter bereik laadt de
+        kalender 1x opnieuw (ids zijn enkel binnen 1 instantie vergelijkbaar).
+        """
+        jaar = date.today().year
+        van = min(_als_date(van), date(jaar - 1, 1, 1)) if van else date(jaar - 1, 1, 1)
+        tot = max(_als_date(tot), date(jaar + 1, 12, 31)) if tot else date(jaar + 1, 12, 31)
+        huidig = cls._instance
+        if huidig is None or not huidig.bevat(van, tot):
+            if huidig is not None:
+                van, tot = min(van, huidig.van), max(tot, huidig.tot)
+            cls._instance = cls.laad(van, tot)
+        return cls._instance
+
+    @classmethod
+    def voor_jaren(cls, eerste_jaar: int, laatste_jaar: int) -> 'DagKalender':
+        """Gedeelde kalender voor volledige jaren"""
+        return cls.get_instance(date(eerste_jaar, 1, 1), date(laatste_jaar, 12, 31))
+
+    @classmethod
+    def refresh(cls):
+        """Herladen bij volgende get_instance(); na wijziging feestdagen, HR regels of rode lijn config"""
+        cls._instance = None
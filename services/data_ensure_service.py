@@ -4,8 +4,10 @@ Auto-generatie service voor ontbrekende data
 Lazy initialization pattern: genereer alleen wat nodig is, wanneer het nodig is
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from database.connection import get_connection
+from services.dag_kalender import DagKalender
+from services.rode_lijnen_service import RodeLijnenKalender, synchroniseer_rode_lijnen_cache
 
 
 def bereken_pasen(jaar):
@@ -42,6 +44,7 @@ def ensure_jaar_data(jaar):
     # Feestdagen
     if not feestdagen_bestaan(jaar):
         genereer_feestdagen_template(jaar)
+        DagKalender.refresh()
         warnings.append({
             'type': 'feestdagen_gegenereerd',
             'jaar': jaar,
@@ -164,61 +167,32 @@ def rode_lijnen_bestaan_tot(datum):
 
 def extend_rode_lijnen_tot(doel_datum):
     """
-    Extend rode lijnen tot doel_datum
+    Extend rode lijnen cache tot doel_datum
+    v0.6.29: periodes komen uit RodeLijnenKalender (rode_lijnen is enkel nog cache)
     Returns: aantal toegevoegde periodes
     """
+    if isinstance(doel_datum, datetime):
+        doel_datum = doel_datum.date()
+
     conn = get_connection()
     cursor = conn.cursor()
 
-    # Haal actieve config op voor start en interval
-    cursor.execute("""
-        SELECT start_datum, interval_dagen FROM rode_lijnen_config
-        WHERE is_actief = 1
-        ORDER BY actief_vanaf DESC
-        LIMIT 1
-    """)
-    config = cursor.fetchone()
+    # Haal laatste rode lijn in de cache
+    cursor.execute("SELECT MAX(start_datum) FROM rode_lijnen")
+    laatste_datum = cursor.fetchone()[0]
+    van = date.fromisoformat(laatste_datum[:10]) + timedelta(days=1) if laatste_datum else date.min
 
-    if not config:
-        # Fallback naar oude defaults
-        config_start_datum = datetime(2024, 7, 28)
-        interval = 28
-    else:
-        config_start_datum = datetime.fromisoformat(config[0])
-        interval = config[1]
-
-    # Haal laatste rode lijn en hoogste periode nummer
-    cursor.execute("SELECT MAX(start_datum), MAX(periode_nummer) FROM rode_lijnen")
-    result = cursor.fetchone()
-    laatste_datum = result[0]
-    laatste_nummer = result[1] or 0  # Start bij 0 als er geen periodes zijn
-
-    if not laatste_datum:
-        # Geen rode lijnen, start vanaf config start datum
-        start = config_start_datum
-        periode_nummer = 1
-    else:
-        # Start na de laatste periode (gebruik interval uit config)
-        start = datetime.fromisoformat(laatste_datum) + timedelta(days=interval)
-        periode_nummer = laatste_nummer + 1
-
-    # Genereer tot doel
-    toegevoegd = 0
-    huidige = start
-
-    while huidige <= doel_datum:
-        eind_datum = huidige + timedelta(days=interval - 1)  # X dagen cyclus (eind is inclusief)
-        cursor.execute("""
-            INSERT INTO rode_lijnen (periode_nummer, start_datum, eind_datum)
-            VALUES (?, ?, ?)
-        """, (periode_nummer, huidige.isoformat(), eind_datum.isoformat()))
-        huidige += timedelta(days=interval)
-        periode_nummer += 1
-        toegevoegd += 1
+    nieuwe = [periode for periode in RodeLijnenKalender.laad(conn).periodes(van, doel_datum)
+              if periode.start_datum >= van]
+    cursor.executemany("""
+        INSERT OR IGNORE INTO rode_lijnen (periode_nummer, start_datum, eind_datum)
+        VALUES (?, ?, ?)
+    """, [(p.periode_nummer, p.start_datum.isoformat(), p.eind_datum.isoformat()) for p in nieuwe])
 
     conn.commit()
     conn.close()
 
+    toegevoegd = len(nieuwe)
     if toegevoegd > 0:
         print(f"  ✓ {toegevoegd} rode lijnen periodes toegevoegd tot {doel_datum.strftime('%d-%m-%Y')}")
 
@@ -231,101 +205,25 @@ def regenereer_rode_lijnen_vanaf(actief_vanaf_str: str):
 
     Gebruikt:
     - Na het wijzigen van rode lijnen configuratie
-    - Verwijdert toekomstige rode lijnen vanaf actief_vanaf
-    - Genereert nieuwe rode lijnen met nieuwe config tot +2 jaar
+    - v0.6.29: RodeLijnenKalender herladen (berekent periodes uit alle config
+      versies) en de rode_lijnen cache herschrijven tot +2 jaar
 
     Args:
         actief_vanaf_str: ISO datum string (YYYY-MM-DD) vanaf wanneer nieuwe config actief is
+
+    Returns:
+        Aantal periodes in de cache
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    RodeLijnenKalender.refresh()
+    DagKalender.refresh()
 
     try:
-        actief_vanaf = datetime.fromisoformat(actief_vanaf_str).date()
-
-        # Stap 1: Verwijder alle rode lijnen vanaf actief_vanaf datum
-        cursor.execute("""
-            DELETE FROM rode_lijnen
-            WHERE start_datum >= ?
-        """, (actief_vanaf.isoformat(),))
-
-        verwijderd = cursor.rowcount
-        print(f"  [OK] {verwijderd} rode lijnen periodes verwijderd vanaf {actief_vanaf.isoformat()}")
-
-        # Stap 2: Haal nieuwe actieve config op
-        cursor.execute("""
-            SELECT start_datum, interval_dagen FROM rode_lijnen_config
-            WHERE is_actief = 1
-            ORDER BY actief_vanaf DESC
-            LIMIT 1
-        """)
-        config = cursor.fetchone()
-
-        if not config:
-            print("  [WARNING] Geen actieve rode lijnen configuratie gevonden")
-            conn.close()
-            return 0
-
-        config_start_datum = datetime.fromisoformat(config[0]).date()
-        interval = config[1]
-
-        # Stap 3: Bepaal vanaf waar we moeten starten
-        # Check of config_start_datum >= actief_vanaf (nieuwe cyclus start)
-        if config_start_datum >= actief_vanaf:
-            # Nieuwe cyclus: start vanaf config start datum
-            start_datum = config_start_datum
-
-            # Haal hoogste periode nummer voor nummering
-            cursor.execute("SELECT MAX(periode_nummer) FROM rode_lijnen WHERE start_datum < ?",
-                          (config_start_datum.isoformat(),))
-            laatste_nummer = cursor.fetchone()[0] or 0
-            periode_nummer = laatste_nummer + 1
-        else:
-            # Continue bestaande cyclus: haal laatste rode lijn vóór actief_vanaf
-            cursor.execute("""
-                SELECT MAX(start_datum), MAX(periode_nummer) FROM rode_lijnen
-                WHERE start_datum < ?
-            """, (actief_vanaf.isoformat(),))
-
-            result = cursor.fetchone()
-            laatste_datum_str = result[0]
-            laatste_nummer = result[1] or 0
-
-            if laatste_datum_str:
-                # Er zijn rode lijnen voor actief_vanaf - continue vanaf daar
-                laatste_datum = datetime.fromisoformat(laatste_datum_str).date()
-                start_datum = laatste_datum + timedelta(days=interval)
-                periode_nummer = laatste_nummer + 1
-            else:
-                # Geen rode lijnen voor actief_vanaf - start vanaf config start
-                start_datum = config_start_datum
-                periode_nummer = 1
-
-        # Stap 4: Genereer nieuwe rode lijnen tot +2 jaar
         doel_datum = datetime.now().date() + timedelta(days=730)  # +2 jaar
-
-        toegevoegd = 0
-        huidige = start_datum
-
-        while huidige <= doel_datum:
-            eind_datum = huidige + timedelta(days=interval - 1)
-            cursor.execute("""
-                INSERT INTO rode_lijnen (periode_nummer, start_datum, eind_datum)
-                VALUES (?, ?, ?)
-            """, (periode_nummer, huidige.isoformat(), eind_datum.isoformat()))
-
-            huidige += timedelta(days=interval)
-            periode_nummer += 1
-            toegevoegd += 1
-
-        conn.commit()
-        print(f"  [OK] {toegevoegd} nieuwe rode lijnen periodes gegenereerd tot {doel_datum.isoformat()}")
-
-        return toegevoegd
+        aantal = synchroniseer_rode_lijnen_cache(doel_datum)
+        print(f"  [OK] Rode lijnen herberekend vanaf {actief_vanaf_str[:10]}: "
+              f"{aantal} periodes tot {doel_datum.isoformat()}")
+        return aantal
 
     except Exception as e:
-        conn.rollback()
         print(f"  [ERROR] Fout bij regenereren rode lijnen: {e}")
         raise
-    finally:
-        conn.close()
\ No newline at end of file
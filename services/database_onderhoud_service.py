@@ -0,0 +1,504 @@
+# services/database_onderhoud_service.py
+"""
+Database Onderhoud Service
+v0.6.29 - Periodiek onderhoud van de SQLite database
+
+Taken:
+- analyze: ANALYZE zodat de query planner sqlite_stat1 statistieken heeft
+- vacuum: vrije pagina's terugwinnen na bulk deletes en auto-generatie overschrijvingen
+  * auto_vacuum = INCREMENTAL → PRAGMA incremental_vacuum (in kleine stappen)
+  * auto_vacuum = NONE → overgeslagen; de eenmalige omzetting naar INCREMENTAL
+    (volledige VACUUM) is een expliciete admin actie: converteer_naar_incremental()
+    via het Database Onderhoud scherm, met alle andere gebruikers afgemeld.
+    Een volledige VACUUM herschrijft het hele bestand op de share onder een
+    exclusieve lock en hoort dus niet in het automatische onderhoud.
+- wal_checkpoint: WAL checkpoint (alleen als journal_mode = WAL, zie scripts/enable_wal_mode.py)
+  * PASSIVE normaal, TRUNCATE als het WAL bestand groot geworden is
+
+LEADER ELECTION:
+De database staat op een netwerkshare en meerdere clients draaien tegelijk.
+Slechts één client mag onderhoud uitvoeren: die client neemt een lease in de
+db_onderhoud_lock tabel (1 rij). De lease verloopt automatisch zodat een
+gecrashte client het onderhoud niet blokkeert.
+
+HISTORIEK:
+Elke uitgevoerde taak wordt gelogd in db_onderhoud_log met duur en database
+grootte, zodat het admin scherm (DatabaseOnderhoudScreen) trends kan tonen.
+
+USAGE:
+    from services.database_onderhoud_service import voer_onderhoud_uit
+
+    resultaten = voer_onderhoud_uit()            # alleen verlopen taken
+    resultaten = voer_onderhoud_uit(forceer=True)  # alle taken nu
+    resultaat = converteer_naar_incremental()      # admin, eenmalig
+"""
+from typing import Dict, Any, List, Optional, Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+import os
+import socket
+import sqlite3
+import time
+import uuid
+
+from database.connection import get_connection
+
+
+# Interval per taak (uren) - taak wordt pas opnieuw uitgevoerd na dit interval
+TAAK_INTERVALLEN: Dict[str, int] = {
+    'analyze': 24,
+    'vacuum': 24 * 7,
+    'wal_checkpoint': 1,
+}
+
+# Lease duur voor leader election (ruim boven de duur van een onderhoudsronde)
+LEASE_SECONDEN = 10 * 60
+
+# Lease voor de eenmalige omzetting (volledige VACUUM kan lang duren op de share)
+CONVERSIE_LEASE_SECONDEN = 2 * 60 * 60
+
+# Vrije pagina ratio waarboven de omzetting naar INCREMENTAL aanbevolen wordt
+VACUUM_DREMPEL_RATIO = 0.20
+
+# Max pagina's per incremental_vacuum stap (kort write lock op de share)
+INCREMENTAL_VACUUM_PAGINAS = 2000
+
+# WAL groter dan dit → TRUNCATE checkpoint ipv PASSIVE
+WAL_TRUNCATE_DREMPEL_BYTES = 16 * 1024 * 1024
+
+# Aantal log regels dat bewaard blijft
+MAX_LOG_REGELS = 2000
+
+# Unieke id voor deze app instantie (host + proces + random suffix)
+CLIENT_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def _nu() -> datetime:
+    return datetime.now().replace(microsecond=0)
+
+
+def ensure_onderhoud_tabellen(conn: sqlite3.Connection) -> None:
+    """Maak lock + log tabellen aan indien nodig (lazy, geen schema upgrade nodig)"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS db_onderhoud_lock (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            client_id TEXT NOT NULL,
+            verloopt_op TIMESTAMP NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS db_onderhoud_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            taak TEXT NOT NULL,
+            gestart_op TIMESTAMP NOT NULL,
+            duur_ms INTEGER NOT NULL,
+            db_grootte_bytes INTEGER,
+            wal_grootte_bytes INTEGER,
+            vrije_paginas INTEGER,
+            succes BOOLEAN DEFAULT 1,
+            details TEXT,
+            client_id TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_db_onderhoud_log_taak
+        ON db_onderhoud_log(taak, gestart_op)
+    """)
+    conn.commit()
+
+
+# ============================================================================
+# LEADER ELECTION
+# ============================================================================
+
+def probeer_leiderschap(conn: sqlite3.Connection, client_id: str = CLIENT_ID,
+                        lease_seconden: int = LEASE_SECONDEN) -> bool:
+    """
+    Probeer de onderhoud lease te nemen (of te verlengen)
+
+    Returns:
+        True als deze client nu leider is, False als een andere client
+        een geldige lease heeft of de database bezet is
+    """
+    nu = _nu()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT client_id, verloopt_op FROM db_onderhoud_lock WHERE id = 1"
+        ).fetchone()
+
+        if row and row[0] != client_id and datetime.fromisoformat(row[1]) > nu:
+            conn.rollback()
+            return False
+
+        conn.execute("""
+            INSERT OR REPLACE INTO db_onderhoud_lock (id, client_id, verloopt_op)
+            VALUES (1, ?, ?)
+        """, (client_id, (nu + timedelta(seconds=lease_seconden)).isoformat()))
+        conn.commit()
+        return True
+
+    except sqlite3.OperationalError:
+        # Database locked door andere client - volgende keer opnieuw
+        if conn.in_transaction:
+            conn.rollback()
+        return False
+
+
+def geef_leiderschap_vrij(conn: sqlite3.Connection, client_id: str = CLIENT_ID) -> None:
+    """Geef lease vrij (alleen als deze client de houder is)"""
+    try:
+        conn.execute("DELETE FROM db_onderhoud_lock WHERE id = 1 AND client_id = ?", (client_id,))
+        conn.commit()
+    except sqlite3.OperationalError:
+        # Lease verloopt vanzelf
+        pass
+
+
+def get_huidige_leider(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+    """Haal huidige lease houder op (None als geen geldige lease)"""
+    row = conn.execute(
+        "SELECT client_id, verloopt_op FROM db_onderhoud_lock WHERE id = 1"
+    ).fetchone()
+    if not row or datetime.fromisoformat(row[1]) <= _nu():
+        return None
+    return {'client_id': row[0], 'verloopt_op': row[1]}
+
+
+# ============================================================================
+# DATABASE METRICS
+# ============================================================================
+
+def _db_bestand(conn: sqlite3.Connection) -> Optional[Path]:
+    """Pad van het main database bestand (None voor in-memory)"""
+    for row in conn.execute("PRAGMA database_list").fetchall():
+        if row[1] == 'main' and row[2]:
+            return Path(row[2])
+    return None
+
+
+def get_db_metrics(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """
+    Verzamel grootte en fragmentatie info
+
+    Returns: dict met page_size, page_count, vrije_paginas, db_grootte_bytes,
+             wal_grootte_bytes, journal_mode, auto_vacuum, heeft_statistieken
+    """
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    vrije_paginas = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+    heeft_statistieken = conn.execute("""
+        SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'
+    """).fetchone()[0] > 0
+
+    wal_grootte = 0
+    db_bestand = _db_bestand(conn)
+    if db_bestand:
+        wal_pad = Path(f"{db_bestand}-wal")
+        if wal_pad.exists():
+            wal_grootte = wal_pad.stat().st_size
+
+    return {
+        'page_size': page_size,
+        'page_count': page_count,
+        'vrije_paginas': vrije_paginas,
+        'db_grootte_bytes': page_size * page_count,
+        'wal_grootte_bytes': wal_grootte,
+        'journal_mode': str(journal_mode).lower(),
+        'auto_vacuum': {0: 'none', 1: 'full', 2: 'incremental'}.get(auto_vacuum, str(auto_vacuum)),
+        'heeft_statistieken': heeft_statistieken,
+    }
+
+
+# ============================================================================
+# ONDERHOUD TAKEN
+# ============================================================================
+
+def taak_analyze(conn: sqlite3.Connection) -> str:
+    """Vernieuw query planner statistieken (sqlite_stat1)"""
+    conn.execute("ANALYZE")
+    conn.commit()
+    return "ANALYZE uitgevoerd"
+
+
+def taak_vacuum(conn: sqlite3.Connection) -> str:
+    """Win vrije pagina's terug (incrementeel waar mogelijk)"""
+    metrics = get_db_metrics(conn)
+    vrije_paginas = metrics['vrije_paginas']
+
+    if vrije_paginas == 0:
+        return "Geen vrije pagina's"
+
+    if metrics['auto_vacuum'] == 'incremental':
+        # Pragma tot het einde stappen, anders komt maar 1 pagina per aanroep vrij.
+        # execute().fetchall() stapt niet verder (pragma zonder resultaat kolommen),
+        # executescript wel.
+        conn.executescript(f"PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_PAGINAS});")
+        conn.commit()
+        vrijgemaakt = vrije_paginas - conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return f"incremental_vacuum: {vrijgemaakt} van {vrije_paginas} pagina's"
+
+    # Geen volledige VACUUM in automatisch onderhoud (exclusieve lock op de share)
+    ratio = vrije_paginas / max(metrics['page_count'], 1)
+    tekst = f"Overgeslagen: auto_vacuum = {metrics['auto_vacuum'].upper()}, {ratio:.0%} vrij"
+    if ratio >= VACUUM_DREMPEL_RATIO:
+        tekst += " - omzetten naar INCREMENTAL aanbevolen (Database Onderhoud scherm)"
+    return tekst
+
+
+def conversie_aanbevolen(metrics: Dict[str, Any]) -> bool:
+    """Database nog niet INCREMENTAL en veel vrije pagina's"""
+    return (metrics['auto_vacuum'] != 'incremental'
+            and metrics['vrije_paginas'] / max(metrics['page_count'], 1) >= VACUUM_DREMPEL_RATIO)
+
+
+def taak_wal_checkpoint(conn: sqlite3.Connection) -> str:
+    """Checkpoint WAL bestand (no-op als database niet in WAL mode staat)"""
+    metrics = get_db_metrics(conn)
+    if metrics['journal_mode'] != 'wal':
+        return f"Overgeslagen: journal_mode = {metrics['journal_mode']}"
+
+    modus = 'TRUNCATE' if metrics['wal_grootte_bytes'] > WAL_TRUNCATE_DREMPEL_BYTES else 'PASSIVE'
+    busy, log_frames, gecheckpoint = conn.execute(f"PRAGMA wal_checkpoint({modus})").fetchone()
+    return f"{modus}: {gecheckpoint}/{log_frames} frames (busy={busy})"
+
+
+ONDERHOUD_TAKEN: Dict[str, Callable[[sqlite3.Connection], str]] = {
+    'analyze': taak_analyze,
+    'vacuum': taak_vacuum,
+    'wal_checkpoint': taak_wal_checkpoint,
+}
+
+
+# ============================================================================
+# PLANNING + UITVOERING
+# ============================================================================
+
+def bepaal_verlopen_taken(conn: sqlite3.Connection, nu: Optional[datetime] = None) -> List[str]:
+    """Return taken waarvan de laatste succesvolle run ouder is dan hun interval"""
+    nu = nu or _nu()
+    verlopen = []
+
+    for taak, interval_uren in TAAK_INTERVALLEN.items():
+        row = conn.execute("""
+            SELECT MAX(gestart_op) FROM db_onderhoud_log
+            WHERE taak = ? AND succes = 1
+        """, (taak,)).fetchone()
+
+        laatste = row[0] if row else None
+        if not laatste or datetime.fromisoformat(laatste) + timedelta(hours=interval_uren) <= nu:
+            verlopen.append(taak)
+
+    return verlopen
+
+
+def _log_taak(conn: sqlite3.Connection, taak: str, gestart_op: datetime, duur_ms: int,
+              succes: bool, details: str, client_id: str) -> Dict[str, Any]:
+    """Schrijf log regel met actuele database grootte"""
+    metrics = get_db_metrics(conn)
+    conn.execute("""
+        INSERT INTO db_onderhoud_log
+        (taak, gestart_op, duur_ms, db_grootte_bytes, wal_grootte_bytes,
+         vrije_paginas, succes, details, client_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (taak, gestart_op.isoformat(), duur_ms, metrics['db_grootte_bytes'],
+          metrics['wal_grootte_bytes'], metrics['vrije_paginas'], 1 if succes else 0,
+          details, client_id))
+    conn.commit()
+
+    return {
+        'taak': taak,
+        'gestart_op': gestart_op.isoformat(),
+        'duur_ms': duur_ms,
+        'succes': succes,
+        'details': details,
+        'db_grootte_bytes': metrics['db_grootte_bytes'],
+    }
+
+
+def voer_onderhoud_uit(
+    taken: Optional[List[str]] = None,
+    forceer: bool = False,
+    client_id: str = CLIENT_ID,
+    conn_factory: Callable[[], sqlite3.Connection] = get_connection
+) -> List[Dict[str, Any]]:
+    """
+    Voer onderhoud uit als deze client leider kan worden
+
+    Args:
+        taken: Subset van ONDERHOUD_TAKEN (default: alle)
+        forceer: True = negeer intervallen (knop "Nu uitvoeren")
+        client_id: Identiteit voor leader election
+        conn_factory: Connection factory (voor tests)
+
+    Returns:
+        List van resultaat dicts (leeg als niets te doen of geen leider)
+    """
+    conn = conn_factory()
+    resultaten: List[Dict[str, Any]] = []
+
+    try:
+        ensure_onderhoud_tabellen(conn)
+
+        te_doen = taken or list(ONDERHOUD_TAKEN.keys())
+        if not forceer:
+            verlopen = set(bepaal_verlopen_taken(conn))
+            te_doen = [t for t in te_doen if t in verlopen]
+
+        if not te_doen:
+            return resultaten
+
+        if not probeer_leiderschap(conn, client_id):
+            return resultaten
+
+        try:
+            for taak in te_doen:
+                functie = ONDERHOUD_TAKEN.get(taak)
+                if not functie:
+                    continue
+
+                gestart_op = _nu()
+                start = time.perf_counter()
+                try:
+                    details = functie(conn)
+                    succes = True
+                except sqlite3.Error as e:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    details = f"Fout: {e}"
+                    succes = False
+                duur_ms = int((time.perf_counter() - start) * 1000)
+
+                resultaten.append(_log_taak(conn, taak, gestart_op, duur_ms, succes, details, client_id))
+
+            # Oude log regels opruimen
+            conn.execute("""
+                DELETE FROM db_onderhoud_log
+                WHERE id <= (SELECT MAX(id) FROM db_onderhoud_log) - ?
+            """, (MAX_LOG_REGELS,))
+            conn.commit()
+
+        finally:
+            geef_leiderschap_vrij(conn, client_id)
+
+    except sqlite3.Error:
+        # Onderhoud mag de applicatie nooit onderbreken
+        pass
+    finally:
+        conn.close()
+
+    return resultaten
+
+
+def converteer_naar_incremental(
+    client_id: str = CLIENT_ID,
+    conn_factory: Callable[[], sqlite3.Connection] = get_connection
+) -> Optional[Dict[str, Any]]:
+    """
+    Eenmalige omzetting naar auto_vacuum = INCREMENTAL (admin actie)
+
+    Volledige VACUUM: herschrijft het hele bestand onder een exclusieve lock,
+    dus enkel uitvoeren als alle andere gebruikers afgemeld zijn. Neemt de
+    onderhoud lease met CONVERSIE_LEASE_SECONDEN zodat een andere client het
+    automatische onderhoud niet overneemt tijdens de omzetting.
+
+    Returns:
+        Resultaat dict (gelogd als taak 'vacuum_conversie'), of None als een
+        andere client de lease heeft of de database bezet is
+    """
+    conn = conn_factory()
+    try:
+        ensure_onderhoud_tabellen(conn)
+        if not probeer_leiderschap(conn, client_id, lease_seconden=CONVERSIE_LEASE_SECONDEN):
+            return None
+
+        try:
+            gestart_op = _nu()
+            start = time.perf_counter()
+            voor = get_db_metrics(conn)
+            try:
+                # auto_vacuum wijziging wordt pas actief na VACUUM
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+                details = (f"VACUUM uitgevoerd ({voor['vrije_paginas']} vrije pagina's), "
+                           f"auto_vacuum {voor['auto_vacuum'].upper()} → INCREMENTAL")
+                succes = True
+            except sqlite3.Error as e:
+                details = f"Fout: {e}"
+                succes = False
+            duur_ms = int((time.perf_counter() - start) * 1000)
+            return _log_taak(conn, 'vacuum_conversie', gestart_op, duur_ms, succes, details, client_id)
+        finally:
+            geef_leiderschap_vrij(conn, client_id)
+    finally:
+        conn.close()
+
+
+# ============================================================================
+# HISTORIEK (admin scherm)
+# ============================================================================
+
+def get_onderhoud_historiek(limit: int = 200,
+                            conn_factory: Callable[[], sqlite3.Connection] = get_connection) -> List[Dict[str, Any]]:
+    """Laatste onderhoud runs (nieuwste eerst)"""
+    conn = conn_factory()
+    try:
+        ensure_onderhoud_tabellen(conn)
+        cursor = conn.execute("""
+            SELECT taak, gestart_op, duur_ms, db_grootte_bytes, wal_grootte_bytes,
+                   vrije_paginas, succes, details, client_id
+            FROM db_onderhoud_log
+            ORDER BY id DESC
+            LIMIT ?
+        """, (limit,))
+        kolommen = [d[0] for d in cursor.description]
+        return [dict(zip(kolommen, row)) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+def get_grootte_per_dag(dagen: int = 90,
+                        conn_factory: Callable[[], sqlite3.Connection] = get_connection) -> List[Dict[str, Any]]:
+    """
+    Database grootte over tijd (laatste meting per dag)
+
+    Returns: [{'dag': 'YYYY-MM-DD', 'db_grootte_bytes': X, 'wal_grootte_bytes': Y}, ...]
+    """
+    conn = conn_factory()
+    try:
+        ensure_onderhoud_tabellen(conn)
+        vanaf = (_nu() - timedelta(days=dagen)).isoformat()
+        cursor = conn.execute("""
+            SELECT substr(l.gestart_op, 1, 10) AS dag, l.db_grootte_bytes, l.wal_grootte_bytes
+            FROM db_onderhoud_log l
+            JOIN (
+                SELECT MAX(id) AS id FROM db_onderhoud_log
+                WHERE gestart_op >= ?
+                GROUP BY substr(gestart_op, 1, 10)
+            ) laatste ON laatste.id = l.id
+            ORDER BY dag
+        """, (vanaf,))
+        return [
+            {'dag': row[0], 'db_grootte_bytes': row[1], 'wal_grootte_bytes': row[2]}
+            for row in cursor.fetchall()
+        ]
+    finally:
+        conn.close()
+
+
+def get_db_status(conn_factory: Callable[[], sqlite3.Connection] = get_connection) -> Dict[str, Any]:
+    """Actuele metrics + lease houder + verlopen taken (voor admin scherm)"""
+    conn = conn_factory()
+    try:
+        ensure_onderhoud_tabellen(conn)
+        status = get_db_metrics(conn)
+        status['leider'] = get_huidige_leider(conn)
+        status['verlopen_taken'] = bepaal_verlopen_taken(conn)
+        status['conversie_aanbevolen'] = conversie_aanbevolen(status)
+        status['client_id'] = CLIENT_ID
+        return status
+    finally:
+        conn.close()
@@ -3,15 +3,21 @@
 Export Service voor Planning Tool
 Genereert Excel exports van planning voor HR
 v0.6.20: Validatie Rapport tab toegevoegd
+v0.6.29: Write-only workbook met gestreamde rijen, 1 planning query en named styles
 """
 
 from pathlib import Path
-from datetime import datetime, date
+from datetime import date
+from itertools import chain, groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from database.connection import get_connection
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
 from openpyxl.utils import get_column_letter
 from services.bemannings_controle_service import controleer_maand, format_ontbrekende_codes, format_dubbele_codes
+from services.dag_kalender import DagKalender
+from services.rode_lijnen_service import RodeLijnenKalender
 import calendar
 
 
@@ -65,10 +71,85 @@ def get_planner_notities_voor_maand(jaar: int, maand: int) -> dict:
     return notities_per_dag
 
 
+# HR Kleur definities (exact uit voorbeeld)
+HR_KLEUREN = {
+    'maand_header': 'FFDDEBF7',      # Lichtblauw voor maandnaam cel
+    'datum_header': 'FFBDD7EE',      # Iets donkerder blauw voor datum info
+    'naam_kolom': 'FFD3D3D3',        # Lichtgrijs voor Naam kolom
+    'feestdag': 'FFF0E68C',          # Geel voor feestdagen
+    'weekend': 'FFF8CBAD',           # Oranje voor za/zo
+    'werkdag': 'FFBFBFBF',           # Grijs voor alle weekdagen (ma/di/wo/do/vr)
+}
+
+# Randen per naam (rood = rode lijn start, zoals de rode lijn in de planner)
+_RANDEN = {
+    'dun': Side(style='thin'),
+    'dik': Side(style='medium'),
+    'rood': Side(style='medium', color='FFFF0000'),
+    None: Side(),
+}
+
+# Workbook standaard font (voor stijlen die enkel vulling/randen zetten)
+_STANDAARD_FONT = Font(name='Calibri', size=11)
+
+# Per dag kolom: (kleur sleutel in HR_KLEUREN, linker rand, rechter rand)
+DagKolom = Tuple[str, str, str]
+
+MAAND_KORT = {
+    1: 'jan', 2: 'feb', 3: 'mrt', 4: 'apr', 5: 'mei', 6: 'jun',
+    7: 'jul', 8: 'aug', 9: 'sep', 10: 'okt', 11: 'nov', 12: 'dec'
+}
+
+
+def _vulling(kleur: Optional[str]) -> PatternFill:
+    if kleur is None:
+        return PatternFill()
+    return PatternFill(start_color=kleur, end_color=kleur, fill_type='solid')
+
+
+class ExportStijlen:
+    """
+    Named styles van 1 export workbook (v0.6.29)
+
+    Elke stijl wordt 1x aangemaakt en geregistreerd; cellen verwijzen er
+    enkel naar (geen Font/Border/PatternFill objecten per cel).
+    """
+
+    def __init__(self, wb: Workbook):
+        self.wb = wb
+        self._namen: set = set()
+
+    def stijl(self, naam: str, font: Font, kleur: Optional[str] = None,
+              uitlijning: Optional[Alignment] = None, links: Optional[str] = None,
+              rechts: Optional[str] = None, boven: Optional[str] = None,
+              onder: Optional[str] = None) -> str:
+        """Registreer de stijl bij eerste gebruik; geeft de naam terug"""
+        if naam not in self._namen:
+            self.wb.add_named_style(NamedStyle(
+                name=naam,
+                font=font,
+                fill=_vulling(kleur),
+                alignment=uitlijning or Alignment(),
+                border=Border(left=_RANDEN[links], right=_RANDEN[rechts],
+                              top=_RANDEN[boven], bottom=_RANDEN[onder])
+            ))
+            self._namen.add(naam)
+        return naam
+
+    @staticmethod
+    def cel(ws, waarde, stijl: str) -> WriteOnlyCell:
+        cel = WriteOnlyCell(ws, waarde)
+        cel.style = stijl
+        return cel
+
+
 def export_maand_naar_excel(jaar: int, maand: int) -> str:
     """
     Exporteer planning van een maand naar Excel bestand (HR formaat)
 
+    v0.6.29: write-only workbook; rijen worden gestreamd uit 1 range query
+    en verwijzen naar gedeelde named styles.
+
     Args:
         jaar: Jaar (bijv. 2025)
         maand: Maand nummer (1-12)
@@ -79,272 +160,226 @@ def export_maand_naar_excel(jaar: int, maand: int) -> str:
     # Exports directory (wordt aangemaakt bij app start)
     export_dir = Path("exports")
 
-    # Bestandsnaam: maandnaam_jaartal.xlsx
-    maand_naam = MAAND_NAMEN[maand]
-    bestand_naam = f"{maand_naam}_{jaar}.xlsx"
-    bestand_pad = export_dir / bestand_naam
-
-    # Haal planning data op
-    planning_data = haal_planning_data(jaar, maand)
-
-    # Maak Excel bestand
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Blad1'
-
-    # HR Kleur definities (exact uit voorbeeld)
-    COLORS = {
-        'maand_header': 'FFDDEBF7',      # Lichtblauw voor maandnaam cel
-        'datum_header': 'FFBDD7EE',      # Iets donkerder blauw voor datum info
-        'naam_kolom': 'FFD3D3D3',        # Lichtgrijs voor Naam kolom
-        'feestdag': 'FFF0E68C',          # Geel voor feestdagen
-        'weekend': 'FFF8CBAD',           # Oranje voor za/zo
-        'werkdag': 'FFBFBFBF',           # Grijs voor alle weekdagen (ma/di/wo/do/vr)
-    }
-
-    # Haal feestdagen op voor deze maand
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT strftime('%d', datum) as dag
-        FROM feestdagen
-        WHERE strftime('%Y', datum) = ?
-        AND strftime('%m', datum) = ?
-    """, (str(jaar), str(maand).zfill(2)))
-    feestdag_dagen = {int(row['dag']) for row in cursor.fetchall()}
-    conn.close()
-
-    # Styling definities
-    border_thin = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    border_medium = Border(
-        left=Side(style='medium'),
-        right=Side(style='medium'),
-        top=Side(style='medium')
-    )
-    center_alignment = Alignment(horizontal='center', vertical='center')
+    bestand_pad = export_dir / maand_bestand_naam(jaar, maand)
 
-    # Bepaal alle dagen in de maand
-    dagen_in_maand = calendar.monthrange(jaar, maand)[1]
-    first_day = datetime(jaar, maand, 1)
-    last_day = datetime(jaar, maand, dagen_in_maand)
+    schrijf_maand_bestand(bestand_pad, jaar, maand, iter_planning_data(jaar, maand))
+    return str(bestand_pad)
 
-    datums = []
-    for dag in range(1, dagen_in_maand + 1):
-        datum = datetime(jaar, maand, dag)
-        datums.append(datum)
 
-    # ============== RIJ 1: LEEG ==============
+def maand_bestand_naam(jaar: int, maand: int) -> str:
+    """Bestandsnaam: maandnaam_jaartal.xlsx"""
+    return f"{MAAND_NAMEN[maand]}_{jaar}.xlsx"
 
-    # ============== RIJ 2: HEADER ==============
-    # Kolom A - Maandnaam (wordt later verticaal gemerged)
-    cell_a2 = ws['A2']
-    cell_a2.value = maand_naam.upper()
-    cell_a2.font = Font(name='Arial', size=14, bold=True, color='FF000000')
-    cell_a2.fill = PatternFill(start_color=COLORS['maand_header'],
-                                end_color=COLORS['maand_header'],
-                                fill_type='solid')
-    cell_a2.alignment = center_alignment
-    cell_a2.border = Border(
-        left=Side(style='medium'),
-        right=Side(style='medium'),
-        top=Side(style='medium')
-    )
-
-    # Kolom B - Maand/Jaar (formaat: mmm/jj, bijv. "jan/26")
-    maand_kort = {
-        1: 'jan', 2: 'feb', 3: 'mrt', 4: 'apr', 5: 'mei', 6: 'jun',
-        7: 'jul', 8: 'aug', 9: 'sep', 10: 'okt', 11: 'nov', 12: 'dec'
-    }
-    jaar_kort = str(jaar)[-2:]  # Laatste 2 cijfers van jaar
-    cell_b2 = ws['B2']
-    cell_b2.value = f"{maand_kort[maand]}/{jaar_kort}"
-    cell_b2.font = Font(name='Arial', size=11, bold=True)
-    cell_b2.fill = PatternFill(start_color=COLORS['datum_header'],
-                                end_color=COLORS['datum_header'],
-                                fill_type='solid')
-    cell_b2.alignment = center_alignment
-    cell_b2.border = Border(
-        left=Side(style='medium'),
-        top=Side(style='medium')
-    )
-
-    # Kolom C - Beschrijving (gemerged over alle dagen)
-    cell_c2 = ws['C2']
-    cell_c2.value = f"Diensttabel van {first_day.strftime('%d-%m-%Y')} tot {last_day.strftime('%d-%m-%Y')}"
-    cell_c2.font = Font(name='Arial', size=11, bold=True, color='FF000000')
-    cell_c2.fill = PatternFill(start_color=COLORS['datum_header'],
-                                end_color=COLORS['datum_header'],
-                                fill_type='solid')
-    cell_c2.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    cell_c2.border = Border(
-        left=Side(style='medium'),
-        top=Side(style='medium'),
-        bottom=Side(style='medium')
-    )
-
-    # Merge C2 tot laatste dag kolom
-    last_col = get_column_letter(2 + dagen_in_maand)
-    ws.merge_cells(f'C2:{last_col}2')
 
-    # ============== RIJ 3: KOLOMKOPPEN ==============
-    # Kolom B - "Naam + Voornaam"
-    cell_b3 = ws['B3']
-    cell_b3.value = 'Naam + Voornaam'
-    cell_b3.font = Font(name='Arial', size=10, bold=True, color='FF000000')
-    cell_b3.fill = PatternFill(start_color=COLORS['naam_kolom'],
-                                end_color=COLORS['naam_kolom'],
-                                fill_type='solid')
-    cell_b3.alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
-    cell_b3.border = Border(
-        left=Side(style='medium'),
-        right=Side(style='thin'),
-        top=Side(style='medium'),
-        bottom=Side(style='medium')
-    )
-
-    # Kolom C+ - Dagnummers met weekend kleuren
-    for dag in range(1, dagen_in_maand + 1):
-        col_idx = 2 + dag  # Kolom C is dag 1
-        cell = ws.cell(row=3, column=col_idx)
-        cell.value = dag
-        cell.font = Font(name='Arial', size=10, bold=True, color='FF000000')
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-        # Bepaal dag van de week voor kleur
-        date = datetime(jaar, maand, dag)
-        weekday = date.weekday()  # 0=maandag, 6=zondag
-
-        # Kleur toewijzen: feestdag > weekend > werkdag
-        if dag in feestdag_dagen:  # Feestdag geel
-            color = COLORS['feestdag']
-        elif weekday >= 5:  # Weekend (zaterdag/zondag) oranje
-            color = COLORS['weekend']
-        else:  # Alle weekdagen (ma/di/wo/do/vr) grijs
-            color = COLORS['werkdag']
-
-        cell.fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
-
-        # Borders voor header rij
-        is_laatste_dag = (dag == dagen_in_maand)
-        cell.border = Border(
-            left=Side(style='medium' if col_idx == 3 else 'thin'),  # Eerste dag kolom medium
-            right=Side(style='medium' if is_laatste_dag else 'thin'),  # Laatste dag kolom medium
-            top=Side(style='medium')
-        )
+def schrijf_maand_bestand(bestand_pad: Path, jaar: int, maand: int,
+                          planning_data: Iterable[Dict[str, Any]],
+                          dag_kolommen: Optional[List[DagKolom]] = None,
+                          validatie_resultaat: Optional[Dict] = None,
+                          planner_notities: Optional[Dict[str, List[str]]] = None) -> None:
+    """
+    Schrijf een maand bestand: HR planning tab + Validatie Rapport
 
-    # ============== DATA RIJEN ==============
-    row_idx = 4
-    is_eerste_data_rij = True
-    for gebruiker_data in planning_data:
-        # Kolom B - Naam
-        naam_cell = ws.cell(row=row_idx, column=2)
-        naam_cell.value = gebruiker_data['naam']
-        naam_cell.font = Font(name='Arial', size=9, bold=True, color='FF000000')
-        naam_cell.alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
-        naam_cell.border = Border(
-            left=Side(style='medium'),
-            top=Side(style='medium' if is_eerste_data_rij else 'thin'),
-            bottom=Side(style='thin')
-        )
+    Zonder dag_kolommen/validatie_resultaat/planner_notities worden die uit
+    de database bepaald; met alle drie raakt dit de database niet (batch
+    export workers, v0.6.29).
+    """
+    # Maak Excel bestand (write-only: geheugen onafhankelijk van aantal rijen)
+    wb = Workbook(write_only=True)
+    stijlen = ExportStijlen(wb)
 
-        # Kolom C+ - Shift codes per dag
-        for dag in range(1, dagen_in_maand + 1):
-            col_idx = 2 + dag
-            datum = datetime(jaar, maand, dag)
-            datum_str = datum.strftime('%Y-%m-%d')
-            shift_code = gebruiker_data['planning'].get(datum_str, '')
-            weekday = datum.weekday()
-
-            cell = ws.cell(row=row_idx, column=col_idx)
-            cell.value = shift_code
-            cell.font = Font(name='Arial', size=10, bold=False, color='FF000000')
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-            # Achtergrondkleur: feestdag > weekend
-            if dag in feestdag_dagen:  # Feestdag achtergrond
-                cell.fill = PatternFill(start_color=COLORS['feestdag'],
-                                       end_color=COLORS['feestdag'],
-                                       fill_type='solid')
-            elif weekday >= 5:  # Weekend achtergrond
-                cell.fill = PatternFill(start_color=COLORS['weekend'],
-                                       end_color=COLORS['weekend'],
-                                       fill_type='solid')
-
-            # Borders
-            is_laatste_dag = (dag == dagen_in_maand)
-            cell.border = Border(
-                left=Side(style='medium' if col_idx == 3 else 'thin'),
-                right=Side(style='medium' if is_laatste_dag else 'thin'),
-                top=Side(style='medium' if is_eerste_data_rij else 'thin'),
-                bottom=Side(style='thin')
-            )
+    ws = wb.create_sheet(title='Blad1')
+    schrijf_planning_sheet(ws, stijlen, jaar, maand, planning_data, dag_kolommen)
 
-        row_idx += 1
-        is_eerste_data_rij = False
+    # Voeg Validatie Rapport sheet toe (v0.6.20)
+    validatie_ws = wb.create_sheet(title="Validatie Rapport")
+    maak_validatie_rapport_sheet(validatie_ws, jaar, maand, stijlen, validatie_resultaat, planner_notities)
 
-    # ============== MERGE KOLOM A VERTICAAL ==============
-    laatste_rij = 3 + len(planning_data)
-    ws.merge_cells(f'A2:A{laatste_rij}')
+    bewaar_workbook(wb, bestand_pad)
 
-    # ============== KOLOM BREEDTES ==============
-    # Alle kolommen uniform 13.0
-    for col_idx in range(1, 3 + dagen_in_maand):
-        col_letter = get_column_letter(col_idx)
-        ws.column_dimensions[col_letter].width = 13.0
 
-    # ============== RIJ HOOGTES ==============
-    ws.row_dimensions[1].height = 15.75
-    ws.row_dimensions[2].height = 15.75
-    ws.row_dimensions[3].height = 39.0
+def schrijf_teamlid_bestand(bestand_pad: Path, naam: str,
+                            maanden: Iterable[Tuple[int, int, Dict[str, str], Optional[List[DagKolom]]]]) -> None:
+    """
+    Persoonlijk rooster (v0.6.29): 1 HR planning tab per maand met enkel de
+    rij van het teamlid
 
-    # Data rijen
-    for row in range(4, 4 + len(planning_data)):
-        ws.row_dimensions[row].height = 25.0
+    Args:
+        maanden: (jaar, maand, {datum_str: code}, dag_kolommen) per tab
+    """
+    wb = Workbook(write_only=True)
+    stijlen = ExportStijlen(wb)
+    for jaar, maand, planning, dag_kolommen in maanden:
+        ws = wb.create_sheet(title=f"{MAAND_NAMEN[maand]} {jaar}")
+        schrijf_planning_sheet(ws, stijlen, jaar, maand, [{'naam': naam, 'planning': planning}], dag_kolommen)
+    bewaar_workbook(wb, bestand_pad)
 
-    # Voeg Validatie Rapport sheet toe (v0.6.20)
-    validatie_ws = wb.create_sheet(title="Validatie Rapport")
-    maak_validatie_rapport_sheet(validatie_ws, jaar, maand)
 
-    # Sla op (v0.6.21: verbeterde error handling)
+def bewaar_workbook(wb: Workbook, bestand_pad: Path) -> None:
+    """Sla op (v0.6.21: verbeterde error handling)"""
     try:
         wb.save(bestand_pad)
     except PermissionError:
         # Re-raise met bestandsnaam voor duidelijkere error message
-        raise PermissionError(f"Kan bestand niet opslaan: {bestand_naam}. Bestand is waarschijnlijk open in Excel.")
+        raise PermissionError(f"Kan bestand niet opslaan: {Path(bestand_pad).name}. "
+                              f"Bestand is waarschijnlijk open in Excel.")
     except (IOError, OSError) as e:
         # Re-raise met context
         raise IOError(f"Kan bestand niet schrijven naar {bestand_pad}: {str(e)}")
 
-    return str(bestand_pad)
 
+def bepaal_dag_kolommen(jaar: int, maand: int) -> List[DagKolom]:
+    """
+    Per dag kolom: kleur (feestdag > weekend > werkdag) en linker/rechter rand
 
-def haal_planning_data(jaar: int, maand: int) -> list:
+    Feestdagen en weekends uit de gedeelde DagKalender (v0.6.29, was een eigen
+    query); rode lijn starts krijgen een rode linker rand, zoals de rode lijn
+    in de planner.
     """
-    Haal planning data op voor een maand
-    Inclusief reserves (is_reserve=1)
+    dagen_in_maand = calendar.monthrange(jaar, maand)[1]
+    first_day = date(jaar, maand, 1)
+    last_day = date(jaar, maand, dagen_in_maand)
+    kalender = DagKalender.get_instance(first_day, last_day)
 
-    Returns:
-        List van dicts met naam en planning per datum
+    rode_lijn_dagen = {periode.start_datum.day
+                       for periode in RodeLijnenKalender.get_instance().periodes(first_day, last_day)
+                       if periode.start_datum >= first_day}
+
+    dag_kolommen = []
+    for dag in range(1, dagen_in_maand + 1):
+        datum = date(jaar, maand, dag)
+        if kalender.is_feestdag(datum):
+            kleur = 'feestdag'
+        elif kalender.weekdag(datum) >= 5:
+            kleur = 'weekend'
+        else:
+            kleur = 'werkdag'
+        links = 'rood' if dag in rode_lijn_dagen else ('dik' if dag == 1 else 'dun')  # Eerste dag kolom medium
+        rechts = 'dik' if dag == dagen_in_maand else 'dun'  # Laatste dag kolom medium
+        dag_kolommen.append((kleur, links, rechts))
+    return dag_kolommen
+
+
+def schrijf_planning_sheet(ws, stijlen: ExportStijlen, jaar: int, maand: int,
+                           planning_data: Iterable[Dict[str, Any]],
+                           dag_kolommen: Optional[List[DagKolom]] = None) -> None:
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    Schrijf de HR planning tab rij per rij (write-only worksheet)
 
-    # Haal alle gebruikers op inclusief reserves, exclusief admin
-    cursor.execute("""
-        SELECT id, volledige_naam, is_reserve
-        FROM gebruikers
-        WHERE is_actief = 1
-        AND gebruikersnaam != 'admin'
-        ORDER BY is_reserve ASC, volledige_naam ASC
-    """)
+    Stijl per dag kolom wordt 1x per maand bepaald (feestdag/weekend kleur,
+    rode lijn rand); per cel blijft enkel waarde + stijl naam over.
+
+    Args:
+        ws: Write-only worksheet
+        stijlen: Named styles van het workbook
+        planning_data: Iterable van {'naam': ..., 'planning': {datum_str: code}}
+        dag_kolommen: Zie bepaal_dag_kolommen (None = uit de kalenders)
+    """
+    maand_naam = MAAND_NAMEN[maand]
+    cel = stijlen.cel
+
+    # Bepaal alle dagen in de maand
+    dagen_in_maand = calendar.monthrange(jaar, maand)[1]
+    first_day = date(jaar, maand, 1)
+    last_day = date(jaar, maand, dagen_in_maand)
+    datum_strs = [date(jaar, maand, dag).isoformat() for dag in range(1, dagen_in_maand + 1)]
+
+    if dag_kolommen is None:
+        dag_kolommen = bepaal_dag_kolommen(jaar, maand)
+
+    midden_wrap = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    links_boven_wrap = Alignment(horizontal='left', vertical='top', wrap_text=True)
+    kop_font = Font(name='Arial', size=10, bold=True, color='FF000000')
+    code_font = Font(name='Arial', size=10, bold=False, color='FF000000')
+    naam_font = Font(name='Arial', size=9, bold=True, color='FF000000')
+
+    # Data cel stijlen voor eerste rij (dikke bovenrand) en overige rijen
+    data_stijlen = {
+        boven: [
+            stijlen.stijl(f"planning_code_{kleur}_{links}_{rechts}_{boven}", code_font,
+                          HR_KLEUREN[kleur] if kleur != 'werkdag' else None, midden_wrap,
+                          links=links, rechts=rechts, boven=boven, onder='dun')
+            for kleur, links, rechts in dag_kolommen
+        ]
+        for boven in ('dik', 'dun')
+    }
+    naam_stijlen = {
+        boven: stijlen.stijl(f"planning_naam_{boven}", naam_font, None, links_boven_wrap,
+                             links='dik', boven=boven, onder='dun')
+        for boven in ('dik', 'dun')
+    }
+    # Randen die merge_cells vroeger op de gemergde cellen zette
+    maand_kolom_stijl = stijlen.stijl("planning_maand_kolom", _STANDAARD_FONT, links='dik', rechts='dik')
+    periode_rand_stijl = stijlen.stijl("planning_periode_rand", _STANDAARD_FONT, boven='dik', onder='dik')
+
+    # ============== KOLOM BREEDTES ==============
+    # Alle kolommen uniform 13.0
+    for col_idx in range(1, 3 + dagen_in_maand):
+        ws.column_dimensions[get_column_letter(col_idx)].width = 13.0
+
+    # ============== RIJ 1: LEEG ==============
+    ws.row_dimensions[1].height = 15.75
+    ws.append([])
+
+    # ============== RIJ 2: HEADER ==============
+    # Kolom A - Maandnaam (verticaal gemerged), kolom B - Maand/Jaar (mmm/jj, bijv. "jan/26"),
+    # kolom C - Beschrijving (gemerged over alle dagen)
+    ws.row_dimensions[2].height = 15.75
+    ws.append([
+        cel(ws, maand_naam.upper(), stijlen.stijl(
+            "planning_maand_naam", Font(name='Arial', size=14, bold=True, color='FF000000'),
+            HR_KLEUREN['maand_header'], Alignment(horizontal='center', vertical='center'),
+            links='dik', rechts='dik', boven='dik')),
+        cel(ws, f"{MAAND_KORT[maand]}/{str(jaar)[-2:]}", stijlen.stijl(
+            "planning_maand_kort", Font(name='Arial', size=11, bold=True),
+            HR_KLEUREN['datum_header'], Alignment(horizontal='center', vertical='center'),
+            links='dik', boven='dik')),
+        cel(ws, f"Diensttabel van {first_day.strftime('%d-%m-%Y')} tot {last_day.strftime('%d-%m-%Y')}",
+            stijlen.stijl("planning_periode", Font(name='Arial', size=11, bold=True, color='FF000000'),
+                          HR_KLEUREN['datum_header'], midden_wrap, links='dik', boven='dik', onder='dik')),
+    ] + [cel(ws, None, periode_rand_stijl) for _ in range(dagen_in_maand - 1)])
+    ws.merged_cells.add(f'C2:{get_column_letter(2 + dagen_in_maand)}2')
+
+    # ============== RIJ 3: KOLOMKOPPEN ==============
+    # Kolom B - "Naam + Voornaam", kolom C+ - Dagnummers met weekend kleuren
+    ws.row_dimensions[3].height = 39.0
+    ws.append([
+        cel(ws, None, maand_kolom_stijl),
+        cel(ws, 'Naam + Voornaam', stijlen.stijl(
+            "planning_naam_kop", kop_font, HR_KLEUREN['naam_kolom'], links_boven_wrap,
+            links='dik', rechts='dun', boven='dik', onder='dik')),
+    ] + [
+        cel(ws, dag, stijlen.stijl(f"planning_dag_{kleur}_{links}_{rechts}", kop_font, HR_KLEUREN[kleur],
+                                   midden_wrap, links=links, rechts=rechts, boven='dik'))
+        for dag, (kleur, links, rechts) in enumerate(dag_kolommen, start=1)
+    ])
+
+    # ============== DATA RIJEN (gestreamd) ==============
+    row_idx = 4
+    for gebruiker_data in planning_data:
+        boven = 'dik' if row_idx == 4 else 'dun'
+        planning = gebruiker_data['planning']
+        ws.row_dimensions[row_idx].height = 25.0
+        ws.append(
+            [cel(ws, None, maand_kolom_stijl), cel(ws, gebruiker_data['naam'], naam_stijlen[boven])]
+            + [cel(ws, planning.get(datum_str, ''), stijl)
+               for datum_str, stijl in zip(datum_strs, data_stijlen[boven])]
+        )
+        row_idx += 1
 
-    gebruikers = cursor.fetchall()
+    # ============== MERGE KOLOM A VERTICAAL ==============
+    ws.merged_cells.add(f'A2:A{row_idx - 1}')
+
+
+def iter_planning_data(jaar: int, maand: int) -> Iterator[Dict[str, Any]]:
+    """
+    Planning per gebruiker voor een maand, gestreamd uit 1 range query (v0.6.29)
+
+    Inclusief reserves (is_reserve=1), exclusief admin; volgorde reserves
+    achteraan, dan op naam. Gebruikers zonder planning krijgen een lege dict.
 
+    Yields:
+        {'naam': ..., 'planning': {datum_str: shift_code}}
+    """
     # Bepaal datum range
     eerste_dag = f"{jaar:04d}-{maand:02d}-01"
     if maand == 12:
@@ -352,89 +387,112 @@ def haal_planning_data(jaar: int, maand: int) -> list:
     else:
         volgende_maand = f"{jaar:04d}-{maand + 1:02d}-01"
 
-    planning_data = []
-
-    for gebruiker in gebruikers:
-        gebruiker_id = gebruiker['id']
-        naam = gebruiker['volledige_naam']
-
-        # Haal planning op voor deze gebruiker
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
         cursor.execute("""
-            SELECT datum, shift_code
-            FROM planning
-            WHERE gebruiker_id = ?
-            AND datum >= ?
-            AND datum < ?
-            ORDER BY datum
-        """, (gebruiker_id, eerste_dag, volgende_maand))
-
-        planning_records = cursor.fetchall()
-
-        # Maak dict van datum -> shift_code
-        planning_dict = {}
-        for record in planning_records:
-            planning_dict[record['datum']] = record['shift_code']
-
-        planning_data.append({
-            'naam': naam,
-            'planning': planning_dict
-        })
+            SELECT g.id, g.volledige_naam, p.datum, p.shift_code
+            FROM gebruikers g
+            LEFT JOIN planning p
+                ON p.gebruiker_id = g.id
+                AND p.datum >= ?
+                AND p.datum < ?
+            WHERE g.is_actief = 1
+            AND g.gebruikersnaam != 'admin'
+            ORDER BY g.is_reserve ASC, g.volledige_naam ASC, g.id, p.datum
+        """, (eerste_dag, volgende_maand))
+
+        for _, rijen in groupby(cursor, key=lambda row: row['id']):
+            eerste = next(rijen)
+            planning_dict = {}
+            for record in chain([eerste], rijen):
+                if record['datum'] is not None:
+                    planning_dict[record['datum']] = record['shift_code']
+            yield {
+                'naam': eerste['volledige_naam'],
+                'planning': planning_dict
+            }
+    finally:
+        conn.close()
 
-    conn.close()
 
-    return planning_data
+def haal_planning_data(jaar: int, maand: int) -> list:
+    """
+    Haal planning data op voor een maand
+    Inclusief reserves (is_reserve=1)
+
+    Returns:
+        List van dicts met naam en planning per datum
+    """
+    return list(iter_planning_data(jaar, maand))
 
 
-def maak_validatie_rapport_sheet(ws, jaar: int, maand: int) -> None:
+def maak_validatie_rapport_sheet(ws, jaar: int, maand: int, stijlen: ExportStijlen,
+                                 validatie_resultaat: Optional[Dict] = None,
+                                 planner_notities: Optional[Dict[str, List[str]]] = None) -> None:
     """
     Vul validatie rapport sheet met bemannings controle resultaten.
 
+    v0.6.29: rij per rij geschreven (write-only worksheet) met named styles
+
     Args:
-        ws: Openpyxl worksheet object
+        ws: Write-only worksheet
         jaar: Jaar (bijv. 2025)
         maand: Maand nummer (1-12)
+        stijlen: Named styles van het workbook
+        validatie_resultaat: controleer_maand() resultaat (None = nu berekenen)
+        planner_notities: get_planner_notities_voor_maand() resultaat (None = nu ophalen)
     """
+    cel = stijlen.cel
+    maand_naam = MAAND_NAMEN[maand]
+
     # Styling definities
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=11)
-    groen_fill = PatternFill(start_color="C8E6C9", end_color="C8E6C9", fill_type="solid")  # Light green
-    oranje_fill = PatternFill(start_color="FFB74D", end_color="FFB74D", fill_type="solid")  # Intenser orange (Material Orange 300)
-    rood_fill = PatternFill(start_color="FFCDD2", end_color="FFCDD2", fill_type="solid")  # Light red
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
     center_alignment = Alignment(horizontal='center', vertical='center')
     left_alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
+    groen = "FFC8E6C9"   # Light green
+    oranje = "FFFFB74D"  # Intenser orange (Material Orange 300)
+    rood = "FFFFCDD2"    # Light red
+    rand = dict(links='dun', rechts='dun', boven='dun', onder='dun')
+
+    header_stijl = stijlen.stijl("validatie_kop", Font(bold=True, color="FFFFFF", size=11), "FF366092",
+                                 center_alignment, **rand)
+    midden_stijl = stijlen.stijl("validatie_midden", _STANDAARD_FONT, None, center_alignment, **rand)
+    links_stijl = stijlen.stijl("validatie_links", _STANDAARD_FONT, None, left_alignment, **rand)
+    status_stijlen = {
+        'groen': ("✓ Volledig", stijlen.stijl("validatie_groen", _STANDAARD_FONT, groen, center_alignment, **rand)),
+        'geel': ("⚠ Dubbel", stijlen.stijl("validatie_geel", _STANDAARD_FONT, oranje, center_alignment, **rand)),
+        'rood': ("✗ Onvolledig", stijlen.stijl("validatie_rood", _STANDAARD_FONT, rood, center_alignment, **rand)),
+    }
+    streep_stijl = stijlen.stijl("validatie_streep", Font(size=10))
 
-    maand_naam = MAAND_NAMEN[maand]
+    # Kolom breedtes
+    ws.column_dimensions['A'].width = 15  # Datum
+    ws.column_dimensions['B'].width = 8   # Dag
+    ws.column_dimensions['C'].width = 15  # Status
+    ws.column_dimensions['D'].width = 50  # Ontbrekende kritische shifts
+    ws.column_dimensions['E'].width = 50  # Planner notities
 
     # Titel rij 1
-    ws.merge_cells('A1:E1')
-    titel_cell = ws['A1']
-    titel_cell.value = f"Bemannings Validatie (Kritische Shifts) - {maand_naam.capitalize()} {jaar}"
-    titel_cell.font = Font(bold=True, size=14, color="366092")
-    titel_cell.alignment = center_alignment
+    ws.row_dimensions[1].height = 25
+    ws.append([cel(ws, f"Bemannings Validatie (Kritische Shifts) - {maand_naam.capitalize()} {jaar}",
+                   stijlen.stijl("validatie_titel", Font(bold=True, size=14, color="FF366092"),
+                                 uitlijning=center_alignment))])
+    ws.merged_cells.add('A1:E1')
 
     # Header rij 2
     headers = ["Datum", "Dag", "Status", "Ontbrekende Kritische Shifts", "Planner Notities"]
-    for col_idx, header in enumerate(headers, start=1):
-        cell = ws.cell(row=2, column=col_idx)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = border
-        cell.alignment = center_alignment
+    ws.row_dimensions[2].height = 30
+    ws.append([cel(ws, header, header_stijl) for header in headers])
 
     # Haal bemannings controle resultaten op
-    validatie_resultaat = controleer_maand(jaar, maand)
+    if validatie_resultaat is None:
+        validatie_resultaat = controleer_maand(jaar, maand)
     dagen_resultaten = validatie_resultaat['dagen']
     samenvatting = validatie_resultaat['samenvatting']
 
     # Haal planner notities op
-    planner_notities = get_planner_notities_voor_maand(jaar, maand)
+    if planner_notities is None:
+        planner_notities = get_planner_notities_voor_maand(jaar, maand)
 
     # Data rijen
     row_idx = 3
@@ -445,124 +503,63 @@ def maak_validatie_rapport_sheet(ws, jaar: int, maand: int) -> None:
         datum_str = datum.strftime('%Y-%m-%d')
 
         # Haal resultaat op voor deze dag
-        if datum_str in dagen_resultaten:
-            dag_resultaat = dagen_resultaten[datum_str]
-            status = dag_resultaat['status']
-            ontbrekende = dag_resultaat.get('ontbrekende_codes', [])
-            dubbele = dag_resultaat.get('dubbele_codes', [])
-
-            # Check of er notities zijn voor deze dag
-            heeft_notities = datum_str in planner_notities
-
-            # Toon alleen dagen met ontbrekende shifts OF planner notities
-            if status != 'rood' and not heeft_notities:
-                continue
-
-            # Datum kolom
-            datum_cell = ws.cell(row=row_idx, column=1)
-            datum_cell.value = datum.strftime('%d-%m-%Y')
-            datum_cell.border = border
-            datum_cell.alignment = center_alignment
-
-            # Dag kolom
-            dag_naam = ['Ma', 'Di', 'Wo', 'Do', 'Vr', 'Za', 'Zo'][datum.weekday()]
-            dag_cell = ws.cell(row=row_idx, column=2)
-            dag_cell.value = dag_naam
-            dag_cell.border = border
-            dag_cell.alignment = center_alignment
-
-            # Status kolom
-            status_cell = ws.cell(row=row_idx, column=3)
-            if status == 'groen':
-                status_cell.value = "✓ Volledig"
-                status_cell.fill = groen_fill
-            elif status == 'geel':
-                status_cell.value = "⚠ Dubbel"
-                status_cell.fill = oranje_fill
-            else:  # rood
-                status_cell.value = "✗ Onvolledig"
-                status_cell.fill = rood_fill
-            status_cell.border = border
-            status_cell.alignment = center_alignment
-
-            # Ontbrekende shifts kolom
-            ontbrekend_cell = ws.cell(row=row_idx, column=4)
-            if ontbrekende:
-                ontbrekend_cell.value = format_ontbrekende_codes(ontbrekende)
-            elif dubbele:
-                ontbrekend_cell.value = format_dubbele_codes(dubbele)
-            else:
-                ontbrekend_cell.value = ""
-            ontbrekend_cell.border = border
-            ontbrekend_cell.alignment = left_alignment
-
-            # Planner notities kolom
-            notities_cell = ws.cell(row=row_idx, column=5)
-            if heeft_notities:
-                notities_text = "\n".join(planner_notities[datum_str])
-                notities_cell.value = notities_text
-            else:
-                notities_cell.value = ""
-            notities_cell.border = border
-            notities_cell.alignment = left_alignment
-
-            row_idx += 1
+        if datum_str not in dagen_resultaten:
+            continue
+        dag_resultaat = dagen_resultaten[datum_str]
+        status = dag_resultaat['status']
+        ontbrekende = dag_resultaat.get('ontbrekende_codes', [])
+        dubbele = dag_resultaat.get('dubbele_codes', [])
+
+        # Check of er notities zijn voor deze dag
+        heeft_notities = datum_str in planner_notities
+
+        # Toon alleen dagen met ontbrekende shifts OF planner notities
+        if status != 'rood' and not heeft_notities:
+            continue
+
+        # Ontbrekende shifts kolom
+        if ontbrekende:
+            ontbrekend_tekst = format_ontbrekende_codes(ontbrekende)
+        elif dubbele:
+            ontbrekend_tekst = format_dubbele_codes(dubbele)
+        else:
+            ontbrekend_tekst = ""
+
+        status_tekst, status_stijl = status_stijlen.get(status, status_stijlen['rood'])
+        dag_naam = ['Ma', 'Di', 'Wo', 'Do', 'Vr', 'Za', 'Zo'][datum.weekday()]
+        ws.append([
+            cel(ws, datum.strftime('%d-%m-%Y'), midden_stijl),
+            cel(ws, dag_naam, midden_stijl),
+            cel(ws, status_tekst, status_stijl),
+            cel(ws, ontbrekend_tekst, links_stijl),
+            cel(ws, "\n".join(planner_notities[datum_str]) if heeft_notities else "", links_stijl),
+        ])
+        row_idx += 1
 
     # Samenvatting sectie (na data rijen + 2 lege rijen)
+    ws.append([])
+    ws.append([])
     samenvatting_start_row = row_idx + 2
 
-    # Streep
-    ws.merge_cells(f'A{samenvatting_start_row}:E{samenvatting_start_row}')
-    streep_cell = ws.cell(row=samenvatting_start_row, column=1)
-    streep_cell.value = "─" * 60
-    streep_cell.font = Font(size=10)
-
-    # Titel samenvatting
+    # Streep, titel samenvatting, streep
     titel_row = samenvatting_start_row + 1
-    ws.merge_cells(f'A{titel_row}:E{titel_row}')
-    titel_cell = ws.cell(row=titel_row, column=1)
-    titel_cell.value = "TOTAAL OVERZICHT"
-    titel_cell.font = Font(bold=True, size=12)
-
-    # Streep
     streep2_row = titel_row + 1
-    ws.merge_cells(f'A{streep2_row}:E{streep2_row}')
-    streep2_cell = ws.cell(row=streep2_row, column=1)
-    streep2_cell.value = "─" * 60
-    streep2_cell.font = Font(size=10)
+    ws.append([cel(ws, "─" * 60, streep_stijl)])
+    ws.append([cel(ws, "TOTAAL OVERZICHT", stijlen.stijl("validatie_totaal", Font(bold=True, size=12)))])
+    ws.append([cel(ws, "─" * 60, streep_stijl)])
+    for row in (samenvatting_start_row, titel_row, streep2_row):
+        ws.merged_cells.add(f'A{row}:E{row}')
 
     # Samenvatting cijfers
-    cijfers_start = streep2_row + 1
-
     samenvatting_items = [
-        (f"Volledig bemand:", f"{samenvatting['volledig']} dagen", groen_fill),
-        (f"Dubbele codes:", f"{samenvatting['dubbel']} dagen", oranje_fill),
-        (f"Onvolledig bemand:", f"{samenvatting['onvolledig']} dagen", rood_fill),
-        (f"TOTAAL:", f"{samenvatting['totaal']} dagen", None)
+        ("Volledig bemand:", f"{samenvatting['volledig']} dagen", groen),
+        ("Dubbele codes:", f"{samenvatting['dubbel']} dagen", oranje),
+        ("Onvolledig bemand:", f"{samenvatting['onvolledig']} dagen", rood),
+        ("TOTAAL:", f"{samenvatting['totaal']} dagen", None)
     ]
 
-    for idx, (label, waarde, fill) in enumerate(samenvatting_items):
-        row = cijfers_start + idx
-
-        label_cell = ws.cell(row=row, column=1)
-        label_cell.value = label
-        label_cell.font = Font(bold=True, size=10)
-
-        waarde_cell = ws.cell(row=row, column=2)
-        waarde_cell.value = waarde
-        waarde_cell.font = Font(size=10)
-
-        if fill:
-            label_cell.fill = fill
-            waarde_cell.fill = fill
-
-    # Kolom breedtes
-    ws.column_dimensions['A'].width = 15  # Datum
-    ws.column_dimensions['B'].width = 8   # Dag
-    ws.column_dimensions['C'].width = 15  # Status
-    ws.column_dimensions['D'].width = 50  # Ontbrekende kritische shifts
-    ws.column_dimensions['E'].width = 50  # Planner notities
-
-    # Rij hoogtes
-    ws.row_dimensions[1].height = 25  # Titel
-    ws.row_dimensions[2].height = 30  # Header
+    for label, waarde, kleur in samenvatting_items:
+        ws.append([
+            cel(ws, label, stijlen.stijl(f"validatie_label_{kleur}", Font(bold=True, size=10), kleur)),
+            cel(ws, waarde, stijlen.stijl(f"validatie_waarde_{kleur}", Font(size=10), kleur)),
+        ])
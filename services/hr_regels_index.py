@@ -0,0 +1,252 @@
+# services/hr_regels_index.py
+"""
+HR Regels Index
+v0.6.29 - Regel waarden zoals ze golden op een datum (time-travel lookup)
+
+Probleem: hr_regels en rode_lijnen_config zijn geversioneerd (actief_vanaf /
+actief_tot), maar PlanningValidator._get_hr_config() en
+HRRegelsService.get_actieve_regel() laadden enkel de huidige versie. Een
+maand uit het verleden werd dus met de regels van vandaag gevalideerd.
+
+Oplossing: alle versies 1x laden en per regel compileren naar gesorteerde
+[vanaf, tot) intervallen. waarde_op(naam, datum) = bisect, O(log n).
+De ConstraintChecker krijgt de index mee en vraagt per venster (week,
+weekend, cyclus, reeks, shift paar) de waarde op die op dat venster van
+toepassing is.
+
+Datums met tijd ('2025-10-30 14:04:24', '...T14:09:04') tellen vanaf die dag.
+Voor de eerste versie geldt de eerste versie (regels werden bij installatie
+ingevoerd, niet pas toen van kracht).
+
+GEBRUIK:
+    index = HRRegelsIndex.get_instance()
+    index.waarde_op('max_uren_week', date(2025, 3, 1))   # 50.0
+    index.config_op(date(2025, 3, 1))                    # volledige hr_config
+    HRRegelsIndex.refresh()                              # na wijziging in hr_regels
+
+Wijzigingen door andere clients worden opgepikt via een goedkope marker
+(aantal rijen, hoogste id, laatste actief_vanaf/actief_tot), hoogstens om de
+MARKER_INTERVAL_SECONDEN gelezen.
+"""
+
+import sqlite3
+import time
+from bisect import bisect_right
+from datetime import date
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from database.connection import get_connection
+
+
+# Fallback als een regel niet geconfigureerd is (zelfde als voorheen in _get_hr_config)
+HR_CONFIG_STANDAARD: Dict[str, Any] = {
+    'min_rust_uren': 12.0,
+    'max_uren_week': 50.0,
+    'max_werkdagen_cyclus': 19,
+    'max_dagen_tussen_rx': 7,
+    'max_werkdagen_reeks': 7,
+    'max_weekends_achter_elkaar': 6,
+    'week_definitie': 'ma-00:00|zo-23:59',
+    'weekend_definitie': 'vr-22:00|ma-06:00',
+}
+
+# get_instance() controleert hoogstens zo vaak of hr_regels gewijzigd is (andere clients);
+# een team validatie (1 index lookup per gebruiker) leest de marker dus 1x
+MARKER_INTERVAL_SECONDEN = 5.0
+
+# (vanaf, tot exclusief of None, waarde)
+Versie = Tuple[date, Optional[date], Any]
+
+
+def parse_moment(waarde: Optional[str]) -> Optional[date]:
+    """'2025-10-30', '2025-10-30 14:04:24' of '2025-10-30T14:04:24' → date"""
+    if not waarde:
+        return None
+    return date.fromisoformat(str(waarde)[:10])
+
+
+def converteer_regel_waarde(waarde: Any, eenheid: Optional[str], beschrijving: Optional[str]) -> Any:
+    """Ruwe hr_regels waarde → type volgens eenheid"""
+    if eenheid == 'uur':
+        return float(waarde)
+    if eenheid == 'dagen':
+        return int(waarde)
+    if eenheid == 'periode':
+        return waarde  # String (bijv. 'ma-00:00|zo-23:59')
+    if eenheid == 'terms':
+        return beschrijving  # Term-based regels: beschrijving is de waarde ('verlof,ziek')
+    return waarde
+
+
+class VersieIndex:
+    """Versies van 1 waarde als gesorteerde [vanaf, tot) intervallen"""
+
+    def __init__(self, versies: Iterable[Versie]):
+        gesorteerd = sorted(versies, key=lambda v: v[0])
+        self._starts: List[date] = []
+        self._einden: List[Optional[date]] = []
+        self._waarden: List[Any] = []
+        for i, (vanaf, tot, waarde) in enumerate(gesorteerd):
+            # Volgende versie sluit de vorige af (ook als actief_tot ontbreekt)
+            if i + 1 < len(gesorteerd):
+                volgende = gesorteerd[i + 1][0]
+                tot = volgende if tot is None else min(tot, volgende)
+            if tot is not None and tot <= vanaf:
+                continue  # Leeg interval (2x gewijzigd op dezelfde dag, foutieve data)
+            self._starts.append(vanaf)
+            self._einden.append(tot)
+            self._waarden.append(waarde)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def waarde_op(self, datum: date) -> Any:
+        """Waarde geldig op datum; None in een gat (regel gedeactiveerd)"""
+        if not self._starts:
+            return None
+        i = max(bisect_right(self._starts, datum) - 1, 0)
+        tot = self._einden[i]
+        if tot is not None and datum >= tot:
+            return None
+        return self._waarden[i]
+
+    def versies(self) -> List[Versie]:
+        """Gecompileerde versies (vanaf, tot, waarde), gesorteerd op vanaf"""
+        return list(zip(self._starts, self._einden, self._waarden))
+
+    def grenzen(self, van: date, tot: date) -> List[date]:
+        """Datums in (van, tot] waarop de waarde kan wijzigen"""
+        return sorted({grens for grens in (*self._starts[1:], *(e for e in self._einden if e))
+                       if van < grens <= tot})
+
+
+class HRRegelsIndex:
+    """Alle versies van alle HR regels, opzoekbaar per datum"""
+
+    _instance: Optional['HRRegelsIndex'] = None
+    _marker: Optional[Tuple] = None
+    _marker_gelezen_op: float = 0.0
+
+    def __init__(self, regels: Iterable[Mapping[str, Any]] = ()):
+        """
+        Args:
+            regels: hr_regels rijen (naam, waarde, eenheid, beschrijving,
+                    actief_vanaf, actief_tot), actief en gearchiveerd
+        """
+        per_naam: Dict[str, List[Versie]] = {}
+        rijen_per_naam: Dict[str, List[Versie]] = {}
+        for regel in regels:
+            vanaf = parse_moment(regel['actief_vanaf'])
+            if vanaf is None:
+                continue
+            tot = parse_moment(regel['actief_tot'])
+            waarde = converteer_regel_waarde(regel['waarde'], regel['eenheid'], regel['beschrijving'])
+            per_naam.setdefault(regel['naam'], []).append((vanaf, tot, waarde))
+            rijen_per_naam.setdefault(regel['naam'], []).append((vanaf, tot, dict(regel)))
+
+        self._regels: Dict[str, VersieIndex] = {naam: VersieIndex(v) for naam, v in per_naam.items()}
+        self._rijen: Dict[str, VersieIndex] = {naam: VersieIndex(v) for naam, v in rijen_per_naam.items()}
+
+    def waarde_op(self, naam: str, datum: date) -> Any:
+        """Getypeerde waarde van regel op datum (None = onbekend / niet actief)"""
+        versies = self._regels.get(naam)
+        return versies.waarde_op(datum) if versies else None
+
+    def regel_op(self, naam: str, datum: date) -> Optional[Dict[str, Any]]:
+        """Volledige hr_regels rij die op datum gold"""
+        versies = self._rijen.get(naam)
+        return versies.waarde_op(datum) if versies else None
+
+    def config_op(self, datum: date) -> Dict[str, Any]:
+        """hr_config (zelfde structuur als PlanningValidator._get_hr_config) op datum"""
+        config = dict(HR_CONFIG_STANDAARD)
+        for naam, versies in self._regels.items():
+            waarde = versies.waarde_op(datum)
+            if waarde is not None:
+                config[naam] = waarde
+        return config
+
+    def grenzen(self, naam: str, van: date, tot: date) -> List[date]:
+        """Datums in (van, tot] waarop regel naam van versie wisselt"""
+        versies = self._regels.get(naam)
+        return versies.grenzen(van, tot) if versies else []
+
+    # ---------------------------------------------------------------- laden
+
+    @classmethod
+    def laad(cls, conn: Optional[sqlite3.Connection] = None) -> 'HRRegelsIndex':
+        eigen = conn is None
+        if eigen:
+            conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, naam, waarde, eenheid, beschrijving, actief_vanaf, actief_tot
+                FROM hr_regels
+            """)
+            return cls(cursor.fetchall())
+        finally:
+            if eigen:
+                conn.close()
+
+    @staticmethod
+    def lees_marker(conn: sqlite3.Connection) -> Tuple:
+        """Goedkope wijzigingsmarker: elke nieuwe versie = nieuwe rij + actief_tot op de oude"""
+        row = conn.execute("""
+            SELECT COUNT(*), MAX(id), MAX(actief_vanaf), MAX(actief_tot) FROM hr_regels
+        """).fetchone()
+        return tuple(row)
+
+    @classmethod
+    def get_instance(cls, conn: Optional[sqlite3.Connection] = None) -> 'HRRegelsIndex':
+        """
+        Gedeelde index (1 query, daarna enkel bisect)
+
+        Wijzigingen door een andere client: om de MARKER_INTERVAL_SECONDEN
+        wordt de marker opnieuw gelezen en bij verschil herladen.
+        """
+        nu = time.monotonic()
+        if cls._instance is not None and nu - cls._marker_gelezen_op < MARKER_INTERVAL_SECONDEN:
+            return cls._instance
+
+        eigen = conn is None
+        if eigen:
+            conn = get_connection()
+        try:
+            marker = cls.lees_marker(conn)
+            if cls._instance is None or marker != cls._marker:
+                cls._instance = cls.laad(conn)
+                cls._marker = marker
+            cls._marker_gelezen_op = nu
+            return cls._instance
+        finally:
+            if eigen:
+                conn.close()
+
+    @classmethod
+    def refresh(cls):
+        """Herladen bij volgende get_instance(); aanroepen na wijzigingen in hr_regels"""
+        cls._instance = None
+        cls._marker = None
+
+
+def laad_rode_lijn_config_index(conn: Optional[sqlite3.Connection] = None) -> VersieIndex:
+    """Versies van rode_lijnen_config: waarde = (start_datum, interval_dagen)"""
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT start_datum, interval_dagen, actief_vanaf, actief_tot
+            FROM rode_lijnen_config
+        """)
+        return VersieIndex(
+            (parse_moment(row['actief_vanaf']) or parse_moment(row['start_datum']),
+             parse_moment(row['actief_tot']),
+             (parse_moment(row['start_datum']), int(row['interval_dagen'])))
+            for row in cursor.fetchall()
+        )
+    finally:
+        if eigen:
+            conn.close()
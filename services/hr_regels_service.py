@@ -8,6 +8,7 @@ Helper functies voor opvragen van HR regels uit de database.
 from datetime import datetime, date
 from typing import Tuple, Optional
 from database.connection import get_connection
+from services.hr_regels_index import HRRegelsIndex
 
 
 class HRRegelsService:
@@ -73,16 +74,24 @@ class HRRegelsService:
         return datetime(jaar, 5, 1).date()
 
     @staticmethod
-    def get_actieve_regel(naam: str) -> dict:
+    def get_actieve_regel(naam: str, datum: Optional[date] = None) -> dict:
         """
         Haal een actieve HR regel op bij naam.
 
         Args:
             naam: Naam van de regel
+            datum: Optioneel - versie die op deze datum gold (v0.6.29, HRRegelsIndex)
 
         Returns:
             Dictionary met regel data, of None als niet gevonden
         """
+        if datum is not None:
+            regel = HRRegelsIndex.get_instance().regel_op(naam, datum)
+            if regel is None:
+                return None
+            return {sleutel: regel[sleutel] for sleutel in
+                    ('id', 'naam', 'waarde', 'eenheid', 'beschrijving', 'actief_vanaf')}
+
         conn = get_connection()
         cursor = conn.cursor()
 
@@ -0,0 +1,226 @@
+# services/hr_regels_simulatie.py
+"""
+HR Regels Simulatie
+v0.6.29 - What-if: impact van gewijzigde HR regels op de bestaande planning
+
+Probleem: de impact van een voorstel (bv. max_uren_week 50 → 48 of een
+andere week_definitie) was pas zichtbaar na het wijzigen van de live
+regels, en dan enkel maand per maand per gebruiker in de planner.
+
+Oplossing:
+- De planning van de laatste N maanden wordt in 1 query voor alle
+  gebruikers geladen (SimulatieBron), samen met shift tijden, rode lijnen
+  en de huidige HR config.
+- De huidige telling (violations per gebruiker per regel) wordt 1x
+  berekend en bewaard.
+- Voor een alternatieve config worden enkel de checks opnieuw gedraaid
+  waarvan een config sleutel wijzigde (REGEL_CONFIG_SLEUTELS); de andere
+  regels nemen de huidige telling over.
+Niets wordt in hr_regels of planning geschreven.
+
+Qt-vrij.
+
+GEBRUIK:
+    bron = laad_simulatie_bron(aantal_maanden=6)
+    resultaat = simuleer(bron, {**bron.hr_config, 'max_uren_week': 48.0})
+    resultaat.per_regel()      # [('max_uren_week', 12, 31), ...]
+    resultaat.per_gebruiker()  # [(gebruiker_id, 4, 9), ...] grootste verschil eerst
+"""
+
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from database.connection import get_connection
+from services.constraint_checker import ConstraintChecker, ConstraintCheckResult, PlanningRegel
+from services.planning_prognose import AANLOOP_DAGEN, laad_rode_lijnen
+from services.planning_validator_service import laad_validatie_config
+
+
+# Check (sleutel in check_all) → hr_config sleutels waarvan het resultaat afhangt
+REGEL_CONFIG_SLEUTELS: Dict[str, Tuple[str, ...]] = {
+    'min_rust_12u': ('min_rust_uren',),
+    'max_uren_week': ('max_uren_week', 'week_definitie'),
+    'max_werkdagen_cyclus': ('max_werkdagen_cyclus',),
+    'max_dagen_tussen_rx': ('max_dagen_tussen_rx',),
+    'max_werkdagen_reeks': ('max_werkdagen_reeks',),
+    'max_weekends': ('max_weekends_achter_elkaar', 'weekend_definitie'),
+    'nacht_vroeg_verboden': ('Nacht gevolgd door vroeg verboden',),
+}
+
+# Zelfde checks als ConstraintChecker.check_all(), individueel aanroepbaar
+_CHECKS: Dict[str, Callable[[ConstraintChecker, List[PlanningRegel], int, List[Dict]], ConstraintCheckResult]] = {
+    'min_rust_12u': lambda c, p, g, r: c.check_12u_rust(p, g),
+    'max_uren_week': lambda c, p, g, r: c.check_max_uren_week(p, g),
+    'max_werkdagen_cyclus': lambda c, p, g, r: c.check_max_werkdagen_cyclus(p, g, r),
+    'max_dagen_tussen_rx': lambda c, p, g, r: c.check_max_dagen_tussen_rx(p, g),
+    'max_werkdagen_reeks': lambda c, p, g, r: c.check_max_werkdagen_reeks(p, g),
+    'max_weekends': lambda c, p, g, r: c.check_max_weekends_achter_elkaar(p, g),
+    'nacht_vroeg_verboden': lambda c, p, g, r: c.check_nacht_gevolgd_door_vroeg(p, g),
+}
+
+# (gebruiker_id, regel) → aantal violations
+Telling = Counter
+
+
+@dataclass
+class SimulatieBron:
+    """Historische planning + huidige configuratie (1x laden)"""
+    hr_config: Dict[str, Any]
+    shift_tijden: Dict[str, Dict[str, Any]]
+    planning: Dict[int, List[PlanningRegel]]  # per gebruiker, gesorteerd op datum
+    van: date
+    tot: date
+    rode_lijnen: List[Dict] = field(default_factory=list)
+    namen: Dict[int, str] = field(default_factory=dict)
+    _huidig: Optional[Telling] = None
+
+    @property
+    def huidig(self) -> Telling:
+        """Telling met de huidige regels (gecachet)"""
+        if self._huidig is None:
+            self._huidig = tel_violations(ConstraintChecker(self.hr_config, self.shift_tijden),
+                                          self.planning, self.rode_lijnen, self.van, self.tot)
+        return self._huidig
+
+
+@dataclass
+class WhatIfResultaat:
+    """Huidige vs alternatieve telling"""
+    huidig: Telling
+    alternatief: Telling
+    gewijzigde_regels: List[str]
+
+    def per_regel(self) -> List[Tuple[str, int, int]]:
+        """(regel, huidig, alternatief) voor alle regels"""
+        huidig = Counter()
+        alternatief = Counter()
+        for (_, regel), aantal in self.huidig.items():
+            huidig[regel] += aantal
+        for (_, regel), aantal in self.alternatief.items():
+            alternatief[regel] += aantal
+        return [(regel, huidig[regel], alternatief[regel]) for regel in REGEL_CONFIG_SLEUTELS]
+
+    def per_gebruiker(self) -> List[Tuple[int, int, int]]:
+        """(gebruiker_id, huidig, alternatief) met verschil, grootste verschil eerst"""
+        huidig = Counter()
+        alternatief = Counter()
+        for (gebruiker_id, _), aantal in self.huidig.items():
+            huidig[gebruiker_id] += aantal
+        for (gebruiker_id, _), aantal in self.alternatief.items():
+            alternatief[gebruiker_id] += aantal
+        rijen = [(gebruiker_id, huidig[gebruiker_id], alternatief[gebruiker_id])
+                 for gebruiker_id in set(huidig) | set(alternatief)
+                 if huidig[gebruiker_id] != alternatief[gebruiker_id]]
+        return sorted(rijen, key=lambda rij: (-abs(rij[2] - rij[1]), rij[0]))
+
+
+def gewijzigde_regels(huidig_config: Dict[str, Any], alternatief_config: Dict[str, Any]) -> List[str]:
+    """Checks waarvan minstens 1 config sleutel een andere waarde heeft"""
+    return [regel for regel, sleutels in REGEL_CONFIG_SLEUTELS.items()
+            if any(huidig_config.get(sleutel) != alternatief_config.get(sleutel) for sleutel in sleutels)]
+
+
+def tel_violations(checker: ConstraintChecker, planning: Dict[int, List[PlanningRegel]],
+                   rode_lijnen: List[Dict], van: date, tot: date,
+                   regels: Optional[List[str]] = None) -> Telling:
+    """
+    Violations per (gebruiker, regel) met referentie datum in [van, tot]
+
+    Args:
+        regels: subset van REGEL_CONFIG_SLEUTELS (None = alle)
+    """
+    telling: Telling = Counter()
+    for regel in (REGEL_CONFIG_SLEUTELS if regels is None else regels):
+        check = _CHECKS[regel]
+        for gebruiker_id, regels_gebruiker in planning.items():
+            for violation in check(checker, regels_gebruiker, gebruiker_id, rode_lijnen).violations:
+                datum = violation.datum or (violation.datum_range[0] if violation.datum_range else None)
+                if datum is not None and van <= datum <= tot:
+                    telling[(gebruiker_id, regel)] += 1
+    return telling
+
+
+def simuleer(bron: SimulatieBron, alternatief_config: Dict[str, Any]) -> WhatIfResultaat:
+    """
+    Tel violations met alternatief_config op dezelfde planning
+
+    Raises:
+        ValueError: alternatief_config mist een verplichte sleutel / ongeldige periode
+    """
+    checker = ConstraintChecker(alternatief_config, bron.shift_tijden)
+    gewijzigd = gewijzigde_regels(bron.hr_config, alternatief_config)
+
+    # Ongewijzigde regels: huidige telling overnemen
+    alternatief: Telling = Counter({sleutel: aantal for sleutel, aantal in bron.huidig.items()
+                                    if sleutel[1] not in gewijzigd})
+    alternatief.update(tel_violations(checker, bron.planning, bron.rode_lijnen,
+                                      bron.van, bron.tot, gewijzigd))
+    return WhatIfResultaat(huidig=bron.huidig, alternatief=alternatief, gewijzigde_regels=gewijzigd)
+
+
+def laad_planning_historiek(van: date, tot: date, conn: sqlite3.Connection) -> Dict[int, List[PlanningRegel]]:
+    """Ingevulde planning van alle gebruikers in [van, tot] (1 query)"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT datum FROM feestdagen WHERE datum >= ? AND datum <= ?",
+                   (van.isoformat(), tot.isoformat()))
+    feestdagen = {row['datum'] for row in cursor.fetchall()}
+
+    cursor.execute("SELECT code FROM speciale_codes WHERE term = 'verlof'")
+    verlof_codes = {row['code'] for row in cursor.fetchall()}
+
+    cursor.execute("""
+        SELECT gebruiker_id, datum, shift_code
+        FROM planning
+        WHERE datum >= ? AND datum <= ?
+          AND shift_code IS NOT NULL AND shift_code != ''
+        ORDER BY gebruiker_id, datum
+    """, (van.isoformat(), tot.isoformat()))
+
+    planning: Dict[int, List[PlanningRegel]] = {}
+    for row in cursor.fetchall():
+        planning.setdefault(row['gebruiker_id'], []).append(PlanningRegel(
+            gebruiker_id=row['gebruiker_id'],
+            datum=date.fromisoformat(row['datum'][:10]),
+            shift_code=row['shift_code'],
+            is_goedgekeurd_verlof=row['shift_code'] in verlof_codes,
+            is_feestdag=row['datum'][:10] in feestdagen
+        ))
+    return planning
+
+
+def laad_simulatie_bron(aantal_maanden: int = 6, vandaag: Optional[date] = None,
+                        conn: Optional[sqlite3.Connection] = None) -> SimulatieBron:
+    """
+    Planning van de laatste aantal_maanden volledige maanden + huidige regels
+
+    Een aanloop van AANLOOP_DAGEN voor de eerste maand wordt mee geladen
+    (reeksen en RX gaps over de grens), maar niet meegeteld.
+    """
+    vandaag = vandaag or date.today()
+    tot = date(vandaag.year, vandaag.month, 1) - timedelta(days=1)
+    index = vandaag.year * 12 + vandaag.month - 1 - aantal_maanden
+    van = date(index // 12, index % 12 + 1, 1)
+
+    # Zelfde HR config + shift tijden als de planner validatie
+    hr_config, shift_tijden = laad_validatie_config(vandaag.year, vandaag.month)
+
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        return SimulatieBron(
+            hr_config=hr_config,
+            shift_tijden=shift_tijden,
+            planning=laad_planning_historiek(van - timedelta(days=AANLOOP_DAGEN), tot, conn),
+            van=van,
+            tot=tot,
+            rode_lijnen=laad_rode_lijnen(conn, van - timedelta(days=AANLOOP_DAGEN), tot),
+            namen={row['id']: row['volledige_naam']
+                   for row in conn.execute("SELECT id, volledige_naam FROM gebruikers")},
+        )
+    finally:
+        if eigen:
+            conn.close()
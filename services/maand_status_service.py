@@ -0,0 +1,247 @@
+# services/maand_status_service.py
+"""
+Maand Status Service
+v0.6.29 - Publicatie status per maand als aparte tabel
+
+Probleem: concept/gepubliceerd werd afgeleid door planning.status rijen te
+scannen (SELECT DISTINCT / LIKE per maand, bij elke status check) en
+publiceren/terug naar concept herschreef ELKE planning rij van de maand.
+
+Oplossing: maand_status tabel (1 rij per maand) is de bron van waarheid.
+- Status check = primary key lookup
+- Publiceren = 1 rij schrijven (versie +1), onafhankelijk van aantal shifts
+- Geen rij = concept
+- planning.status wordt niet meer bijgewerkt (legacy kolom)
+
+HARDE OVERSTAP (geen dual-write): v0.6.28 clients lezen/schrijven nog
+planning.status en zien deze tabel niet. Daarom verhoogt MIN_DB_VERSION naar
+0.6.29 en zet migrations/upgrade_to_v0_6_29.py de database op die versie,
+zodat oude clients weigeren te starten. Alle clients updaten tegelijk.
+
+Tabel wordt ook lazy aangemaakt (nieuwe/test databases); bij aanmaak worden
+maanden met gepubliceerde planning rijen eenmalig overgenomen.
+
+GEBRUIK:
+    from services.maand_status_service import get_maand_status, zet_maand_status
+
+    if get_maand_status(2025, 11) == 'gepubliceerd': ...
+    zet_maand_status(2025, 11, 'gepubliceerd', gebruiker_id=1)
+"""
+
+import sqlite3
+from calendar import monthrange
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+
+from database.connection import get_connection
+
+
+STATUS_CONCEPT = 'concept'
+STATUS_GEPUBLICEERD = 'gepubliceerd'
+
+
+def maand_niet_gepubliceerd(datum_kolom: str) -> str:
+    """WHERE fragment: de maand van datum_kolom (YYYY-MM-DD) is niet gepubliceerd"""
+    return f"""NOT EXISTS (
+    SELECT 1 FROM maand_status ms
+    WHERE ms.status = 'gepubliceerd'
+      AND ms.jaar = CAST(substr({datum_kolom}, 1, 4) AS INTEGER)
+      AND ms.maand = CAST(substr({datum_kolom}, 6, 2) AS INTEGER)
+)"""
+
+
+# WHERE fragment voor writes op planning: vervangt "status = 'concept'" per rij.
+# Rijen in een gepubliceerde maand blijven beschermd (ook buffer dagen van buurmaanden).
+SQL_MAAND_NIET_GEPUBLICEERD = maand_niet_gepubliceerd('planning.datum')
+
+# Shift opslaan (params: gebruiker_id, datum, shift_code). Ook de INSERT tak is
+# bewaakt: een lege cel in een gepubliceerde maand krijgt geen nieuwe rij.
+SQL_SHIFT_OPSLAAN = f"""
+    INSERT INTO planning (gebruiker_id, datum, shift_code, status)
+    SELECT nieuw.gebruiker_id, nieuw.datum, nieuw.shift_code, 'concept'
+    FROM (SELECT ? AS gebruiker_id, ? AS datum, ? AS shift_code) AS nieuw
+    WHERE {maand_niet_gepubliceerd('nieuw.datum')}
+    ON CONFLICT(gebruiker_id, datum)
+    DO UPDATE SET shift_code = excluded.shift_code
+    WHERE {SQL_MAAND_NIET_GEPUBLICEERD}
+"""
+
+# Per proces: tabel bestaat al → CREATE/backfill check overslaan
+_tabel_ok: bool = False
+
+
+def ensure_maand_status_tabel(conn: sqlite3.Connection) -> None:
+    """Maak maand_status tabel aan (idempotent), backfill uit planning.status bij aanmaak"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='maand_status'
+    """)
+    if cursor.fetchone():
+        return
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS maand_status (
+            jaar INTEGER NOT NULL,
+            maand INTEGER NOT NULL CHECK(maand BETWEEN 1 AND 12),
+            status TEXT NOT NULL DEFAULT 'concept'
+                   CHECK(status IN ('concept', 'gepubliceerd')),
+            gepubliceerd_op TIMESTAMP,
+            gepubliceerd_door INTEGER,
+            versie INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (jaar, maand),
+            FOREIGN KEY (gepubliceerd_door) REFERENCES gebruikers(id)
+        )
+    """)
+
+    # Bestaande publicaties overnemen (laatste keer dat planning.status gescand wordt)
+    cursor.execute("""
+        INSERT OR IGNORE INTO maand_status (jaar, maand, status, versie)
+        SELECT DISTINCT
+            CAST(substr(datum, 1, 4) AS INTEGER),
+            CAST(substr(datum, 6, 2) AS INTEGER),
+            'gepubliceerd',
+            1
+        FROM planning
+        WHERE status = 'gepubliceerd'
+    """)
+    conn.commit()
+
+
+def _open(conn: Optional[sqlite3.Connection]) -> Tuple[sqlite3.Connection, bool]:
+    """Gebruik meegegeven connectie of open een nieuwe. Returns (conn, zelf_geopend)"""
+    global _tabel_ok
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    if not eigen or not _tabel_ok:
+        ensure_maand_status_tabel(conn)
+        if eigen:
+            _tabel_ok = True
+    return conn, eigen
+
+
+def maand_grenzen(jaar: int, maand: int) -> Tuple[str, str]:
+    """Eerste en laatste dag van maand als ISO strings"""
+    return (f"{jaar:04d}-{maand:02d}-01",
+            f"{jaar:04d}-{maand:02d}-{monthrange(jaar, maand)[1]:02d}")
+
+
+def maanden_in_periode(start_datum: str, eind_datum: str) -> List[Tuple[int, int]]:
+    """(jaar, maand) paren die de periode raakt, in volgorde (ook over een jaargrens)"""
+    jaar, maand = int(start_datum[:4]), int(start_datum[5:7])
+    maanden = []
+    while (jaar, maand) <= (int(eind_datum[:4]), int(eind_datum[5:7])):
+        maanden.append((jaar, maand))
+        jaar, maand = (jaar + 1, 1) if maand == 12 else (jaar, maand + 1)
+    return maanden
+
+
+def actie_maand_in_periode(jaar: int, maand: int,
+                           start_datum: str, eind_datum: str) -> Tuple[int, int]:
+    """
+    Actie maand (publiceren, generatie, validatie) voor een getoonde periode
+
+    Blijft ongewijzigd als de maand in de periode valt, anders de maand met
+    de meeste dagen in de periode (bij gelijke stand de eerste). Zo werken
+    acties nooit op een maand die niet op het scherm staat.
+    """
+    maanden = maanden_in_periode(start_datum, eind_datum)
+    if (jaar, maand) in maanden:
+        return jaar, maand
+
+    def dagen_in_periode(jaar_maand: Tuple[int, int]) -> int:
+        eerste, laatste = maand_grenzen(*jaar_maand)
+        return (datetime.fromisoformat(min(laatste, eind_datum))
+                - datetime.fromisoformat(max(eerste, start_datum))).days + 1
+
+    return max(maanden, key=dagen_in_periode)
+
+
+def get_maand_status(jaar: int, maand: int,
+                     conn: Optional[sqlite3.Connection] = None) -> str:
+    """'concept' of 'gepubliceerd' (geen rij = concept)"""
+    conn, eigen = _open(conn)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT status FROM maand_status
+            WHERE jaar = ? AND maand = ?
+        """, (jaar, maand))
+        row = cursor.fetchone()
+        return row['status'] if row else STATUS_CONCEPT
+    finally:
+        if eigen:
+            conn.close()
+
+
+def get_gepubliceerde_maanden(start_datum: str, eind_datum: str,
+                              conn: Optional[sqlite3.Connection] = None) -> Set[Tuple[int, int]]:
+    """
+    Gepubliceerde (jaar, maand) paren die overlappen met periode
+
+    Args:
+        start_datum: YYYY-MM-DD
+        eind_datum: YYYY-MM-DD
+    """
+    start_jaar, start_maand = int(start_datum[:4]), int(start_datum[5:7])
+    eind_jaar, eind_maand = int(eind_datum[:4]), int(eind_datum[5:7])
+
+    conn, eigen = _open(conn)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT jaar, maand FROM maand_status
+            WHERE status = 'gepubliceerd'
+              AND (jaar * 12 + maand) BETWEEN ? AND ?
+        """, (start_jaar * 12 + start_maand, eind_jaar * 12 + eind_maand))
+        return {(row['jaar'], row['maand']) for row in cursor.fetchall()}
+    finally:
+        if eigen:
+            conn.close()
+
+
+def gepubliceerde_datum_ranges(start_datum: str, eind_datum: str,
+                               maanden: Set[Tuple[int, int]]) -> List[Tuple[str, str]]:
+    """Knip periode op tot de delen die in gepubliceerde maanden vallen (voor WHERE clauses)"""
+    ranges = []
+    for jaar, maand in sorted(maanden):
+        eerste, laatste = maand_grenzen(jaar, maand)
+        ranges.append((max(eerste, start_datum), min(laatste, eind_datum)))
+    return ranges
+
+
+def zet_maand_status(jaar: int, maand: int, status: str,
+                     gebruiker_id: Optional[int] = None,
+                     conn: Optional[sqlite3.Connection] = None) -> int:
+    """
+    Publiceer of zet terug naar concept (1 rij, ongeacht aantal shifts)
+
+    Returns:
+        Nieuwe versie van de maand (verhoogt bij elke status wijziging)
+    """
+    if status not in (STATUS_CONCEPT, STATUS_GEPUBLICEERD):
+        raise ValueError(f"Ongeldige maand status: {status}")
+
+    gepubliceerd_op = datetime.now().isoformat(timespec='seconds') if status == STATUS_GEPUBLICEERD else None
+    gepubliceerd_door = gebruiker_id if status == STATUS_GEPUBLICEERD else None
+
+    conn, eigen = _open(conn)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO maand_status (jaar, maand, status, gepubliceerd_op, gepubliceerd_door, versie)
+            VALUES (?, ?, ?, ?, ?, 1)
+            ON CONFLICT(jaar, maand) DO UPDATE SET
+                status = excluded.status,
+                gepubliceerd_op = excluded.gepubliceerd_op,
+                gepubliceerd_door = excluded.gepubliceerd_door,
+                versie = maand_status.versie + 1
+        """, (jaar, maand, status, gepubliceerd_op, gepubliceerd_door))
+        conn.commit()
+
+        cursor.execute("SELECT versie FROM maand_status WHERE jaar = ? AND maand = ?", (jaar, maand))
+        return cursor.fetchone()['versie']
+    finally:
+        if eigen:
+            conn.close()
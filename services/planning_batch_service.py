@@ -0,0 +1,132 @@
+# services/planning_batch_service.py
+"""
+Planning Batch Service
+v0.6.29 - Set-based schrijven van meerdere planning cellen
+
+Probleem: bulk invullen/wissen deed 1 cursor.execute per cel en herlaadde
+daarna de volledige grid; "vul week" riep 7x save_shift aan (7 connecties,
+7 commits, 7 HR hertellingen).
+
+Oplossing: alle wijzigingen in 1 transactie via executemany. De grid werkt
+daarna enkel zijn in-memory rooster en de geraakte cellen bij.
+
+Gepubliceerde maanden blijven beschermd via SQL_SHIFT_OPSLAAN (ook nieuwe
+rijen in lege cellen) en SQL_MAAND_NIET_GEPUBLICEERD. schrijf_shifts geeft
+de geweigerde wijzigingen terug (maand intussen gepubliceerd), zodat de grid
+die niet als opgeslagen toont.
+Notities blijven altijd behouden (wissen = shift_code NULL, rij blijft).
+
+GEBRUIK:
+    from services.planning_batch_service import schrijf_shifts, patroon_toewijzing
+
+    schrijf_shifts([("2025-11-03", 12, '7101'), ("2025-11-04", 12, None)])
+
+    patroon = parse_patroon("V V L L N N - -")
+    wijzigingen = patroon_toewijzing(geselecteerde_cellen, patroon)
+"""
+
+import re
+import sqlite3
+from datetime import date
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from database.connection import get_connection
+from services.maand_status_service import (SQL_MAAND_NIET_GEPUBLICEERD, SQL_SHIFT_OPSLAAN,
+                                          get_gepubliceerde_maanden)
+
+
+# (datum YYYY-MM-DD, gebruiker_id, code) - code None/'' = shift wissen
+Wijziging = Tuple[str, int, Optional[str]]
+
+# Lege plek in een patroon (vrije dag)
+PATROON_LEEG = '-'
+
+
+def schrijf_shifts(wijzigingen: Sequence[Wijziging],
+                   conn: Optional[sqlite3.Connection] = None,
+                   alleen_lege_cellen: bool = False) -> List[Wijziging]:
+    """
+    Schrijf alle wijzigingen in 1 transactie (executemany)
+
+    Args:
+        alleen_lege_cellen: bestaande shifts nooit overschrijven (auto-generatie)
+
+    Returns:
+        Geweigerde wijzigingen: maand intussen gepubliceerd (bv. door een andere
+        client), de write guard heeft ze niet geschreven. Leeg = alles geschreven.
+
+    Raises:
+        sqlite3.Error: bij fout wordt de volledige batch teruggedraaid
+    """
+    if not wijzigingen:
+        return []
+
+    # Insert en update tak bewaakt (gepubliceerde maand), optioneel enkel lege cellen
+    invul_sql = SQL_SHIFT_OPSLAAN + ("  AND planning.shift_code IS NULL" if alleen_lege_cellen else "")
+
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        # Schrijflock vooraf: publiceren kan niet meer tussen status check en writes vallen
+        if not conn.in_transaction:
+            cursor.execute("BEGIN IMMEDIATE")
+        datums = [datum_str for datum_str, _, _ in wijzigingen]
+        gepubliceerd = get_gepubliceerde_maanden(min(datums), max(datums), conn)
+        geweigerd = [w for w in wijzigingen if (int(w[0][:4]), int(w[0][5:7])) in gepubliceerd]
+
+        invullen = [(gebruiker_id, datum_str, code)
+                    for datum_str, gebruiker_id, code in wijzigingen if code]
+        wissen = [(gebruiker_id, datum_str)
+                  for datum_str, gebruiker_id, code in wijzigingen if not code]
+        if invullen:
+            cursor.executemany(invul_sql, invullen)
+        if wissen:
+            # Shift wissen maar notitie behouden
+            cursor.executemany(f"""
+                UPDATE planning
+                SET shift_code = NULL
+                WHERE gebruiker_id = ? AND datum = ?
+                  AND {SQL_MAAND_NIET_GEPUBLICEERD}
+            """, wissen)
+        conn.commit()
+        return geweigerd
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    finally:
+        if eigen:
+            conn.close()
+
+
+def parse_patroon(tekst: str) -> List[Optional[str]]:
+    """
+    Patroon tekst → lijst codes (None = vrije dag)
+
+    Codes gescheiden door spaties of komma's, '-' = lege dag.
+    Voorbeeld: "V V L L N N - -" → ['V', 'V', 'L', 'L', 'N', 'N', None, None]
+    """
+    return [None if deel == PATROON_LEEG else deel
+            for deel in re.split(r'[\s,;]+', tekst.strip().upper()) if deel]
+
+
+def patroon_toewijzing(cellen: Iterable[Tuple[str, int]],
+                       patroon: Sequence[Optional[str]]) -> List[Wijziging]:
+    """
+    Verdeel een herhalend patroon over geselecteerde cellen
+
+    Het patroon loopt op kalenderdagen vanaf de vroegste geselecteerde datum:
+    dag n krijgt patroon[n % lengte], ook als er dagen niet geselecteerd zijn.
+    Zo blijft het ritme gelijk voor alle geselecteerde gebruikers.
+    """
+    cellen = list(cellen)
+    if not cellen or not patroon:
+        return []
+
+    anker = date.fromisoformat(min(datum_str for datum_str, _ in cellen))
+    return [
+        (datum_str, gebruiker_id,
+         patroon[(date.fromisoformat(datum_str) - anker).days % len(patroon)])
+        for datum_str, gebruiker_id in sorted(cellen, key=lambda cel: (cel[1], cel[0]))
+    ]
@@ -0,0 +1,247 @@
+# services/planning_prognose.py
+"""
+Planning Prognose
+v0.6.29 - HR violations en onderbemanning voor de komende maanden, VOOR generatie
+
+Probleem: HR overtredingen en gaten in de bemanning werden pas zichtbaar
+nadat een maand gegenereerd was (PlanningValidator + controleer_maand()).
+Een startweek of concept typetabel bijsturen betekende genereren, kijken,
+terugdraaien.
+
+Oplossing: de typetabel wordt voor het hele team in memory uitgerold
+(RoosterProjectie), goedgekeurd verlof erover gelegd en per gebruiker
+door de ConstraintChecker gehaald. Per dag wordt de bemanning tegen de
+kritische codes geteld. Alles wat uit de database moet komt 1x in een
+PrognoseBron; bereken_prognose() is puur rekenwerk en kan bij elke
+startweek wijziging opnieuw draaien. De planning tabel wordt nooit
+gelezen of geschreven.
+
+Niet meegenomen: handmatige aanpassingen in de bestaande planning (de
+prognose toont wat de typetabel zou opleveren).
+
+Qt-vrij.
+
+GEBRUIK:
+    bron = laad_prognose_bron(versie_id)           # None = actieve typetabel
+    maanden = bereken_prognose(bron, date(2026, 1, 1), aantal_maanden=12,
+                               startweken={12: 3})  # startweek override
+    for maand in maanden:
+        print(maand.jaar, maand.maand, len(maand.errors), len(maand.onderbemand))
+"""
+
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from database.connection import get_connection
+from services.constraint_checker import (
+    ConstraintChecker, PlanningRegel, Violation, ViolationSeverity
+)
+from services.planning_validator_service import maak_checker
+from services.rode_lijnen_service import RodeLijnenKalender
+from services.rooster_projectie import DAG_TYPES, RoosterProjectie
+from services.term_code_service import TermCodeService
+from services.typetabel_dekking import KritiekeCode, laad_kritische_codes, volgende_maandag
+
+
+# Dagen voor de start die mee uitgerold worden (reeksen, RX gaps, 12u rust
+# over de startgrens). Violations in deze aanloop worden niet gerapporteerd.
+AANLOOP_DAGEN = 28
+# Rode lijnen tot zo ver na de start laden (dialog: max 24 maanden)
+PROGNOSE_HORIZON_DAGEN = 25 * 31
+
+# (start, eind, code) per goedgekeurde verlof aanvraag
+VerlofBlok = Tuple[date, date, str]
+
+
+@dataclass
+class MaandPrognose:
+    """Verwachte problemen in 1 maand"""
+    jaar: int
+    maand: int
+    violations: List[Violation] = field(default_factory=list)
+    onderbemand: List[date] = field(default_factory=list)
+    dubbel: List[date] = field(default_factory=list)
+    gaten: List[Tuple[date, str]] = field(default_factory=list)  # (datum, ontbrekende code)
+    verlof_dagen: int = 0
+
+    @property
+    def errors(self) -> List[Violation]:
+        return [v for v in self.violations if v.severity == ViolationSeverity.ERROR]
+
+    @property
+    def violations_per_type(self) -> Dict[str, int]:
+        return dict(Counter(v.type.value for v in self.violations))
+
+
+@dataclass
+class PrognoseBron:
+    """Alles uit de database dat de prognose nodig heeft (1x laden)"""
+    projectie: RoosterProjectie
+    checker: ConstraintChecker
+    kritische_codes: List[KritiekeCode] = field(default_factory=list)
+    verlof: Dict[int, List[VerlofBlok]] = field(default_factory=dict)
+    rode_lijnen: List[Dict] = field(default_factory=list)
+    namen: Dict[int, str] = field(default_factory=dict)
+
+
+def _maand_eind(jaar: int, maand: int, aantal_maanden: int) -> date:
+    """Laatste dag van de aantal_maanden-de maand vanaf (jaar, maand)"""
+    index = jaar * 12 + maand - 1 + aantal_maanden
+    return date(index // 12, index % 12 + 1, 1) - timedelta(days=1)
+
+
+def bereken_prognose(bron: PrognoseBron, start: date, aantal_maanden: int = 12,
+                     startweken: Optional[Dict[int, int]] = None) -> List[MaandPrognose]:
+    """
+    Prognose per maand vanaf de maand van start
+
+    Args:
+        startweken: {gebruiker_id: startweek} overrides (what-if)
+
+    Returns:
+        Eén MaandPrognose per maand, in volgorde
+    """
+    projectie = bron.projectie
+    eerste_dag = date(start.year, start.month, 1)
+    laatste_dag = _maand_eind(start.year, start.month, aantal_maanden)
+    aanloop = eerste_dag - timedelta(days=AANLOOP_DAGEN)
+
+    gebruikers = projectie.gebruikers
+    if startweken:
+        gebruikers = [replace(g, startweek=startweken.get(g.gebruiker_id, g.startweek))
+                      for g in gebruikers]
+    rooster = projectie.projecteer(aanloop, laatste_dag, gebruikers)
+
+    # Goedgekeurd verlof over de typetabel leggen
+    verlof_cellen = set()
+    for gebruiker in gebruikers:
+        for verlof_start, verlof_eind, code in bron.verlof.get(gebruiker.gebruiker_id, ()):
+            dag = max(verlof_start, aanloop)
+            while dag <= min(verlof_eind, laatste_dag):
+                rooster.zet_code(dag.isoformat(), gebruiker.gebruiker_id, code)
+                verlof_cellen.add((dag, gebruiker.gebruiker_id))
+                dag += timedelta(days=1)
+
+    maanden: Dict[Tuple[int, int], MaandPrognose] = {}
+    index = eerste_dag.year * 12 + eerste_dag.month - 1
+    for i in range(aantal_maanden):
+        jaar, maand = divmod(index + i, 12)
+        maanden[(jaar, maand + 1)] = MaandPrognose(jaar, maand + 1)
+
+    for dag, _ in verlof_cellen:
+        if dag >= eerste_dag:
+            maanden[(dag.year, dag.month)].verlof_dagen += 1
+
+    # Bemanning: kritische codes per dag_type, feestdag telt als zondag
+    verwacht: Dict[str, List[str]] = {}
+    for _, _, dag_type, code in bron.kritische_codes:
+        verwacht.setdefault(dag_type, []).append(code)
+
+    datums = [aanloop + timedelta(days=i) for i in range(len(rooster.datums))]
+    for datum_str, datum in zip(rooster.datums, datums):
+        if datum < eerste_dag:
+            continue
+        codes = verwacht.get(DAG_TYPES[projectie.dag_type(datum)])
+        if not codes:
+            continue
+        telling = Counter(code for _, code in rooster.codes_op_datum(datum_str))
+        prognose = maanden[(datum.year, datum.month)]
+        ontbrekend = [code for code in codes if telling[code] == 0]
+        if ontbrekend:
+            prognose.onderbemand.append(datum)
+            prognose.gaten.extend((datum, code) for code in ontbrekend)
+        elif any(telling[code] > 1 for code in codes):
+            prognose.dubbel.append(datum)
+
+    # HR regels per gebruiker
+    for gebruiker in gebruikers:
+        gebruiker_id = gebruiker.gebruiker_id
+        planning = [
+            PlanningRegel(
+                gebruiker_id=gebruiker_id,
+                datum=datum,
+                shift_code=rooster.get_code(datum_str, gebruiker_id) or None,
+                is_goedgekeurd_verlof=(datum, gebruiker_id) in verlof_cellen,
+                is_feestdag=datum_str in projectie.feestdagen
+            )
+            for datum_str, datum in zip(rooster.datums, datums)
+        ]
+        for result in bron.checker.check_all(planning, gebruiker_id, bron.rode_lijnen).values():
+            for violation in result.violations:
+                datum = violation.datum or (violation.datum_range[0] if violation.datum_range else None)
+                if datum is None or not eerste_dag <= datum <= laatste_dag:
+                    continue
+                maanden[(datum.year, datum.month)].violations.append(violation)
+
+    return list(maanden.values())
+
+
+def _laad_verlof(conn: sqlite3.Connection, van: date) -> Dict[int, List[VerlofBlok]]:
+    """Goedgekeurde aanvragen die na van eindigen, met toegekende code"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT gebruiker_id, start_datum, eind_datum, toegekende_code_term
+        FROM verlof_aanvragen
+        WHERE status = 'goedgekeurd'
+          AND eind_datum >= ?
+        ORDER BY id
+    """, (van.isoformat(),))
+    verlof: Dict[int, List[VerlofBlok]] = {}
+    for row in cursor.fetchall():
+        code = TermCodeService.get_code_for_term(row['toegekende_code_term'] or 'verlof')
+        verlof.setdefault(row['gebruiker_id'], []).append((
+            date.fromisoformat(row['start_datum'][:10]),
+            date.fromisoformat(row['eind_datum'][:10]),
+            code
+        ))
+    return verlof
+
+
+def laad_rode_lijnen(conn: sqlite3.Connection, van: date, tot: date) -> List[Dict]:
+    """Rode lijn periodes die [van, tot] raken (berekend uit rode_lijnen_config)"""
+    return [periode.als_dict() for periode in RodeLijnenKalender.laad(conn).periodes(van, tot)]
+
+
+def laad_prognose_bron(versie_id: Optional[int] = None, start: Optional[date] = None,
+                       conn: Optional[sqlite3.Connection] = None) -> Optional[PrognoseBron]:
+    """
+    Statische data voor de prognose
+
+    Args:
+        versie_id: typetabel versie (None = actieve versie). Een concept
+                   wordt verondersteld actief te worden op de eerste maandag
+                   vanaf start.
+        start: begin van de prognose (standaard vandaag)
+
+    Returns None als de versie niet bestaat / er geen actieve typetabel is.
+    """
+    start = start or date.today()
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        projectie = RoosterProjectie.laad(versie_id, conn, concept_vanaf=volgende_maandag(start))
+        if projectie is None:
+            return None
+
+        namen = {row['id']: row['volledige_naam']
+                 for row in conn.execute("SELECT id, volledige_naam FROM gebruikers")}
+
+        # Zelfde HR config + shift tijden als de planner validatie
+        checker = maak_checker(start.year, start.month)
+
+        van = date(start.year, start.month, 1) - timedelta(days=AANLOOP_DAGEN)
+        return PrognoseBron(
+            projectie=projectie,
+            checker=checker,
+            kritische_codes=laad_kritische_codes(conn),
+            verlof=_laad_verlof(conn, van),
+            rode_lijnen=laad_rode_lijnen(conn, van, start + timedelta(days=PROGNOSE_HORIZON_DAGEN)),
+            namen=namen,
+        )
+    finally:
+        if eigen:
+            conn.close()
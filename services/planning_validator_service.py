@@ -28,6 +28,10 @@ from services.constraint_checker import (
 
 # Import existing services
 from services.hr_regels_service import HRRegelsService
+from services.hr_regels_index import HRRegelsIndex
+from services.dag_kalender import DagKalender
+from services.rode_lijnen_service import periodes_rond
+from services.referentie_catalogus import ReferentieCatalogus
 from services.term_code_service import TermCodeService
 
 
@@ -94,7 +98,9 @@ class PlanningValidator:
         if self._checker is None:
             hr_config = self._get_hr_config()
             shift_tijden = self._get_shift_tijden()
-            self._checker = ConstraintChecker(hr_config, shift_tijden)
+            # Index: regel versie per venster, ook als de maand een wijziging bevat (v0.6.29)
+            self._checker = ConstraintChecker(hr_config, shift_tijden,
+                                              regels_index=HRRegelsIndex.get_instance())
 
         return self._checker
 
@@ -130,53 +136,16 @@ class PlanningValidator:
         if self._hr_config_cache is not None:
             return self._hr_config_cache
 
-        # Direct database query (HRRegelsService heeft geen get_all_regels)
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT naam, waarde, eenheid, beschrijving
-            FROM hr_regels
-            WHERE is_actief = 1
-        """)
-
-        # Map naar config dict
-        config = {}
-        for row in cursor.fetchall():
-            naam = row['naam']
-            waarde = row['waarde']
-            eenheid = row['eenheid']
-            beschrijving = row['beschrijving']
-
-            # Convert naar juiste type
-            if eenheid == 'uur':
-                config[naam] = float(waarde)
-            elif eenheid == 'dagen':
-                config[naam] = int(waarde)
-            elif eenheid == 'periode':
-                config[naam] = waarde  # String (bijv. 'ma-00:00|zo-23:59')
-            elif eenheid == 'terms':
-                # Voor term-based regels: sla beschrijving op als waarde
-                config[naam] = beschrijving  # String (bijv. 'verlof,ziek')
-            else:
-                config[naam] = waarde
-
-        # Defaults (fallback als niet geconfigureerd)
-        config.setdefault('min_rust_uren', 12.0)
-        config.setdefault('max_uren_week', 50.0)
-        config.setdefault('max_werkdagen_cyclus', 19)
-        config.setdefault('max_dagen_tussen_rx', 7)
-        config.setdefault('max_werkdagen_reeks', 7)
-        config.setdefault('max_weekends_achter_elkaar', 6)
-        config.setdefault('week_definitie', 'ma-00:00|zo-23:59')
-        config.setdefault('weekend_definitie', 'vr-22:00|ma-06:00')
+        # Regels zoals ze golden op de 1e van de maand (v0.6.29 - HRRegelsIndex,
+        # voorheen enkel is_actief = 1 ongeacht de gevalideerde maand)
+        config = HRRegelsIndex.get_instance().config_op(date(self.jaar, self.maand, 1))
 
         self._hr_config_cache = config
         return config
 
     def _get_shift_tijden(self) -> Dict[str, Dict[str, Any]]:
         """
-        Laad shift tijden + flags uit database
+        Laad shift tijden + flags (v0.6.29: ReferentieCatalogus)
 
         Returns:
             Dict met shift code → info mapping:
@@ -201,63 +170,9 @@ class PlanningValidator:
         if self._shift_tijden_cache is not None:
             return self._shift_tijden_cache
 
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        shift_tijden = {}
-
-        # 1. Werkposten shift codes (shift_codes table)
-        cursor.execute("""
-            SELECT
-                sc.code,
-                sc.start_uur,
-                sc.eind_uur,
-                sc.shift_type,
-                w.naam as werkpost_naam,
-                w.telt_als_werkdag,
-                w.reset_12u_rust
-            FROM shift_codes sc
-            JOIN werkposten w ON sc.werkpost_id = w.id
-            WHERE w.is_actief = 1
-        """)
-
-        for row in cursor.fetchall():
-            shift_tijden[row['code']] = {
-                'start_uur': row['start_uur'],
-                'eind_uur': row['eind_uur'],
-                'shift_type': row['shift_type'],
-                'werkpost_naam': row['werkpost_naam'],  # v0.6.28 voor error messages
-                'telt_als_werkdag': bool(row['telt_als_werkdag']),
-                'reset_12u_rust': bool(row['reset_12u_rust']),
-                'breekt_werk_reeks': bool(row['reset_12u_rust']),  # Same flag
-                'term': None  # Werkpost shifts hebben geen term
-            }
-
-        # 2. Speciale codes (speciale_codes table)
-        cursor.execute("""
-            SELECT
-                code,
-                term,
-                telt_als_werkdag,
-                reset_12u_rust,
-                breekt_werk_reeks
-            FROM speciale_codes
-        """)
-
-        for row in cursor.fetchall():
-            shift_tijden[row['code']] = {
-                'start_uur': None,  # Speciale codes hebben geen tijden
-                'eind_uur': None,
-                'shift_type': None,  # Speciale codes hebben geen shift_type
-                'term': row['term'],  # IMPORTANT: term voor RX/CX detectie
-                'telt_als_werkdag': bool(row['telt_als_werkdag']),
-                'reset_12u_rust': bool(row['reset_12u_rust']),
-                'breekt_werk_reeks': bool(row['breekt_werk_reeks'])
-            }
-
-        self._shift_tijden_cache = shift_tijden
-        conn.close()
-        return shift_tijden
+        # v0.6.29: uit de gedeelde ReferentieCatalogus (geen queries per validator)
+        self._shift_tijden_cache = ReferentieCatalogus.get_instance().shift_tijden()
+        return self._shift_tijden_cache
 
     def _get_gebruiker_werkposten_map(self) -> Dict[int, List[int]]:
         """
@@ -295,7 +210,7 @@ class PlanningValidator:
 
     def _get_shift_code_werkpost_map(self) -> Dict[str, int]:
         """
-        Laad shift_code → werkpost_id mapping uit database (v0.6.28)
+        Laad shift_code → werkpost_id mapping (v0.6.28, v0.6.29: ReferentieCatalogus)
 
         Returns:
             Dict met shift_code → werkpost_id:
@@ -308,22 +223,7 @@ class PlanningValidator:
 
         Note: Speciale codes (VV, KD, RX, CX) zitten NIET in deze mapping
         """
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT code, werkpost_id
-            FROM shift_codes sc
-            JOIN werkposten w ON sc.werkpost_id = w.id
-            WHERE w.is_actief = 1
-        """)
-
-        mapping = {}
-        for row in cursor.fetchall():
-            mapping[row['code']] = row['werkpost_id']
-
-        conn.close()
-        return mapping
+        return ReferentieCatalogus.get_instance().werkpost_per_code()
 
     def _get_planning_data(self) -> List[PlanningRegel]:
         """
@@ -380,14 +280,8 @@ class PlanningValidator:
         """, (self.gebruiker_id, start_datum.isoformat(), eind_datum.isoformat()))
         planning_rows = cursor.fetchall()  # BEWAAR resultaten voordat andere queries
 
-        # Haal feestdagen (met buffer voor cross-month detection)
-        cursor.execute("""
-            SELECT datum
-            FROM feestdagen
-            WHERE datum >= ?
-              AND datum <= ?
-        """, (start_datum.isoformat(), eind_datum.isoformat()))
-        feestdagen = {row['datum'] for row in cursor.fetchall()}
+        # Feestdagen (met buffer voor cross-month detection) uit de gedeelde DagKalender (v0.6.29)
+        kalender = DagKalender.get_instance(start_datum, eind_datum)
 
         # Haal goedgekeurde verlof aanvragen (met buffer)
         cursor.execute("""
@@ -412,7 +306,7 @@ class PlanningValidator:
                 datum=datum_obj,
                 shift_code=row['shift_code'],
                 is_goedgekeurd_verlof=(datum_str in goedgekeurd_verlof),
-                is_feestdag=(datum_str in feestdagen)
+                is_feestdag=kalender.is_feestdag(datum_str)
             ))
 
         self._planning_cache = planning_regels
@@ -433,28 +327,11 @@ class PlanningValidator:
         if self._rode_lijnen_cache is not None:
             return self._rode_lijnen_cache
 
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT
-                periode_nummer,
-                start_datum
-            FROM rode_lijnen
-            WHERE strftime('%Y', start_datum) = ?
-            ORDER BY start_datum
-        """, (str(self.jaar),))
-
-        periodes = []
-        for row in cursor.fetchall():
-            start = datetime.strptime(row['start_datum'], "%Y-%m-%d").date()
-            eind = start + timedelta(days=27)  # 28-dagen periode
-
-            periodes.append({
-                'start_datum': start,
-                'eind_datum': eind,
-                'periode_nummer': row['periode_nummer']
-            })
+        # Periodes die de maand raken, berekend uit rode_lijnen_config (v0.6.29 -
+        # voorheen strftime('%Y') filter: cyclus over nieuwjaar ontbrak)
+        maand_start = date(self.jaar, self.maand, 1)
+        maand_eind = (maand_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        periodes = periodes_rond(maand_start, maand_eind)
 
         self._rode_lijnen_cache = periodes
         return periodes
@@ -641,3 +518,23 @@ class PlanningValidator:
             datum: Datum die gewijzigd is (voor logging/debugging)
         """
         self._violations_cache = None
+
+
+# ============================================================================
+# FACTORIES - Zelfde HR config + shift tijden buiten een validator sessie
+# ============================================================================
+
+def laad_validatie_config(jaar: int, maand: int) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    HR config + shift tijden zoals de planner validatie ze gebruikt (v0.6.29)
+
+    Returns:
+        (hr_config, shift_tijden) - hr_config is een kopie (aanpasbaar voor simulaties)
+    """
+    validator = PlanningValidator(0, jaar, maand)
+    return dict(validator._get_hr_config()), validator._get_shift_tijden()
+
+
+def maak_checker(jaar: int, maand: int) -> ConstraintChecker:
+    """ConstraintChecker met HR config, shift tijden en regel versies van de planner validatie (v0.6.29)"""
+    return PlanningValidator(0, jaar, maand)._get_checker()
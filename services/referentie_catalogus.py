@@ -0,0 +1,257 @@
+# services/referentie_catalogus.py
+"""
+Referentie Catalogus
+v0.6.29 - Shift codes, speciale codes en werkposten 1x in het geheugen
+
+Probleem: dezelfde referentie data werd op veel plaatsen apart geladen:
+PlanningEditorScreen/MijnPlanningScreen.load_valid_codes,
+ValidationCache._load_shift_codes (met PRAGMA table_info bij elke load),
+PlanningValidator._get_shift_tijden/_get_werkpost_map per validator,
+get_verwachte_codes (query per datum, ook in de batch validatie),
+fetch_werkdag_codes, de auto-generatie dialog en TermCodeService.
+
+Oplossing: 1 catalogus met geïndexeerde lookups:
+- per code:                       shift_code(), speciale_code()
+- per (werkpost, dag_type, shift_type): code_voor()
+- per term:                       code_voor_term(), term_van()
+- per flag:                       werkdag_codes(), reset_codes()
+- afgeleide sets:                 geldige_codes(), geldige_codes_per_dag(), ...
+
+Geladen bij login (get_instance), daarna enkel lookups. Wijzigingsteller:
+invalideer() verhoogt de teller; get_instance() laadt opnieuw als de
+catalogus ouder is dan de teller. Aanroepen na elke wijziging in
+shift_codes, speciale_codes of werkposten. Schermen die afgeleide sets
+bijhouden vergelijken catalogus.versie met hun eigen versie.
+
+GEBRUIK:
+    catalogus = ReferentieCatalogus.get_instance()
+    catalogus.code_voor(werkpost_id, 'zondag', 'vroeg')   # '7701'
+    catalogus.code_voor_term('verlof')                    # 'VV'
+    ReferentieCatalogus.invalideer()                      # na wijziging
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from database.connection import get_connection
+from services.rooster_projectie import DAG_TYPES
+
+
+@dataclass(frozen=True)
+class Werkpost:
+    id: int
+    naam: str
+    telt_als_werkdag: bool
+    reset_12u_rust: bool
+    breekt_werk_reeks: bool
+    is_actief: bool
+
+
+@dataclass(frozen=True)
+class ShiftCode:
+    """shift_codes rij + flags van zijn werkpost"""
+    code: str
+    werkpost_id: int
+    dag_type: str
+    shift_type: str
+    start_uur: Optional[str]
+    eind_uur: Optional[str]
+    is_kritisch: bool
+    werkpost: Werkpost
+
+
+@dataclass(frozen=True)
+class SpecialeCode:
+    code: str
+    naam: str
+    term: Optional[str]
+    telt_als_werkdag: bool
+    reset_12u_rust: bool
+    breekt_werk_reeks: bool
+
+
+class ReferentieCatalogus:
+    """Alle shift codes, speciale codes en werkposten met indexen"""
+
+    _instance: Optional['ReferentieCatalogus'] = None
+    _wijzigingen: int = 0  # Wijzigingsteller (invalideer)
+
+    def __init__(self, werkposten: Iterable[Werkpost], shift_codes: Iterable[ShiftCode],
+                 speciale_codes: Iterable[SpecialeCode], versie: int = 0):
+        self.versie = versie
+        self.werkposten: Dict[int, Werkpost] = {werkpost.id: werkpost for werkpost in werkposten}
+        self.shift_codes: List[ShiftCode] = list(shift_codes)
+        self.speciale_codes: Dict[str, SpecialeCode] = {sc.code: sc for sc in speciale_codes}
+
+        # Per code: actieve werkpost wint (zelfde code kan bij een inactieve werkpost blijven staan)
+        self._per_code: Dict[str, ShiftCode] = {}
+        for shift in self.shift_codes:
+            huidig = self._per_code.get(shift.code)
+            if huidig is None or (shift.werkpost.is_actief and not huidig.werkpost.is_actief):
+                self._per_code[shift.code] = shift
+
+        self._per_sleutel: Dict[Tuple[int, str, str], str] = {
+            (shift.werkpost_id, shift.dag_type, shift.shift_type): shift.code for shift in self.shift_codes
+        }
+        self._per_term: Dict[str, str] = {sc.term: sc.code for sc in self.speciale_codes.values() if sc.term}
+
+        actief = [shift for shift in self.shift_codes if shift.werkpost.is_actief]
+        self._geldige_per_dag: Dict[str, FrozenSet[str]] = {
+            dag_type: frozenset(shift.code for shift in actief if shift.dag_type == dag_type)
+            for dag_type in DAG_TYPES
+        }
+        self._geldige: FrozenSet[str] = frozenset(shift.code for shift in actief) | frozenset(self.speciale_codes)
+        self._kritisch_per_dag: Dict[str, List[ShiftCode]] = {
+            dag_type: sorted((shift for shift in actief if shift.dag_type == dag_type and shift.is_kritisch),
+                             key=lambda shift: (shift.werkpost.naam, shift.shift_type))
+            for dag_type in DAG_TYPES
+        }
+        self._werkdag: FrozenSet[str] = frozenset(
+            [shift.code for shift in self.shift_codes if shift.werkpost.telt_als_werkdag]
+            + [sc.code for sc in self.speciale_codes.values() if sc.telt_als_werkdag])
+        self._reset: FrozenSet[str] = frozenset(
+            [shift.code for shift in self.shift_codes if shift.werkpost.reset_12u_rust]
+            + [sc.code for sc in self.speciale_codes.values() if sc.reset_12u_rust])
+
+    # ---------------------------------------------------------------- lookups
+
+    def shift_code(self, code: str) -> Optional[ShiftCode]:
+        return self._per_code.get(code)
+
+    def speciale_code(self, code: str) -> Optional[SpecialeCode]:
+        return self.speciale_codes.get(code)
+
+    def code_voor(self, werkpost_id: int, dag_type: str, shift_type: str) -> Optional[str]:
+        """Shift code voor (werkpost, dag_type, shift_type)"""
+        return self._per_sleutel.get((werkpost_id, dag_type, shift_type))
+
+    def code_voor_term(self, term: str) -> Optional[str]:
+        return self._per_term.get(term)
+
+    def term_van(self, code: str) -> Optional[str]:
+        speciale = self.speciale_codes.get(code)
+        return speciale.term if speciale else None
+
+    def term_codes(self) -> Dict[str, str]:
+        """{term: code}"""
+        return dict(self._per_term)
+
+    def geldige_codes(self) -> FrozenSet[str]:
+        """Shift codes van actieve werkposten + alle speciale codes"""
+        return self._geldige
+
+    def geldige_codes_per_dag(self) -> Dict[str, FrozenSet[str]]:
+        """{dag_type: shift codes van actieve werkposten}"""
+        return dict(self._geldige_per_dag)
+
+    def speciale_code_set(self) -> FrozenSet[str]:
+        return frozenset(self.speciale_codes)
+
+    def kritische_codes(self, dag_type: str) -> List[ShiftCode]:
+        """Kritische shift codes van actieve werkposten, op werkpost naam + shift_type"""
+        return self._kritisch_per_dag.get(dag_type, [])
+
+    def werkdag_codes(self) -> FrozenSet[str]:
+        """Codes die als werkdag tellen (werkpost of speciale code flag)"""
+        return self._werkdag
+
+    def reset_codes(self) -> FrozenSet[str]:
+        """Codes die de 12u rust resetten"""
+        return self._reset
+
+    def werkpost_per_code(self) -> Dict[str, int]:
+        """{code: werkpost_id} van actieve werkposten (speciale codes niet)"""
+        return {shift.code: shift.werkpost_id for shift in self.shift_codes if shift.werkpost.is_actief}
+
+    def shift_tijden(self) -> Dict[str, Dict[str, Any]]:
+        """Formaat van PlanningValidator._get_shift_tijden (ConstraintChecker input)"""
+        tijden: Dict[str, Dict[str, Any]] = {}
+        for shift in self.shift_codes:
+            if not shift.werkpost.is_actief:
+                continue
+            tijden[shift.code] = {
+                'start_uur': shift.start_uur,
+                'eind_uur': shift.eind_uur,
+                'shift_type': shift.shift_type,
+                'werkpost_naam': shift.werkpost.naam,
+                'telt_als_werkdag': shift.werkpost.telt_als_werkdag,
+                'reset_12u_rust': shift.werkpost.reset_12u_rust,
+                'breekt_werk_reeks': shift.werkpost.reset_12u_rust,  # Zelfde flag
+                'term': None,
+            }
+        for speciale in self.speciale_codes.values():
+            tijden[speciale.code] = {
+                'start_uur': None,
+                'eind_uur': None,
+                'shift_type': None,
+                'term': speciale.term,
+                'telt_als_werkdag': speciale.telt_als_werkdag,
+                'reset_12u_rust': speciale.reset_12u_rust,
+                'breekt_werk_reeks': speciale.breekt_werk_reeks,
+            }
+        return tijden
+
+    # ---------------------------------------------------------------- laden
+
+    @classmethod
+    def laad(cls, conn: Optional[sqlite3.Connection] = None, versie: int = 0) -> 'ReferentieCatalogus':
+        """Werkposten, shift codes en speciale codes (3 queries)"""
+        eigen = conn is None
+        if eigen:
+            conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, naam, telt_als_werkdag, reset_12u_rust, breekt_werk_reeks, is_actief
+                FROM werkposten
+            """)
+            werkposten = {
+                row['id']: Werkpost(row['id'], row['naam'], bool(row['telt_als_werkdag']),
+                                    bool(row['reset_12u_rust']), bool(row['breekt_werk_reeks']),
+                                    bool(row['is_actief']))
+                for row in cursor.fetchall()
+            }
+
+            cursor.execute("""
+                SELECT code, werkpost_id, dag_type, shift_type, start_uur, eind_uur, is_kritisch
+                FROM shift_codes
+                ORDER BY id
+            """)
+            shift_codes = [
+                ShiftCode(row['code'], row['werkpost_id'], row['dag_type'], row['shift_type'],
+                          row['start_uur'], row['eind_uur'], bool(row['is_kritisch']),
+                          werkposten[row['werkpost_id']])
+                for row in cursor.fetchall() if row['werkpost_id'] in werkposten
+            ]
+
+            cursor.execute("""
+                SELECT code, naam, term, telt_als_werkdag, reset_12u_rust, breekt_werk_reeks
+                FROM speciale_codes
+            """)
+            speciale_codes = [
+                SpecialeCode(row['code'], row['naam'], row['term'], bool(row['telt_als_werkdag']),
+                             bool(row['reset_12u_rust']), bool(row['breekt_werk_reeks']))
+                for row in cursor.fetchall()
+            ]
+            return cls(werkposten.values(), shift_codes, speciale_codes, versie)
+        finally:
+            if eigen:
+                conn.close()
+
+    @classmethod
+    def get_instance(cls, conn: Optional[sqlite3.Connection] = None) -> 'ReferentieCatalogus':
+        """Gedeelde catalogus; herladen als er sinds het laden iets gewijzigd is"""
+        if cls._instance is None or cls._instance.versie != cls._wijzigingen:
+            cls._instance = cls.laad(conn, versie=cls._wijzigingen)
+        return cls._instance
+
+    @classmethod
+    def huidige_versie(cls) -> int:
+        """Wijzigingsteller; afgeleide caches herladen als hun versie verschilt"""
+        return cls._wijzigingen
+
+    @classmethod
+    def invalideer(cls):
+        """Verhoog de wijzigingsteller; aanroepen na wijziging in shift/speciale codes of werkposten"""
+        cls._wijzigingen += 1
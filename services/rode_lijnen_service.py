@@ -0,0 +1,241 @@
+# services/rode_lijnen_service.py
+"""
+Rode Lijnen Service
+v0.6.29 - Rode lijn periodes berekend uit rode_lijnen_config i.p.v. opgezocht
+
+Probleem: rode lijnen werden per periode in de rode_lijnen tabel gezet
+(extend_rode_lijnen_tot / regenereer_rode_lijnen_vanaf) en elke lezer had
+een eigen query. PlanningValidator filterde op strftime('%Y', start_datum)
+en miste daardoor de cyclus over nieuwjaar.
+
+Oplossing: een periode is rekenkunde op de config versies:
+    start = eerste_start + k * interval, nummer = eerste_nummer + k
+Per config versie (HRRegelsIndex VersieIndex op actief_vanaf) 1 segment.
+Bij een nieuwe versie met actief_vanaf V (zelfde regels als voorheen in
+regenereer_rode_lijnen_vanaf):
+- config start_datum >= V: nieuwe cyclus start op start_datum
+- anders: bestaande cyclus loopt door, volgende periode = laatste start
+  voor V + nieuw interval
+De laatste periode van een segment loopt tot de eerste start van het
+volgende segment (periodes sluiten naadloos aan).
+
+periode_op(datum): bisect over de segmenten (enkele versies) + deling = O(1).
+De rode_lijnen tabel is enkel nog een cache (synchroniseer_rode_lijnen_cache).
+
+GEBRUIK:
+    kalender = RodeLijnenKalender.get_instance()
+    periode = kalender.periode_op(date(2026, 1, 2))   # RodeLijnPeriode(19, ...)
+    kalender.periodes(van, tot)                       # alle periodes die [van, tot] raken
+    RodeLijnenKalender.refresh()                      # na wijziging in rode_lijnen_config
+"""
+
+import sqlite3
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from database.connection import get_connection
+from services.hr_regels_index import Versie, laad_rode_lijn_config_index
+
+
+# Fallback als rode_lijnen_config leeg is (zelfde als voorheen in extend_rode_lijnen_tot)
+STANDAARD_START = date(2024, 7, 28)
+STANDAARD_INTERVAL = 28
+
+
+@dataclass(frozen=True)
+class RodeLijnPeriode:
+    """1 rode lijn cyclus (eind inclusief)"""
+    periode_nummer: int
+    start_datum: date
+    eind_datum: date
+
+    def als_dict(self) -> Dict[str, Any]:
+        """Formaat van ConstraintChecker.check_max_werkdagen_cyclus"""
+        return {'start_datum': self.start_datum, 'eind_datum': self.eind_datum,
+                'periode_nummer': self.periode_nummer}
+
+
+@dataclass
+class _Segment:
+    """Periodes eerste_start + k * interval, k < aantal (None = onbegrensd)"""
+    eerste_start: date
+    interval: int
+    eerste_nummer: int
+    aantal: Optional[int] = None
+
+
+class RodeLijnenKalender:
+    """Rode lijn periodes voor elke datum, zonder rode_lijnen tabel"""
+
+    _instance: Optional['RodeLijnenKalender'] = None
+
+    def __init__(self, versies: Iterable[Versie]):
+        """
+        Args:
+            versies: (actief_vanaf, actief_tot, (start_datum, interval_dagen)),
+                     bijv. laad_rode_lijn_config_index().versies()
+        """
+        segmenten: List[_Segment] = []
+        for vanaf, _, (anker, interval) in sorted(versies, key=lambda v: v[0]):
+            if not segmenten:
+                # Eerste versie geldt vanaf zijn eigen start datum
+                segmenten.append(_Segment(anker, interval, 1))
+                continue
+
+            # Versie die ingaat voor de vorige cyclus begon vervangt die volledig
+            nummer = segmenten[-1].eerste_nummer
+            while segmenten and vanaf <= segmenten[-1].eerste_start:
+                nummer = segmenten.pop().eerste_nummer
+            if not segmenten:
+                segmenten.append(_Segment(anker, interval, nummer))
+                continue
+
+            vorige = segmenten[-1]
+            k = (vanaf - vorige.eerste_start - timedelta(days=1)).days // vorige.interval
+            if vorige.aantal is not None:
+                k = min(k, vorige.aantal - 1)
+            laatste_start = vorige.eerste_start + timedelta(days=k * vorige.interval)
+            vorige.aantal = k + 1
+
+            eerste = anker if anker >= vanaf else laatste_start + timedelta(days=interval)
+            segmenten.append(_Segment(eerste, interval, vorige.eerste_nummer + k + 1))
+
+        self._segmenten = segmenten
+        self._starts = [segment.eerste_start for segment in segmenten]
+        self._nummers = [segment.eerste_nummer for segment in segmenten]
+
+    def _periode(self, s: int, k: int) -> RodeLijnPeriode:
+        """Periode k van segment s"""
+        segment = self._segmenten[s]
+        start = segment.eerste_start + timedelta(days=k * segment.interval)
+        if segment.aantal is not None and k == segment.aantal - 1:
+            eind = self._segmenten[s + 1].eerste_start - timedelta(days=1)
+        else:
+            eind = start + timedelta(days=segment.interval - 1)
+        return RodeLijnPeriode(segment.eerste_nummer + k, start, eind)
+
+    def periode_op(self, datum: date) -> Optional[RodeLijnPeriode]:
+        """Periode die datum bevat (None als datum voor de eerste rode lijn valt)"""
+        s = bisect_right(self._starts, datum) - 1
+        if s < 0:
+            return None
+        segment = self._segmenten[s]
+        k = (datum - segment.eerste_start).days // segment.interval
+        if segment.aantal is not None:
+            k = min(k, segment.aantal - 1)
+        return self._periode(s, k)
+
+    def periode_nummer(self, nummer: int) -> Optional[RodeLijnPeriode]:
+        """Periode met dit nummer (None als onbekend)"""
+        s = bisect_right(self._nummers, nummer) - 1
+        if s < 0:
+            return None
+        k = nummer - self._nummers[s]
+        segment = self._segmenten[s]
+        if segment.aantal is not None and k >= segment.aantal:
+            return None
+        return self._periode(s, k)
+
+    def periodes(self, van: date, tot: date) -> List[RodeLijnPeriode]:
+        """Alle periodes die [van, tot] raken, op volgorde"""
+        if not self._starts or tot < self._starts[0]:
+            return []
+        periode = self.periode_op(max(van, self._starts[0]))
+        resultaat = []
+        while periode is not None and periode.start_datum <= tot:
+            resultaat.append(periode)
+            periode = self.periode_nummer(periode.periode_nummer + 1)
+        return resultaat
+
+    def starts(self) -> 'RodeLijnStarts':
+        """Start datum lookup voor de grids"""
+        return RodeLijnStarts(self)
+
+    # ---------------------------------------------------------------- laden
+
+    @classmethod
+    def laad(cls, conn: Optional[sqlite3.Connection] = None) -> 'RodeLijnenKalender':
+        """Alle rode_lijnen_config versies (1 query)"""
+        versies = laad_rode_lijn_config_index(conn).versies()
+        if not versies:
+            versies = [(STANDAARD_START, None, (STANDAARD_START, STANDAARD_INTERVAL))]
+        return cls(versies)
+
+    @classmethod
+    def get_instance(cls) -> 'RodeLijnenKalender':
+        """Gedeelde kalender (1 query, daarna enkel rekenwerk)"""
+        if cls._instance is None:
+            cls._instance = cls.laad()
+        return cls._instance
+
+    @classmethod
+    def refresh(cls):
+        """Herladen bij volgende get_instance(); aanroepen na wijzigingen in rode_lijnen_config"""
+        cls._instance = None
+
+
+class RodeLijnStarts:
+    """
+    Start datum (ISO string) → periode nummer, berekend per datum
+
+    Vervangt de dict uit SELECT ... FROM rode_lijnen in de grids: zelfde
+    'in' / [] / get gebruik, maar voor elke datum (niet enkel de tabel).
+    """
+
+    def __init__(self, kalender: RodeLijnenKalender):
+        self._kalender = kalender
+        self._cache: Dict[str, Optional[int]] = {}
+
+    def get(self, datum_str: str, standaard: Optional[int] = None) -> Optional[int]:
+        if datum_str not in self._cache:
+            periode = self._kalender.periode_op(date.fromisoformat(datum_str[:10]))
+            is_start = periode is not None and periode.start_datum.isoformat() == datum_str[:10]
+            self._cache[datum_str] = periode.periode_nummer if is_start else None
+        nummer = self._cache[datum_str]
+        return standaard if nummer is None else nummer
+
+    def __contains__(self, datum_str: str) -> bool:
+        return self.get(datum_str) is not None
+
+    def __getitem__(self, datum_str: str) -> int:
+        nummer = self.get(datum_str)
+        if nummer is None:
+            raise KeyError(datum_str)
+        return nummer
+
+
+def periodes_rond(van: date, tot: date) -> List[Dict[str, Any]]:
+    """Periodes die [van, tot] raken als checker dicts"""
+    return [periode.als_dict() for periode in RodeLijnenKalender.get_instance().periodes(van, tot)]
+
+
+def synchroniseer_rode_lijnen_cache(tot: date, conn: Optional[sqlite3.Connection] = None) -> int:
+    """
+    Schrijf de rode_lijnen tabel (optionele cache) opnieuw vanuit de kalender
+
+    Enkel voor externe lezers/rapporten; de applicatie rekent zelf.
+
+    Returns:
+        Aantal geschreven periodes
+    """
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        kalender = RodeLijnenKalender.laad(conn)
+        rijen: List[Tuple[int, str, str]] = [
+            (periode.periode_nummer, periode.start_datum.isoformat(), periode.eind_datum.isoformat())
+            for periode in kalender.periodes(date.min, tot)
+        ]
+        conn.execute("DELETE FROM rode_lijnen")
+        conn.executemany("""
+            INSERT INTO rode_lijnen (periode_nummer, start_datum, eind_datum)
+            VALUES (?, ?, ?)
+        """, rijen)
+        conn.commit()
+        return len(rijen)
+    finally:
+        if eigen:
+            conn.close()
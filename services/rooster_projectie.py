@@ -0,0 +1,283 @@
+# services/rooster_projectie.py
+"""
+Rooster Projectie
+v0.6.29 - Typetabel in memory uitrollen over een willekeurige horizon
+
+Probleem: AutoGeneratieDialog en TypetabelBeheerScreen hadden elk een kopie
+van bereken_shift_slim(): per dag en per gebruiker werden de werkposten
+opnieuw gesorteerd en het shift type met string operaties genormaliseerd.
+
+Oplossing: RoosterProjectie compileert eenmalig
+- de typetabel naar een lijst van genormaliseerde shift types per cyclusdag
+- per werkposten combinatie (op prioriteit) een lookup tabel
+  [dag_type][cyclusdag] → concrete code
+Een dag projecteren is daarna enkel index rekenen + 1 lijst lookup.
+Gebruikers met dezelfde werkposten delen hun tabel.
+
+projecteer() levert een RoosterStore (zelfde compacte formaat als de grid),
+zonder de planning tabel aan te raken: bruikbaar voor generatie,
+pre-validatie en prognoses.
+
+Qt-vrij.
+
+GEBRUIK:
+    projectie = RoosterProjectie.laad()          # actieve typetabel, None als geen
+    rooster = projectie.projecteer(date(2026, 1, 1), date(2026, 12, 31))
+    rooster.get_code("2026-03-02", gebruiker_id)  # '7101' of ''
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from database.connection import get_connection
+from services.dag_kalender import DAG_TYPES, DAG_TYPE_PER_WEEKDAG, ZONDAG
+from services.rooster_store import RoosterStore
+
+
+# Typetabel waarden die zonder mapping als code overgenomen worden
+DIRECTE_CODES = frozenset({'RX', 'CX', 'T'})
+
+# Typetabel notaties → shift_type in shift_codes
+SHIFT_TYPE_ALIASSEN = {
+    'v': 'vroeg', 'vroeg': 'vroeg',
+    'l': 'laat', 'laat': 'laat',
+    'n': 'nacht', 'nacht': 'nacht',
+    'd': 'dag', 'dag': 'dag',
+}
+
+# (is_directe_code, waarde): ('RX') of shift_type ('vroeg')
+CyclusCel = Optional[Tuple[bool, str]]
+
+
+def normaliseer_shift_type(shift_type: Optional[str]) -> CyclusCel:
+    """
+    Typetabel waarde → (True, directe code) / (False, shift_type) / None
+
+    Voorbeelden: 'rx' → (True, 'RX'), 'V' → (False, 'vroeg'), '' → None
+    """
+    if not shift_type:
+        return None
+    if shift_type.upper() in DIRECTE_CODES:
+        return True, shift_type.upper()
+    genormaliseerd = SHIFT_TYPE_ALIASSEN.get(shift_type.lower())
+    return (False, genormaliseerd) if genormaliseerd else None
+
+
+@dataclass(frozen=True)
+class ProjectieGebruiker:
+    """Gebruiker zoals de projectie hem nodig heeft"""
+    gebruiker_id: int
+    startweek: int
+    werkposten: Tuple[int, ...]  # werkpost ids, hoogste prioriteit eerst
+
+
+class RoosterProjectie:
+    """Gecompileerde typetabel + shift code mapping"""
+
+    def __init__(self, aantal_weken: int, actief_vanaf: date,
+                 typetabel_data: Dict[Tuple[int, int], str],
+                 shift_codes_map: Dict[Tuple[int, str, str], str],
+                 feestdagen: Iterable[str] = (),
+                 gebruikers: Sequence[ProjectieGebruiker] = ()):
+        """
+        Args:
+            typetabel_data: {(week, dag): shift_type} - week 1-based, dag 1=maandag
+            shift_codes_map: {(werkpost_id, dag_type, shift_type): code}
+            feestdagen: datum strings; krijgen zondag codes (V → 7701)
+            gebruikers: standaard gebruikers voor projecteer()
+        """
+        self.aantal_weken = aantal_weken
+        self.actief_vanaf = actief_vanaf
+        self.feestdagen = frozenset(feestdagen)
+        self.gebruikers: List[ProjectieGebruiker] = list(gebruikers)
+        self.shift_codes_map = shift_codes_map
+
+        # Cyclusdag index = (week - 1) * 7 + (dag - 1)
+        self._cyclus: List[CyclusCel] = [
+            normaliseer_shift_type(typetabel_data.get((week, dag)))
+            for week in range(1, aantal_weken + 1)
+            for dag in range(1, 8)
+        ]
+        self._tabellen: Dict[Tuple[int, ...], List[List[Optional[str]]]] = {}
+
+    # ------------------------------------------------------------- compileren
+
+    def tabel(self, werkposten: Tuple[int, ...]) -> List[List[Optional[str]]]:
+        """Lookup tabel [dag_type][cyclusdag] → code voor deze werkposten (gecachet)"""
+        tabel = self._tabellen.get(werkposten)
+        if tabel is None:
+            tabel = [[self._zoek_code(cel, werkposten, dag_type) for cel in self._cyclus]
+                     for dag_type in DAG_TYPES]
+            self._tabellen[werkposten] = tabel
+        return tabel
+
+    def _zoek_code(self, cel: CyclusCel, werkposten: Tuple[int, ...], dag_type: str) -> Optional[str]:
+        if cel is None:
+            return None
+        is_directe_code, waarde = cel
+        if is_directe_code:
+            return waarde
+        # Eerste werkpost (op prioriteit) met een code voor dit shift type
+        for werkpost_id in werkposten:
+            code = self.shift_codes_map.get((werkpost_id, dag_type, waarde))
+            if code:
+                return code
+        return None
+
+    # ------------------------------------------------------------ projecteren
+
+    def cyclus_positie(self, datum: date) -> Tuple[int, int]:
+        """(week basis sinds actief_vanaf, dag in week 0-6)"""
+        return (datum - self.actief_vanaf).days // 7, datum.weekday()
+
+    def dag_type(self, datum: date) -> int:
+        """Index in DAG_TYPES (feestdag = zondag)"""
+        if datum.isoformat() in self.feestdagen:
+            return ZONDAG
+        return DAG_TYPE_PER_WEEKDAG[datum.weekday()]
+
+    def posities(self, datums: Iterable[date]) -> List[Tuple[int, int, int]]:
+        """(week basis, dag in week, dag_type) per datum: dag afhankelijke delen 1x per datum"""
+        return [(*self.cyclus_positie(datum), self.dag_type(datum)) for datum in datums]
+
+    def bereken_shift(self, datum: date, startweek: int, werkposten: Tuple[int, ...]) -> Optional[str]:
+        """Code voor 1 dag (zelfde uitkomst als de oude bereken_shift_slim)"""
+        week_basis, dag = self.cyclus_positie(datum)
+        week = (week_basis + startweek - 1) % self.aantal_weken
+        return self.tabel(werkposten)[self.dag_type(datum)][week * 7 + dag]
+
+    def projecteer(self, start_datum: date, eind_datum: date,
+                   gebruikers: Optional[Sequence[ProjectieGebruiker]] = None) -> RoosterStore:
+        """
+        Rol de typetabel uit over [start_datum, eind_datum] als RoosterStore
+
+        Args:
+            gebruikers: standaard self.gebruikers (actieve, niet-reserve gebruikers
+                        met minstens 1 werkpost)
+        """
+        rooster = RoosterStore(start_datum.isoformat(), eind_datum.isoformat())
+        datums = [start_datum + timedelta(days=i) for i in range(len(rooster.datums))]
+
+        # Dag afhankelijke delen 1x per datum i.p.v. per gebruiker
+        posities = self.posities(datums)
+
+        for gebruiker in (self.gebruikers if gebruikers is None else gebruikers):
+            tabel = self.tabel(gebruiker.werkposten)
+            offset = gebruiker.startweek - 1
+            rooster.zet_rij(gebruiker.gebruiker_id, [
+                tabel[dag_type][((week_basis + offset) % self.aantal_weken) * 7 + dag]
+                for week_basis, dag, dag_type in posities
+            ])
+        return rooster
+
+    # ----------------------------------------------------------------- laden
+
+    @classmethod
+    def laad(cls, versie_id: Optional[int] = None,
+             conn: Optional[sqlite3.Connection] = None,
+             concept_vanaf: Optional[date] = None) -> Optional['RoosterProjectie']:
+        """
+        Projectie voor typetabel versie (standaard: actieve versie)
+
+        Args:
+            concept_vanaf: veronderstelde activatie datum voor een concept versie
+
+        Returns None als de versie niet bestaat / er geen actieve typetabel is.
+        """
+        eigen = conn is None
+        if eigen:
+            conn = get_connection()
+        try:
+            typetabel = laad_typetabel(conn, versie_id, concept_vanaf)
+            if typetabel is None:
+                return None
+            aantal_weken, actief_vanaf, typetabel_data = typetabel
+            return cls(
+                aantal_weken, actief_vanaf, typetabel_data,
+                laad_shift_codes_map(conn),
+                feestdagen=[row['datum'] for row in conn.execute("SELECT datum FROM feestdagen")],
+                gebruikers=laad_projectie_gebruikers(conn),
+            )
+        finally:
+            if eigen:
+                conn.close()
+
+
+def laad_typetabel(conn: sqlite3.Connection, versie_id: Optional[int] = None,
+                   concept_vanaf: Optional[date] = None
+                   ) -> Optional[Tuple[int, date, Dict[Tuple[int, int], str]]]:
+    """
+    (aantal_weken, actief_vanaf, {(week, dag): shift_type}) of None
+
+    Concept versies hebben nog geen actief_vanaf: concept_vanaf (standaard vandaag).
+    """
+    cursor = conn.cursor()
+    if versie_id is None:
+        cursor.execute("""
+            SELECT id, aantal_weken, actief_vanaf
+            FROM typetabel_versies
+            WHERE status = 'actief'
+        """)
+    else:
+        cursor.execute("""
+            SELECT id, aantal_weken, actief_vanaf
+            FROM typetabel_versies
+            WHERE id = ?
+        """, (versie_id,))
+    versie = cursor.fetchone()
+    if not versie:
+        return None
+
+    # Concept versies hebben nog geen actief_vanaf
+    actief_vanaf = (date.fromisoformat(versie['actief_vanaf'][:10])
+                    if versie['actief_vanaf'] else concept_vanaf or date.today())
+
+    cursor.execute("""
+        SELECT week_nummer, dag_nummer, shift_type
+        FROM typetabel_data
+        WHERE versie_id = ?
+    """, (versie['id'],))
+    typetabel_data = {(row['week_nummer'], row['dag_nummer']): row['shift_type']
+                      for row in cursor.fetchall()}
+    return versie['aantal_weken'], actief_vanaf, typetabel_data
+
+
+def laad_shift_codes_map(conn: sqlite3.Connection) -> Dict[Tuple[int, str, str], str]:
+    """{(werkpost_id, dag_type, shift_type): code}"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT werkpost_id, dag_type, shift_type, code
+        FROM shift_codes
+        WHERE code IS NOT NULL AND code != ''
+    """)
+    return {(row['werkpost_id'], row['dag_type'], row['shift_type']): row['code']
+            for row in cursor.fetchall()}
+
+
+def laad_projectie_gebruikers(conn: sqlite3.Connection) -> List[ProjectieGebruiker]:
+    """Actieve, niet-reserve gebruikers met minstens 1 werkpost"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT gebruiker_id, werkpost_id
+        FROM gebruiker_werkposten
+        ORDER BY gebruiker_id, prioriteit
+    """)
+    werkposten: Dict[int, List[int]] = {}
+    for row in cursor.fetchall():
+        werkposten.setdefault(row['gebruiker_id'], []).append(row['werkpost_id'])
+
+    cursor.execute("""
+        SELECT id, startweek_typedienst
+        FROM gebruikers
+        WHERE is_actief = 1
+          AND gebruikersnaam != 'admin'
+          AND is_reserve = 0
+        ORDER BY volledige_naam
+    """)
+    return [
+        ProjectieGebruiker(row['id'], row['startweek_typedienst'] or 1, tuple(werkposten[row['id']]))
+        for row in cursor.fetchall()
+        if werkposten.get(row['id'])
+    ]
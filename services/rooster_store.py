@@ -0,0 +1,360 @@
+# services/rooster_store.py
+"""
+Rooster Store
+v0.6.29 - Compacte in-memory opslag van planning en verlof voor een periode
+
+Probleem: planning_data[datum][gebruiker_id] was een dict met 10+ velden per
+cel (shift naam, werkpost, tijden, ... herhaald bij elk voorkomen van dezelfde
+code) en verlof_data werd dag per dag uitgeschreven. De planning query deed
+hiervoor 4 JOINs per rij.
+
+Oplossing:
+- CodeCatalogus: elke code krijgt één klein getal + gedeelde CodeInfo
+  (metadata 1x per code i.p.v. per cel, apart geladen uit de kleine code tabellen)
+- RoosterStore: per gebruiker een array('H') van code ids, geïndexeerd op dag
+  offset; notities sparse in een dict
+- VerlofPerioden: per gebruiker een lijst van intervallen (geen dag expansie)
+
+Qt-vrij: bruikbaar in grid widgets en services.
+
+GEBRUIK:
+    rooster = laad_rooster("2025-10-24", "2025-12-08")
+    rooster.get_code("2025-11-03", gebruiker_id)       # '7101' of ''
+    rooster.get_code_info("2025-11-03", gebruiker_id)  # CodeInfo (gedeeld object)
+    verlof = laad_verlof_perioden("2025-10-24", "2025-12-08")
+    verlof.get("2025-11-03", gebruiker_id)             # VerlofPeriode of None
+"""
+
+import sqlite3
+from array import array
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from database.connection import get_connection
+from services.maand_status_service import get_gepubliceerde_maanden, gepubliceerde_datum_ranges
+
+
+GEEN_CODE = 0  # Code id voor lege cel
+
+
+@dataclass(frozen=True)
+class CodeInfo:
+    """Metadata van een code (gedeeld door alle cellen met deze code)"""
+    code: str
+    shift_naam: Optional[str] = None
+    start_tijd: Optional[str] = None
+    eind_tijd: Optional[str] = None
+    werkpost_naam: Optional[str] = None
+    speciale_naam: Optional[str] = None
+
+    @property
+    def is_speciale_code(self) -> bool:
+        return self.speciale_naam is not None
+
+
+class CodeCatalogus:
+    """Interning van codes: code ↔ klein getal + gedeelde CodeInfo"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._infos: List[Optional[CodeInfo]] = [None]  # Index 0 = GEEN_CODE
+
+    def registreer(self, info: CodeInfo) -> int:
+        """Voeg code toe of vervang metadata. Returns code id"""
+        code_id = self._ids.get(info.code)
+        if code_id is None:
+            code_id = len(self._infos)
+            self._ids[info.code] = code_id
+            self._infos.append(info)
+        else:
+            self._infos[code_id] = info
+        return code_id
+
+    def intern(self, code: Optional[str]) -> int:
+        """Code id (onbekende code wordt toegevoegd zonder metadata)"""
+        if not code:
+            return GEEN_CODE
+        code_id = self._ids.get(code)
+        if code_id is None:
+            code_id = self.registreer(CodeInfo(code))
+        return code_id
+
+    def code_id(self, code: Optional[str]) -> int:
+        """Code id zonder toe te voegen (GEEN_CODE als onbekend)"""
+        return self._ids.get(code, GEEN_CODE) if code else GEEN_CODE
+
+    def info(self, code_id: int) -> Optional[CodeInfo]:
+        return self._infos[code_id]
+
+    def code(self, code_id: int) -> str:
+        info = self._infos[code_id]
+        return info.code if info else ''
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @classmethod
+    def laad(cls, conn: sqlite3.Connection) -> 'CodeCatalogus':
+        """Alle shift codes + speciale codes (2 kleine queries)"""
+        catalogus = cls()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT sc.code, sc.shift_type, sc.start_uur, sc.eind_uur, w.naam as werkpost_naam
+            FROM shift_codes sc
+            LEFT JOIN werkposten w ON sc.werkpost_id = w.id
+            ORDER BY sc.id
+        """)
+        for row in cursor.fetchall():
+            catalogus.registreer(CodeInfo(
+                code=row['code'],
+                shift_naam=row['shift_type'],
+                start_tijd=row['start_uur'],
+                eind_tijd=row['eind_uur'],
+                werkpost_naam=row['werkpost_naam'],
+            ))
+
+        # Speciale codes na shift codes: bij gelijke code wint speciale code (zoals voorheen)
+        cursor.execute("SELECT code, naam FROM speciale_codes")
+        for row in cursor.fetchall():
+            catalogus.registreer(CodeInfo(code=row['code'], speciale_naam=row['naam']))
+
+        return catalogus
+
+
+class RoosterStore:
+    """
+    Planning voor een aaneengesloten datum range
+
+    Per gebruiker één array van code ids (1 slot per dag). Status komt uit
+    maand_status (per maand), namen uit de gebruikers tabel.
+    """
+
+    def __init__(self, start_datum: Optional[str] = None, eind_datum: Optional[str] = None,
+                 catalogus: Optional[CodeCatalogus] = None):
+        self.datums: List[str] = []
+        if start_datum and eind_datum:
+            start = date.fromisoformat(start_datum)
+            aantal = (date.fromisoformat(eind_datum) - start).days + 1
+            self.datums = [(start + timedelta(days=i)).isoformat() for i in range(aantal)]
+        self._dag_index: Dict[str, int] = {datum: i for i, datum in enumerate(self.datums)}
+
+        self.catalogus = catalogus or CodeCatalogus()
+        self._codes: Dict[int, array] = {}  # {gebruiker_id: array('H') per dag}
+        self._notities: Dict[Tuple[int, int], str] = {}  # {(gebruiker_id, dag): notitie}
+
+        self.gebruiker_namen: Dict[int, str] = {}
+        self.gepubliceerde_maanden: Set[Tuple[int, int]] = set()
+
+    # ------------------------------------------------------------------ lezen
+
+    def get_code(self, datum_str: str, gebruiker_id: int) -> str:
+        """Shift code of lege string"""
+        dag = self._dag_index.get(datum_str)
+        rij = self._codes.get(gebruiker_id)
+        if dag is None or rij is None:
+            return ''
+        return self.catalogus.code(rij[dag])
+
+    def get_code_info(self, datum_str: str, gebruiker_id: int) -> Optional[CodeInfo]:
+        dag = self._dag_index.get(datum_str)
+        rij = self._codes.get(gebruiker_id)
+        if dag is None or rij is None:
+            return None
+        return self.catalogus.info(rij[dag])
+
+    def get_notitie(self, datum_str: str, gebruiker_id: int) -> str:
+        dag = self._dag_index.get(datum_str)
+        if dag is None:
+            return ''
+        return self._notities.get((gebruiker_id, dag), '')
+
+    def get_status(self, datum_str: str) -> str:
+        """'gepubliceerd' of 'concept' (per maand)"""
+        maand = (int(datum_str[:4]), int(datum_str[5:7]))
+        return 'gepubliceerd' if maand in self.gepubliceerde_maanden else 'concept'
+
+    def get_gebruiker_naam(self, gebruiker_id: int) -> Optional[str]:
+        return self.gebruiker_namen.get(gebruiker_id)
+
+    def codes_op_datum(self, datum_str: str) -> Iterator[Tuple[int, str]]:
+        """(gebruiker_id, code) voor alle ingevulde cellen op datum"""
+        dag = self._dag_index.get(datum_str)
+        if dag is None:
+            return
+        for gebruiker_id, rij in self._codes.items():
+            if rij[dag]:
+                yield gebruiker_id, self.catalogus.code(rij[dag])
+
+    def iter_codes(self) -> Iterator[Tuple[str, int, str]]:
+        """(datum_str, gebruiker_id, code) voor alle ingevulde cellen"""
+        for gebruiker_id, rij in self._codes.items():
+            for dag, code_id in enumerate(rij):
+                if code_id:
+                    yield self.datums[dag], gebruiker_id, self.catalogus.code(code_id)
+
+    def dagen_met_data(self) -> int:
+        """Aantal dagen met minstens 1 shift of notitie"""
+        dagen = {dag for rij in self._codes.values() for dag, code_id in enumerate(rij) if code_id}
+        dagen.update(dag for _, dag in self._notities)
+        return len(dagen)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'dagen': len(self.datums),
+            'gebruikers': len(self._codes),
+            'codes': len(self.catalogus),
+            'shifts': sum(1 for rij in self._codes.values() for code_id in rij if code_id),
+            'notities': len(self._notities),
+        }
+
+    # --------------------------------------------------------------- schrijven
+
+    def _rij(self, gebruiker_id: int) -> array:
+        rij = self._codes.get(gebruiker_id)
+        if rij is None:
+            rij = array('H', bytes(2 * len(self.datums)))
+            self._codes[gebruiker_id] = rij
+        return rij
+
+    def zet_code(self, datum_str: str, gebruiker_id: int, code: Optional[str]) -> str:
+        """Zet code (None/'' = leeg, notitie blijft). Returns oude code"""
+        dag = self._dag_index.get(datum_str)
+        if dag is None:
+            return ''
+        rij = self._rij(gebruiker_id)
+        oude_code = self.catalogus.code(rij[dag])
+        rij[dag] = self.catalogus.intern(code)
+        return oude_code
+
+    def zet_rij(self, gebruiker_id: int, codes: List[Optional[str]]) -> None:
+        """Vervang alle codes van gebruiker (1 code per dag in self.datums)"""
+        if len(codes) != len(self.datums):
+            raise ValueError(f"{len(codes)} codes voor {len(self.datums)} dagen")
+        intern = self.catalogus.intern
+        self._codes[gebruiker_id] = array('H', [intern(code) for code in codes])
+
+    def zet_notitie(self, datum_str: str, gebruiker_id: int, notitie: Optional[str]) -> None:
+        dag = self._dag_index.get(datum_str)
+        if dag is None:
+            return
+        if notitie:
+            self._notities[(gebruiker_id, dag)] = notitie
+        else:
+            self._notities.pop((gebruiker_id, dag), None)
+
+    def verwijder(self, datum_str: str, gebruiker_id: int) -> str:
+        """Verwijder planning rij (code + notitie). Returns oude code"""
+        self.zet_notitie(datum_str, gebruiker_id, None)
+        return self.zet_code(datum_str, gebruiker_id, None)
+
+    def zet_maand_status(self, jaar: int, maand: int, status: str) -> None:
+        if status == 'gepubliceerd':
+            self.gepubliceerde_maanden.add((jaar, maand))
+        else:
+            self.gepubliceerde_maanden.discard((jaar, maand))
+
+
+@dataclass(frozen=True)
+class VerlofPeriode:
+    """Eén verlof aanvraag (interval, niet per dag uitgeschreven)"""
+    start_datum: str
+    eind_datum: str
+    status: str
+    aangevraagd_op: Optional[str] = None
+
+
+class VerlofPerioden:
+    """Verlof aanvragen per gebruiker als interval lijsten"""
+
+    def __init__(self):
+        self._per_gebruiker: Dict[int, List[VerlofPeriode]] = {}
+
+    def voeg_toe(self, gebruiker_id: int, periode: VerlofPeriode) -> None:
+        self._per_gebruiker.setdefault(gebruiker_id, []).append(periode)
+
+    def get(self, datum_str: str, gebruiker_id: int) -> Optional[VerlofPeriode]:
+        """Verlof op datum (bij overlap wint de laatst geladen aanvraag, zoals voorheen)"""
+        gevonden = None
+        for periode in self._per_gebruiker.get(gebruiker_id, ()):
+            # ISO datum strings: string vergelijking volstaat
+            if periode.start_datum <= datum_str <= periode.eind_datum:
+                gevonden = periode
+        return gevonden
+
+    def __len__(self) -> int:
+        return sum(len(perioden) for perioden in self._per_gebruiker.values())
+
+
+def laad_rooster(start_datum: str, eind_datum: str, alleen_gepubliceerd: bool = False,
+                 conn: Optional[sqlite3.Connection] = None) -> RoosterStore:
+    """
+    Planning voor periode als RoosterStore (thread-safe: eigen connectie)
+
+    Args:
+        alleen_gepubliceerd: Enkel datums in gepubliceerde maanden (teamleden)
+    """
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        rooster = RoosterStore(start_datum, eind_datum, CodeCatalogus.laad(conn))
+        rooster.gepubliceerde_maanden = get_gepubliceerde_maanden(start_datum, eind_datum, conn)
+
+        where_clause = "WHERE datum BETWEEN ? AND ?"
+        params: List[str] = [start_datum, eind_datum]
+        if alleen_gepubliceerd:
+            ranges = gepubliceerde_datum_ranges(start_datum, eind_datum, rooster.gepubliceerde_maanden)
+            if not ranges:
+                return rooster
+            where_clause += " AND (" + " OR ".join("datum BETWEEN ? AND ?" for _ in ranges) + ")"
+            for range_start, range_eind in ranges:
+                params.extend((range_start, range_eind))
+
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT gebruiker_id, datum, shift_code, notitie
+            FROM planning
+            {where_clause}
+        """, params)
+        for row in cursor.fetchall():
+            rooster.zet_code(row['datum'], row['gebruiker_id'], row['shift_code'])
+            if row['notitie']:
+                rooster.zet_notitie(row['datum'], row['gebruiker_id'], row['notitie'])
+
+        cursor.execute("SELECT id, volledige_naam FROM gebruikers")
+        rooster.gebruiker_namen = {row['id']: row['volledige_naam'] for row in cursor.fetchall()}
+        return rooster
+    finally:
+        if eigen:
+            conn.close()
+
+
+def laad_verlof_perioden(start_datum: str, eind_datum: str,
+                         conn: Optional[sqlite3.Connection] = None) -> VerlofPerioden:
+    """Verlof aanvragen die overlappen met periode (thread-safe: eigen connectie)"""
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT gebruiker_id, start_datum, eind_datum, status, aangevraagd_op
+            FROM verlof_aanvragen
+            WHERE start_datum <= ? AND eind_datum >= ?
+            ORDER BY id
+        """, (eind_datum, start_datum))
+
+        verlof = VerlofPerioden()
+        for row in cursor.fetchall():
+            verlof.voeg_toe(row['gebruiker_id'], VerlofPeriode(
+                start_datum=row['start_datum'],
+                eind_datum=row['eind_datum'],
+                status=row['status'],
+                aangevraagd_op=row['aangevraagd_op'],
+            ))
+        return verlof
+    finally:
+        if eigen:
+            conn.close()
@@ -10,6 +10,8 @@ GEBRUIK:
 
 CACHE:
 - Bij eerste gebruik wordt de mapping geladen
+- v0.6.29: mapping komt uit de ReferentieCatalogus en volgt diens
+  wijzigingsteller (herladen na ReferentieCatalogus.invalideer())
 - Refresh automatisch na wijzigingen in ShiftCodesScreen
 - Bij ontbrekende term: fallback naar standaard codes
 
@@ -24,7 +26,7 @@ VERPLICHTE TERMEN:
 
 from typing import Dict
 import sqlite3
-from database.connection import get_connection
+from services.referentie_catalogus import ReferentieCatalogus
 
 
 class TermCodeService:
@@ -33,6 +35,7 @@ class TermCodeService:
     # Cache: term → code mapping
     _cache: Dict[str, str] = {}
     _initialized: bool = False
+    _versie: int = -1  # ReferentieCatalogus versie van de cache
 
     # Fallback codes als term niet gevonden wordt
     _FALLBACK_CODES = {
@@ -56,9 +59,8 @@ class TermCodeService:
             Code string (bijv. 'VV', 'RX', etc.)
             Bij ontbrekende term: fallback naar standaard code
         """
-        # Laad cache bij eerste gebruik
-        if not cls._initialized:
-            cls.refresh()
+        # Laad cache bij eerste gebruik of na wijziging in de catalogus
+        cls._zorg_actueel()
 
         # Haal code uit cache
         code = cls._cache.get(term)
@@ -78,36 +80,26 @@ class TermCodeService:
         Returns:
             Dictionary met term als key, code als value
         """
-        if not cls._initialized:
-            cls.refresh()
+        cls._zorg_actueel()
 
         return cls._cache.copy()
 
     @classmethod
-    def refresh(cls):
-        """
-        Herlaad cache vanuit database
-        Aanroepen na wijzigingen in speciale codes
-        """
-        try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
-            # Haal alle codes met termen op
-            cursor.execute("""
-                SELECT term, code
-                FROM speciale_codes
-                WHERE term IS NOT NULL
-            """)
+    def _zorg_actueel(cls):
+        """Herlaad als de cache nog niet geladen is of de catalogus gewijzigd is"""
+        if not cls._initialized or cls._versie != ReferentieCatalogus.huidige_versie():
+            cls._laad()
 
-            rows = cursor.fetchall()
-            conn.close()
+    @classmethod
+    def _laad(cls):
+        """Term→code mapping uit de ReferentieCatalogus"""
+        cls._versie = ReferentieCatalogus.huidige_versie()
+        try:
+            term_codes = ReferentieCatalogus.get_instance().term_codes()
 
             # Update cache
             cls._cache.clear()
-            for row in rows:
-                cls._cache[row['term']] = row['code']
-
+            cls._cache.update(term_codes)
             cls._initialized = True
 
         except sqlite3.Error:
@@ -115,6 +107,15 @@ class TermCodeService:
             cls._cache = cls._FALLBACK_CODES.copy()
             cls._initialized = True
 
+    @classmethod
+    def refresh(cls):
+        """
+        Herlaad cache vanuit database
+        Aanroepen na wijzigingen in speciale codes (invalideert ook de ReferentieCatalogus)
+        """
+        ReferentieCatalogus.invalideer()
+        cls._laad()
+
     @classmethod
     def validate_required_terms(cls) -> tuple[bool, list[str]]:
         """
@@ -123,8 +124,7 @@ class TermCodeService:
         Returns:
             (success: bool, missing_terms: list[str])
         """
-        if not cls._initialized:
-            cls.refresh()
+        cls._zorg_actueel()
 
         missing = []
         for term in cls._FALLBACK_CODES.keys():
@@ -0,0 +1,315 @@
+# services/typetabel_cyclus_validator.py
+"""
+Typetabel Cyclus Validator
+v0.6.29 - HR validatie van een typetabel als periodiek patroon
+
+Probleem: pre_valideer_typetabel() simuleerde 2.5 cycli voor 1 dummy
+gebruiker (startweek 1) en liet check_all() daarop lopen:
+- randeffecten: een reeks/RX gap over de cyclusgrens werd afgekapt, en
+  aan het einde van de simulatie kwamen valse "na laatste RX" violations
+- enkel startweek 1: de rode lijn cyclus (28 dagen) valt voor elke
+  startweek anders over het patroon, violations bij andere startweken
+  bleven onzichtbaar
+- traag voor 52-weken tabellen (check_all schaalt niet lineair)
+
+Oplossing: het patroon is periodiek (L = aantal_weken x 7 dagen) en een
+gebruiker met startweek s ziet exact hetzelfde patroon, 7 x (s - 1) dagen
+verschoven. Daaruit volgt:
+- Regels die enkel van de volgorde + weekdag afhangen (12u rust, reeks,
+  RX gap, nacht/vroeg, uren per week, weekends) geven voor ELKE startweek
+  dezelfde violations op dezelfde typetabel cellen → 1 evaluatie op de
+  cyclus met wrap-around (rotatie naar een reset punt of 2 cycli voor de
+  nacht-modus scan) volstaat.
+- Enkel de rode lijn regel hangt van de startweek af. Werkdagen per
+  venster worden 1x berekend voor alle L vensterstarts (prefix sommen);
+  startweek s gebruikt de vensters s ≡ fase + 7(s-1) (mod ggd(L, periode)).
+
+Locaties worden gerapporteerd als (week, dag, startweek): typetabel cel +
+betrokken startweek. Violation.datum(_range) blijft gevuld op de
+theoretische kalender vanaf `anker` (compatibel met bestaande dialogs);
+details['startweken'] bevat de betrokken startweken.
+
+Qt-vrij.
+
+GEBRUIK:
+    validator = CyclusValidator(checker, codes, rode_lijnen, anker=date(2025, 1, 6))
+    for v in validator.valideer():
+        print(validator.locaties(v), v.beschrijving)
+"""
+
+from datetime import date, timedelta
+from math import gcd
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from services.constraint_checker import (
+    ConstraintChecker, PlanningRegel, Violation, ViolationType, ViolationSeverity
+)
+
+
+# Theoretische maandag: week 1 dag 1 van de cyclus
+THEORETISCH_ANKER = date(2025, 1, 6)
+
+# (week 1-based, dag 1=maandag, startweek)
+CyclusLocatie = Tuple[int, int, int]
+
+
+class CyclusValidator:
+    """HR validatie van 1 typetabel cyclus over alle startweken"""
+
+    def __init__(self, checker: ConstraintChecker, codes: Sequence[Optional[str]],
+                 rode_lijnen: Optional[List[Dict]] = None,
+                 anker: date = THEORETISCH_ANKER):
+        """
+        Args:
+            checker: ConstraintChecker met HR config + shift tijden
+            codes: 1 cyclus codes vanaf week 1 maandag (lengte veelvoud van 7),
+                   None/'' = geen code
+            rode_lijnen: rode lijn periodes (enkel de eerste bepaalt fase + lengte)
+            anker: datum van week 1 maandag op de theoretische kalender
+        """
+        if not codes or len(codes) % 7:
+            raise ValueError(f"Cyclus moet een veelvoud van 7 dagen zijn, niet {len(codes)}")
+        self.checker = checker
+        self.codes: List[Optional[str]] = [code or None for code in codes]
+        self.rode_lijnen = rode_lijnen or []
+        self.anker = anker
+        self.lengte = len(codes)
+        self.aantal_weken = self.lengte // 7
+        self.alle_startweken = tuple(range(1, self.aantal_weken + 1))
+
+    # ---------------------------------------------------------------- helpers
+
+    def _code(self, positie: int) -> Optional[str]:
+        return self.codes[positie % self.lengte]
+
+    def _datum(self, positie: int) -> date:
+        return self.anker + timedelta(days=positie)
+
+    def _regels(self, van: int, tot: int) -> List[PlanningRegel]:
+        """Uitgerold patroon voor posities [van, tot) (wrap-around)"""
+        return [PlanningRegel(0, self._datum(p), self._code(p)) for p in range(van, tot)]
+
+    def _normaliseer(self, v: Violation, startweken: Sequence[int]) -> Violation:
+        """Verschuif naar de eerste cyclus (referentie: datum, anders range start)"""
+        referentie = v.datum or v.datum_range[0]
+        verschuiving = timedelta(days=((referentie - self.anker).days // self.lengte) * self.lengte)
+        if verschuiving:
+            if v.datum:
+                v.datum -= verschuiving
+            if v.datum_range:
+                v.datum_range = (v.datum_range[0] - verschuiving, v.datum_range[1] - verschuiving)
+        v.gebruiker_id = 0
+        v.details['startweken'] = list(startweken)
+        return v
+
+    def positie(self, datum: date) -> Tuple[int, int]:
+        """Datum op de theoretische kalender → (week, dag) in de typetabel"""
+        p = (datum - self.anker).days % self.lengte
+        return p // 7 + 1, p % 7 + 1
+
+    def locaties(self, v: Violation) -> List[CyclusLocatie]:
+        """(week, dag, startweek) per betrokken startweek"""
+        week, dag = self.positie(v.datum or v.datum_range[0])
+        return [(week, dag, startweek) for startweek in v.details.get('startweken', ())]
+
+    # ------------------------------------------------------------ valideren
+
+    def valideer(self) -> List[Violation]:
+        """Alle violations, gesorteerd op cyclus positie"""
+        invariant = (
+            self._check_12u_rust()
+            + self._check_max_uren_week()
+            + self._check_max_dagen_tussen_rx()
+            + self._check_max_werkdagen_reeks()
+            + self._check_max_weekends()
+            + self._check_nacht_vroeg()
+        )
+        violations = [self._normaliseer(v, self.alle_startweken) for v in invariant]
+        violations.extend(self._check_max_werkdagen_cyclus())
+        violations.sort(key=lambda v: v.datum or v.datum_range[0])
+        return violations
+
+    def _check_12u_rust(self) -> List[Violation]:
+        # L + 1 regels = alle L opeenvolgende paren, inclusief laatste → eerste dag
+        return self.checker.check_12u_rust(self._regels(0, self.lengte + 1)).violations
+
+    def _check_max_werkdagen_reeks(self) -> List[Violation]:
+        """Start na een reset punt: de reeks loopt dan exact zoals in het oneindige patroon"""
+        checker = self.checker
+        resets = [p for p, code in enumerate(self.codes)
+                  if not checker.is_werkdag_shift(code) or checker.breekt_werk_reeks(code)]
+        if not resets:
+            max_reeks = int(checker.hr_config.get('max_werkdagen_reeks', 7))
+            return [self._cyclus_violation(
+                ViolationType.MAX_WERKDAGEN_REEKS,
+                f"Geen rustdag in de volledige cyclus: onbeperkte reeks werkdagen (maximaal {max_reeks})",
+                {'max_reeks': max_reeks})]
+        start = resets[0] + 1
+        return checker.check_max_werkdagen_reeks(self._regels(start, start + self.lengte)).violations
+
+    def _check_max_dagen_tussen_rx(self) -> List[Violation]:
+        checker = self.checker
+        lege = [p for p, code in enumerate(self.codes) if not code]
+        if lege:
+            # Segmenten lopen van lege cel tot lege cel: start net na een lege cel
+            start = lege[0] + 1
+            return checker.check_max_dagen_tussen_rx(self._regels(start, start + self.lengte)).violations
+
+        # 1 oneindig segment: gaps tussen opeenvolgende RX, ook over de cyclusgrens
+        rx = [p for p, code in enumerate(self.codes) if code == 'RX']
+        max_gap = int(checker.hr_config.get('max_dagen_tussen_rx', 7))
+        if not rx:
+            return [self._cyclus_violation(
+                ViolationType.MAX_DAGEN_TUSSEN_RX,
+                f"Geen RX in de volledige cyclus (maximaal {max_gap} dagen tussen RX)",
+                {'max_gap': max_gap})]
+        # Eerste RX tot dezelfde RX een cyclus later: laatste regel is RX → geen "na laatste RX"
+        return checker.check_rx_gaps(self._regels(rx[0], rx[0] + self.lengte + 1), max_gap)
+
+    def _check_nacht_vroeg(self) -> List[Violation]:
+        """
+        Nacht-modus scan eindigt uiterlijk bij de volgende niet-RX/CX shift
+        (ten laatste de nacht zelf, 1 cyclus later) → 2 cycli volstaan.
+        Enkel nachten uit de eerste cyclus tellen (geen dubbels).
+        """
+        grens = self._datum(self.lengte)
+        violations = self.checker.check_nacht_gevolgd_door_vroeg(self._regels(0, 2 * self.lengte), 0).violations
+        return [v for v in violations if v.datum_range[0] < grens]
+
+    def _periodes(self, vensters) -> List[Tuple[int, int, Tuple]]:
+        """Periodes (week/weekend) die in de cyclus starten, met overlappende posities"""
+        periodes = []
+        for periode in vensters(self._datum(0), self._datum(self.lengte - 1)):
+            periode_start, periode_eind = periode[0], periode[1]
+            if periode_start.date() < self.anker:
+                continue  # Zelfde periode zit 1 cyclus later ook in de lijst
+            # Dag ervoor: nachtshift die over middernacht de periode in loopt
+            eerste = (periode_start.date() - self.anker).days - 1
+            laatste = (periode_eind.date() - self.anker).days
+            periodes.append((eerste, laatste, periode))
+        return periodes
+
+    def _check_max_uren_week(self) -> List[Violation]:
+        checker = self.checker
+        max_uren = float(checker.hr_config['max_uren_week'])
+        violations = []
+        for eerste, laatste, (week_start, week_eind, week_nummer) in self._periodes(checker.week_vensters):
+            shifts = [(p, self._code(p)) for p in range(eerste, laatste + 1)
+                      if self._code(p) and checker.shift_overlapt_venster(
+                          self._datum(p), self._code(p), week_start, week_eind)]
+            totaal_uren = sum(checker.shift_duur(code) or 0.0 for _, code in shifts)
+            if totaal_uren > max_uren:
+                violations.append(Violation(
+                    type=ViolationType.MAX_UREN_WEEK,
+                    severity=ViolationSeverity.ERROR,
+                    gebruiker_id=0,
+                    datum=None,
+                    datum_range=(week_start.date(), week_eind.date()),
+                    beschrijving=f"Te veel uren: {totaal_uren:.1f}u in week (maximaal {max_uren:.0f}u)",
+                    details={'totaal_uren': totaal_uren, 'max_uren': max_uren, 'shifts_count': len(shifts)},
+                    affected_shifts=[(0, self._datum(p)) for p, _ in shifts],
+                ))
+        return violations
+
+    def _check_max_weekends(self) -> List[Violation]:
+        """Gewerkte weekends als cyclische rij; reeksen tellen vanaf een vrij weekend"""
+        checker = self.checker
+        max_weekends = int(checker.hr_config.get('max_weekends_achter_elkaar', 6))
+        weekends = []
+        for eerste, laatste, (weekend_start, weekend_eind) in self._periodes(checker.weekend_vensters):
+            gewerkt = any(
+                self._code(p) and checker.shift_overlapt_venster(
+                    self._datum(p), self._code(p), weekend_start, weekend_eind)
+                for p in range(eerste, laatste + 1)
+            )
+            weekends.append((weekend_start, weekend_eind, gewerkt))
+
+        vrij = [i for i, (_, _, gewerkt) in enumerate(weekends) if not gewerkt]
+        if not vrij:
+            return [self._cyclus_violation(
+                ViolationType.MAX_WEEKENDS,
+                f"Geen vrij weekend in de volledige cyclus (maximaal {max_weekends} weekends achter elkaar)",
+                {'max_weekends': max_weekends})]
+
+        violations = []
+        reeks = 0
+        aantal = len(weekends)
+        cyclus = timedelta(days=self.lengte)
+        for i in range(vrij[0] + 1, vrij[0] + 1 + aantal):
+            weekend_start, weekend_eind, gewerkt = weekends[i % aantal]
+            if not gewerkt:
+                reeks = 0
+                continue
+            reeks += 1
+            if reeks > max_weekends:
+                # Datums lopen door over de cyclusgrens (normaliseren gebeurt nadien)
+                verschuiving = cyclus * (i // aantal)
+                reeks_start = weekends[(i - reeks + 1) % aantal][0] + cyclus * ((i - reeks + 1) // aantal)
+                violations.append(Violation(
+                    type=ViolationType.MAX_WEEKENDS,
+                    severity=ViolationSeverity.ERROR,
+                    gebruiker_id=0,
+                    datum=None,
+                    datum_range=(reeks_start.date(), (weekend_eind + verschuiving).date()),
+                    beschrijving=f"Te veel weekends achter elkaar: {reeks} weekends gewerkt (maximaal {max_weekends})",
+                    details={'weekends_count': reeks, 'max_weekends': max_weekends},
+                ))
+        return violations
+
+    def _check_max_werkdagen_cyclus(self) -> List[Violation]:
+        """
+        Rode lijn regel, gevectoriseerd over startweken
+
+        Werkdagen per venster voor alle L vensterstarts in 1 pass (prefix
+        sommen). Startweek s heeft vensters op posities
+        s ≡ fase + 7(s - 1) (mod ggd(L, periode_lengte)).
+        """
+        if not self.rode_lijnen:
+            return []
+        eerste_periode = self.rode_lijnen[0]
+        periode_lengte = (eerste_periode['eind_datum'] - eerste_periode['start_datum']).days + 1
+        fase = (eerste_periode['start_datum'] - self.anker).days
+        modulus = gcd(self.lengte, periode_lengte)
+        max_dagen = int(self.checker.hr_config.get('max_werkdagen_cyclus', 19))
+
+        werkdag = [1 if self.checker.is_werkdag_shift(code) else 0 for code in self.codes]
+        prefix = [0]
+        for p in range(self.lengte + periode_lengte):
+            prefix.append(prefix[-1] + werkdag[p % self.lengte])
+
+        # Startweken per venster restklasse
+        startweken_per_klasse: Dict[int, List[int]] = {}
+        for startweek in self.alle_startweken:
+            klasse = (fase + 7 * (startweek - 1)) % modulus
+            startweken_per_klasse.setdefault(klasse, []).append(startweek)
+
+        violations = []
+        for s in range(self.lengte):
+            startweken = startweken_per_klasse.get(s % modulus)
+            if not startweken:
+                continue
+            werkdagen = prefix[s + periode_lengte] - prefix[s]
+            if werkdagen > max_dagen:
+                violations.append(Violation(
+                    type=ViolationType.MAX_WERKDAGEN_CYCLUS,
+                    severity=ViolationSeverity.ERROR,
+                    gebruiker_id=0,
+                    datum=None,
+                    datum_range=(self._datum(s), self._datum(s + periode_lengte - 1)),
+                    beschrijving=f"Te veel werkdagen: {werkdagen} dagen in rode lijn periode (maximaal {max_dagen})",
+                    details={'werkdagen': werkdagen, 'max_dagen': max_dagen, 'startweken': startweken},
+                ))
+        return violations
+
+    def _cyclus_violation(self, violation_type: ViolationType, beschrijving: str,
+                          details: Dict) -> Violation:
+        """Violation over de volledige cyclus (patroon zonder reset punt)"""
+        return Violation(
+            type=violation_type,
+            severity=ViolationSeverity.ERROR,
+            gebruiker_id=0,
+            datum=None,
+            datum_range=(self._datum(0), self._datum(self.lengte - 1)),
+            beschrijving=beschrijving,
+            details=details,
+        )
@@ -0,0 +1,196 @@
+# services/typetabel_dekking.py
+"""
+Typetabel Dekking
+v0.6.29 - Bemanning per cyclusdag met het echte team, VOOR activatie
+
+Probleem: of een typetabel + startweken + werkpost prioriteiten elke dag
+alle kritische shift codes dekt, bleek pas na generatie, maand per maand
+via controleer_maand() (1-3 queries per dag).
+
+Oplossing: de typetabel wordt voor alle projectie gebruikers uitgerold over
+1 volledige cyclus (feestdagen = zondag codes) en per dag geteld hoeveel
+keer elke kritische code voorkomt. Gebruikers met dezelfde werkposten en
+dezelfde startweek (modulo de cyclus) hebben een identieke rij → per groep
+1x tellen met de groepsgrootte als gewicht. Geen database writes.
+
+Statussen per dag (zelfde als bemannings_controle_service):
+- groen: alle kritische codes minstens 1x
+- geel: dubbele kritische code(s)
+- rood: ontbrekende kritische code(s)
+
+Qt-vrij.
+
+GEBRUIK:
+    analyse = laad_dekking(versie_id, start_datum=date(2026, 1, 5))
+    analyse.samenvatting()   # {'volledig': 20, 'dubbel': 3, 'onvolledig': 5, 'totaal': 28}
+    analyse.gaten()          # [(date, code, werkpost_naam, shift_type), ...]
+"""
+
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from database.connection import get_connection
+from services.rooster_projectie import DAG_TYPES, RoosterProjectie, ProjectieGebruiker
+
+
+# (werkpost_naam, shift_type, dag_type, code)
+KritiekeCode = Tuple[str, str, str, str]
+
+# Rij in de heatmap: (werkpost_naam, shift_type)
+DekkingsRij = Tuple[str, str]
+
+
+@dataclass
+class DekkingsAnalyse:
+    """Telling per (werkpost, shift type) per dag over 1 cyclus"""
+    datums: List[date]
+    rijen: List[DekkingsRij]
+    # [rij][dag] → verwachte kritische code (None = niet verwacht die dag)
+    codes: List[List[Optional[str]]]
+    # [rij][dag] → aantal gebruikers met die code
+    aantallen: List[List[int]]
+    feestdagen: frozenset = field(default_factory=frozenset)
+    aantal_gebruikers: int = 0
+
+    def status(self, dag: int) -> str:
+        """'groen', 'geel' of 'rood' voor dag index"""
+        verwacht = [self.aantallen[r][dag] for r in range(len(self.rijen))
+                    if self.codes[r][dag] is not None]
+        if any(aantal == 0 for aantal in verwacht):
+            return 'rood'
+        if any(aantal > 1 for aantal in verwacht):
+            return 'geel'
+        return 'groen'
+
+    def gaten(self) -> List[Tuple[date, str, str, str]]:
+        """(datum, code, werkpost_naam, shift_type) per ontbrekende kritische code"""
+        return [(self.datums[dag], self.codes[r][dag], *self.rijen[r])
+                for r in range(len(self.rijen))
+                for dag in range(len(self.datums))
+                if self.codes[r][dag] is not None and self.aantallen[r][dag] == 0]
+
+    def dubbels(self) -> List[Tuple[date, str, int]]:
+        """(datum, code, aantal) per dubbel ingevulde kritische code"""
+        return [(self.datums[dag], self.codes[r][dag], self.aantallen[r][dag])
+                for r in range(len(self.rijen))
+                for dag in range(len(self.datums))
+                if self.codes[r][dag] is not None and self.aantallen[r][dag] > 1]
+
+    def samenvatting(self) -> Dict[str, int]:
+        """Zelfde structuur als controleer_maand()['samenvatting']"""
+        telling = Counter(self.status(dag) for dag in range(len(self.datums)))
+        return {
+            'volledig': telling['groen'],
+            'dubbel': telling['geel'],
+            'onvolledig': telling['rood'],
+            'totaal': len(self.datums)
+        }
+
+
+def analyseer_dekking(projectie: RoosterProjectie, start_datum: date,
+                      kritische_codes: Sequence[KritiekeCode],
+                      gebruikers: Optional[Sequence[ProjectieGebruiker]] = None) -> DekkingsAnalyse:
+    """
+    Tel kritische codes per dag over 1 cyclus vanaf start_datum
+
+    Args:
+        projectie: typetabel + shift codes + feestdagen
+        kritische_codes: [(werkpost_naam, shift_type, dag_type, code), ...]
+        gebruikers: standaard projectie.gebruikers
+    """
+    gebruikers = projectie.gebruikers if gebruikers is None else gebruikers
+    aantal_dagen = projectie.aantal_weken * 7
+    datums = [start_datum + timedelta(days=i) for i in range(aantal_dagen)]
+
+    # Dag afhankelijke delen 1x per datum
+    posities = projectie.posities(datums)
+
+    # Rijen + verwachte code per dag_type
+    rijen: List[DekkingsRij] = []
+    verwacht_per_rij: Dict[DekkingsRij, Dict[str, str]] = {}
+    for werkpost_naam, shift_type, dag_type, code in kritische_codes:
+        rij = (werkpost_naam, shift_type)
+        if rij not in verwacht_per_rij:
+            rijen.append(rij)
+            verwacht_per_rij[rij] = {}
+        verwacht_per_rij[rij][dag_type] = code
+
+    codes = [[verwacht_per_rij[rij].get(DAG_TYPES[dag_type]) for _, _, dag_type in posities]
+             for rij in rijen]
+
+    # Identieke rijen groeperen: (werkposten, startweek binnen de cyclus) → aantal
+    groepen = Counter((g.werkposten, (g.startweek - 1) % projectie.aantal_weken) for g in gebruikers)
+
+    # Per dag: code → aantal gebruikers
+    per_dag: List[Counter] = [Counter() for _ in datums]
+    for (werkposten, offset), gewicht in groepen.items():
+        tabel = projectie.tabel(werkposten)
+        for dag, (week_basis, weekdag, dag_type) in enumerate(posities):
+            code = tabel[dag_type][((week_basis + offset) % projectie.aantal_weken) * 7 + weekdag]
+            if code:
+                per_dag[dag][code] += gewicht
+
+    aantallen = [[per_dag[dag][code] if code else 0 for dag, code in enumerate(rij_codes)]
+                 for rij_codes in codes]
+
+    return DekkingsAnalyse(
+        datums=datums,
+        rijen=rijen,
+        codes=codes,
+        aantallen=aantallen,
+        feestdagen=frozenset(datum for datum in datums if datum.isoformat() in projectie.feestdagen),
+        aantal_gebruikers=len(gebruikers),
+    )
+
+
+def laad_kritische_codes(conn: sqlite3.Connection) -> List[KritiekeCode]:
+    """Kritische codes van actieve werkposten, op werkpost naam + shift type"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT w.naam AS werkpost_naam, sc.shift_type, sc.dag_type, sc.code
+        FROM shift_codes sc
+        JOIN werkposten w ON sc.werkpost_id = w.id
+        WHERE w.is_actief = 1
+          AND sc.is_kritisch = 1
+          AND sc.code IS NOT NULL AND sc.code != ''
+        ORDER BY w.naam, sc.shift_type
+    """)
+    return [(row['werkpost_naam'], row['shift_type'], row['dag_type'], row['code'])
+            for row in cursor.fetchall()]
+
+
+def volgende_maandag(datum: date) -> date:
+    """Eerste maandag op of na datum"""
+    return datum + timedelta(days=(7 - datum.weekday()) % 7)
+
+
+def laad_dekking(versie_id: int, start_datum: Optional[date] = None,
+                 conn: Optional[sqlite3.Connection] = None) -> Optional[DekkingsAnalyse]:
+    """
+    Dekkingsanalyse voor typetabel versie met de actieve gebruikers
+
+    Args:
+        start_datum: eerste dag van de geanalyseerde cyclus. Standaard
+                     actief_vanaf (actieve/gearchiveerde versie) of de
+                     volgende maandag (concept = nog niet geactiveerd).
+
+    Returns None als de versie niet bestaat.
+    """
+    eigen = conn is None
+    if eigen:
+        conn = get_connection()
+    try:
+        # Concept: startweken gelden vanaf de (toekomstige) activatie datum
+        projectie = RoosterProjectie.laad(versie_id, conn,
+                                          concept_vanaf=volgende_maandag(start_datum or date.today()))
+        if projectie is None:
+            return None
+        if start_datum is None:
+            start_datum = projectie.actief_vanaf
+        return analyseer_dekking(projectie, start_datum, laad_kritische_codes(conn))
+    finally:
+        if eigen:
+            conn.close()
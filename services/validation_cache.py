@@ -15,24 +15,42 @@ USAGE:
     # Bij maandwissel:
     ValidationCache.get_instance().preload_month(jaar=2025, maand=11)
 
+    # Vrije periode in planner (v0.6.29):
+    ValidationCache.get_instance().preload_range(date(2025, 11, 3), date(2026, 1, 31))
+
+    # Async maand load (v0.6.29): berekenen in worker, bewaren op GUI thread
+    entries = cache.bereken_range(start, eind, gebruiker_ids, catalogus)   # worker
+    cache.bewaar_entries(entries)                                          # GUI thread
+
     # Bij cel render:
     status = ValidationCache.get_instance().get_bemannings_status(datum)
 
     # Na planning edit:
     ValidationCache.get_instance().invalidate_date(datum)
 
+    # Na bulk edit (v0.6.29):
+    ValidationCache.get_instance().ververs_datums(geraakte_datums)
+
+GEHEUGEN (v0.6.29):
+- Begrensd op MAX_DAGEN datums; de minst recent gebruikte datums worden
+  verwijderd (LRU), zodat een planner die de hele dag door maanden bladert
+  het geheugen niet laat groeien
+
 TARGET:
 - Maandwissel: 30-60s → <2s (15-30x sneller)
 - Cel render: 50-100ms → <1ms (50-100x sneller)
 
 Zie: refactor performance/PERFORMANCE_OPTIMALISATIE_CONSTRAINT_CHECKING.md
 """
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 from datetime import date, timedelta
 from dataclasses import dataclass, field
+from collections import OrderedDict
 from calendar import monthrange
 import time
 
+from services.referentie_catalogus import ReferentieCatalogus
+
 
 @dataclass
 class CacheEntry:
@@ -60,16 +78,21 @@ class ValidationCache:
 
     _instance: Optional['ValidationCache'] = None
 
-    def __init__(self):
+    # Max aantal gecachte datums (~13 maanden); oudst gebruikte eerst weg (v0.6.29)
+    MAX_DAGEN = 400
+
+    def __init__(self, max_dagen: int = MAX_DAGEN):
         """Private constructor - gebruik get_instance()"""
-        self._cache: Dict[date, CacheEntry] = {}
+        self.max_dagen = max_dagen
+        self._cache: Dict[date, CacheEntry] = OrderedDict()  # LRU volgorde: oudste eerst
         self._dirty_dates: Set[date] = set()  # Datums die re-check nodig hebben
 
         # Performance metrics
         self._stats = {
             'hits': 0,
             'misses': 0,
-            'batch_loads': 0
+            'batch_loads': 0,
+            'evictions': 0
         }
 
     @classmethod
@@ -114,20 +137,47 @@ class ValidationCache:
             maand: Maand (1-12)
             gebruiker_ids: Optioneel filter op gebruikers (voor snelheid)
         """
-        start_time = time.time()
-
         # Stap 1: Datum range
         _, last_day = monthrange(jaar, maand)
-        start_datum = date(jaar, maand, 1)
-        eind_datum = date(jaar, maand, last_day)
+        self.preload_range(date(jaar, maand, 1), date(jaar, maand, last_day), gebruiker_ids)
 
+    def preload_range(
+        self,
+        start_datum: date,
+        eind_datum: date,
+        gebruiker_ids: Optional[List[int]] = None
+    ) -> None:
+        """
+        Preload validatie data voor een willekeurige periode (v0.6.29)
+
+        Zelfde batch aanpak als preload_month(), maar voor de periode die de
+        planner toont (bv. rode lijn cyclus of 13 weken) i.p.v. per maand.
+        """
+        start_time = time.time()
+        self.bewaar_entries(self.bereken_range(start_datum, eind_datum, gebruiker_ids))
+        duration = time.time() - start_time
+
+    def bereken_range(
+        self,
+        start_datum: date,
+        eind_datum: date,
+        gebruiker_ids: Optional[List[int]] = None,
+        catalogus: Optional[ReferentieCatalogus] = None
+    ) -> List[CacheEntry]:
+        """
+        Bereken cache entries voor een periode zonder de cache te wijzigen (v0.6.29)
+
+        Thread-safe (async maand load): enkel leesqueries op een eigen connectie.
+        Geef de catalogus mee vanuit de GUI thread; de entries worden daar met
+        bewaar_entries() in de cache gezet.
+        """
         # Stap 2: Batch load planning data
         planning_data = self._load_planning_batch(
             start_datum, eind_datum, gebruiker_ids
         )
 
         # Stap 3: Load shift codes (eenmalig, cache this)
-        shift_codes_data = self._load_shift_codes()
+        shift_codes_data = self._load_shift_codes(catalogus)
 
         # Stap 4: Bereken bemannings status (in-memory)
         bemannings_results = self._calculate_bemannings_batch(
@@ -138,20 +188,31 @@ class ValidationCache:
         notities_data = self._load_notities_batch(start_datum, eind_datum)
 
         # Stap 6: Build cache entries
+        entries = []
         current = start_datum
         while current <= eind_datum:
-            self._cache[current] = CacheEntry(
+            entries.append(CacheEntry(
                 datum=current,
                 bemannings_status=bemannings_results.get(current, 'groen'),
                 hr_violation_level='none',  # TODO: v0.6.25+ HR validatie
                 heeft_notities=current in notities_data,
                 heeft_dubbele_codes=False  # TODO: detect dubbele codes
-            )
+            ))
 
             # Next day
             current = current + timedelta(days=1)
+        return entries
+
+    def bewaar_entries(self, entries: List[CacheEntry]) -> None:
+        """Zet entries van bereken_range() in de cache (zelfde thread als de lezers)"""
+        if not entries:
+            return
+        for entry in entries:
+            self._bewaar(entry)
+        self._evict()
 
-        # Clear dirty dates voor deze maand
+        # Clear dirty dates voor deze periode
+        start_datum, eind_datum = entries[0].datum, entries[-1].datum
         self._dirty_dates = {
             d for d in self._dirty_dates
             if not (start_datum <= d <= eind_datum)
@@ -159,7 +220,28 @@ class ValidationCache:
 
         # Stats
         self._stats['batch_loads'] += 1
-        duration = time.time() - start_time
+
+    # ========================================================================
+    # LRU BEGRENZING (v0.6.29)
+    # ========================================================================
+
+    def _bewaar(self, entry: CacheEntry) -> None:
+        """Voeg entry toe als meest recent gebruikt"""
+        self._cache[entry.datum] = entry
+        self._cache.move_to_end(entry.datum)
+
+    def _raak(self, datum: date) -> Optional[CacheEntry]:
+        """Lookup die de datum als meest recent gebruikt markeert"""
+        entry = self._cache.get(datum)
+        if entry:
+            self._cache.move_to_end(datum)
+        return entry
+
+    def _evict(self) -> None:
+        """Verwijder minst recent gebruikte datums boven max_dagen"""
+        while len(self._cache) > self.max_dagen:
+            self._cache.popitem(last=False)
+            self._stats['evictions'] += 1
 
     # ========================================================================
     # CACHE ACCESS
@@ -171,7 +253,7 @@ class ValidationCache:
 
         Returns: 'groen', 'geel', 'rood', or None if not cached
         """
-        entry = self._cache.get(datum)
+        entry = self._raak(datum)
         if entry:
             self._stats['hits'] += 1
             return entry.bemannings_status
@@ -181,7 +263,7 @@ class ValidationCache:
 
     def get_hr_violation_level(self, datum: date) -> Optional[str]:
         """Get cached HR violation level voor datum"""
-        entry = self._cache.get(datum)
+        entry = self._raak(datum)
         if entry:
             self._stats['hits'] += 1
             return entry.hr_violation_level
@@ -191,12 +273,12 @@ class ValidationCache:
 
     def heeft_notities(self, datum: date) -> bool:
         """Check if datum heeft notities (cached)"""
-        entry = self._cache.get(datum)
+        entry = self._raak(datum)
         return entry.heeft_notities if entry else False
 
     def get_full_status(self, datum: date) -> Optional[CacheEntry]:
         """Get complete cache entry voor datum"""
-        return self._cache.get(datum)
+        return self._raak(datum)
 
     # ========================================================================
     # CACHE INVALIDATION
@@ -240,6 +322,27 @@ class ValidationCache:
         for (jaar, maand), datums in per_maand.items():
             self.preload_month(jaar, maand)
 
+    def ververs_datums(
+        self,
+        datums: Iterable[date],
+        gebruiker_ids: Optional[List[int]] = None
+    ) -> Dict[date, Optional[str]]:
+        """
+        Invalideer en herbereken geraakte datums na een bulk wijziging (v0.6.29)
+
+        1 batch load over de periode die de datums omvat, i.p.v. een
+        preload_month per datum.
+
+        Returns: {datum: bemannings status}
+        """
+        datums = sorted(set(datums))
+        if not datums:
+            return {}
+        for datum in datums:
+            self.invalidate_date(datum)
+        self.preload_range(datums[0], datums[-1], gebruiker_ids)
+        return {datum: self.get_bemannings_status(datum) for datum in datums}
+
     def clear(self) -> None:
         """Clear hele cache (bij grote wijzigingen)"""
         self._cache.clear()
@@ -296,47 +399,24 @@ class ValidationCache:
         conn.close()
         return result
 
-    def _load_shift_codes(self) -> Dict[str, Dict]:
+    def _load_shift_codes(self, catalogus: Optional[ReferentieCatalogus] = None) -> Dict[str, Dict]:
         """
-        Load shift codes config (cached binnen session)
+        Load shift codes config
+
+        v0.6.29: uit de gedeelde ReferentieCatalogus (geen PRAGMA/query per load)
 
         Returns: {code: {'is_kritisch': bool, 'werkpost_id': int, ...}, ...}
         """
-        from database.connection import get_connection
-
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        try:
-            # Check which columns exist
-            cursor.execute("PRAGMA table_info(shift_codes)")
-            columns = [row[1] for row in cursor.fetchall()]
-            has_kritisch = 'is_kritisch' in columns
-            has_actief = 'is_actief' in columns
-
-            # Build query based on available columns
-            select_parts = ['code', 'werkpost_id']
-            if has_kritisch:
-                select_parts.append('is_kritisch')
-
-            where_clause = 'WHERE is_actief = 1' if has_actief else ''
-
-            query = f"SELECT {', '.join(select_parts)} FROM shift_codes {where_clause}"
-            cursor.execute(query)
-
-            result = {}
-            for row in cursor.fetchall():
-                result[row['code']] = {
-                    'werkpost_id': row['werkpost_id'],
-                    'is_kritisch': bool(row['is_kritisch']) if has_kritisch else True
-                }
+        if catalogus is None:
+            try:
+                catalogus = ReferentieCatalogus.get_instance()
+            except Exception:
+                return {}
 
-        except Exception:
-            result = {}
-        finally:
-            conn.close()
-
-        return result
+        return {
+            shift.code: {'werkpost_id': shift.werkpost_id, 'is_kritisch': shift.is_kritisch}
+            for shift in catalogus.shift_codes
+        }
 
     def _calculate_bemannings_batch(
         self,
@@ -420,6 +500,7 @@ class ValidationCache:
 
         return {
             'cache_size': len(self._cache),
+            'max_dagen': self.max_dagen,
             'dirty_dates': len(self._dirty_dates),
             'hit_rate': f"{hit_rate:.1f}%",
             **self._stats
@@ -0,0 +1,142 @@
+"""
+Test script voor auto-generatie diff + gechunkte writes (v0.6.29)
+
+Scenario:
+1. Dry-run diff: invullen / ongewijzigd / beschermd (speciaal, handmatig, gepubliceerd)
+2. Toepassen in chunks: voortgang per chunk, notities blijven behouden
+3. Annuleren na eerste chunk; cel die na de dry-run ingevuld werd blijft behouden
+
+Gebruikt een in-memory database (data/planning.db blijft onaangeroerd)
+
+Run: python tests/test_auto_generatie.py
+"""
+import sqlite3
+from datetime import date
+
+from services.auto_generatie_service import bereken_generatie_diff, pas_diff_toe
+from services.maand_status_service import ensure_maand_status_tabel, zet_maand_status
+from services.rooster_projectie import RoosterProjectie, ProjectieGebruiker
+
+
+def _maak_test_db() -> sqlite3.Connection:
+    """Kleine planning: gebruiker 1 heeft verlof, handmatige shift en notitie"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE planning (
+            id INTEGER PRIMARY KEY, gebruiker_id INTEGER, datum TEXT,
+            shift_code TEXT, notitie TEXT, status TEXT DEFAULT 'concept',
+            UNIQUE(gebruiker_id, datum)
+        );
+        CREATE TABLE werkposten (id INTEGER PRIMARY KEY, naam TEXT);
+        CREATE TABLE shift_codes (
+            id INTEGER PRIMARY KEY, werkpost_id INTEGER, dag_type TEXT,
+            shift_type TEXT, code TEXT, start_uur TEXT, eind_uur TEXT
+        );
+        CREATE TABLE speciale_codes (code TEXT, naam TEXT);
+        CREATE TABLE gebruikers (id INTEGER PRIMARY KEY, volledige_naam TEXT);
+
+        INSERT INTO werkposten VALUES (1, 'Interventie');
+        INSERT INTO shift_codes (werkpost_id, dag_type, shift_type, code)
+            VALUES (1, 'weekdag', 'vroeg', '7101');
+        INSERT INTO speciale_codes VALUES ('VV', 'Verlof');
+        INSERT INTO gebruikers VALUES (1, 'Jan'), (2, 'Piet');
+
+        INSERT INTO planning (gebruiker_id, datum, shift_code, notitie) VALUES
+            (1, '2025-11-03', '7101', NULL),
+            (1, '2025-11-04', 'VV', NULL),
+            (1, '2025-11-05', 'RX', NULL),
+            (1, '2025-11-06', NULL, 'Opleiding'),
+            (2, '2025-12-01', '7101', NULL);
+    """)
+    ensure_maand_status_tabel(conn)
+    zet_maand_status(2025, 12, 'gepubliceerd', conn=conn)
+    return conn
+
+
+def _maak_projectie() -> RoosterProjectie:
+    """1 week cyclus: elke weekdag vroeg, weekend vrij"""
+    typetabel = {(1, dag): 'V' for dag in range(1, 6)}
+    return RoosterProjectie(1, date(2025, 11, 3), typetabel, {(1, 'weekdag', 'vroeg'): '7101'},
+                            gebruikers=[ProjectieGebruiker(1, 1, (1,)), ProjectieGebruiker(2, 1, (1,))])
+
+
+def _code(conn: sqlite3.Connection, gebruiker_id: int, datum_str: str):
+    row = conn.execute("SELECT shift_code, notitie FROM planning WHERE gebruiker_id = ? AND datum = ?",
+                       (gebruiker_id, datum_str)).fetchone()
+    return (row['shift_code'], row['notitie']) if row else None
+
+
+def test_dry_run_diff():
+    """Classificatie zonder writes"""
+    conn = _maak_test_db()
+
+    print("\n" + "="*60)
+    print("TEST: Dry-run diff")
+    print("="*60)
+
+    wijzigingen_voor = conn.total_changes
+    diff = bereken_generatie_diff(_maak_projectie(), date(2025, 11, 3), date(2025, 12, 2), conn)
+    print(f"  {diff.samenvatting()}")
+
+    assert conn.total_changes == wijzigingen_voor, "Dry-run mag niets schrijven"
+    assert diff.ongewijzigd == 1                       # 11-03 al 7101
+    assert diff.beschermd_speciaal == 1                # 11-04 VV
+    assert diff.beschermd_handmatig == 1               # 11-05 RX
+    assert diff.beschermd_gepubliceerd == 4            # 12-01 + 12-02, 2 gebruikers
+    # Weekdagen 3-28 nov: 20 per gebruiker, min 3 ingevulde dagen gebruiker 1
+    assert diff.invullen_per_gebruiker == {1: 17, 2: 20}
+    assert ("2025-11-06", 1, '7101') in diff.invullen, "Cel met enkel notitie = leeg"
+    assert all(datum_str < "2025-12-01" for datum_str, _, _ in diff.invullen)
+    print("TEST GESLAAGD")
+
+
+def test_toepassen_in_chunks():
+    """Chunks + voortgang, notitie blijft behouden"""
+    conn = _maak_test_db()
+
+    print("\n" + "="*60)
+    print("TEST: Toepassen in chunks")
+    print("="*60)
+
+    diff = bereken_generatie_diff(_maak_projectie(), date(2025, 11, 3), date(2025, 11, 30), conn)
+    voortgang = []
+    gedaan = pas_diff_toe(diff.invullen, chunk_grootte=10,
+                          voortgang=lambda gedaan, totaal: voortgang.append(gedaan) or True, conn=conn)
+    print(f"  Voortgang: {voortgang}")
+
+    assert gedaan == 37 and voortgang == [10, 20, 30, 37]
+    assert _code(conn, 1, "2025-11-06") == ('7101', 'Opleiding')
+    assert _code(conn, 1, "2025-11-05") == ('RX', None)
+
+    # Tweede run: niets meer te doen
+    tweede = bereken_generatie_diff(_maak_projectie(), date(2025, 11, 3), date(2025, 11, 30), conn)
+    assert not tweede.invullen and tweede.ongewijzigd == 38
+    print("TEST GESLAAGD")
+
+
+def test_annuleren_en_concurrente_edit():
+    """Annuleren stopt na chunk; handmatige edit na dry-run wordt niet overschreven"""
+    conn = _maak_test_db()
+
+    print("\n" + "="*60)
+    print("TEST: Annuleren + concurrente edit")
+    print("="*60)
+
+    diff = bereken_generatie_diff(_maak_projectie(), date(2025, 11, 3), date(2025, 11, 30), conn)
+
+    # Andere planner vult 11-06 in tussen dry-run en toepassen
+    conn.execute("UPDATE planning SET shift_code = 'Z' WHERE gebruiker_id = 1 AND datum = '2025-11-06'")
+    conn.commit()
+
+    gedaan = pas_diff_toe(diff.invullen, chunk_grootte=10, voortgang=lambda gedaan, totaal: False, conn=conn)
+    assert gedaan == 10
+    assert _code(conn, 1, "2025-11-06") == ('Z', 'Opleiding')
+    assert conn.execute("SELECT COUNT(*) FROM planning WHERE shift_code = '7101'").fetchone()[0] == 2 + 9
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_dry_run_diff()
+    test_toepassen_in_chunks()
+    test_annuleren_en_concurrente_edit()
@@ -0,0 +1,179 @@
+"""
+Test script voor batch export (v0.6.29)
+
+Scenario:
+1. Snapshot: 1x laden, per maand de HR rijen, bemanning en planner notities
+   met dezelfde filters als de losse queries (actief, geen admin, reserves achteraan)
+2. Batch: maand bestanden + 1 bestand per teamlid; in proces en via process pool
+   dezelfde bestanden
+3. Annuleren: voortgang → False stopt na het lopende bestand
+
+Gebruikt een in-memory database en een tijdelijke export map
+(data/planning.db en exports/ blijven onaangeroerd)
+
+Run: python tests/test_batch_export.py
+"""
+import sqlite3
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from services.batch_export_service import exporteer_batch, laad_export_snapshot, maanden_tussen
+from services.dag_kalender import DagKalender
+from services.referentie_catalogus import ReferentieCatalogus
+from services.rode_lijnen_service import RodeLijnenKalender
+
+
+def _maak_db() -> sqlite3.Connection:
+    """3 actieve teamleden (1 reserve), 1 inactief, admin; 1 kritische weekdag shift"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE gebruikers (
+            id INTEGER PRIMARY KEY, gebruikersnaam TEXT, volledige_naam TEXT,
+            is_reserve BOOLEAN, is_actief BOOLEAN
+        );
+        CREATE TABLE planning (
+            id INTEGER PRIMARY KEY, gebruiker_id INTEGER, datum DATE, shift_code TEXT,
+            notitie TEXT, status TEXT
+        );
+        CREATE TABLE maand_status (jaar INTEGER, maand INTEGER, status TEXT);
+        CREATE TABLE werkposten (
+            id INTEGER PRIMARY KEY, naam TEXT, telt_als_werkdag BOOLEAN,
+            reset_12u_rust BOOLEAN, breekt_werk_reeks BOOLEAN, is_actief BOOLEAN
+        );
+        CREATE TABLE shift_codes (
+            id INTEGER PRIMARY KEY, werkpost_id INTEGER, dag_type TEXT, shift_type TEXT,
+            code TEXT, start_uur TEXT, eind_uur TEXT, is_kritisch BOOLEAN
+        );
+        CREATE TABLE speciale_codes (
+            id INTEGER PRIMARY KEY, code TEXT, naam TEXT, term TEXT,
+            telt_als_werkdag BOOLEAN, reset_12u_rust BOOLEAN, breekt_werk_reeks BOOLEAN
+        );
+        CREATE TABLE feestdagen (datum TEXT PRIMARY KEY, naam TEXT, is_zondagsrust BOOLEAN, is_variabel BOOLEAN);
+        CREATE TABLE hr_regels (
+            id INTEGER PRIMARY KEY, naam TEXT, waarde TEXT, eenheid TEXT, beschrijving TEXT,
+            actief_vanaf TIMESTAMP, actief_tot TIMESTAMP
+        );
+        CREATE TABLE rode_lijnen_config (
+            id INTEGER PRIMARY KEY, start_datum DATE, interval_dagen INTEGER,
+            actief_vanaf TIMESTAMP, actief_tot TIMESTAMP, is_actief BOOLEAN
+        );
+        INSERT INTO gebruikers VALUES (1, 'admin', 'Administrator', 0, 1);
+        INSERT INTO gebruikers VALUES (2, 'piet', 'Piet Peeters', 0, 1);
+        INSERT INTO gebruikers VALUES (3, 'an', 'An Aerts', 1, 1);
+        INSERT INTO gebruikers VALUES (4, 'jan', 'Jan Janssens', 0, 1);
+        INSERT INTO gebruikers VALUES (5, 'oud', 'Oud Lid', 0, 0);
+        INSERT INTO werkposten VALUES (1, 'PAT', 1, 0, 0, 1);
+        INSERT INTO shift_codes VALUES (1, 1, 'weekdag', 'vroeg', '7101', '06:00', '14:00', 1);
+        INSERT INTO speciale_codes VALUES (1, 'VV', 'Verlof', 'verlof', 0, 1, 1);
+        INSERT INTO planning VALUES (1, 2, '2025-05-02', '7101', '[Planner]: Ruil met An', 'concept');
+        INSERT INTO planning VALUES (2, 3, '2025-05-02', 'VV', NULL, 'concept');
+        INSERT INTO planning VALUES (3, 5, '2025-05-05', '7101', '[Planner]: oud', 'concept');
+        INSERT INTO planning VALUES (4, 4, '2025-06-02', '7101', 'eigen notitie', 'concept');
+        INSERT INTO planning VALUES (5, 4, '2025-06-03', NULL, '[planner]: opleiding', 'concept');
+    """)
+    return conn
+
+
+def _snapshot(maanden):
+    """Snapshot met kalender en catalogus uit de in-memory database"""
+    conn = _maak_db()
+    DagKalender._instance = DagKalender.laad(date(2024, 1, 1), date(date.today().year + 1, 12, 31), conn)
+    RodeLijnenKalender._instance = RodeLijnenKalender.laad(conn)
+    ReferentieCatalogus.invalideer()
+    ReferentieCatalogus.get_instance(conn)
+    try:
+        return laad_export_snapshot(maanden, conn)
+    finally:
+        DagKalender.refresh()
+        RodeLijnenKalender.refresh()
+        ReferentieCatalogus.invalideer()
+
+
+def test_snapshot():
+    """Rijen, bemanning en notities uit 1 snapshot"""
+    print("\n" + "="*60)
+    print("TEST: Snapshot")
+    print("="*60)
+
+    snapshot = _snapshot(maanden_tussen((2025, 5), (2025, 6)))
+    assert snapshot.maanden == [(2025, 5), (2025, 6)]
+
+    # Actief, geen admin, reserves achteraan
+    assert [naam for _, naam in snapshot.teamleden] == ['Jan Janssens', 'Piet Peeters', 'An Aerts']
+    rijen = snapshot.maand_rijen(2025, 5)
+    assert rijen[1] == {'naam': 'Piet Peeters', 'planning': {'2025-05-02': '7101'}}
+    assert rijen[2]['planning'] == {'2025-05-02': 'VV'}
+    assert snapshot.maand_rijen(2025, 6)[0]['planning'] == {'2025-06-02': '7101'}
+
+    # Bemanning: 2 mei 7101 aanwezig, 5 mei enkel inactief lid → rood
+    dagen = snapshot.validatie[(2025, 5)]['dagen']
+    assert dagen['2025-05-02']['status'] == 'groen'
+    assert dagen['2025-05-05']['status'] == 'rood'
+
+    # Planner notities (ook inactieve leden, prefix hoofdletterongevoelig)
+    assert snapshot.maand_notities(2025, 5) == {'2025-05-02': ['Piet Peeters: Ruil met An'],
+                                                '2025-05-05': ['Oud Lid: oud']}
+    assert snapshot.maand_notities(2025, 6) == {'2025-06-03': ['Jan Janssens: [planner]: opleiding']}
+    assert len(snapshot.dag_kolommen[(2025, 6)]) == 30
+    print("TEST GESLAAGD")
+
+
+def test_batch_proces_en_pool():
+    """Zelfde bestanden in proces en via process pool"""
+    print("\n" + "="*60)
+    print("TEST: Batch in proces en pool")
+    print("="*60)
+
+    snapshot = _snapshot(maanden_tussen((2025, 5), (2025, 6)))
+    resultaten = {}
+    for processen in (1, 2):
+        export_dir = Path(tempfile.mkdtemp())
+        voortgang = []
+        resultaat = exporteer_batch(snapshot.maanden, per_teamlid=True, export_dir=export_dir,
+                                    processen=processen, snapshot=snapshot,
+                                    voortgang=lambda gedaan, totaal: voortgang.append((gedaan, totaal)) or True)
+        assert not resultaat.fouten and not resultaat.geannuleerd
+        assert voortgang[-1] == (5, 5)
+        resultaten[processen] = [Path(pad).relative_to(export_dir).as_posix() for pad in resultaat.bestanden]
+        print(f"  {processen} proces(sen): {resultaat.samenvatting()}")
+
+        mei = load_workbook(export_dir / 'mei_2025.xlsx')
+        assert mei.sheetnames == ['Blad1', 'Validatie Rapport']
+        assert mei['Blad1']['B5'].value == 'Piet Peeters' and mei['Blad1']['D5'].value == '7101'
+
+        piet = load_workbook(export_dir / 'teamleden' / 'Piet_Peeters_mei_2025_juni_2025.xlsx')
+        assert piet.sheetnames == ['mei 2025', 'juni 2025'], "1 tab per maand, geen validatie"
+        assert piet['mei 2025']['B4'].value == 'Piet Peeters' and piet['mei 2025'].max_row == 4
+
+    assert resultaten[1] == resultaten[2] == [
+        'juni_2025.xlsx', 'mei_2025.xlsx', 'teamleden/An_Aerts_mei_2025_juni_2025.xlsx',
+        'teamleden/Jan_Janssens_mei_2025_juni_2025.xlsx', 'teamleden/Piet_Peeters_mei_2025_juni_2025.xlsx'
+    ]
+    print("TEST GESLAAGD")
+
+
+def test_annuleren():
+    """voortgang → False: rest van de batch wordt niet geschreven"""
+    print("\n" + "="*60)
+    print("TEST: Annuleren")
+    print("="*60)
+
+    snapshot = _snapshot(maanden_tussen((2025, 1), (2025, 12)))
+    export_dir = Path(tempfile.mkdtemp())
+    resultaat = exporteer_batch(snapshot.maanden, export_dir=export_dir, processen=1,
+                                snapshot=snapshot, voortgang=lambda gedaan, totaal: gedaan < 3)
+    assert resultaat.geannuleerd and len(resultaat.bestanden) == 3
+    assert sorted(pad.name for pad in export_dir.iterdir()) == ['februari_2025.xlsx', 'januari_2025.xlsx',
+                                                                'maart_2025.xlsx']
+    print(f"  {resultaat.samenvatting()}")
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_snapshot()
+    test_batch_proces_en_pool()
+    test_annuleren()
@@ -0,0 +1,82 @@
+"""
+Test script voor geïnterneerde cel stijlen (v0.6.29)
+
+Scenario:
+1. Zelfde combinatie → zelfde (geïnterneerd) object, andere combinatie → nieuw object
+2. Overlay en selectie worden vooraf gemengd tot een ondoorzichtige vulling
+3. Property ids + container stylesheet bevatten enkel de gebruikte stijlen
+
+Run: python tests/test_cel_stijlen.py
+"""
+from gui.widgets.cel_stijlen import CelStijlCache, css_naar_qcolor, STIJL_PROPERTY
+
+
+def test_interning():
+    """Cache geeft hetzelfde object terug voor identieke combinaties"""
+    CelStijlCache.clear()
+
+    print("\n" + "="*60)
+    print("TEST: Stijl interning")
+    print("="*60)
+
+    a = CelStijlCache.get("#ffffff", None, is_rode_lijn_start=True)
+    b = CelStijlCache.get("#ffffff", None, is_rode_lijn_start=True)
+    c = CelStijlCache.get("#ffffff", None, is_rode_lijn_start=True, is_geselecteerd=True)
+
+    assert a is b, "Identieke combinatie moet geïnterneerd zijn"
+    assert a is not c, "Selectie moet een aparte stijl opleveren"
+    assert CelStijlCache.get_stats()['stijlen'] == 2
+
+    # Rode lijn border aanwezig, in prioriteit volgorde
+    assert a.borders[0][0] == 'left' and a.borders[0][2] == 4
+    print("TEST GESLAAGD")
+
+
+def test_kleur_menging():
+    """Overlay over wit en selectie over vulling → ondoorzichtige kleur"""
+    CelStijlCache.clear()
+
+    print("\n" + "="*60)
+    print("TEST: Kleur menging")
+    print("="*60)
+
+    overlay = "rgba(255, 0, 0, 0.5)"
+    assert css_naar_qcolor(overlay).alpha() == 128
+
+    stijl = CelStijlCache.get("#ffffff", overlay)
+    print(f"  Overlay vulling: {stijl.vulling.name()}")
+    assert stijl.vulling.alpha() == 255, "Vulling moet ondoorzichtig zijn"
+    assert stijl.vulling.red() == 255 and 120 <= stijl.vulling.green() <= 135
+
+    geselecteerd = CelStijlCache.get("#ffffff", overlay, is_geselecteerd=True)
+    assert geselecteerd.vulling.name() != stijl.vulling.name(), "Selectie moet vulling wijzigen"
+    print("TEST GESLAAGD")
+
+
+def test_container_stylesheet():
+    """Eén regel per gebruikte property id"""
+    CelStijlCache.clear()
+
+    print("\n" + "="*60)
+    print("TEST: Container stylesheet")
+    print("="*60)
+
+    id_wit = CelStijlCache.stijl_id("#ffffff")
+    id_notitie = CelStijlCache.stijl_id("#ffffff", heeft_notitie=True)
+    id_ongebruikt = CelStijlCache.stijl_id("#fff9c4")
+
+    assert CelStijlCache.stijl_id("#ffffff") == id_wit, "Id moet stabiel zijn"
+
+    qss = CelStijlCache.container_stylesheet({id_wit, id_notitie})
+    print(qss)
+    assert f'[{STIJL_PROPERTY}="{id_wit}"]' in qss
+    assert f'[{STIJL_PROPERTY}="{id_notitie}"]' in qss
+    assert f'[{STIJL_PROPERTY}="{id_ongebruikt}"]' not in qss
+    assert qss.count("border-top: 3px solid #00e676;") == 1
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_interning()
+    test_kleur_menging()
+    test_container_stylesheet()
@@ -0,0 +1,133 @@
+"""
+Test script voor vooraf berekende dag kalender (v0.6.29)
+
+Scenario:
+1. dag_type met feestdag = zondag, feestdag naam, ISO week, datums buiten het bereik
+2. week/weekend ids = vensters van ConstraintChecker, ook over een gewijzigde
+   weekend definitie; rode lijn ids = RodeLijnenKalender
+3. Lookups goedkoop genoeg voor elke cel
+
+Gebruikt een in-memory database (data/planning.db blijft onaangeroerd)
+
+Run: python tests/test_dag_kalender.py
+"""
+import sqlite3
+import time
+from datetime import date, datetime, timedelta
+
+from services.dag_kalender import DagKalender
+from services.rode_lijnen_service import RodeLijnenKalender
+
+VAN = date(2025, 1, 1)
+TOT = date(2026, 12, 31)
+
+
+def _maak_db() -> sqlite3.Connection:
+    """Feestdagen, HR regels (weekend definitie wijzigt 1 maart 2025) en rode lijn config"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE feestdagen (datum TEXT PRIMARY KEY, naam TEXT, is_zondagsrust BOOLEAN, is_variabel BOOLEAN);
+        CREATE TABLE hr_regels (
+            id INTEGER PRIMARY KEY, naam TEXT, waarde TEXT, eenheid TEXT, beschrijving TEXT,
+            actief_vanaf TIMESTAMP, actief_tot TIMESTAMP
+        );
+        CREATE TABLE rode_lijnen_config (
+            id INTEGER PRIMARY KEY, start_datum DATE, interval_dagen INTEGER,
+            actief_vanaf TIMESTAMP, actief_tot TIMESTAMP, is_actief BOOLEAN
+        );
+        INSERT INTO feestdagen VALUES ('2025-04-21', 'Paasmaandag', 1, 1);
+        INSERT INTO feestdagen VALUES ('2025-11-01', 'Allerheiligen', 1, 0);
+        INSERT INTO feestdagen VALUES ('2025-12-25', 'Kerstmis', 1, 0);
+        INSERT INTO feestdagen VALUES ('2024-12-25', 'Kerstmis', 1, 0);
+        INSERT INTO hr_regels VALUES (1, 'week_definitie', 'ma-00:00|zo-23:59', 'periode', NULL, '2024-01-01', NULL);
+        INSERT INTO hr_regels VALUES (2, 'weekend_definitie', 'vr-22:00|ma-06:00', 'periode', NULL,
+                                      '2024-01-01', '2025-03-01 10:00:00');
+        INSERT INTO hr_regels VALUES (3, 'weekend_definitie', 'za-00:00|zo-23:59', 'periode', NULL,
+                                      '2025-03-01 10:00:00', NULL);
+        INSERT INTO rode_lijnen_config VALUES (1, '2024-07-29', 28, '2025-10-20 08:28:44', NULL, 1);
+    """)
+    return conn
+
+
+def test_dag_feiten():
+    """Weekdag, dag_type, feestdag, ISO week"""
+    print("\n" + "="*60)
+    print("TEST: Dag feiten")
+    print("="*60)
+
+    kalender = DagKalender.laad(VAN, TOT, _maak_db())
+    assert kalender.dag_type('2025-12-25') == 'zondag', "Feestdag op donderdag = zondag"
+    assert kalender.dag_type(date(2025, 11, 1)) == 'zondag', "Feestdag op zaterdag = zondag"
+    assert kalender.dag_type('2025-11-08') == 'zaterdag'
+    assert kalender.dag_type(datetime(2025, 12, 24, 14, 0)) == 'weekdag'
+    assert kalender.feestdag_naam('2025-04-21') == 'Paasmaandag'
+    assert kalender.is_feestdag('2025-04-21T00:00:00') and not kalender.is_feestdag('2025-04-22')
+    assert set(kalender.feestdagen()) == {'2025-04-21', '2025-11-01', '2025-12-25'}
+
+    for i in range(0, (TOT - VAN).days + 1, 17):
+        datum = VAN + timedelta(days=i)
+        assert kalender.dag_nummer(datum) == kalender.dag_nummer(datum.isoformat()) == i
+        assert kalender.iso_week(datum) == datum.isocalendar()[1]
+        assert kalender.weekdag(datum) == datum.weekday()
+
+    # Buiten het bereik: rechtstreeks berekend, zonder feestdag
+    assert kalender.dag_nummer('2024-12-25') is None
+    assert kalender.dag_type('2024-12-25') == 'weekdag' and kalender.iso_week(date(2024, 12, 30)) == 1
+    assert DagKalender.leeg().dag_type(date(2025, 11, 2)) == 'zondag'
+    print("TEST GESLAAGD")
+
+
+def test_vensters_en_rode_lijnen():
+    """Venster ids volgen de geconfigureerde definitie per versie"""
+    print("\n" + "="*60)
+    print("TEST: Vensters en rode lijnen")
+    print("="*60)
+
+    conn = _maak_db()
+    kalender = DagKalender.laad(VAN, TOT, conn)
+
+    # Voor 1 maart: weekend vr-22:00 → ma-06:00 (vr t/m ma), daarna za t/m zo
+    februari = [kalender.weekend_id(date(2025, 2, d)) for d in range(20, 25)]  # do 20 .. ma 24
+    print(f"  do-ma 20-24 februari: {februari}")
+    assert februari[0] is None and len(set(februari[1:])) == 1 and februari[1] is not None
+    maart = [kalender.weekend_id(date(2025, 3, d)) for d in range(6, 11)]  # do 6 .. ma 10
+    print(f"  do-ma 6-10 maart:     {maart}")
+    assert maart[0] is None and maart[1] is None and maart[2] == maart[3] and maart[4] is None
+    assert maart[2] == februari[1] + 2, "Opeenvolgende weekends = opeenvolgende ids"
+
+    # Weken: ma t/m zo, elke dag in exact 1 week
+    assert kalender.week_id('2025-03-03') == kalender.week_id('2025-03-09') != kalender.week_id('2025-03-10')
+    assert all(week_id >= 0 for week_id in kalender.week_ids)
+
+    # Rode lijnen: zelfde periode nummer als RodeLijnenKalender
+    rode_lijnen = RodeLijnenKalender.laad(conn)
+    for i in range(0, (TOT - VAN).days + 1, 5):
+        datum = VAN + timedelta(days=i)
+        assert kalender.rode_lijn_periode(datum) == rode_lijnen.periode_op(datum).periode_nummer
+    assert kalender.rode_lijn_periode('2026-01-02') == 19
+    print("TEST GESLAAGD")
+
+
+def test_lookup_snelheid():
+    """dag_type voor elke cel van een jaar x 30 gebruikers"""
+    print("\n" + "="*60)
+    print("TEST: Lookup snelheid")
+    print("="*60)
+
+    kalender = DagKalender.laad(VAN, TOT, _maak_db())
+    datum_strs = [(VAN + timedelta(days=i)).isoformat() for i in range(365)]
+    start = time.perf_counter()
+    for _ in range(30):
+        for datum_str in datum_strs:
+            kalender.dag_type(datum_str)
+    duur = time.perf_counter() - start
+    print(f"  {30 * 365} lookups: {duur * 1000:.0f} ms")
+    assert duur < 1.0
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_dag_feiten()
+    test_vensters_en_rode_lijnen()
+    test_lookup_snelheid()
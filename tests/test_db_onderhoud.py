@@ -0,0 +1,163 @@
+"""
+Test script voor database onderhoud service (v0.6.29)
+
+Scenario:
+1. Leader election: tweede client krijgt geen lease zolang eerste lease geldig is
+2. Onderhoud draait, logt historiek en maakt sqlite_stat1 aan
+3. Verlopen taken: na een run zijn taken niet meer verlopen, forceer negeert interval
+4. Automatisch onderhoud doet geen volledige VACUUM; de omzetting naar INCREMENTAL
+   is een aparte admin actie, daarna wint incremental_vacuum vrije pagina's terug
+
+Gebruikt een tijdelijke database (data/planning.db blijft onaangeroerd)
+
+Run: python tests/test_db_onderhoud.py
+"""
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from services.database_onderhoud_service import (
+    ensure_onderhoud_tabellen, probeer_leiderschap, geef_leiderschap_vrij,
+    voer_onderhoud_uit, bepaal_verlopen_taken, get_db_metrics, get_onderhoud_historiek,
+    converteer_naar_incremental, INCREMENTAL_VACUUM_PAGINAS
+)
+
+
+def _maak_test_db() -> Path:
+    """Tijdelijke database met wat data"""
+    db_pad = Path(tempfile.mkdtemp()) / "onderhoud_test.db"
+    conn = sqlite3.connect(db_pad)
+    conn.execute("CREATE TABLE planning (id INTEGER PRIMARY KEY, datum TEXT, shift_code TEXT)")
+    conn.execute("CREATE INDEX idx_planning_datum ON planning(datum)")
+    conn.executemany(
+        "INSERT INTO planning (datum, shift_code) VALUES (?, ?)",
+        [(f"2025-01-{(i % 28) + 1:02d}", 'D' * 200) for i in range(5000)]
+    )
+    conn.commit()
+    conn.close()
+    return db_pad
+
+
+def test_leader_election():
+    """Slechts één client kan tegelijk leider zijn"""
+    db_pad = _maak_test_db()
+    conn_a = sqlite3.connect(db_pad)
+    conn_b = sqlite3.connect(db_pad)
+    ensure_onderhoud_tabellen(conn_a)
+
+    print("\n" + "="*60)
+    print("TEST: Leader Election")
+    print("="*60)
+
+    assert probeer_leiderschap(conn_a, 'client-a') == True, "Client A moet lease krijgen"
+    assert probeer_leiderschap(conn_b, 'client-b') == False, "Client B mag geen lease krijgen"
+    assert probeer_leiderschap(conn_a, 'client-a') == True, "Client A mag lease verlengen"
+
+    geef_leiderschap_vrij(conn_a, 'client-a')
+    assert probeer_leiderschap(conn_b, 'client-b') == True, "Na vrijgave moet client B lease krijgen"
+
+    # Verlopen lease mag overgenomen worden
+    geef_leiderschap_vrij(conn_b, 'client-b')
+    assert probeer_leiderschap(conn_b, 'client-b', lease_seconden=-1) == True
+    assert probeer_leiderschap(conn_a, 'client-a') == True, "Verlopen lease moet overgenomen worden"
+
+    conn_a.close()
+    conn_b.close()
+    print("TEST GESLAAGD")
+
+
+def test_onderhoud_en_historiek():
+    """Onderhoud voert taken uit, logt ze en respecteert intervallen"""
+    db_pad = _maak_test_db()
+    factory = lambda: sqlite3.connect(db_pad)
+
+    print("\n" + "="*60)
+    print("TEST: Onderhoud + Historiek")
+    print("="*60)
+
+    resultaten = voer_onderhoud_uit(client_id='test', conn_factory=factory)
+    for r in resultaten:
+        print(f"  {r['taak']}: {r['details']} ({r['duur_ms']} ms)")
+
+    taken = {r['taak'] for r in resultaten}
+    assert taken == {'analyze', 'vacuum', 'wal_checkpoint'}, f"Alle taken verwacht, kreeg {taken}"
+    assert all(r['succes'] for r in resultaten), "Alle taken moeten slagen"
+
+    conn = factory()
+    assert get_db_metrics(conn)['heeft_statistieken'] == True, "ANALYZE moet sqlite_stat1 aanmaken"
+    assert bepaal_verlopen_taken(conn) == [], "Na run mogen geen taken verlopen zijn"
+    conn.close()
+
+    # Niet verlopen → niets te doen
+    assert voer_onderhoud_uit(client_id='test', conn_factory=factory) == []
+
+    # Forceer negeert interval
+    assert len(voer_onderhoud_uit(forceer=True, client_id='test', conn_factory=factory)) == 3
+
+    historiek = get_onderhoud_historiek(conn_factory=factory)
+    assert len(historiek) == 6, f"Verwacht 6 log regels, kreeg {len(historiek)}"
+    assert historiek[0]['db_grootte_bytes'] > 0
+    print("TEST GESLAAGD")
+
+
+def test_vacuum_fragmentatie():
+    """Geen VACUUM in automatisch onderhoud; omzetting expliciet, daarna incrementeel"""
+    db_pad = _maak_test_db()
+    factory = lambda: sqlite3.connect(db_pad)
+
+    conn = factory()
+    conn.execute("DELETE FROM planning WHERE id % 2 = 0 OR id > 1000")
+    conn.commit()
+    voor = get_db_metrics(conn)
+    conn.close()
+
+    print("\n" + "="*60)
+    print("TEST: Vacuum bij fragmentatie")
+    print("="*60)
+    print(f"  Voor: {voor['vrije_paginas']}/{voor['page_count']} vrij, auto_vacuum={voor['auto_vacuum']}")
+
+    assert voor['vrije_paginas'] > 0
+    resultaten = voer_onderhoud_uit(taken=['vacuum'], forceer=True, client_id='test', conn_factory=factory)
+    assert resultaten[0]['succes'] and 'aanbevolen' in resultaten[0]['details'], resultaten[0]['details']
+
+    conn = factory()
+    assert get_db_metrics(conn)['page_count'] == voor['page_count'], "Automatisch onderhoud mag niet VACUUMen"
+
+    # Omzetting kan niet zolang een andere client de lease heeft
+    ensure_onderhoud_tabellen(conn)
+    assert probeer_leiderschap(conn, 'andere-client')
+    assert converteer_naar_incremental(client_id='test', conn_factory=factory) is None
+    geef_leiderschap_vrij(conn, 'andere-client')
+    conn.close()
+
+    resultaat = converteer_naar_incremental(client_id='test', conn_factory=factory)
+    assert resultaat['succes'] and resultaat['taak'] == 'vacuum_conversie', resultaat['details']
+
+    conn = factory()
+    na = get_db_metrics(conn)
+    print(f"  Na omzetting: {na['vrije_paginas']}/{na['page_count']} vrij, auto_vacuum={na['auto_vacuum']}")
+    assert na['auto_vacuum'] == 'incremental', "Database moet naar INCREMENTAL omgezet zijn"
+    assert na['page_count'] < voor['page_count'], "Database moet kleiner geworden zijn"
+
+    # Nieuwe fragmentatie: automatisch onderhoud gebruikt incremental_vacuum
+    conn.execute("DELETE FROM planning WHERE id > 200")
+    conn.commit()
+    gefragmenteerd = get_db_metrics(conn)['vrije_paginas']
+    conn.close()
+    resultaten = voer_onderhoud_uit(taken=['vacuum'], forceer=True, client_id='test', conn_factory=factory)
+    assert resultaten[0]['details'].startswith('incremental_vacuum'), resultaten[0]['details']
+
+    conn = factory()
+    verwacht = min(gefragmenteerd, INCREMENTAL_VACUUM_PAGINAS)
+    over = get_db_metrics(conn)['vrije_paginas']
+    print(f"  incremental_vacuum: {gefragmenteerd} -> {over} vrij ({resultaten[0]['details']})")
+    assert gefragmenteerd > 1 and over <= gefragmenteerd - verwacht, "Alle pagina's (tot de limiet) vrijgeven"
+    assert resultaten[0]['details'] == f"incremental_vacuum: {gefragmenteerd - over} van {gefragmenteerd} pagina's"
+    conn.close()
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_leader_election()
+    test_onderhoud_en_historiek()
+    test_vacuum_fragmentatie()
@@ -0,0 +1,116 @@
+"""
+Test script voor gestreamde HR export (v0.6.29)
+
+Scenario:
+1. Planning tab rij per rij geschreven: waarden, feestdag/weekend kleuren,
+   rode lijn rand, merges en rij hoogtes
+2. Named styles: aantal stijlen onafhankelijk van het aantal rijen
+3. Gebruikers zonder planning krijgen een lege rij
+
+Gebruikt een in-memory database voor kalender en rode lijnen
+(data/planning.db blijft onaangeroerd)
+
+Run: python tests/test_export_service.py
+"""
+import os
+import sqlite3
+import tempfile
+from datetime import date
+
+from openpyxl import Workbook, load_workbook
+
+from services.dag_kalender import DagKalender
+from services.export_service import ExportStijlen, schrijf_planning_sheet
+from services.rode_lijnen_service import RodeLijnenKalender
+
+
+def _maak_db() -> sqlite3.Connection:
+    """Feestdag 1 mei, rode lijn start 5 mei 2025"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE feestdagen (datum TEXT PRIMARY KEY, naam TEXT, is_zondagsrust BOOLEAN, is_variabel BOOLEAN);
+        CREATE TABLE hr_regels (
+            id INTEGER PRIMARY KEY, naam TEXT, waarde TEXT, eenheid TEXT, beschrijving TEXT,
+            actief_vanaf TIMESTAMP, actief_tot TIMESTAMP
+        );
+        CREATE TABLE rode_lijnen_config (
+            id INTEGER PRIMARY KEY, start_datum DATE, interval_dagen INTEGER,
+            actief_vanaf TIMESTAMP, actief_tot TIMESTAMP, is_actief BOOLEAN
+        );
+        INSERT INTO feestdagen VALUES ('2025-05-01', 'Dag van de Arbeid', 1, 0);
+        INSERT INTO rode_lijnen_config VALUES (1, '2025-04-07', 28, '2025-01-01 00:00:00', NULL, 1);
+    """)
+    return conn
+
+
+def _schrijf(planning_data) -> str:
+    """Planning tab voor mei 2025 naar een tijdelijk bestand"""
+    conn = _maak_db()
+    DagKalender._instance = DagKalender.laad(date(2024, 1, 1), date(date.today().year + 1, 12, 31), conn)
+    RodeLijnenKalender._instance = RodeLijnenKalender.laad(conn)
+    try:
+        wb = Workbook(write_only=True)
+        stijlen = ExportStijlen(wb)
+        ws = wb.create_sheet(title='Blad1')
+        schrijf_planning_sheet(ws, stijlen, 2025, 5, planning_data)
+        pad = os.path.join(tempfile.mkdtemp(), 'mei_2025.xlsx')
+        wb.save(pad)
+        return pad
+    finally:
+        DagKalender.refresh()
+        RodeLijnenKalender.refresh()
+
+
+def _gebruikers(aantal: int):
+    """Generator zoals iter_planning_data"""
+    for i in range(aantal):
+        yield {'naam': f'Teamlid {i}', 'planning': {'2025-05-01': 'VV', '2025-05-05': '7101'} if i else {}}
+
+
+def test_planning_tab():
+    """Waarden, kleuren, randen, merges"""
+    print("\n" + "="*60)
+    print("TEST: Planning tab")
+    print("="*60)
+
+    ws = load_workbook(_schrijf(_gebruikers(3)))['Blad1']
+    assert ws['A2'].value == 'MEI' and ws['B2'].value == 'mei/25'
+    assert ws['C2'].value == 'Diensttabel van 01-05-2025 tot 31-05-2025'
+    assert [ws.cell(3, 2 + dag).value for dag in (1, 31)] == [1, 31]
+    assert {str(r) for r in ws.merged_cells.ranges} == {'C2:AG2', 'A2:A6'}
+    assert ws.row_dimensions[3].height == 39.0 and ws.row_dimensions[6].height == 25.0
+
+    # Rijen: lege planning = lege cellen, codes op de juiste dag
+    assert ws['B4'].value == 'Teamlid 0' and ws['C4'].value is None
+    assert ws['C5'].value == 'VV' and ws['G5'].value == '7101'
+
+    # 1 mei feestdag (geel), 3 mei zaterdag (oranje), 2 mei werkdag (geen vulling in data rij)
+    assert ws['C5'].fill.fgColor.rgb == 'FFF0E68C'
+    assert ws['E5'].fill.fgColor.rgb == 'FFF8CBAD'
+    assert ws['D5'].fill.fill_type is None and ws.cell(3, 4).fill.fgColor.rgb == 'FFBFBFBF'
+
+    # Rode lijn start 5 mei: rode linker rand in kop en data; eerste rij dikke bovenrand
+    assert ws['G3'].border.left.color.rgb == 'FFFF0000' and ws['G6'].border.left.color.rgb == 'FFFF0000'
+    assert ws['D4'].border.top.style == 'medium' and ws['D5'].border.top.style == 'thin'
+    assert ws['C5'].border.left.style == 'medium' and ws['AG5'].border.right.style == 'medium'
+    print("TEST GESLAAGD")
+
+
+def test_named_styles():
+    """Aantal named styles hangt niet af van het aantal rijen"""
+    print("\n" + "="*60)
+    print("TEST: Named styles")
+    print("="*60)
+
+    klein = load_workbook(_schrijf(_gebruikers(3)))
+    groot = load_workbook(_schrijf(_gebruikers(400)))
+    print(f"  named styles: {len(klein.named_styles)} (3 rijen), {len(groot.named_styles)} (400 rijen)")
+    assert len(klein.named_styles) == len(groot.named_styles)
+    assert groot['Blad1'].max_row == 403
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_planning_tab()
+    test_named_styles()
@@ -0,0 +1,220 @@
+"""
+Test script voor HR regels versie index (v0.6.29)
+
+Scenario:
+1. Interval lookup: versies, leeg interval, voor de eerste versie, gat na actief_tot
+2. Regel wijziging midden in de periode: elke week / cyclus / reeks krijgt de
+   versie die op dat venster gold, weekend reeks loopt door over een gewijzigde
+   weekend definitie
+3. Index met enkel de huidige waarden = exact zelfde violations als zonder index
+4. Lookups goedkoop genoeg voor team validatie
+5. Nieuwe versie door een andere client: get_instance() herlaadt via de marker
+
+Geen database nodig (index rechtstreeks uit rijen, marker test op een in-memory database)
+
+Run: python tests/test_hr_regels_index.py
+"""
+import random
+import sqlite3
+import time
+from datetime import date, timedelta
+
+from services.constraint_checker import ConstraintChecker, PlanningRegel
+from services import hr_regels_index
+from services.hr_regels_index import HRRegelsIndex, VersieIndex
+
+from test_typetabel_cyclus_validator import HR_CONFIG, SHIFT_TIJDEN, _rode_lijnen
+
+
+def _regel(naam, waarde, eenheid, vanaf, tot=None, beschrijving=None):
+    return {'id': 0, 'naam': naam, 'waarde': waarde, 'eenheid': eenheid,
+            'beschrijving': beschrijving, 'actief_vanaf': vanaf, 'actief_tot': tot}
+
+
+def _huidige_regels():
+    """Alle HR_CONFIG waarden als 1 versie sinds 2024"""
+    eenheden = {float: 'uur', int: 'dagen', str: 'periode'}
+    return [_regel(naam, str(waarde), eenheden[type(waarde)], '2024-01-01')
+            for naam, waarde in HR_CONFIG.items()]
+
+
+def _planning(start: date, codes):
+    return [PlanningRegel(1, start + timedelta(days=i), code) for i, code in enumerate(codes) if code]
+
+
+def test_versie_index():
+    """[vanaf, tot) intervallen, bisect lookup"""
+    print("\n" + "="*60)
+    print("TEST: Versie index")
+    print("="*60)
+
+    index = HRRegelsIndex([
+        _regel('max_uren_week', '50', 'uur', '2025-01-01', '2025-06-01 10:15:00'),
+        _regel('max_uren_week', '48', 'uur', '2025-06-01T10:15:00.123', '2025-06-01'),  # Leeg
+        _regel('max_uren_week', '45', 'uur', '2025-06-01 10:16:00'),
+        _regel('max_werkdagen_reeks', '7', 'dagen', '2025-01-01', '2025-03-01'),
+        _regel('Nacht gevolgd door vroeg verboden', 'x', 'terms', '2025-01-01', beschrijving='verlof'),
+    ])
+    assert index.waarde_op('max_uren_week', date(2024, 6, 1)) == 50.0, "Voor eerste versie = eerste versie"
+    assert index.waarde_op('max_uren_week', date(2025, 5, 31)) == 50.0
+    assert index.waarde_op('max_uren_week', date(2025, 6, 1)) == 45.0
+    assert index.waarde_op('max_werkdagen_reeks', date(2025, 3, 1)) is None, "Gat na actief_tot"
+    assert index.waarde_op('onbekend', date(2025, 3, 1)) is None
+    assert index.waarde_op('Nacht gevolgd door vroeg verboden', date(2025, 3, 1)) == 'verlof'
+    assert index.grenzen('max_uren_week', date(2025, 1, 1), date(2025, 12, 31)) == [date(2025, 6, 1)]
+
+    config = index.config_op(date(2025, 4, 1))
+    assert config['max_uren_week'] == 50.0 and config['max_werkdagen_reeks'] == 7
+    assert index.config_op(date(2025, 7, 1))['max_werkdagen_reeks'] == 7, "Standaard waarde in gat"
+    assert index.regel_op('max_uren_week', date(2025, 7, 1))['waarde'] == '45'
+
+    # Zonder actief_tot sluit de volgende versie de vorige af
+    versies = VersieIndex([(date(2025, 3, 1), None, 'b'), (date(2025, 1, 1), None, 'a')])
+    assert [versies.waarde_op(date(2025, m, 1)) for m in (1, 2, 3, 4)] == ['a', 'a', 'b', 'b']
+    print("TEST GESLAAGD")
+
+
+def test_regel_wijziging_per_venster():
+    """Elk venster krijgt de versie die op dat venster gold"""
+    print("\n" + "="*60)
+    print("TEST: Regel wijziging per venster")
+    print("="*60)
+
+    regels = [r for r in _huidige_regels() if r['naam'] not in
+              ('max_uren_week', 'max_werkdagen_cyclus', 'max_werkdagen_reeks', 'weekend_definitie')]
+    regels += [
+        _regel('max_uren_week', '50', 'uur', '2024-01-01', '2025-03-10'),
+        _regel('max_uren_week', '40', 'uur', '2025-03-10'),
+        _regel('max_werkdagen_cyclus', '19', 'dagen', '2024-01-01', '2025-03-01'),
+        _regel('max_werkdagen_cyclus', '15', 'dagen', '2025-03-01'),
+        _regel('max_werkdagen_reeks', '7', 'dagen', '2024-01-01', '2025-03-01'),
+        _regel('max_werkdagen_reeks', '5', 'dagen', '2025-03-01'),
+        _regel('weekend_definitie', 'vr-22:00|ma-06:00', 'periode', '2024-01-01', '2025-03-01'),
+        _regel('weekend_definitie', 'za-00:00|ma-00:00', 'periode', '2025-03-01'),
+    ]
+    checker = ConstraintChecker(HR_CONFIG, SHIFT_TIJDEN, regels_index=HRRegelsIndex(regels))
+
+    # Februari-maart 2025: elke week ma-za vroeg (48u, 6 dagen), zondag RX
+    start = date(2025, 2, 3)  # Maandag
+    codes = (['7101'] * 6 + ['RX']) * 8
+    planning = _planning(start, codes)
+
+    weken = sorted(v.datum_range[0] for v in checker.check_max_uren_week(planning).violations)
+    print(f"  max_uren_week violations: {weken}")
+    assert weken == [date(2025, 3, 10), date(2025, 3, 17), date(2025, 3, 24)]
+
+    reeksen = {v.datum_range[0] for v in checker.check_max_werkdagen_reeks(planning).violations}
+    assert min(reeksen) == date(2025, 3, 3), "Reeks van 6 pas fout vanaf de reeks die in maart start"
+
+    rode_lijnen = [{'start_datum': date(2025, 2, 3), 'eind_datum': date(2025, 3, 2), 'periode_nummer': 1},
+                   {'start_datum': date(2025, 3, 3), 'eind_datum': date(2025, 3, 30), 'periode_nummer': 2}]
+    cycli = checker.check_max_werkdagen_cyclus(planning, rode_lijnen=rode_lijnen).violations
+    assert [(v.details['periode_nummer'], v.details['max_dagen']) for v in cycli] == [(1, 19), (2, 15)]
+
+    # Elke zaterdag gewerkt: weekend reeks loopt door over de nieuwe definitie
+    weekends = checker.check_max_weekends_achter_elkaar(planning).violations
+    print(f"  max_weekends violations: {[v.datum_range for v in weekends]}")
+    assert weekends and max(v.details['weekends_count'] for v in weekends) == 8
+    print("TEST GESLAAGD")
+
+
+def test_zonder_wijziging_identiek():
+    """Index met 1 versie per regel = zelfde resultaat als hr_config"""
+    print("\n" + "="*60)
+    print("TEST: Zonder wijziging identiek")
+    print("="*60)
+
+    zonder = ConstraintChecker(HR_CONFIG, SHIFT_TIJDEN)
+    met = ConstraintChecker(HR_CONFIG, SHIFT_TIJDEN, regels_index=HRRegelsIndex(_huidige_regels()))
+    rode_lijnen = _rode_lijnen(fase_dagen=3)
+    keuzes = ['7101', '7101', '7102', '7103', '7103', 'RX', 'CX', None]
+
+    def sleutel(violations):
+        return [(v.type, v.datum, v.datum_range, v.beschrijving) for v in violations]
+
+    totaal = 0
+    for seed in range(5):
+        rng = random.Random(seed)
+        planning = _planning(date(2025, 1, 1), [rng.choice(keuzes) for _ in range(120)])
+        verwacht = sleutel(zonder.get_all_violations(planning, 1, rode_lijnen))
+        assert sleutel(met.get_all_violations(planning, 1, rode_lijnen)) == verwacht
+        totaal += len(verwacht)
+    print(f"  {totaal} violations identiek")
+    print("TEST GESLAAGD")
+
+
+def test_lookup_snelheid():
+    """Bisect lookups: duizenden per validatie zonder extra queries"""
+    print("\n" + "="*60)
+    print("TEST: Lookup snelheid")
+    print("="*60)
+
+    regels = []
+    for i in range(50):  # 50 versies per regel
+        vanaf = date(2020, 1, 1) + timedelta(days=30 * i)
+        regels.append(_regel('max_uren_week', str(40 + i % 10), 'uur', vanaf.isoformat(),
+                             (vanaf + timedelta(days=30)).isoformat()))
+    index = HRRegelsIndex(regels + _huidige_regels())
+
+    start = time.perf_counter()
+    for i in range(100_000):
+        index.waarde_op('max_uren_week', date(2020, 1, 1) + timedelta(days=i % 1500))
+    duur = time.perf_counter() - start
+    print(f"  100.000 lookups: {duur * 1000:.0f} ms")
+    assert duur < 2.0
+    print("TEST GESLAAGD")
+
+
+def test_wijziging_andere_client():
+    """Marker (aantal, max id, laatste vanaf/tot) verandert → index herladen"""
+    print("\n" + "="*60)
+    print("TEST: Wijziging door andere client")
+    print("="*60)
+
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE hr_regels (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, naam TEXT, waarde REAL, eenheid TEXT,
+            beschrijving TEXT, actief_vanaf TIMESTAMP, actief_tot TIMESTAMP, is_actief BOOLEAN DEFAULT 1
+        )
+    """)
+    conn.execute("""
+        INSERT INTO hr_regels (naam, waarde, eenheid, actief_vanaf)
+        VALUES ('max_uren_week', 50, 'uur', '2024-01-01')
+    """)
+    conn.commit()
+
+    HRRegelsIndex.refresh()
+    try:
+        assert HRRegelsIndex.get_instance(conn).waarde_op('max_uren_week', date(2026, 1, 1)) == 50.0
+
+        # Andere client: nieuwe versie (zelfde flow als hr_regels_beheer_screen)
+        conn.execute("UPDATE hr_regels SET actief_tot = '2025-06-01', is_actief = 0 WHERE id = 1")
+        conn.execute("""
+            INSERT INTO hr_regels (naam, waarde, eenheid, actief_vanaf)
+            VALUES ('max_uren_week', 45, 'uur', '2025-06-01')
+        """)
+        conn.commit()
+
+        # Binnen het interval geen extra query, daarna herladen
+        assert HRRegelsIndex.get_instance(conn).waarde_op('max_uren_week', date(2026, 1, 1)) == 50.0
+        HRRegelsIndex._marker_gelezen_op -= hr_regels_index.MARKER_INTERVAL_SECONDEN
+        index = HRRegelsIndex.get_instance(conn)
+        assert index.waarde_op('max_uren_week', date(2026, 1, 1)) == 45.0
+        assert index.waarde_op('max_uren_week', date(2025, 1, 1)) == 50.0
+
+        # Ongewijzigd: zelfde instantie
+        HRRegelsIndex._marker_gelezen_op -= hr_regels_index.MARKER_INTERVAL_SECONDEN
+        assert HRRegelsIndex.get_instance(conn) is index
+    finally:
+        HRRegelsIndex.refresh()
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_versie_index()
+    test_regel_wijziging_per_venster()
+    test_zonder_wijziging_identiek()
+    test_lookup_snelheid()
+    test_wijziging_andere_client()
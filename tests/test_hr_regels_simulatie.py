@@ -0,0 +1,109 @@
+"""
+Test script voor HR regels what-if simulatie (v0.6.29)
+
+Scenario:
+1. Enkel checks met gewijzigde config sleutels worden herberekend
+2. Resultaat gelijk aan een volledige hertelling met de alternatieve config
+   (max_uren_week, week_definitie, max_werkdagen_cyclus)
+3. 30 gebruikers x 6 maanden in enkele seconden
+
+Geen database nodig (SimulatieBron rechtstreeks opgebouwd)
+
+Run: python tests/test_hr_regels_simulatie.py
+"""
+import random
+import time
+from datetime import date, timedelta
+
+from services.constraint_checker import ConstraintChecker, PlanningRegel
+from services.hr_regels_simulatie import SimulatieBron, gewijzigde_regels, simuleer, tel_violations
+
+from test_typetabel_cyclus_validator import HR_CONFIG, SHIFT_TIJDEN, _rode_lijnen
+
+
+VAN = date(2025, 7, 1)
+TOT = date(2025, 12, 31)
+
+
+def _maak_bron(aantal_gebruikers: int, seed: int = 0) -> SimulatieBron:
+    """Willekeurige planning met aanloop van 28 dagen"""
+    rng = random.Random(seed)
+    keuzes = ['7101', '7101', '7102', '7102', '7103', 'RX', 'CX', None]
+    start = VAN - timedelta(days=28)
+    planning = {}
+    for gebruiker_id in range(1, aantal_gebruikers + 1):
+        planning[gebruiker_id] = [
+            PlanningRegel(gebruiker_id, start + timedelta(days=i), code)
+            for i in range((TOT - start).days + 1)
+            if (code := rng.choice(keuzes))
+        ]
+    return SimulatieBron(dict(HR_CONFIG), SHIFT_TIJDEN, planning, VAN, TOT,
+                         rode_lijnen=_rode_lijnen(fase_dagen=3))
+
+
+def test_gewijzigde_regels():
+    """Config sleutel → check"""
+    print("\n" + "="*60)
+    print("TEST: Gewijzigde regels")
+    print("="*60)
+
+    assert gewijzigde_regels(HR_CONFIG, dict(HR_CONFIG)) == []
+    assert gewijzigde_regels(HR_CONFIG, {**HR_CONFIG, 'week_definitie': 'zo-00:00|za-23:59'}) == ['max_uren_week']
+    assert gewijzigde_regels(HR_CONFIG, {**HR_CONFIG, 'max_werkdagen_reeks': 6,
+                                         'weekend_definitie': 'za-00:00|zo-23:59'}) == [
+        'max_werkdagen_reeks', 'max_weekends']
+    print("TEST GESLAAGD")
+
+
+def test_gelijk_aan_volledige_hertelling():
+    """Overgenomen + herberekende tellingen = alles opnieuw tellen"""
+    print("\n" + "="*60)
+    print("TEST: Gelijk aan volledige hertelling")
+    print("="*60)
+
+    bron = _maak_bron(5)
+    alternatief_config = {**HR_CONFIG, 'max_uren_week': 40.0, 'week_definitie': 'zo-00:00|za-23:59',
+                          'max_werkdagen_cyclus': 15}
+    resultaat = simuleer(bron, alternatief_config)
+    volledig = tel_violations(ConstraintChecker(alternatief_config, SHIFT_TIJDEN),
+                              bron.planning, bron.rode_lijnen, VAN, TOT)
+
+    for regel, huidig, alternatief in resultaat.per_regel():
+        print(f"  {regel:25s} {huidig:4d} → {alternatief:4d}")
+    assert resultaat.gewijzigde_regels == ['max_uren_week', 'max_werkdagen_cyclus']
+    assert resultaat.alternatief == volledig
+    per_regel = {regel: (huidig, alternatief) for regel, huidig, alternatief in resultaat.per_regel()}
+    assert per_regel['max_uren_week'][1] > per_regel['max_uren_week'][0]
+    assert per_regel['min_rust_12u'][0] == per_regel['min_rust_12u'][1]
+
+    # Per gebruiker: enkel gebruikers met een verschil, grootste eerst
+    verschillen = [abs(alternatief - huidig) for _, huidig, alternatief in resultaat.per_gebruiker()]
+    assert verschillen and all(verschillen) and verschillen == sorted(verschillen, reverse=True)
+    print("TEST GESLAAGD")
+
+
+def test_snelheid():
+    """30 gebruikers x 6 maanden, huidige + alternatieve telling"""
+    print("\n" + "="*60)
+    print("TEST: Snelheid")
+    print("="*60)
+
+    bron = _maak_bron(30, seed=1)
+    start = time.perf_counter()
+    simuleer(bron, {**HR_CONFIG, 'max_uren_week': 48.0})
+    eerste = time.perf_counter() - start
+
+    start = time.perf_counter()
+    simuleer(bron, {**HR_CONFIG, 'max_uren_week': 44.0})
+    tweede = time.perf_counter() - start
+
+    print(f"  Eerste simulatie (incl. huidige telling): {eerste * 1000:.0f} ms")
+    print(f"  Volgende simulatie: {tweede * 1000:.0f} ms")
+    assert eerste < 5.0 and tweede < eerste
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_gewijzigde_regels()
+    test_gelijk_aan_volledige_hertelling()
+    test_snelheid()
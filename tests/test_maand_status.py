@@ -0,0 +1,165 @@
+"""
+Test script voor maand publicatie status (v0.6.29)
+
+Scenario:
+1. Bij aanmaak worden maanden met gepubliceerde planning rijen overgenomen
+2. Publiceren/terugzetten = 1 rij, versie verhoogt, planning rijen onaangeroerd
+3. Gepubliceerde maanden in periode + write guard op planning rijen
+4. Shift opslaan: ook een nieuwe rij (lege cel) in een gepubliceerde maand wordt geweigerd
+5. Vrije periode over een jaargrens: maanden/jaren van de periode en de actie maand
+   blijft binnen de getoonde periode
+
+Gebruikt een in-memory database (data/planning.db blijft onaangeroerd)
+
+Run: python tests/test_maand_status.py
+"""
+import sqlite3
+
+from services.maand_status_service import (
+    ensure_maand_status_tabel, get_maand_status, zet_maand_status,
+    get_gepubliceerde_maanden, gepubliceerde_datum_ranges, maanden_in_periode,
+    actie_maand_in_periode, SQL_MAAND_NIET_GEPUBLICEERD, SQL_SHIFT_OPSLAAN
+)
+
+
+def _maak_test_db() -> sqlite3.Connection:
+    """Planning met een legacy gepubliceerde maand (oktober) en een concept maand (november)"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE planning (
+            id INTEGER PRIMARY KEY, gebruiker_id INTEGER, datum TEXT,
+            shift_code TEXT, status TEXT DEFAULT 'concept',
+            UNIQUE(gebruiker_id, datum)
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO planning (gebruiker_id, datum, shift_code, status) VALUES (?, ?, ?, ?)",
+        [(1, f"2025-10-{dag:02d}", '7101', 'gepubliceerd') for dag in range(1, 32)] +
+        [(1, f"2025-11-{dag:02d}", '7101', 'concept') for dag in range(1, 31)]
+    )
+    conn.commit()
+    return conn
+
+
+def test_backfill():
+    """Legacy planning.status wordt eenmalig overgenomen"""
+    conn = _maak_test_db()
+    ensure_maand_status_tabel(conn)
+
+    print("\n" + "="*60)
+    print("TEST: Backfill uit planning.status")
+    print("="*60)
+
+    assert get_maand_status(2025, 10, conn) == 'gepubliceerd'
+    assert get_maand_status(2025, 11, conn) == 'concept'
+    assert get_maand_status(2030, 1, conn) == 'concept', "Geen rij = concept"
+    print("TEST GESLAAGD")
+
+
+def test_publiceren_constante_write():
+    """Status wijziging raakt geen planning rijen, versie verhoogt"""
+    conn = _maak_test_db()
+    ensure_maand_status_tabel(conn)
+
+    print("\n" + "="*60)
+    print("TEST: Publiceren = 1 rij")
+    print("="*60)
+
+    wijzigingen_voor = conn.total_changes
+    assert zet_maand_status(2025, 11, 'gepubliceerd', gebruiker_id=7, conn=conn) == 1
+    assert conn.total_changes - wijzigingen_voor == 1, "Enkel maand_status rij mag wijzigen"
+
+    row = conn.execute("SELECT * FROM maand_status WHERE jaar = 2025 AND maand = 11").fetchone()
+    assert row['gepubliceerd_door'] == 7 and row['gepubliceerd_op']
+
+    assert zet_maand_status(2025, 11, 'concept', conn=conn) == 2
+    row = conn.execute("SELECT * FROM maand_status WHERE jaar = 2025 AND maand = 11").fetchone()
+    assert row['status'] == 'concept' and row['gepubliceerd_door'] is None
+
+    try:
+        zet_maand_status(2025, 11, 'archief', conn=conn)
+        assert False, "Ongeldige status moet ValueError geven"
+    except ValueError:
+        pass
+    print("TEST GESLAAGD")
+
+
+def test_periode_en_write_guard():
+    """Buffer dagen van gepubliceerde buurmaand zijn beschermd"""
+    conn = _maak_test_db()
+    ensure_maand_status_tabel(conn)
+
+    print("\n" + "="*60)
+    print("TEST: Gepubliceerde maanden in periode")
+    print("="*60)
+
+    maanden = get_gepubliceerde_maanden("2025-10-24", "2025-12-08", conn)
+    print(f"  Gepubliceerd: {maanden}")
+    assert maanden == {(2025, 10)}
+    assert gepubliceerde_datum_ranges("2025-10-24", "2025-12-08", maanden) == [("2025-10-24", "2025-10-31")]
+
+    # Verwijder alles in periode: enkel november (concept) mag verdwijnen
+    conn.execute(f"""
+        DELETE FROM planning
+        WHERE datum BETWEEN '2025-10-24' AND '2025-12-08'
+          AND {SQL_MAAND_NIET_GEPUBLICEERD}
+    """)
+    over = {row['datum'][:7] for row in conn.execute("SELECT datum FROM planning")}
+    assert over == {'2025-10'}, f"Oktober moet beschermd blijven, over: {over}"
+    print("TEST GESLAAGD")
+
+
+def test_shift_opslaan_guard():
+    """Insert en update tak van save_shift zijn allebei bewaakt"""
+    conn = _maak_test_db()
+    ensure_maand_status_tabel(conn)
+
+    print("\n" + "="*60)
+    print("TEST: Shift opslaan in gepubliceerde maand")
+    print("="*60)
+
+    # Oktober gepubliceerd: lege cel (gebruiker 2) en bestaande cel blijven ongewijzigd
+    conn.execute(SQL_SHIFT_OPSLAAN, (2, '2025-10-15', 'RX'))
+    conn.execute(SQL_SHIFT_OPSLAAN, (1, '2025-10-15', 'RX'))
+    rijen = {(row['gebruiker_id'], row['shift_code']) for row in
+             conn.execute("SELECT gebruiker_id, shift_code FROM planning WHERE datum = '2025-10-15'")}
+    assert rijen == {(1, '7101')}, f"Gepubliceerde maand gewijzigd: {rijen}"
+
+    # November concept: nieuwe rij + update
+    conn.execute(SQL_SHIFT_OPSLAAN, (2, '2025-11-15', 'RX'))
+    conn.execute(SQL_SHIFT_OPSLAAN, (1, '2025-11-15', 'VV'))
+    rijen = {(row['gebruiker_id'], row['shift_code'], row['status']) for row in
+             conn.execute("SELECT gebruiker_id, shift_code, status FROM planning WHERE datum = '2025-11-15'")}
+    assert rijen == {(1, 'VV', 'concept'), (2, 'RX', 'concept')}
+    print("TEST GESLAAGD")
+
+
+def test_periode_over_jaargrens():
+    """Periode december → januari terwijl de gekozen maand november vorig jaar is"""
+    print("\n" + "="*60)
+    print("TEST: Vrije periode over een jaargrens")
+    print("="*60)
+
+    assert maanden_in_periode("2026-12-14", "2027-01-24") == [(2026, 12), (2027, 1)]
+    assert maanden_in_periode("2025-11-03", "2025-11-30") == [(2025, 11)]
+    jaren = sorted({jaar for jaar, _ in maanden_in_periode("2026-12-14", "2027-01-24")})
+    assert jaren == [2026, 2027], "Feestdagen/dag types nodig voor beide jaren"
+
+    # Actie maand buiten de periode → maand met de meeste getoonde dagen
+    assert actie_maand_in_periode(2025, 11, "2026-12-14", "2027-01-24") == (2027, 1)   # 18 vs 24 dagen
+    assert actie_maand_in_periode(2025, 11, "2026-12-07", "2027-01-03") == (2026, 12)  # 25 vs 3 dagen
+    assert actie_maand_in_periode(2025, 11, "2026-12-17", "2027-01-15") == (2026, 12), "Gelijk: eerste"
+
+    # Actie maand in de periode blijft, ook als ze maar een paar dagen telt
+    assert actie_maand_in_periode(2027, 1, "2026-12-07", "2027-01-03") == (2027, 1)
+    assert actie_maand_in_periode(2025, 11, "2025-10-27", "2025-11-23") == (2025, 11)
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_backfill()
+    test_publiceren_constante_write()
+    test_periode_en_write_guard()
+    test_shift_opslaan_guard()
+    test_periode_over_jaargrens()
@@ -0,0 +1,125 @@
+"""
+Test script voor set-based planning writes (v0.6.29)
+
+Scenario:
+1. Batch invullen + wissen in 1 transactie, notities blijven behouden
+2. Gepubliceerde maand blijft beschermd, ook lege cellen (geen nieuwe rijen);
+   geweigerde wijzigingen worden teruggegeven
+3. Patroon kwast: herhalende reeks op kalenderdagen, gelijk ritme per gebruiker
+
+Gebruikt een in-memory database (data/planning.db blijft onaangeroerd)
+
+Run: python tests/test_planning_batch.py
+"""
+import sqlite3
+
+from services.maand_status_service import ensure_maand_status_tabel, zet_maand_status
+from services.planning_batch_service import schrijf_shifts, parse_patroon, patroon_toewijzing
+
+
+def _maak_test_db() -> sqlite3.Connection:
+    """Planning met 1 shift + notitie in november"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE planning (
+            id INTEGER PRIMARY KEY, gebruiker_id INTEGER, datum TEXT,
+            shift_code TEXT, notitie TEXT, status TEXT DEFAULT 'concept',
+            UNIQUE(gebruiker_id, datum)
+        )
+    """)
+    conn.execute("""
+        INSERT INTO planning (gebruiker_id, datum, shift_code, notitie)
+        VALUES (1, '2025-11-03', '7101', 'Opleiding')
+    """)
+    conn.commit()
+    ensure_maand_status_tabel(conn)
+    return conn
+
+
+def _codes(conn: sqlite3.Connection) -> dict:
+    return {(row['datum'], row['gebruiker_id']): row['shift_code']
+            for row in conn.execute("SELECT datum, gebruiker_id, shift_code FROM planning")}
+
+
+def test_batch_invullen_en_wissen():
+    """Upserts + wissen in 1 transactie"""
+    conn = _maak_test_db()
+
+    print("\n" + "="*60)
+    print("TEST: Batch invullen en wissen")
+    print("="*60)
+
+    wijzigingen_voor = conn.total_changes
+    schrijf_shifts([
+        ("2025-11-03", 1, None),
+        ("2025-11-04", 1, '7101'),
+        ("2025-11-05", 1, 'RX'),
+        ("2025-11-04", 2, '7201'),
+    ], conn)
+    assert conn.total_changes - wijzigingen_voor == 4
+
+    codes = _codes(conn)
+    assert codes[("2025-11-03", 1)] is None
+    assert codes[("2025-11-04", 1)] == '7101' and codes[("2025-11-04", 2)] == '7201'
+    notitie = conn.execute("SELECT notitie FROM planning WHERE datum = '2025-11-03'").fetchone()
+    assert notitie['notitie'] == 'Opleiding', "Notitie moet behouden blijven"
+    print("TEST GESLAAGD")
+
+
+def test_gepubliceerde_maand_beschermd():
+    """Writes in gepubliceerde maand worden genegeerd"""
+    conn = _maak_test_db()
+    zet_maand_status(2025, 11, 'gepubliceerd', conn=conn)
+
+    print("\n" + "="*60)
+    print("TEST: Gepubliceerde maand beschermd")
+    print("="*60)
+
+    geweigerd = schrijf_shifts([("2025-11-03", 1, 'RX'), ("2025-11-03", 1, None)], conn)
+    assert _codes(conn)[("2025-11-03", 1)] == '7101'
+    assert geweigerd == [("2025-11-03", 1, 'RX'), ("2025-11-03", 1, None)], "Grid moet weten wat niet geschreven is"
+
+    # Lege cel: geen nieuwe rij (bulk invullen, patroon, auto-generatie)
+    schrijf_shifts([("2025-11-04", 1, 'RX'), ("2025-11-03", 2, '7101')], conn)
+    schrijf_shifts([("2025-11-05", 1, '7101')], conn, alleen_lege_cellen=True)
+    assert set(_codes(conn)) == {("2025-11-03", 1)}, "Geen nieuwe rijen in gepubliceerde maand"
+
+    # Concept maand: lege cellen worden wel ingevuld, bestaande enkel zonder alleen_lege_cellen
+    # Gemengde batch over de maandgrens: enkel de gepubliceerde cellen zijn geweigerd
+    geweigerd = schrijf_shifts([("2025-11-30", 1, 'RX'), ("2025-12-01", 1, '7101'), ("2025-12-02", 1, 'RX')], conn)
+    assert geweigerd == [("2025-11-30", 1, 'RX')]
+    schrijf_shifts([("2025-12-01", 1, 'VV'), ("2025-12-03", 1, 'VV')], conn, alleen_lege_cellen=True)
+    codes = _codes(conn)
+    assert (codes[("2025-12-01", 1)], codes[("2025-12-03", 1)]) == ('7101', 'VV')
+    print("TEST GESLAAGD")
+
+
+def test_patroon_toewijzing():
+    """Patroon loopt op kalenderdagen vanaf vroegste geselecteerde datum"""
+    print("\n" + "="*60)
+    print("TEST: Patroon kwast")
+    print("="*60)
+
+    patroon = parse_patroon("v v, L - ")
+    assert patroon == ['V', 'V', 'L', None]
+
+    # Gebruiker 2 start 1 dag later, 2025-11-07 niet geselecteerd
+    cellen = [("2025-11-03", 1), ("2025-11-04", 1), ("2025-11-05", 1), ("2025-11-06", 1),
+              ("2025-11-08", 1), ("2025-11-04", 2), ("2025-11-05", 2)]
+    toewijzing = {(datum, gid): code for datum, gid, code in patroon_toewijzing(cellen, patroon)}
+    print(f"  Toewijzing: {toewijzing}")
+
+    assert toewijzing[("2025-11-03", 1)] == 'V'
+    assert toewijzing[("2025-11-05", 1)] == 'L'
+    assert toewijzing[("2025-11-06", 1)] is None
+    assert toewijzing[("2025-11-08", 1)] == 'V', "Ritme loopt door over niet-geselecteerde dag"
+    assert toewijzing[("2025-11-04", 2)] == toewijzing[("2025-11-04", 1)], "Zelfde ritme per gebruiker"
+    assert patroon_toewijzing([], patroon) == []
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_batch_invullen_en_wissen()
+    test_gepubliceerde_maand_beschermd()
+    test_patroon_toewijzing()
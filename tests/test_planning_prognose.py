@@ -0,0 +1,134 @@
+"""
+Test script voor planning prognose (v0.6.29)
+
+Scenario:
+1. Verlof overlay: gat in de bemanning op de verlofdagen, verlofdagen per maand
+2. Startweek override: twee gebruikers in dezelfde week → elke weekdag onderbemand,
+   gespreid → volledig bemand
+3. HR violations per maand, aanloop violations niet gerapporteerd
+4. 30 gebruikers x 12 maanden in enkele seconden
+
+Geen database nodig (projectie + checker rechtstreeks)
+
+Run: python tests/test_planning_prognose.py
+"""
+import time
+from datetime import date
+
+from services.constraint_checker import ConstraintChecker
+from services.planning_prognose import PrognoseBron, bereken_prognose
+from services.rooster_projectie import RoosterProjectie, ProjectieGebruiker
+
+from test_typetabel_cyclus_validator import HR_CONFIG, SHIFT_TIJDEN, _rode_lijnen
+
+
+# 2 weken cyclus: week 1 vroeg ma-vr, week 2 laat ma-vr, weekends vrij
+TYPETABEL = {**{(1, dag): 'V' for dag in range(1, 6)}, **{(2, dag): 'L' for dag in range(1, 6)},
+             (1, 6): 'RX', (1, 7): 'CX', (2, 6): 'RX', (2, 7): 'CX'}
+SHIFT_CODES = {(1, 'weekdag', 'vroeg'): '7101', (1, 'weekdag', 'laat'): '7102'}
+KRITISCH = [('Interventie', 'vroeg', 'weekdag', '7101'), ('Interventie', 'laat', 'weekdag', '7102')]
+
+
+def _maak_bron(gebruikers, verlof=None) -> PrognoseBron:
+    projectie = RoosterProjectie(2, date(2025, 12, 29), TYPETABEL, SHIFT_CODES,
+                                 gebruikers=gebruikers)
+    return PrognoseBron(
+        projectie=projectie,
+        checker=ConstraintChecker(HR_CONFIG, SHIFT_TIJDEN),
+        kritische_codes=KRITISCH,
+        verlof=verlof or {},
+        rode_lijnen=_rode_lijnen(fase_dagen=0),
+    )
+
+
+def test_verlof_overlay():
+    """Verlofdagen vervangen de typetabel code en openen een gat"""
+    print("\n" + "="*60)
+    print("TEST: Verlof overlay")
+    print("="*60)
+
+    gebruikers = [ProjectieGebruiker(1, 1, (1,)), ProjectieGebruiker(2, 2, (1,))]
+    verlof = {1: [(date(2026, 2, 2), date(2026, 2, 4), 'VV')]}
+    maanden = bereken_prognose(_maak_bron(gebruikers, verlof), date(2026, 1, 15), aantal_maanden=2)
+
+    assert [(m.jaar, m.maand) for m in maanden] == [(2026, 1), (2026, 2)]
+    januari, februari = maanden
+    print(f"  januari: {len(januari.onderbemand)} onderbemand, februari: {februari.gaten}")
+    assert not januari.onderbemand and januari.verlof_dagen == 0
+    assert februari.verlof_dagen == 3
+    # Gebruiker 1 heeft laat in week 2 (2 feb = week 2 van de cyclus)
+    assert februari.onderbemand == [date(2026, 2, 2), date(2026, 2, 3), date(2026, 2, 4)]
+    assert {code for _, code in februari.gaten} == {'7102'}
+    print("TEST GESLAAGD")
+
+
+def test_startweek_override():
+    """What-if startweken zonder de projectie te wijzigen"""
+    print("\n" + "="*60)
+    print("TEST: Startweek override")
+    print("="*60)
+
+    gebruikers = [ProjectieGebruiker(1, 1, (1,)), ProjectieGebruiker(2, 1, (1,))]
+    bron = _maak_bron(gebruikers)
+
+    samen = bereken_prognose(bron, date(2026, 3, 1), aantal_maanden=1)[0]
+    gespreid = bereken_prognose(bron, date(2026, 3, 1), aantal_maanden=1, startweken={2: 2})[0]
+    print(f"  zelfde startweek: {len(samen.onderbemand)} onderbemand, {len(samen.dubbel)} dubbel")
+    print(f"  gespreid: {len(gespreid.onderbemand)} onderbemand, {len(gespreid.dubbel)} dubbel")
+
+    assert len(samen.onderbemand) == 22  # alle weekdagen in maart 2026
+    assert not gespreid.onderbemand and not gespreid.dubbel
+    assert bron.projectie.gebruikers[1].startweek == 1, "Override mag de projectie niet wijzigen"
+    print("TEST GESLAAGD")
+
+
+def test_hr_violations_per_maand():
+    """Nacht → vroeg na het weekend, enkel vanaf de startmaand"""
+    print("\n" + "="*60)
+    print("TEST: HR violations per maand")
+    print("="*60)
+
+    # Week 1 vroeg ma-vr, zondag nacht → elke maandag nacht_vroeg + 12u rust
+    typetabel = {**{(1, dag): 'V' for dag in range(1, 6)}, (1, 6): 'RX', (1, 7): 'N'}
+    shift_codes = {(1, 'weekdag', 'vroeg'): '7101', (1, 'zondag', 'nacht'): '7103'}
+    projectie = RoosterProjectie(1, date(2025, 12, 29), typetabel, shift_codes,
+                                 gebruikers=[ProjectieGebruiker(1, 1, (1,))])
+    bron = PrognoseBron(projectie, ConstraintChecker(HR_CONFIG, SHIFT_TIJDEN),
+                        rode_lijnen=_rode_lijnen(fase_dagen=0))
+
+    maanden = bereken_prognose(bron, date(2026, 2, 1), aantal_maanden=2)
+    for maand in maanden:
+        print(f"  {maand.jaar}-{maand.maand:02d}: {maand.violations_per_type}")
+        maandagen = {v.datum for v in maand.violations if v.type.value == 'nacht_vroeg_verboden'}
+        assert all(d.month == maand.maand and d.weekday() == 0 for d in maandagen)
+    # Februari 2026: 4 maandagen, maart: 5
+    assert maanden[0].violations_per_type['nacht_vroeg_verboden'] == 4
+    assert maanden[1].violations_per_type['nacht_vroeg_verboden'] == 5
+    assert maanden[0].errors
+    print("TEST GESLAAGD")
+
+
+def test_jaar_snelheid():
+    """30 gebruikers x 12 maanden interactief herberekenbaar"""
+    print("\n" + "="*60)
+    print("TEST: Jaar snelheid")
+    print("="*60)
+
+    gebruikers = [ProjectieGebruiker(i, i % 2 + 1, (1,)) for i in range(1, 31)]
+    bron = _maak_bron(gebruikers, {5: [(date(2026, 7, 1), date(2026, 7, 21), 'VV')]})
+
+    start = time.perf_counter()
+    maanden = bereken_prognose(bron, date(2026, 1, 1))
+    duur = time.perf_counter() - start
+
+    print(f"  12 maanden, 30 gebruikers: {duur * 1000:.0f} ms")
+    assert len(maanden) == 12 and maanden[6].verlof_dagen == 21
+    assert duur < 5.0
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_verlof_overlay()
+    test_startweek_override()
+    test_hr_violations_per_maand()
+    test_jaar_snelheid()
@@ -0,0 +1,129 @@
+"""
+Test script voor gedeelde referentie catalogus (v0.6.29)
+
+Scenario:
+1. Lookups per code, (werkpost, dag_type, shift_type), term en flags
+2. Afgeleide formaten = wat validator, bemannings controle en schermen verwachten
+3. Wijzigingsteller: get_instance() herlaadt enkel na invalideer(), ook TermCodeService
+
+Gebruikt een in-memory database (data/planning.db blijft onaangeroerd)
+
+Run: python tests/test_referentie_catalogus.py
+"""
+import sqlite3
+
+from services.referentie_catalogus import ReferentieCatalogus
+from services.term_code_service import TermCodeService
+
+
+def _maak_db() -> sqlite3.Connection:
+    """2 actieve werkposten + 1 inactieve, speciale codes met termen"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE werkposten (
+            id INTEGER PRIMARY KEY, naam TEXT, beschrijving TEXT, telt_als_werkdag BOOLEAN,
+            reset_12u_rust BOOLEAN, breekt_werk_reeks BOOLEAN, is_actief BOOLEAN,
+            aangemaakt_op TIMESTAMP, gedeactiveerd_op TIMESTAMP
+        );
+        CREATE TABLE shift_codes (
+            id INTEGER PRIMARY KEY, werkpost_id INTEGER, dag_type TEXT, shift_type TEXT,
+            code TEXT, start_uur TEXT, eind_uur TEXT, is_kritisch BOOLEAN
+        );
+        CREATE TABLE speciale_codes (
+            id INTEGER PRIMARY KEY, code TEXT, naam TEXT, term TEXT,
+            telt_als_werkdag BOOLEAN, reset_12u_rust BOOLEAN, breekt_werk_reeks BOOLEAN
+        );
+        INSERT INTO werkposten VALUES (1, 'PAT', NULL, 1, 0, 0, 1, NULL, NULL);
+        INSERT INTO werkposten VALUES (2, 'Interventie', NULL, 1, 1, 0, 1, NULL, NULL);
+        INSERT INTO werkposten VALUES (3, 'Oud', NULL, 0, 0, 0, 0, NULL, NULL);
+        INSERT INTO shift_codes VALUES (1, 1, 'weekdag', 'vroeg', '7101', '06:00', '14:00', 1);
+        INSERT INTO shift_codes VALUES (2, 1, 'weekdag', 'laat', '7201', '14:00', '22:00', 0);
+        INSERT INTO shift_codes VALUES (3, 1, 'zondag', 'vroeg', '7701', '06:00', '14:00', 1);
+        INSERT INTO shift_codes VALUES (4, 2, 'weekdag', 'vroeg', '1101', '06:00', '14:00', 1);
+        INSERT INTO shift_codes VALUES (5, 3, 'weekdag', 'vroeg', '9101', '06:00', '14:00', 1);
+        INSERT INTO speciale_codes VALUES (1, 'VV', 'Verlof', 'verlof', 0, 1, 1);
+        INSERT INTO speciale_codes VALUES (2, 'RX', 'Zondagrust', 'zondagrust', 0, 1, 1);
+        INSERT INTO speciale_codes VALUES (3, 'DA', 'ADV', NULL, 1, 0, 0);
+    """)
+    return conn
+
+
+def test_lookups():
+    """Indexen en afgeleide sets"""
+    print("\n" + "="*60)
+    print("TEST: Lookups")
+    print("="*60)
+
+    catalogus = ReferentieCatalogus.laad(_maak_db())
+    assert catalogus.code_voor(1, 'zondag', 'vroeg') == '7701'
+    assert catalogus.code_voor(2, 'zondag', 'vroeg') is None
+    assert catalogus.shift_code('1101').werkpost.naam == 'Interventie'
+    assert catalogus.code_voor_term('verlof') == 'VV' and catalogus.term_van('RX') == 'zondagrust'
+    assert catalogus.term_codes() == {'verlof': 'VV', 'zondagrust': 'RX'}
+
+    # Inactieve werkpost: niet geldig, niet kritisch, niet in validator data
+    assert catalogus.geldige_codes() == {'7101', '7201', '7701', '1101', 'VV', 'RX', 'DA'}
+    assert catalogus.geldige_codes_per_dag()['weekdag'] == {'7101', '7201', '1101'}
+    assert catalogus.speciale_code_set() == {'VV', 'RX', 'DA'}
+    assert [shift.code for shift in catalogus.kritische_codes('weekdag')] == ['1101', '7101']
+    assert catalogus.werkpost_per_code() == {'7101': 1, '7201': 1, '7701': 1, '1101': 2}
+
+    # Flags: werkpost flags voor shift codes, eigen flags voor speciale codes
+    assert catalogus.werkdag_codes() == {'7101', '7201', '7701', '1101', 'DA'}
+    assert catalogus.reset_codes() == {'1101', 'VV', 'RX'}
+    print("TEST GESLAAGD")
+
+
+def test_validator_formaat():
+    """shift_tijden = voormalige _get_shift_tijden queries"""
+    print("\n" + "="*60)
+    print("TEST: Validator formaat")
+    print("="*60)
+
+    tijden = ReferentieCatalogus.laad(_maak_db()).shift_tijden()
+    assert set(tijden) == {'7101', '7201', '7701', '1101', 'VV', 'RX', 'DA'}
+    assert tijden['1101'] == {
+        'start_uur': '06:00', 'eind_uur': '14:00', 'shift_type': 'vroeg', 'werkpost_naam': 'Interventie',
+        'telt_als_werkdag': True, 'reset_12u_rust': True, 'breekt_werk_reeks': True, 'term': None
+    }
+    assert tijden['RX'] == {
+        'start_uur': None, 'eind_uur': None, 'shift_type': None, 'term': 'zondagrust',
+        'telt_als_werkdag': False, 'reset_12u_rust': True, 'breekt_werk_reeks': True
+    }
+    print("TEST GESLAAGD")
+
+
+def test_wijzigingsteller():
+    """Herladen enkel na invalideer(); TermCodeService volgt"""
+    print("\n" + "="*60)
+    print("TEST: Wijzigingsteller")
+    print("="*60)
+
+    conn = _maak_db()
+    try:
+        ReferentieCatalogus.invalideer()
+        TermCodeService.reset()
+        eerste = ReferentieCatalogus.get_instance(conn)
+        assert ReferentieCatalogus.get_instance() is eerste, "Geen herlading zonder wijziging"
+        assert TermCodeService.get_code_for_term('verlof') == 'VV'
+        assert TermCodeService.get_code_for_term('ziek') == 'Z', "Fallback code"
+
+        conn.execute("UPDATE speciale_codes SET code = 'VL' WHERE term = 'verlof'")
+        assert TermCodeService.get_code_for_term('verlof') == 'VV', "Nog geen invalidatie"
+
+        ReferentieCatalogus.invalideer()
+        tweede = ReferentieCatalogus.get_instance(conn)
+        assert tweede is not eerste and tweede.versie == eerste.versie + 1
+        assert TermCodeService.get_code_for_term('verlof') == 'VL'
+        print(f"  versies: {eerste.versie} -> {tweede.versie}")
+    finally:
+        ReferentieCatalogus.invalideer()
+        TermCodeService.reset()
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_lookups()
+    test_validator_formaat()
+    test_wijzigingsteller()
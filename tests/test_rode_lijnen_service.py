@@ -0,0 +1,140 @@
+"""
+Test script voor berekende rode lijn periodes (v0.6.29)
+
+Scenario:
+1. 1 config: zelfde periodes als de rode_lijnen tabel, cyclus over nieuwjaar
+2. Config wijziging: bestaande cyclus loopt door met nieuw interval, of
+   nieuwe cyclus op start_datum; nummering loopt door, periodes sluiten aan
+3. Start datum lookup voor de grids + cache synchronisatie
+4. periode_op is goedkoop genoeg voor elke cel
+
+Gebruikt een in-memory database (data/planning.db blijft onaangeroerd)
+
+Run: python tests/test_rode_lijnen_service.py
+"""
+import sqlite3
+import time
+from datetime import date, timedelta
+
+from services.rode_lijnen_service import RodeLijnenKalender, synchroniseer_rode_lijnen_cache
+
+
+def _kalender(*configs) -> RodeLijnenKalender:
+    """configs: (actief_vanaf, start_datum, interval_dagen)"""
+    return RodeLijnenKalender([(vanaf, None, (start, interval)) for vanaf, start, interval in configs])
+
+
+def test_een_config():
+    """Periodes = start + k * 28, ook over nieuwjaar"""
+    print("\n" + "="*60)
+    print("TEST: 1 config")
+    print("="*60)
+
+    kalender = _kalender((date(2025, 10, 20), date(2024, 7, 29), 28))
+    assert kalender.periode_op(date(2024, 7, 28)) is None
+    eerste = kalender.periode_op(date(2024, 7, 29))
+    assert (eerste.periode_nummer, eerste.eind_datum) == (1, date(2024, 8, 25))
+
+    nieuwjaar = kalender.periode_op(date(2026, 1, 2))
+    print(f"  2 januari 2026: {nieuwjaar}")
+    assert nieuwjaar.start_datum == date(2025, 12, 15) and nieuwjaar.periode_nummer == 19
+    assert nieuwjaar.start_datum <= date(2026, 1, 2) <= nieuwjaar.eind_datum
+
+    januari = kalender.periodes(date(2026, 1, 1), date(2026, 1, 31))
+    assert [p.start_datum for p in januari] == [date(2025, 12, 15), date(2026, 1, 12)]
+    assert kalender.periode_nummer(19) == nieuwjaar
+    print("TEST GESLAAGD")
+
+
+def test_config_wijziging():
+    """Zelfde regels als regenereer_rode_lijnen_vanaf, zonder gaten"""
+    print("\n" + "="*60)
+    print("TEST: Config wijziging")
+    print("="*60)
+
+    # Doorlopen: start_datum voor actief_vanaf → laatste start + nieuw interval
+    kalender = _kalender((date(2024, 1, 1), date(2025, 1, 6), 28),
+                         (date(2025, 3, 1), date(2025, 1, 6), 21))
+    perioden = kalender.periodes(date(2025, 1, 6), date(2025, 5, 1))
+    for periode in perioden:
+        print(f"  {periode.periode_nummer}: {periode.start_datum} - {periode.eind_datum}")
+    assert [p.start_datum for p in perioden] == [
+        date(2025, 1, 6), date(2025, 2, 3), date(2025, 2, 24), date(2025, 3, 17),
+        date(2025, 4, 7), date(2025, 4, 28)]
+    assert [p.periode_nummer for p in perioden] == [1, 2, 3, 4, 5, 6]
+    assert all(a.eind_datum + timedelta(days=1) == b.start_datum for a, b in zip(perioden, perioden[1:]))
+
+    # Nieuwe cyclus: start_datum na actief_vanaf → laatste oude periode loopt tot daar
+    kalender = _kalender((date(2024, 1, 1), date(2025, 1, 6), 28),
+                         (date(2025, 3, 1), date(2025, 3, 10), 28))
+    overgang = kalender.periode_op(date(2025, 3, 5))
+    assert (overgang.periode_nummer, overgang.start_datum, overgang.eind_datum) == (
+        2, date(2025, 2, 3), date(2025, 3, 9))
+    assert kalender.periode_op(date(2025, 3, 10)).periode_nummer == 3
+    assert kalender.periode_nummer(4).start_datum == date(2025, 4, 7)
+
+    # Versie die ingaat voor de eerste start vervangt die volledig
+    kalender = _kalender((date(2024, 1, 1), date(2025, 1, 6), 28),
+                         (date(2025, 1, 1), date(2025, 1, 13), 28))
+    assert kalender.periode_nummer(1).start_datum == date(2025, 1, 13)
+    print("TEST GESLAAGD")
+
+
+def test_starts_en_cache():
+    """Grid lookup + rode_lijnen tabel als cache"""
+    print("\n" + "="*60)
+    print("TEST: Starts en cache")
+    print("="*60)
+
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE rode_lijnen_config (
+            id INTEGER PRIMARY KEY, start_datum DATE, interval_dagen INTEGER,
+            actief_vanaf TIMESTAMP, actief_tot TIMESTAMP, is_actief BOOLEAN
+        );
+        CREATE TABLE rode_lijnen (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, start_datum DATE NOT NULL UNIQUE,
+            eind_datum DATE NOT NULL, periode_nummer INTEGER NOT NULL
+        );
+        INSERT INTO rode_lijnen_config VALUES (1, '2024-07-29', 28, '2025-10-20 08:28:44', NULL, 1);
+    """)
+
+    starts = RodeLijnenKalender.laad(conn).starts()
+    assert '2025-12-15' in starts and starts['2025-12-15'] == 19
+    assert '2025-12-16' not in starts and starts.get('2025-12-16') is None
+    assert starts['2030-02-04'] == 73, "Ook ver na de gematerialiseerde periodes"
+
+    aantal = synchroniseer_rode_lijnen_cache(date(2026, 12, 31), conn)
+    rijen = conn.execute("SELECT periode_nummer, start_datum, eind_datum FROM rode_lijnen "
+                         "ORDER BY start_datum").fetchall()
+    print(f"  {aantal} periodes in cache")
+    assert len(rijen) == aantal == 32
+    assert tuple(rijen[0]) == (1, '2024-07-29', '2024-08-25')
+    assert all(date.fromisoformat(r['eind_datum']) - date.fromisoformat(r['start_datum']) == timedelta(days=27)
+               for r in rijen)
+    print("TEST GESLAAGD")
+
+
+def test_lookup_snelheid():
+    """periode_op voor 100.000 datums"""
+    print("\n" + "="*60)
+    print("TEST: Lookup snelheid")
+    print("="*60)
+
+    kalender = _kalender((date(2024, 1, 1), date(2024, 7, 29), 28),
+                         (date(2026, 1, 1), date(2024, 7, 29), 21))
+    start = time.perf_counter()
+    for i in range(100_000):
+        kalender.periode_op(date(2024, 8, 1) + timedelta(days=i % 2000))
+    duur = time.perf_counter() - start
+    print(f"  100.000 lookups: {duur * 1000:.0f} ms")
+    assert duur < 2.0
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_een_config()
+    test_config_wijziging()
+    test_starts_en_cache()
+    test_lookup_snelheid()
@@ -0,0 +1,111 @@
+"""
+Test script voor rooster projectie engine (v0.6.29)
+
+Scenario:
+1. Typetabel notaties normaliseren (V/vroeg, directe codes RX/CX/T)
+2. Projectie: startweek offset, werkpost prioriteit, feestdag = zondag codes
+3. Lookup tabellen gedeeld per werkposten combinatie, bereken_shift == projecteer
+
+Geen database nodig (projectie wordt rechtstreeks opgebouwd)
+
+Run: python tests/test_rooster_projectie.py
+"""
+from datetime import date
+
+from services.rooster_projectie import (
+    RoosterProjectie, ProjectieGebruiker, normaliseer_shift_type
+)
+
+
+# 2 weken cyclus: week 1 ma-di vroeg, wo RX; week 2 ma nacht, zo vroeg
+TYPETABEL = {
+    (1, 1): 'V', (1, 2): 'vroeg', (1, 3): 'rx',
+    (2, 1): 'N', (2, 7): 'v',
+}
+SHIFT_CODES = {
+    (1, 'weekdag', 'vroeg'): '7101', (1, 'zondag', 'vroeg'): '7701',
+    (2, 'weekdag', 'vroeg'): '7201', (2, 'weekdag', 'nacht'): '7203',
+}
+
+
+def _maak_projectie() -> RoosterProjectie:
+    # 2025-11-03 = maandag, 2025-11-11 (dinsdag) = feestdag
+    return RoosterProjectie(2, date(2025, 11, 3), TYPETABEL, SHIFT_CODES,
+                            feestdagen=["2025-11-11"])
+
+
+def test_normaliseer_shift_type():
+    """Notaties uit de typetabel"""
+    print("\n" + "="*60)
+    print("TEST: Shift type normalisatie")
+    print("="*60)
+
+    assert normaliseer_shift_type('V') == (False, 'vroeg')
+    assert normaliseer_shift_type('Nacht') == (False, 'nacht')
+    assert normaliseer_shift_type('cx') == (True, 'CX')
+    assert normaliseer_shift_type('') is None
+    assert normaliseer_shift_type('X') is None
+    print("TEST GESLAAGD")
+
+
+def test_projectie():
+    """Startweek offset, werkpost prioriteit en feestdagen"""
+    projectie = _maak_projectie()
+
+    print("\n" + "="*60)
+    print("TEST: Projectie")
+    print("="*60)
+
+    gebruikers = [
+        ProjectieGebruiker(1, startweek=1, werkposten=(1, 2)),
+        ProjectieGebruiker(2, startweek=2, werkposten=(1, 2)),
+        ProjectieGebruiker(3, startweek=1, werkposten=(2,)),
+    ]
+    rooster = projectie.projecteer(date(2025, 11, 3), date(2025, 11, 16), gebruikers)
+    print(f"  Stats: {rooster.get_stats()}")
+
+    assert rooster.get_code("2025-11-03", 1) == '7101'
+    assert rooster.get_code("2025-11-05", 1) == 'RX', "Directe code zonder mapping"
+    assert rooster.get_code("2025-11-04", 1) == '7101'
+    assert rooster.get_code("2025-11-03", 3) == '7201', "Enkel werkpost 2"
+
+    # Startweek 2: begint met week 2 van de cyclus
+    assert rooster.get_code("2025-11-03", 2) == '7203', "Nacht enkel op werkpost 2"
+    assert rooster.get_code("2025-11-10", 2) == '7101'
+
+    # Feestdag dinsdag week 2 van gebruiker 2 → zondag code
+    assert rooster.get_code("2025-11-11", 2) == '7701'
+    # Zondag week 2, werkpost 2 heeft geen zondag code → leeg
+    assert rooster.get_code("2025-11-16", 3) == ''
+    assert rooster.get_code("2025-11-16", 1) == '7701'
+
+    # Posities: (week basis, dag in week, dag_type) - feestdag telt als zondag
+    assert projectie.posities([date(2025, 11, 8), date(2025, 11, 11)]) == [(0, 5, 1), (1, 1, 2)]
+    print("TEST GESLAAGD")
+
+
+def test_tabellen_gedeeld():
+    """Zelfde werkposten = zelfde lookup tabel; bereken_shift consistent"""
+    projectie = _maak_projectie()
+
+    print("\n" + "="*60)
+    print("TEST: Gedeelde lookup tabellen")
+    print("="*60)
+
+    projectie.gebruikers = [ProjectieGebruiker(gid, startweek=gid % 2 + 1, werkposten=(1, 2))
+                            for gid in range(1, 21)]
+    rooster = projectie.projecteer(date(2025, 10, 1), date(2026, 9, 30))
+    assert len(projectie._tabellen) == 1
+
+    for gebruiker in projectie.gebruikers[:2]:
+        for datum_str in rooster.datums[::7]:
+            verwacht = projectie.bereken_shift(date.fromisoformat(datum_str),
+                                               gebruiker.startweek, gebruiker.werkposten)
+            assert rooster.get_code(datum_str, gebruiker.gebruiker_id) == (verwacht or '')
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_normaliseer_shift_type()
+    test_projectie()
+    test_tabellen_gedeeld()
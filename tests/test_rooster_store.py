@@ -0,0 +1,102 @@
+"""
+Test script voor compacte rooster opslag (v0.6.29)
+
+Scenario:
+1. Code catalogus: zelfde code → zelfde id en gedeelde metadata, speciale code wint
+2. Rooster: code/notitie per dag, verwijderen wist beide, buiten range genegeerd
+3. Verlof intervallen: lookup zonder dag expansie, laatste aanvraag wint bij overlap
+
+Run: python tests/test_rooster_store.py
+"""
+from services.rooster_store import (
+    CodeCatalogus, CodeInfo, RoosterStore, VerlofPerioden, VerlofPeriode, GEEN_CODE
+)
+
+
+def test_code_catalogus():
+    """Interning van codes met gedeelde CodeInfo"""
+    print("\n" + "="*60)
+    print("TEST: Code catalogus")
+    print("="*60)
+
+    catalogus = CodeCatalogus()
+    shift_id = catalogus.registreer(CodeInfo('7101', shift_naam='vroeg', start_tijd='06:00', eind_tijd='14:00'))
+    assert catalogus.intern('7101') == shift_id
+    assert catalogus.intern('') == GEEN_CODE and catalogus.code(GEEN_CODE) == ''
+
+    # Onbekende code krijgt id zonder metadata
+    onbekend_id = catalogus.intern('XYZ')
+    assert catalogus.info(onbekend_id) == CodeInfo('XYZ')
+    assert not catalogus.info(onbekend_id).is_speciale_code
+
+    # Zelfde code als speciale code → metadata vervangen, id blijft
+    assert catalogus.registreer(CodeInfo('7101', speciale_naam='Test')) == shift_id
+    assert catalogus.info(shift_id).is_speciale_code
+    print("TEST GESLAAGD")
+
+
+def test_rooster_store():
+    """Per gebruiker een array van code ids, notities sparse"""
+    print("\n" + "="*60)
+    print("TEST: Rooster store")
+    print("="*60)
+
+    rooster = RoosterStore("2025-10-24", "2025-12-08")
+    assert len(rooster.datums) == 46
+
+    rooster.zet_code("2025-11-03", 1, '7101')
+    rooster.zet_code("2025-11-03", 2, '7101')
+    rooster.zet_notitie("2025-11-03", 1, "Opleiding")
+
+    assert rooster.get_code("2025-11-03", 1) == '7101'
+    assert rooster.get_code("2025-11-04", 1) == ''
+    assert rooster.get_code("2025-11-03", 99) == ''
+    assert rooster.get_code_info("2025-11-03", 1) is rooster.get_code_info("2025-11-03", 2), \
+        "Metadata moet gedeeld zijn"
+    assert sorted(rooster.codes_op_datum("2025-11-03")) == [(1, '7101'), (2, '7101')]
+
+    # Code wijzigen behoudt notitie
+    assert rooster.zet_code("2025-11-03", 1, 'RX') == '7101'
+    assert rooster.get_notitie("2025-11-03", 1) == "Opleiding"
+
+    # Verwijderen wist rij (code + notitie)
+    assert rooster.verwijder("2025-11-03", 1) == 'RX'
+    assert rooster.get_code("2025-11-03", 1) == '' and rooster.get_notitie("2025-11-03", 1) == ''
+
+    # Buiten range: genegeerd
+    assert rooster.zet_code("2026-01-01", 1, '7101') == ''
+    assert rooster.get_code("2026-01-01", 1) == ''
+
+    rooster.zet_maand_status(2025, 10, 'gepubliceerd')
+    assert rooster.get_status("2025-10-30") == 'gepubliceerd'
+    assert rooster.get_status("2025-11-03") == 'concept'
+
+    stats = rooster.get_stats()
+    print(f"  Stats: {stats}")
+    assert stats['shifts'] == 1 and stats['notities'] == 0
+    print("TEST GESLAAGD")
+
+
+def test_verlof_perioden():
+    """Interval lookup op ISO datum strings"""
+    print("\n" + "="*60)
+    print("TEST: Verlof perioden")
+    print("="*60)
+
+    verlof = VerlofPerioden()
+    verlof.voeg_toe(1, VerlofPeriode("2025-11-01", "2025-11-10", 'pending'))
+    verlof.voeg_toe(1, VerlofPeriode("2025-11-08", "2025-11-12", 'goedgekeurd'))
+
+    assert verlof.get("2025-10-31", 1) is None
+    assert verlof.get("2025-11-01", 1).status == 'pending'
+    assert verlof.get("2025-11-09", 1).status == 'goedgekeurd', "Laatste aanvraag wint bij overlap"
+    assert verlof.get("2025-11-12", 1).status == 'goedgekeurd'
+    assert verlof.get("2025-11-05", 2) is None
+    assert len(verlof) == 2
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_code_catalogus()
+    test_rooster_store()
+    test_verlof_perioden()
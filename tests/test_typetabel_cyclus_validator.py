@@ -0,0 +1,166 @@
+"""
+Test script voor cyclische typetabel validatie (v0.6.29)
+
+Scenario:
+1. Wrap-around: nacht op de laatste dag → vroeg op week 1 maandag, reeks over de cyclusgrens
+2. Gelijkwaardigheid met brute force: per startweek 8 cycli uitrollen + check_all,
+   zelfde (type, week, dag, startweek) locaties (ook rode lijn regel per startweek)
+3. 52 weken voor alle startweken niet trager dan de oude 2.5 cycli simulatie
+
+Geen database nodig (checker config + codes rechtstreeks)
+
+Run: python tests/test_typetabel_cyclus_validator.py
+"""
+import random
+import time
+from datetime import timedelta
+
+from services.constraint_checker import ConstraintChecker, PlanningRegel
+from services.typetabel_cyclus_validator import CyclusValidator, THEORETISCH_ANKER
+
+
+HR_CONFIG = {
+    'min_rust_uren': 12.0,
+    'max_uren_week': 50.0,
+    'max_werkdagen_cyclus': 19,
+    'max_dagen_tussen_rx': 7,
+    'max_werkdagen_reeks': 7,
+    'max_weekends_achter_elkaar': 2,
+    'week_definitie': 'ma-00:00|zo-23:59',
+    'weekend_definitie': 'vr-22:00|ma-06:00'
+}
+
+
+def _werkpost_shift(start: str, eind: str, shift_type: str) -> dict:
+    return {'start_uur': start, 'eind_uur': eind, 'shift_type': shift_type,
+            'telt_als_werkdag': True, 'reset_12u_rust': False, 'breekt_werk_reeks': False}
+
+
+def _rustdag(term: str) -> dict:
+    return {'start_uur': None, 'eind_uur': None, 'term': term,
+            'telt_als_werkdag': False, 'reset_12u_rust': True, 'breekt_werk_reeks': True}
+
+
+SHIFT_TIJDEN = {
+    '7101': _werkpost_shift('06:00', '14:00', 'vroeg'),
+    '7102': _werkpost_shift('14:00', '22:00', 'laat'),
+    '7103': _werkpost_shift('22:00', '06:00', 'nacht'),
+    'RX': _rustdag('zondagrust'),
+    'CX': _rustdag('zaterdagrust'),
+}
+
+
+def _rode_lijnen(fase_dagen: int, aantal: int = 40):
+    """28-dagen periodes, eerste start fase_dagen na het anker"""
+    start = THEORETISCH_ANKER + timedelta(days=fase_dagen)
+    return [{'start_datum': start + timedelta(days=28 * i),
+             'eind_datum': start + timedelta(days=28 * i + 27),
+             'periode_nummer': i + 1} for i in range(aantal)]
+
+
+def _brute_force(checker, codes, rode_lijnen, cycli: int = 8):
+    """Per startweek uitrollen + check_all; locaties uit de middelste cycli"""
+    lengte = len(codes)
+    locaties = set()
+    for startweek in range(1, lengte // 7 + 1):
+        verschuiving = 7 * (startweek - 1)
+        planning = [PlanningRegel(1, THEORETISCH_ANKER + timedelta(days=i),
+                                  codes[(i + verschuiving) % lengte])
+                    for i in range(cycli * lengte)]
+        for result in checker.check_all(planning, 1, rode_lijnen).values():
+            for v in result.violations:
+                dag = ((v.datum or v.datum_range[0]) - THEORETISCH_ANKER).days
+                if lengte <= dag < (cycli - 2) * lengte:
+                    p = (dag + verschuiving) % lengte
+                    locaties.add((v.type.value, p // 7 + 1, p % 7 + 1, startweek))
+    return locaties
+
+
+def _cyclisch(validator):
+    return {(v.type.value, week, dag, startweek)
+            for v in validator.valideer()
+            for week, dag, startweek in validator.locaties(v)}
+
+
+def test_wrap_around():
+    """Violations over de cyclusgrens, voor alle startweken op dezelfde cel"""
+    print("\n" + "="*60)
+    print("TEST: Wrap-around")
+    print("="*60)
+
+    codes = ['7101', '7101', '7101', '7102', '7102', 'RX', 'CX',
+             '7101', '7101', '7103', '7103', '7103', '7102', '7103']
+    validator = CyclusValidator(ConstraintChecker(HR_CONFIG, SHIFT_TIJDEN), codes)
+    locaties = _cyclisch(validator)
+    for locatie in sorted(locaties):
+        print(f"  {locatie}")
+
+    # Nacht week 2 zondag → vroeg week 1 maandag
+    assert ('min_rust_12u', 1, 1, 1) in locaties and ('min_rust_12u', 1, 1, 2) in locaties
+    assert ('nacht_vroeg_verboden', 1, 1, 2) in locaties
+    # Reeks vanaf week 2 maandag: dag 8-12 = week 1 ma-vr
+    reeks = sorted((w, d) for t, w, d, s in locaties if t == 'max_werkdagen_reeks' and s == 1)
+    assert reeks == [(1, 1), (1, 2), (1, 3), (1, 4), (1, 5)], reeks
+    # 1 RX per 14 dagen: gap over de grens
+    assert ('max_dagen_tussen_rx', 1, 6, 1) in locaties
+    # Week 2: 7 shifts x 8u
+    assert ('max_uren_week', 2, 1, 2) in locaties
+    print("TEST GESLAAGD")
+
+
+def test_gelijk_aan_brute_force():
+    """Zelfde locaties als uitrollen per startweek, inclusief rode lijn fase"""
+    print("\n" + "="*60)
+    print("TEST: Gelijkwaardig met brute force")
+    print("="*60)
+
+    checker = ConstraintChecker(HR_CONFIG, SHIFT_TIJDEN)
+    keuzes = ['7101', '7101', '7102', '7103', '7103', 'RX', 'CX', None]
+    for seed in range(6):
+        rng = random.Random(seed)
+        aantal_weken = rng.choice([3, 5, 6])
+        codes = [rng.choice(keuzes) for _ in range(aantal_weken * 7)]
+        # Vrij weekend in week 1 (anders oneindige weekend reeks)
+        codes[4:7] = ['RX', 'RX', 'CX']
+        rode_lijnen = _rode_lijnen(fase_dagen=rng.randrange(28))
+
+        cyclisch = _cyclisch(CyclusValidator(checker, codes, rode_lijnen))
+        brute = _brute_force(checker, codes, rode_lijnen)
+        per_startweek = {s: sum(1 for loc in cyclisch if loc[3] == s)
+                         for s in range(1, aantal_weken + 1)}
+        print(f"  seed {seed}: {aantal_weken} weken, {len(cyclisch)} locaties, per startweek {per_startweek}")
+        assert cyclisch == brute, (seed, cyclisch ^ brute)
+    print("TEST GESLAAGD")
+
+
+def test_52_weken_snelheid():
+    """Alle 52 startweken ≤ tijd van de oude simulatie (2.5 cycli, 1 startweek)"""
+    print("\n" + "="*60)
+    print("TEST: 52 weken snelheid")
+    print("="*60)
+
+    checker = ConstraintChecker(HR_CONFIG, SHIFT_TIJDEN)
+    week = ['7101', '7101', '7102', '7102', '7103', 'RX', 'CX']
+    codes = week * 52
+    rode_lijnen = _rode_lijnen(fase_dagen=0)
+
+    start = time.perf_counter()
+    violations = CyclusValidator(checker, codes, rode_lijnen).valideer()
+    cyclisch_tijd = time.perf_counter() - start
+
+    start = time.perf_counter()
+    planning = [PlanningRegel(0, THEORETISCH_ANKER + timedelta(days=i), codes[i % len(codes)])
+                for i in range(int(len(codes) * 2.5))]
+    checker.check_all(planning, 0, rode_lijnen)
+    oud_tijd = time.perf_counter() - start
+
+    print(f"  Cyclisch (52 startweken): {cyclisch_tijd * 1000:.0f} ms, {len(violations)} violations")
+    print(f"  Oud (2.5 cycli, startweek 1): {oud_tijd * 1000:.0f} ms")
+    assert cyclisch_tijd <= oud_tijd * 1.5
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_wrap_around()
+    test_gelijk_aan_brute_force()
+    test_52_weken_snelheid()
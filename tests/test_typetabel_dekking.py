@@ -0,0 +1,103 @@
+"""
+Test script voor typetabel dekkingsanalyse (v0.6.29)
+
+Scenario:
+1. 2 gebruikers, 1 week cyclus: gaten, dubbels, feestdag = zondag codes
+2. Gegroepeerde telling == brute force (projecteer() + tellen per dag) voor een team
+
+Geen database nodig (projectie wordt rechtstreeks opgebouwd)
+
+Run: python tests/test_typetabel_dekking.py
+"""
+import random
+from collections import Counter
+from datetime import date
+
+from services.rooster_projectie import RoosterProjectie, ProjectieGebruiker
+from services.typetabel_dekking import analyseer_dekking
+
+
+SHIFT_CODES = {
+    (1, 'weekdag', 'vroeg'): '7101', (1, 'weekdag', 'laat'): '7102',
+    (1, 'zaterdag', 'vroeg'): '7501', (1, 'zondag', 'vroeg'): '7701',
+}
+KRITISCH = [
+    ('Interventie', 'laat', 'weekdag', '7102'),
+    ('Interventie', 'vroeg', 'weekdag', '7101'),
+    ('Interventie', 'vroeg', 'zaterdag', '7501'),
+    ('Interventie', 'vroeg', 'zondag', '7701'),
+]
+
+
+def test_gaten_en_dubbels():
+    """1 week cyclus, startweek verschil maakt geen verschil bij 1 week"""
+    print("\n" + "="*60)
+    print("TEST: Gaten en dubbels")
+    print("="*60)
+
+    # Ma-vr vroeg, za vroeg, zo leeg
+    typetabel = {(1, dag): 'V' for dag in range(1, 7)}
+    # 2025-11-03 = maandag, 2025-11-05 (woensdag) = feestdag
+    projectie = RoosterProjectie(1, date(2025, 11, 3), typetabel, SHIFT_CODES,
+                                 feestdagen=["2025-11-05"],
+                                 gebruikers=[ProjectieGebruiker(1, 1, (1,)), ProjectieGebruiker(2, 1, (1,))])
+    analyse = analyseer_dekking(projectie, date(2025, 11, 3), KRITISCH)
+    print(f"  Rijen: {analyse.rijen}")
+    print(f"  Samenvatting: {analyse.samenvatting()}")
+
+    assert analyse.rijen == [('Interventie', 'laat'), ('Interventie', 'vroeg')]
+    vroeg = analyse.aantallen[1]
+    assert vroeg == [2, 2, 2, 2, 2, 2, 0], vroeg
+    # Woensdag feestdag: 7701 verwacht i.p.v. 7101/7102
+    assert analyse.codes[1][2] == '7701' and analyse.codes[0][2] is None
+    assert analyse.status(2) == 'geel'
+    # Laat nooit ingevuld → rood op weekdagen, zondag 7701 ontbreekt
+    assert analyse.samenvatting() == {'volledig': 0, 'dubbel': 2, 'onvolledig': 5, 'totaal': 7}
+    gaten = analyse.gaten()
+    assert (date(2025, 11, 9), '7701', 'Interventie', 'vroeg') in gaten
+    assert len(gaten) == 4 + 1
+    assert (date(2025, 11, 8), '7501', 2) in analyse.dubbels()
+    print("TEST GESLAAGD")
+
+
+def test_gelijk_aan_projectie():
+    """Groepen met gewicht == elke gebruiker apart projecteren en tellen"""
+    print("\n" + "="*60)
+    print("TEST: Gegroepeerd == brute force")
+    print("="*60)
+
+    rng = random.Random(42)
+    shift_codes = dict(SHIFT_CODES)
+    shift_codes.update({(2, 'weekdag', 'vroeg'): '7201', (2, 'weekdag', 'nacht'): '7203',
+                        (2, 'zondag', 'vroeg'): '7701'})
+    kritisch = KRITISCH + [('PAT', 'nacht', 'weekdag', '7203'), ('PAT', 'vroeg', 'weekdag', '7201')]
+    typetabel = {(week, dag): rng.choice(['V', 'L', 'N', 'RX', 'CX', ''])
+                 for week in range(1, 7) for dag in range(1, 8)}
+    werkposten = [(1,), (2,), (1, 2), (2, 1)]
+    gebruikers = [ProjectieGebruiker(gid, rng.randint(1, 12), rng.choice(werkposten))
+                  for gid in range(1, 31)]
+    projectie = RoosterProjectie(6, date(2025, 1, 6), typetabel, shift_codes,
+                                 feestdagen=["2025-12-25", "2026-01-01"], gebruikers=gebruikers)
+
+    start = date(2025, 12, 1)
+    analyse = analyseer_dekking(projectie, start, kritisch)
+    rooster = projectie.projecteer(start, analyse.datums[-1])
+    print(f"  {len(gebruikers)} gebruikers, {len(analyse.rijen)} rijen, {analyse.samenvatting()}")
+
+    per_dag = {datum_str: Counter() for datum_str in rooster.datums}
+    for datum_str, _, code in rooster.iter_codes():
+        per_dag[datum_str][code] += 1
+
+    for dag, datum_str in enumerate(rooster.datums):
+        telling = per_dag[datum_str]
+        for r in range(len(analyse.rijen)):
+            code = analyse.codes[r][dag]
+            if code is not None:
+                assert analyse.aantallen[r][dag] == telling[code], (datum_str, code)
+    assert date(2025, 12, 25) in analyse.feestdagen
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_gaten_en_dubbels()
+    test_gelijk_aan_projectie()
@@ -0,0 +1,133 @@
+"""
+Test script voor begrensde ValidationCache (v0.6.29)
+
+Scenario:
+1. Cache groeit niet boven max_dagen bij bladeren door maanden
+2. Minst recent gebruikte datums worden eerst verwijderd (LRU)
+3. Bulk wijziging: geraakte datums herberekend met 1 batch load
+4. Async load: bereken_range (worker) wijzigt de cache niet, bewaar_entries wel
+
+Batch queries worden vervangen door lege resultaten (geen database nodig)
+
+Run: python tests/test_validation_cache.py
+"""
+from datetime import date
+
+from services.validation_cache import ValidationCache
+
+
+def _maak_cache(max_dagen: int) -> ValidationCache:
+    """Cache zonder database: planning/notities leeg, alles groen"""
+    cache = ValidationCache(max_dagen=max_dagen)
+    cache._load_planning_batch = lambda start, eind, gebruiker_ids: {}
+    cache._load_shift_codes = lambda catalogus=None: {}
+    cache._calculate_bemannings_batch = lambda planning, codes, start, eind: {}
+    cache._load_notities_batch = lambda start, eind: set()
+    return cache
+
+
+def test_cache_begrensd():
+    """Bladeren door een heel jaar blijft binnen max_dagen"""
+    cache = _maak_cache(max_dagen=100)
+
+    print("\n" + "="*60)
+    print("TEST: Cache begrensd")
+    print("="*60)
+
+    for maand in range(1, 13):
+        cache.preload_month(2025, maand)
+
+    stats = cache.get_stats()
+    print(f"  Stats: {stats}")
+    assert stats['cache_size'] == 100
+    assert stats['evictions'] == 365 - 100
+    assert cache.get_bemannings_status(date(2025, 12, 31)) == 'groen'
+    assert cache.get_bemannings_status(date(2025, 1, 1)) is None
+    print("TEST GESLAAGD")
+
+
+def test_lru_volgorde():
+    """Gebruikte datum blijft, oudste ongebruikte verdwijnt"""
+    cache = _maak_cache(max_dagen=45)
+
+    print("\n" + "="*60)
+    print("TEST: LRU volgorde")
+    print("="*60)
+
+    cache.preload_month(2025, 10)
+    assert cache.get_bemannings_status(date(2025, 10, 5)) == 'groen'
+    cache.preload_month(2025, 11)
+
+    # 31 + 30 = 61 datums → 16 oudste weg, 5 oktober net gebruikt
+    assert cache.get_stats()['evictions'] == 16
+    assert cache.get_full_status(date(2025, 10, 5)) is not None
+    assert cache.get_full_status(date(2025, 10, 1)) is None
+    assert cache.get_full_status(date(2025, 10, 17)) is None
+    assert cache.get_full_status(date(2025, 10, 18)) is not None
+    print("TEST GESLAAGD")
+
+
+def test_ververs_datums():
+    """Na bulk invullen krijgen enkel de geraakte datums een nieuwe status"""
+    cache = _maak_cache(max_dagen=100)
+    rood = set()
+    geladen = []
+
+    def bemanning(planning, codes, start, eind):
+        geladen.append((start, eind))
+        return {datum: 'rood' for datum in rood if start <= datum <= eind}
+    cache._calculate_bemannings_batch = bemanning
+
+    print("\n" + "="*60)
+    print("TEST: Ververs geraakte datums")
+    print("="*60)
+
+    cache.preload_month(2025, 11)
+    assert cache.get_bemannings_status(date(2025, 11, 4)) == 'groen'
+
+    # Planning gewijzigd op 4 en 6 november (bv. bulk wissen) → rood
+    rood.update({date(2025, 11, 4), date(2025, 11, 6), date(2025, 11, 20)})
+    geladen.clear()
+    statussen = cache.ververs_datums([date(2025, 11, 6), date(2025, 11, 4), date(2025, 11, 6)])
+
+    print(f"  Batch loads: {geladen}")
+    assert geladen == [(date(2025, 11, 4), date(2025, 11, 6))], "1 batch load over geraakte periode"
+    assert statussen == {date(2025, 11, 4): 'rood', date(2025, 11, 6): 'rood'}
+    assert cache.get_bemannings_status(date(2025, 11, 20)) == 'groen', "Niet geraakte datum blijft"
+    assert not cache._dirty_dates
+    assert cache.ververs_datums([]) == {}
+    print("TEST GESLAAGD")
+
+
+def test_bereken_en_bewaar():
+    """Worker berekent enkel; de GUI thread zet de entries in de cache"""
+    cache = _maak_cache(max_dagen=100)
+
+    print("\n" + "="*60)
+    print("TEST: Bereken (worker) en bewaar (GUI thread)")
+    print("="*60)
+
+    cache.invalidate_date(date(2025, 11, 10))
+    entries = cache.bereken_range(date(2025, 11, 3), date(2025, 11, 30))
+    assert [entry.datum for entry in (entries[0], entries[-1])] == [date(2025, 11, 3), date(2025, 11, 30)]
+    assert len(entries) == 28
+    assert cache.get_stats()['cache_size'] == 0, "Berekenen wijzigt de gedeelde cache niet"
+    assert cache._dirty_dates == {date(2025, 11, 10)}
+
+    cache.bewaar_entries(entries)
+    stats = cache.get_stats()
+    print(f"  Stats: {stats}")
+    assert stats['cache_size'] == 28 and stats['batch_loads'] == 1
+    assert cache.get_bemannings_status(date(2025, 11, 10)) == 'groen'
+    assert not cache._dirty_dates
+
+    cache.bewaar_entries([])
+    assert cache.get_stats()['batch_loads'] == 1
+    print("TEST GESLAAGD")
+
+
+if __name__ == '__main__':
+    test_cache_begrensd()
+    test_lru_volgorde()
+    test_ververs_datums()
+    test_bereken_en_bewaar()